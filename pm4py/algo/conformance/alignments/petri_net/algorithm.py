@@ -32,6 +32,8 @@ from typing import Optional, Dict, Any, Union
 from pm4py.objects.log.obj import EventLog, EventStream, Trace
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 from pm4py.util import typing, constants, pandas_utils
+from pm4py.algo.conformance.alignments.petri_net.utils.cache import AlignmentsCache, get_net_fingerprint
+from pm4py.algo.conformance.alignments.petri_net.utils.lp_heuristics import LpHeuristicsCache
 import pandas as pd
 
 
@@ -41,6 +43,7 @@ class Variants(Enum):
     VERSION_DIJKSTRA_NO_HEURISTICS = variants.dijkstra_no_heuristics
     VERSION_DIJKSTRA_LESS_MEMORY = variants.dijkstra_less_memory
     VERSION_DISCOUNTED_A_STAR = variants.discounted_a_star
+    VERSION_DIJKSTRA_PREFIX_SHARING = variants.dijkstra_prefix_sharing
 
 class Parameters(Enum):
     PARAM_TRACE_COST_FUNCTION = 'trace_cost_function'
@@ -63,6 +66,8 @@ class Parameters(Enum):
     SYNCHRONOUS = "synchronous_dijkstra"
     EXPONENT="theta"
     ENABLE_BEST_WORST_COST = "enable_best_worst_cost"
+    ALIGNMENTS_CACHE = "alignments_cache"
+    LP_HEURISTICS_CACHE = "lp_heuristics_cache"
 
 
 def __variant_mapper(variant):
@@ -75,6 +80,8 @@ def __variant_mapper(variant):
             variant = Variants.VERSION_DIJKSTRA_NO_HEURISTICS
         elif variant == "Variants.VERSION_DIJKSTRA_LESS_MEMORY":
             variant = Variants.VERSION_DIJKSTRA_LESS_MEMORY
+        elif variant == "Variants.VERSION_DIJKSTRA_PREFIX_SHARING":
+            variant = Variants.VERSION_DIJKSTRA_PREFIX_SHARING
 
     return variant
 
@@ -152,19 +159,22 @@ def apply_trace(trace, petri_net, initial_marking, final_marking, parameters=Non
     if enable_best_worst_cost:
         best_worst_cost = exec_utils.get_param_value(Parameters.BEST_WORST_COST_INTERNAL, parameters,
                                                      __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters))
+        __add_fitness(ali, trace_cost_function_sum, best_worst_cost)
 
-        if ali is not None and best_worst_cost is not None:
-            ltrace_bwc = trace_cost_function_sum + best_worst_cost
+    return ali
 
-            fitness_num = ali['cost'] // align_utils.STD_MODEL_LOG_MOVE_COST
-            fitness_den = ltrace_bwc // align_utils.STD_MODEL_LOG_MOVE_COST
-            fitness = 1 - fitness_num / fitness_den if fitness_den > 0 else 0
 
-            ali["fitness"] = fitness
-            # returning also the best worst cost, for log fitness computation
-            ali["bwc"] = ltrace_bwc
+def __add_fitness(ali, trace_cost_function_sum, best_worst_cost):
+    if ali is not None and best_worst_cost is not None:
+        ltrace_bwc = trace_cost_function_sum + best_worst_cost
 
-    return ali
+        fitness_num = ali['cost'] // align_utils.STD_MODEL_LOG_MOVE_COST
+        fitness_den = ltrace_bwc // align_utils.STD_MODEL_LOG_MOVE_COST
+        fitness = 1 - fitness_num / fitness_den if fitness_den > 0 else 0
+
+        ali["fitness"] = fitness
+        # returning also the best worst cost, for log fitness computation
+        ali["bwc"] = ltrace_bwc
 
 
 def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, variant=DEFAULT_VARIANT):
@@ -183,7 +193,11 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     variant
         selected variant of the algorithm, possible values: {\'Variants.VERSION_STATE_EQUATION_A_STAR, Variants.VERSION_DIJKSTRA_NO_HEURISTICS \'}
     parameters
-        :class:`dict` parameters of the algorithm,
+        :class:`dict` parameters of the algorithm, including:
+            Parameters.ALIGNMENTS_CACHE -> (optional) AlignmentsCache object, or path to the SQLite file
+            of the cache, that is consulted before aligning each variant
+            Parameters.LP_HEURISTICS_CACHE -> (optional) LpHeuristicsCache object, re-using the solutions of the
+            LPs of the state-equation variants among the variants of the log (by default, a new one is created)
 
     Returns
     -----------
@@ -211,30 +225,72 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
                                                      sys.maxsize)
 
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
-    progress = __get_progress_bar(len(one_tr_per_var), parameters)
+    cache, fingerprint, close_cache = __open_cache(petri_net, initial_marking, final_marking, variant, parameters)
+    all_alignments, to_align = __get_cached_alignments(variants_idxs, cache, fingerprint)
+    progress = __get_progress_bar(len(to_align), parameters)
 
-    if enable_best_worst_cost:
+    if enable_best_worst_cost and to_align:
         best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
         parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
-    all_alignments = []
-    for trace in one_tr_per_var:
+    # the solutions of the LPs (state-equation variants) are shared among the variants of the log
+    variant_parameters = copy(parameters)
+    variant_parameters[Parameters.LP_HEURISTICS_CACHE] = exec_utils.get_param_value(
+        Parameters.LP_HEURISTICS_CACHE, parameters, LpHeuristicsCache())
+
+    variants_list = list(variants_idxs)
+    if variant is Variants.VERSION_DIJKSTRA_PREFIX_SHARING and Parameters.PARAM_TRACE_COST_FUNCTION not in parameters \
+            and Parameters.PARAM_TRACE_COST_FUNCTION.value not in parameters:
+        # all the variants are aligned together by a single search over their prefix trie
+        __align_prefix_sharing(one_tr_per_var, to_align, all_alignments, petri_net, initial_marking, final_marking,
+                               variant_parameters, enable_best_worst_cost)
+        for index in to_align:
+            if cache is not None:
+                cache.put(fingerprint, variants_list[index], all_alignments[index])
+        if progress is not None:
+            progress.update(len(to_align))
+        to_align = []
+
+    for index in to_align:
         this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
-        parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
-        all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
-                                          variant=variant))
+        variant_parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
+        all_alignments[index] = apply_trace(one_tr_per_var[index], petri_net, initial_marking, final_marking,
+                                            parameters=copy(variant_parameters), variant=variant)
+        if cache is not None:
+            cache.put(fingerprint, variants_list[index], all_alignments[index])
         if progress is not None:
             progress.update()
 
     alignments = __form_alignments(variants_idxs, all_alignments)
     __close_progress_bar(progress)
+    if cache is not None:
+        cache.commit()
+    if close_cache:
+        cache.close()
 
     return alignments
 
 
+def __align_prefix_sharing(one_tr_per_var, to_align, all_alignments, petri_net, initial_marking, final_marking,
+                           parameters, enable_best_worst_cost):
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    best_worst_cost = exec_utils.get_param_value(Parameters.BEST_WORST_COST_INTERNAL, parameters, None)
+    traces = [tuple(x[activity_key] for x in one_tr_per_var[index]) for index in to_align]
+
+    alignments = variants.dijkstra_prefix_sharing.apply_variants(traces, petri_net, initial_marking, final_marking,
+                                                                 parameters=parameters)
+
+    for index, trace, ali in zip(to_align, traces, alignments):
+        if enable_best_worst_cost:
+            __add_fitness(ali, align_utils.STD_MODEL_LOG_MOVE_COST * len(trace), best_worst_cost)
+        all_alignments[index] = ali
+
+
 def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parameters=None, variant=DEFAULT_VARIANT):
     """
-    Applies the alignments using a process pool (multiprocessing)
+    Applies the alignments using a process pool (multiprocessing).
+    The Petri net is shipped once to every worker of the pool, and the variants are dispatched in chunks
+    sorted by their expected cost (length of the trace).
 
     Parameters
     ---------------
@@ -261,43 +317,114 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
 
     variant = __variant_mapper(variant)
 
-    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2)
+    num_cores = max(1, exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2))
 
     enable_best_worst_cost = exec_utils.get_param_value(Parameters.ENABLE_BEST_WORST_COST, parameters, True)
 
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
+    cache, fingerprint, close_cache = __open_cache(petri_net, initial_marking, final_marking, variant, parameters)
+    all_alignments, to_align = __get_cached_alignments(variants_idxs, cache, fingerprint)
 
-    if enable_best_worst_cost:
+    if enable_best_worst_cost and to_align:
         best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
         parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
-    all_alignments = []
-
-    from concurrent.futures import ProcessPoolExecutor
-    with ProcessPoolExecutor(max_workers=num_cores) as executor:
-        futures = []
-        for trace in one_tr_per_var:
-            futures.append(executor.submit(apply_trace, trace, petri_net, initial_marking, final_marking, parameters, str(variant)))
-        progress = __get_progress_bar(len(one_tr_per_var), parameters)
-        if progress is not None:
-            alignments_ready = 0
-            while alignments_ready != len(futures):
-                current = 0
-                for index, variant in enumerate(futures):
-                    current = current + 1 if futures[index].done() else current
-                if current > alignments_ready:
-                    for i in range(0, current - alignments_ready):
-                        progress.update()
-                alignments_ready = current
-        for index, variant in enumerate(futures):
-            all_alignments.append(futures[index].result())
-        __close_progress_bar(progress)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    variants_activities = [tuple(x[activity_key] for x in trace) for trace in one_tr_per_var]
+    chunks = [[to_align[i] for i in chunk] for chunk in
+              __get_cost_sorted_chunks([variants_activities[i] for i in to_align], num_cores)]
+
+    if chunks:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        # the net, the markings and the parameters are shipped once to every worker (through the initializer)
+        # instead of being pickled together with every single variant
+        # the cache (holding a connection to the database) is not shipped to the workers
+        worker_parameters = {x: y for x, y in parameters.items() if
+                             x not in [Parameters.ALIGNMENTS_CACHE, Parameters.ALIGNMENTS_CACHE.value]}
+        with ProcessPoolExecutor(max_workers=num_cores, initializer=__initialize_worker,
+                                 initargs=(petri_net, initial_marking, final_marking, worker_parameters,
+                                           str(variant))) as executor:
+            futures = {}
+            for chunk in chunks:
+                futures[executor.submit(__align_variants_chunk, [variants_activities[i] for i in chunk])] = chunk
+            progress = __get_progress_bar(len(to_align), parameters)
+            for future in as_completed(futures):
+                chunk = futures[future]
+                for index, ali in zip(chunk, future.result()):
+                    all_alignments[index] = ali
+                    if cache is not None:
+                        cache.put(fingerprint, variants_activities[index], ali)
+                if progress is not None:
+                    progress.update(len(chunk))
+            __close_progress_bar(progress)
 
     alignments = __form_alignments(variants_idxs, all_alignments)
+    if cache is not None:
+        cache.commit()
+    if close_cache:
+        cache.close()
 
     return alignments
 
 
+# state of the worker processes of apply_multiprocessing (set once per process by the initializer)
+__WORKER_STATE = {}
+
+
+def __initialize_worker(petri_net, initial_marking, final_marking, parameters, variant):
+    __WORKER_STATE["petri_net"] = petri_net
+    __WORKER_STATE["initial_marking"] = initial_marking
+    __WORKER_STATE["final_marking"] = final_marking
+    __WORKER_STATE["parameters"] = copy(parameters)
+    # every worker keeps its own cache of the solutions of the LPs (state-equation variants)
+    __WORKER_STATE["parameters"][Parameters.LP_HEURISTICS_CACHE] = LpHeuristicsCache()
+    __WORKER_STATE["variant"] = variant
+
+
+def __align_variants_chunk(variants_activities):
+    petri_net = __WORKER_STATE["petri_net"]
+    initial_marking = __WORKER_STATE["initial_marking"]
+    final_marking = __WORKER_STATE["final_marking"]
+    parameters = __WORKER_STATE["parameters"]
+    variant = __WORKER_STATE["variant"]
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+
+    ret = []
+    for activities in variants_activities:
+        trace = Trace([Event({activity_key: act}) for act in activities])
+        ret.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=parameters,
+                               variant=variant))
+    return ret
+
+
+def __get_cost_sorted_chunks(variants_activities, num_cores, chunks_per_core=4):
+    """
+    Groups the indexes of the variants into chunks to be dispatched to the workers.
+    The variants are sorted by their expected cost (the length of the trace), the most expensive first, and a
+    chunk is closed when its expected cost reaches a fraction of the total. In this way, the expensive variants
+    are aligned in small chunks at the beginning, while the cheap ones are grouped together at the end (reducing
+    the number of round-trips to the workers and keeping all the workers busy until the end).
+    """
+    order = sorted(range(len(variants_activities)), key=lambda i: len(variants_activities[i]), reverse=True)
+    total_cost = sum(len(x) + 1 for x in variants_activities)
+    target_cost = max(1, total_cost // (chunks_per_core * max(1, num_cores)))
+
+    chunks = []
+    chunk = []
+    chunk_cost = 0
+    for index in order:
+        chunk.append(index)
+        chunk_cost += len(variants_activities[index]) + 1
+        if chunk_cost >= target_cost:
+            chunks.append(chunk)
+            chunk = []
+            chunk_cost = 0
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
 def __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters):
     parameters_best_worst = copy(parameters)
 
@@ -341,6 +468,56 @@ def __get_variants_structure(log, parameters):
     return variants_idxs, one_tr_per_var
 
 
+def __open_cache(petri_net, initial_marking, final_marking, variant, parameters):
+    """
+    Opens the alignments cache provided in the parameters (either an AlignmentsCache object or the path to
+    a SQLite file), and computes the fingerprint of the accepting Petri net
+    """
+    cache = exec_utils.get_param_value(Parameters.ALIGNMENTS_CACHE, parameters, None)
+    if cache is None:
+        return None, None, False
+
+    close_cache = False
+    if not isinstance(cache, AlignmentsCache):
+        cache = AlignmentsCache(cache)
+        close_cache = True
+
+    fingerprint = get_net_fingerprint(petri_net, initial_marking, final_marking,
+                                      model_cost_function=exec_utils.get_param_value(
+                                          Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None),
+                                      sync_cost_function=exec_utils.get_param_value(
+                                          Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None),
+                                      trace_cost_function=exec_utils.get_param_value(
+                                          Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None),
+                                      variant=str(variant),
+                                      ret_tuple_as_trans_desc=exec_utils.get_param_value(
+                                          Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE, parameters, False),
+                                      enable_best_worst_cost=exec_utils.get_param_value(
+                                          Parameters.ENABLE_BEST_WORST_COST, parameters, True),
+                                      activity_key=exec_utils.get_param_value(
+                                          Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY))
+
+    return cache, fingerprint, close_cache
+
+
+def __get_cached_alignments(variants_idxs, cache, fingerprint):
+    """
+    Gets the alignments of the variants contained in the cache, along with the indexes of the variants
+    that still need to be aligned
+    """
+    all_alignments = [None] * len(variants_idxs)
+    if cache is None:
+        return all_alignments, list(range(len(variants_idxs)))
+
+    to_align = []
+    for index, variant in enumerate(variants_idxs):
+        all_alignments[index] = cache.get(fingerprint, variant)
+        if all_alignments[index] is None:
+            to_align.append(index)
+
+    return all_alignments, to_align
+
+
 def __get_progress_bar(num_variants, parameters):
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR)
     progress = None
@@ -0,0 +1,223 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import hashlib
+import json
+import pickle
+import sqlite3
+from typing import Optional, Dict, Any, Tuple, Collection
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.util import constants
+
+
+class AlignmentsCache(object):
+    """
+    Persistent (SQLite-based) cache of the alignments of the variants of a log.
+
+    Each entry is identified by the fingerprint of the accepting Petri net (along with the cost functions and the
+    alignment variant, see get_net_fingerprint) and by the tuple of activities of the variant. When the maximum
+    number of entries is exceeded, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str = ":memory:", max_entries: Optional[int] = None):
+        """
+        Opens (or creates) an alignments cache
+
+        Parameters
+        ----------------
+        path
+            Path to the SQLite file storing the cache (by default, the cache is kept in memory)
+        max_entries
+            Maximum number of entries of the cache (LRU eviction). If None, the cache is unbounded.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS alignments (fingerprint TEXT NOT NULL, variant TEXT NOT NULL, "
+            "alignment BLOB NOT NULL, last_access INTEGER NOT NULL, PRIMARY KEY (fingerprint, variant))")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS alignments_last_access ON alignments (last_access)")
+        self.connection.commit()
+        self.__clock = self.connection.execute("SELECT COALESCE(MAX(last_access), 0) FROM alignments").fetchone()[0]
+        self.__evict()
+        self.connection.commit()
+
+    def __tick(self) -> int:
+        self.__clock += 1
+        return self.__clock
+
+    def __evict(self):
+        if self.max_entries is not None:
+            num_entries = len(self)
+            if num_entries > self.max_entries:
+                to_evict = num_entries - self.max_entries
+                self.connection.execute("DELETE FROM alignments WHERE rowid IN (SELECT rowid FROM alignments "
+                                        "ORDER BY last_access LIMIT ?)", (to_evict,))
+                self.evictions += to_evict
+
+    def get(self, fingerprint: str, variant: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """
+        Gets the alignment of a variant from the cache
+
+        Parameters
+        ----------------
+        fingerprint
+            Fingerprint of the accepting Petri net
+        variant
+            Tuple of activities
+
+        Returns
+        ----------------
+        alignment
+            Alignment of the variant (None if it is not contained in the cache)
+        """
+        variant = json.dumps(list(variant), default=str)
+        row = self.connection.execute("SELECT alignment FROM alignments WHERE fingerprint = ? AND variant = ?",
+                                      (fingerprint, variant)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.connection.execute("UPDATE alignments SET last_access = ? WHERE fingerprint = ? AND variant = ?",
+                                (self.__tick(), fingerprint, variant))
+        return pickle.loads(row[0])
+
+    def put(self, fingerprint: str, variant: Tuple[str, ...], alignment: Dict[str, Any]):
+        """
+        Stores the alignment of a variant in the cache (evicting the least recently used entries if needed)
+
+        Parameters
+        ----------------
+        fingerprint
+            Fingerprint of the accepting Petri net
+        variant
+            Tuple of activities
+        alignment
+            Alignment of the variant
+        """
+        if alignment is None:
+            # alignments interrupted by the timeout are not cached
+            return
+
+        self.connection.execute("INSERT OR REPLACE INTO alignments VALUES (?, ?, ?, ?)",
+                                (fingerprint, json.dumps(list(variant), default=str), pickle.dumps(alignment),
+                                 self.__tick()))
+
+        self.__evict()
+
+    def commit(self):
+        """
+        Persists the entries stored since the last commit (the insertions are not committed one by one, but once
+        per batch of aligned variants)
+        """
+        self.connection.commit()
+
+    def clear(self):
+        """
+        Removes all the entries from the cache
+        """
+        self.connection.execute("DELETE FROM alignments")
+        self.connection.commit()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Gets the statistics of the usage of the cache
+
+        Returns
+        ----------------
+        statistics
+            Dictionary containing the number of hits, misses, evictions and entries of the cache
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self)}
+
+    def close(self):
+        """
+        Closes the connection to the cache
+        """
+        self.connection.commit()
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM alignments").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def get_net_fingerprint(petri_net: PetriNet, initial_marking: Marking, final_marking: Marking,
+                        model_cost_function: Optional[Dict[PetriNet.Transition, Any]] = None,
+                        sync_cost_function: Optional[Dict[PetriNet.Transition, Any]] = None,
+                        trace_cost_function: Optional[Collection[Any]] = None,
+                        variant: Optional[str] = None, ret_tuple_as_trans_desc: bool = False,
+                        enable_best_worst_cost: bool = True, activity_key: Optional[str] = None) -> str:
+    """
+    Computes a stable fingerprint (independent from the Python session) of an accepting Petri net, along with the
+    cost functions and the settings that influence the result of the alignments
+
+    Parameters
+    ----------------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    model_cost_function
+        (if provided) Model cost function
+    sync_cost_function
+        (if provided) Sync cost function
+    trace_cost_function
+        (if provided) Trace cost function
+    variant
+        (if provided) Variant of the alignments algorithm
+    ret_tuple_as_trans_desc
+        Boolean telling if the alignments are expressed in terms of the transitions of the synchronous product net
+    enable_best_worst_cost
+        Boolean telling if the fitness and the best worst cost are stored along with the alignments
+    activity_key
+        (if provided) Attribute used as activity
+
+    Returns
+    ----------------
+    fingerprint
+        Hexadecimal fingerprint
+    """
+    description = {
+        "places": sorted(str(p.name) for p in petri_net.places),
+        "transitions": sorted([str(t.name), str(t.label)] for t in petri_net.transitions),
+        "arcs": sorted([str(a.source.name), str(a.target.name), a.weight] for a in petri_net.arcs),
+        "im": sorted([str(p.name), c] for p, c in initial_marking.items()),
+        "fm": sorted([str(p.name), c] for p, c in final_marking.items()),
+        "model_cost_function": sorted(
+            [str(t.name), c] for t, c in model_cost_function.items()) if model_cost_function is not None else None,
+        "sync_cost_function": sorted(
+            [str(t.name), c] for t, c in sync_cost_function.items()) if sync_cost_function is not None else None,
+        "trace_cost_function": list(trace_cost_function) if trace_cost_function is not None else None,
+        "variant": variant,
+        "ret_tuple_as_trans_desc": ret_tuple_as_trans_desc,
+        "enable_best_worst_cost": enable_best_worst_cost,
+        "activity_key": activity_key
+    }
+
+    return hashlib.sha256(json.dumps(description, default=str).encode(constants.DEFAULT_ENCODING)).hexdigest()
@@ -0,0 +1,253 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from typing import Optional, Dict, Any, Tuple, List, Sequence
+
+from pm4py.objects.petri_net import properties
+from pm4py.objects.petri_net.obj import PetriNet
+
+
+class LpHeuristicsCache(object):
+    """
+    Cache of the solutions of the state-equation LP, shared among the searches of the alignments of the variants
+    of a log (against the same model).
+
+    In the synchronous product net, the LP of a marking depends only on the marking of the model part and on the
+    suffix of the trace that is still to be aligned (the variables of the already consumed events are forced to 0
+    by the constraints of the trace net). Hence, the solution computed in the search of a variant can be re-used
+    (after re-indexing the variables) in the search of every variant sharing the same suffix, and in the same
+    search when the marking is reached again through a different path.
+    """
+
+    def __init__(self):
+        self.__solutions = {}
+        # the suffixes of the traces are interned as the nodes of a trie (built from the end of the traces)
+        self.__suffixes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def bind(self, sync_net: PetriNet, incidence_matrix: Any, cost_function: Dict[PetriNet.Transition, Any],
+             skip: Any) -> Optional["BoundLpHeuristicsCache"]:
+        """
+        Binds the cache to the synchronous product net of a trace
+
+        Parameters
+        ----------------
+        sync_net
+            Synchronous product net
+        incidence_matrix
+            Incidence matrix of the synchronous product net (defines the indexing of the markings and of the
+            solutions of the LP)
+        cost_function
+            Cost function of the synchronous product net
+        skip
+            Symbol used for the skips
+
+        Returns
+        ----------------
+        bound_cache
+            Cache bound to the synchronous product net (None if the synchronous product net does not follow
+            the structure expected by the cache)
+        """
+        return BoundLpHeuristicsCache.build(self, self.__solutions, self.__suffixes, sync_net, incidence_matrix,
+                                            cost_function, skip)
+
+    def clear(self):
+        """
+        Removes all the entries from the cache
+        """
+        self.__solutions.clear()
+        self.__suffixes.clear()
+
+    def __len__(self):
+        return len(self.__solutions)
+
+
+class BoundLpHeuristicsCache(object):
+    """
+    Cache of the solutions of the state-equation LP, bound to the synchronous product net of a trace
+    (see LpHeuristicsCache)
+    """
+
+    def __init__(self, cache, solutions, model_key, model_places, trace_places, transitions_keys, suffixes_ids):
+        self.__cache = cache
+        self.__solutions = solutions
+        self.__model_key = model_key
+        self.__model_places = model_places
+        self.__trace_places = trace_places
+        self.__transitions_keys = transitions_keys
+        self.__transitions_indices = {k: i for i, k in enumerate(transitions_keys)}
+        self.__suffixes_ids = suffixes_ids
+
+    @staticmethod
+    def build(cache, solutions, suffixes, sync_net, incidence_matrix, cost_function, skip):
+        places = [None] * len(incidence_matrix.places)
+        for p, i in incidence_matrix.places.items():
+            places[i] = p
+        transitions = [None] * len(incidence_matrix.transitions)
+        for t, i in incidence_matrix.transitions.items():
+            transitions[i] = t
+
+        if not all(type(x.name) is tuple and len(x.name) == 2 for x in places + transitions):
+            return None
+
+        # trace transitions are identified by their index in the trace, model transitions by their name
+        transitions_keys = []
+        positions = {}
+        for t in transitions:
+            if t.name[0] == skip:
+                transitions_keys.append((None, t.name[1]))
+            elif properties.TRACE_NET_TRANS_INDEX in t.properties:
+                index = t.properties[properties.TRACE_NET_TRANS_INDEX]
+                transitions_keys.append((index, t.name[1] if t.name[1] != skip else None))
+                if index not in positions:
+                    positions[index] = [None, None, []]
+                positions[index][0] = t.label[0]
+                if t.name[1] == skip:
+                    positions[index][1] = cost_function[t]
+                else:
+                    positions[index][2].append((str(t.name[1]), cost_function[t]))
+            else:
+                return None
+
+        if len(set(transitions_keys)) != len(transitions_keys):
+            return None
+
+        model_places = []
+        trace_places = []
+        for i, p in enumerate(places):
+            if p.name[0] == skip:
+                model_places.append((str(p.name[1]), i))
+            else:
+                index = BoundLpHeuristicsCache.__get_trace_place_index(p)
+                if index is None:
+                    return None
+                trace_places.append((index, i))
+
+        if len(set(x[0] for x in model_places)) != len(model_places):
+            return None
+        model_places = sorted(model_places)
+
+        positions_keys = []
+        for index in sorted(positions):
+            if index != len(positions_keys):
+                return None
+            positions_keys.append((positions[index][0], positions[index][1], tuple(sorted(positions[index][2]))))
+
+        suffixes_ids = [0] * (len(positions_keys) + 1)
+        for index in range(len(positions_keys) - 1, -1, -1):
+            suffix = (positions_keys[index], suffixes_ids[index + 1])
+            if suffix not in suffixes:
+                suffixes[suffix] = len(suffixes) + 1
+            suffixes_ids[index] = suffixes[suffix]
+
+        # the transitions of the model (along with their costs) are interned in the same dictionary
+        model_key = ("model", tuple(sorted((str(t.name[1]), cost_function[t]) for t in transitions
+                                           if t.name[0] == skip)))
+        if model_key not in suffixes:
+            suffixes[model_key] = len(suffixes) + 1
+        model_key = suffixes[model_key]
+
+        return BoundLpHeuristicsCache(cache, solutions, model_key, model_places, trace_places, transitions_keys,
+                                      suffixes_ids)
+
+    @staticmethod
+    def __get_trace_place_index(place):
+        if properties.TRACE_NET_PLACE_INDEX in place.properties:
+            return place.properties[properties.TRACE_NET_PLACE_INDEX]
+        for a in place.out_arcs:
+            if properties.TRACE_NET_TRANS_INDEX in a.target.properties:
+                return a.target.properties[properties.TRACE_NET_TRANS_INDEX]
+        for a in place.in_arcs:
+            if properties.TRACE_NET_TRANS_INDEX in a.source.properties:
+                return a.source.properties[properties.TRACE_NET_TRANS_INDEX] + 1
+        return None
+
+    def __get_key(self, marking: Sequence[int], fin_vec: Sequence[int]) -> Tuple[Optional[Tuple[Any, ...]], int]:
+        position = None
+        for index, i in self.__trace_places:
+            if marking[i] > 0:
+                if position is not None or marking[i] > 1:
+                    return None, 0
+                position = index
+        if position is None or position >= len(self.__suffixes_ids):
+            return None, 0
+
+        return (self.__model_key, tuple(marking[i] for name, i in self.__model_places),
+                tuple(fin_vec[i] for name, i in self.__model_places), self.__suffixes_ids[position]), position
+
+    def get(self, marking: Sequence[int], fin_vec: Sequence[int]) -> Tuple[Optional[float], Optional[List[float]]]:
+        """
+        Gets the solution of the LP for the given marking (if it is contained in the cache)
+
+        Parameters
+        ----------------
+        marking
+            Marking of the synchronous product net (vector indexed as the incidence matrix)
+        fin_vec
+            Final marking of the synchronous product net (vector indexed as the incidence matrix)
+
+        Returns
+        ----------------
+        h
+            Value of the heuristics (None if the solution is not contained in the cache)
+        x
+            Solution vector (None if the solution is not contained in the cache)
+        """
+        key, position = self.__get_key(marking, fin_vec)
+        if key is None or key not in self.__solutions:
+            self.__cache.misses += 1
+            return None, None
+
+        h, solution = self.__solutions[key]
+        x = [0.0] * len(self.__transitions_keys)
+        for (index, name), value in solution:
+            t_key = (index + position if index is not None else None, name)
+            if t_key not in self.__transitions_indices:
+                self.__cache.misses += 1
+                return None, None
+            x[self.__transitions_indices[t_key]] = value
+
+        self.__cache.hits += 1
+        return h, x
+
+    def put(self, marking: Sequence[int], fin_vec: Sequence[int], h: float, x: List[float]):
+        """
+        Stores the solution of the LP for the given marking
+
+        Parameters
+        ----------------
+        marking
+            Marking of the synchronous product net (vector indexed as the incidence matrix)
+        fin_vec
+            Final marking of the synchronous product net (vector indexed as the incidence matrix)
+        h
+            Value of the heuristics
+        x
+            Solution vector
+        """
+        key, position = self.__get_key(marking, fin_vec)
+        if key is None:
+            return
+
+        solution = []
+        for i, value in enumerate(x):
+            if value != 0:
+                index, name = self.__transitions_keys[i]
+                solution.append(((index - position if index is not None else None, name), value))
+
+        self.__solutions[key] = (h, tuple(solution))
+
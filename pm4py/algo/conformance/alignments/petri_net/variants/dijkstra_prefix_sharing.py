@@ -0,0 +1,411 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Alignments of a set of variants computed by a single Dijkstra search over the prefix trie of the variants.
+
+The states of the search are couples (node of the trie, marking of the model). Model moves keep the node, while
+log moves and synchronous moves go from a node to one of its children. Since every path reaching a node of the
+trie visits only its ancestors, the subgraph explored for a variant is exactly the synchronous product of the
+variant with the model: the costs found for the states (and hence the alignments) are optimal, and the states of a
+common prefix are expanded only once for all the variants sharing it.
+
+The search ends when the final marking has been reached in the nodes of all the variants. The states of the
+nodes whose variants are all aligned are not expanded anymore.
+"""
+import heapq
+import sys
+import time
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List, Tuple
+
+from pm4py.objects.log import obj as log_implementation
+from pm4py.objects.log.obj import Trace
+from pm4py.objects.petri_net.compiled.obj import CompiledPetriNet
+from pm4py.objects.petri_net.compiled.semantics import CompiledPetriNetSemantics
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.utils import align_utils as utils
+from pm4py.objects.trie.obj import Trie
+from pm4py.util import exec_utils
+from pm4py.util import typing
+from pm4py.util import variants_util
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+
+class Parameters(Enum):
+    PARAM_TRACE_COST_FUNCTION = 'trace_cost_function'
+    PARAM_MODEL_COST_FUNCTION = 'model_cost_function'
+    PARAM_SYNC_COST_FUNCTION = 'sync_cost_function'
+    PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE = 'ret_tuple_as_trans_desc'
+    PARAM_MAX_ALIGN_TIME_TRACE = "max_align_time_trace"
+    PARAM_MAX_ALIGN_TIME = "max_align_time"
+    PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
+    ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
+    VARIANTS_IDX = "variants_idx"
+
+
+def get_best_worst_cost(petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Gets the best worst cost of an alignment
+
+    Parameters
+    -----------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+
+    Returns
+    -----------
+    best_worst_cost
+        Best worst cost of alignment
+    """
+    if parameters is None:
+        parameters = {}
+    trace = log_implementation.Trace()
+
+    best_worst = apply(trace, petri_net, initial_marking, final_marking, parameters=parameters)
+
+    if best_worst is not None:
+        return best_worst['cost']
+
+    return None
+
+
+def apply(trace: Trace, petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> typing.AlignmentResult:
+    """
+    Performs the alignment search, given a trace and a net.
+
+    Parameters
+    ----------
+    trace: :class:`list` input trace, assumed to be a list of events (i.e. the code will use the activity key
+    to get the attributes)
+    petri_net: :class:`pm4py.objects.petri.net.PetriNet` the Petri net to use in the alignment
+    initial_marking: :class:`pm4py.objects.petri.net.Marking` initial marking in the Petri net
+    final_marking: :class:`pm4py.objects.petri.net.Marking` final marking in the Petri net
+    parameters: :class:`dict` (optional) dictionary containing one of the following:
+        Parameters.PARAM_TRACE_COST_FUNCTION: :class:`list` (parameter) mapping of each index of the trace to a positive cost value
+        Parameters.PARAM_MODEL_COST_FUNCTION: :class:`dict` (parameter) mapping of each transition in the model to corresponding
+        model cost
+        Parameters.PARAM_SYNC_COST_FUNCTION: :class:`dict` (parameter) mapping of each transition in the model to corresponding
+        synchronous costs
+        Parameters.ACTIVITY_KEY: :class:`str` (parameter) key to use to identify the activity described by the events
+
+    Returns
+    -------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    trace_cost_function = exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None)
+
+    if trace_cost_function is None:
+        trace_cost_function = list(
+            map(lambda e: utils.STD_MODEL_LOG_MOVE_COST, trace))
+        parameters[Parameters.PARAM_TRACE_COST_FUNCTION] = trace_cost_function
+
+    max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
+                                                      sys.maxsize)
+
+    return __search([tuple(x[activity_key] for x in trace)], petri_net, initial_marking, final_marking, parameters,
+                    max_align_time_trace, trace_cost_function=trace_cost_function)[0]
+
+
+def apply_variants(variants: List[Tuple[str, ...]], petri_net: PetriNet, initial_marking: Marking,
+                   final_marking: Marking, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> typing.ListAlignments:
+    """
+    Aligns a list of variants with a single search over their prefix trie
+    (the standard cost is assigned to the log moves)
+
+    Parameters
+    ----------------
+    variants
+        List of variants (tuples of activities)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, except the trace cost function). The
+        Parameters.PARAM_MAX_ALIGN_TIME parameter limits the duration of the whole search
+
+    Returns
+    ----------------
+    alignments
+        List of alignments (one per variant, None if the variant could not be aligned in the given time)
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_align_time = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters, sys.maxsize)
+
+    return __search(variants, petri_net, initial_marking, final_marking, parameters, max_align_time)
+
+
+def apply_from_variant(variant, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a single variant
+
+    Parameters
+    -------------
+    variant
+        Variant (as string delimited by the "variant_delimiter" parameter)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    ------------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    if parameters is None:
+        parameters = {}
+    trace = variants_util.variant_to_trace(variant, parameters=parameters)
+
+    return apply(trace, petri_net, initial_marking, final_marking, parameters=parameters)
+
+
+def apply_from_variants_dictionary(var_dictio, petri_net, initial_marking, final_marking, parameters=None):
+    return apply_from_variants_list([(v,) for v in var_dictio], petri_net, initial_marking, final_marking,
+                                    parameters=parameters)
+
+
+def apply_from_variants_list(var_list, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a list of variants in the log
+    (all the variants are aligned together, see apply_variants)
+
+    Parameters
+    -------------
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    variants = [varitem[0] for varitem in var_list]
+    traces = [variants_util.variant_to_trace(variant, parameters=parameters) for variant in variants]
+    alignments = apply_variants([tuple(x[activity_key] for x in trace) for trace in traces], petri_net,
+                                initial_marking, final_marking, parameters=parameters)
+
+    return {variant: alignment for variant, alignment in zip(variants, alignments)}
+
+
+def __build_trie(variants):
+    root = Trie()
+    nodes = [root]
+    node_indices = {root: 0}
+    ends = {}
+
+    for i, variant in enumerate(variants):
+        node = root
+        for j, activity in enumerate(variant):
+            child = None
+            for c in node.children:
+                if c.label == activity:
+                    child = c
+                    break
+            if child is None:
+                child = Trie(label=activity, parent=node, depth=node.depth + 1)
+                node.children.append(child)
+                node_indices[child] = len(nodes)
+                nodes.append(child)
+            node = child
+        node.final = True
+        if node_indices[node] not in ends:
+            ends[node_indices[node]] = []
+        ends[node_indices[node]].append(i)
+
+    return nodes, node_indices, ends
+
+
+def __search(variants, petri_net, initial_marking, final_marking, parameters, max_align_time, trace_cost_function=None):
+    start_time = time.time()
+
+    ret_tuple_as_trans_desc = exec_utils.get_param_value(Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE,
+                                                         parameters, False)
+    model_cost_function = exec_utils.get_param_value(Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None)
+    sync_cost_function = exec_utils.get_param_value(Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None)
+
+    cnet = CompiledPetriNet(petri_net)
+    transitions = cnet.transitions
+    if model_cost_function is None or sync_cost_function is None:
+        model_costs = [utils.STD_MODEL_LOG_MOVE_COST if t.label is not None else utils.STD_TAU_COST for t in
+                       transitions]
+        sync_costs = [utils.STD_SYNC_COST for t in transitions]
+    else:
+        model_costs = [model_cost_function[t] for t in transitions]
+        sync_costs = [sync_cost_function[t] if t in sync_cost_function else utils.STD_SYNC_COST for t in
+                      transitions]
+    label_transitions = {}
+    for i, t in enumerate(transitions):
+        if t.label is not None:
+            if t.label not in label_transitions:
+                label_transitions[t.label] = []
+            label_transitions[t.label].append(i)
+
+    nodes, node_indices, ends = __build_trie(variants)
+    # cost of the log move of the event associated to each node of the trie
+    if trace_cost_function is not None:
+        # single variant with a custom cost for each event
+        log_move_costs = [0] + list(trace_cost_function)
+    else:
+        log_move_costs = [utils.STD_MODEL_LOG_MOVE_COST] * len(nodes)
+    children = [[(node_indices[c], c.label) for c in node.children] for node in nodes]
+    parents = [node_indices[node.parent] if node.parent is not None else None for node in nodes]
+
+    # number of variants (ending in the subtree of the node) that are not yet aligned
+    remaining = [0] * len(nodes)
+    for n, var_idxs in ends.items():
+        while n is not None:
+            remaining[n] += len(var_idxs)
+            n = parents[n]
+
+    # static (consistent) heuristics: the minimum cost of the log moves that are unavoidable in the subtree
+    # of the node, i.e., of the events whose activity is not the label of any transition of the model
+    heuristics = [0] * len(nodes)
+    for n in range(len(nodes) - 1, -1, -1):
+        h = 0 if n in ends else sys.maxsize
+        for c, label in children[n]:
+            h = min(h, heuristics[c] + (log_move_costs[c] if label not in label_transitions else 0))
+        heuristics[n] = h
+
+    fin = cnet.encode_marking(final_marking)
+    ini = cnet.encode_marking(initial_marking)
+
+    alignments = [None] * len(variants)
+    closed = set()
+    visited = 0
+    queued = 0
+    traversed = 0
+    counter = 0
+
+    # each entry of the heap: (f, -number of moves, counter, g, node, marking, back-pointer)
+    # where the back-pointer is a tuple (back-pointer of the parent, move)
+    open_set = [(heuristics[0], 0, counter, 0, 0, ini, None)]
+
+    while open_set:
+        if (time.time() - start_time) > max_align_time:
+            break
+
+        f, neg_l, _, g, n, m, back = heapq.heappop(open_set)
+
+        if remaining[n] == 0 or (n, m) in closed:
+            continue
+
+        closed.add((n, m))
+        visited += 1
+
+        if m == fin and n in ends:
+            for var_idx in ends[n]:
+                alignments[var_idx] = __reconstruct_alignment(back, g, transitions, nodes, visited, queued,
+                                                              traversed, ret_tuple_as_trans_desc)
+            p = n
+            while p is not None:
+                remaining[p] -= len(ends[n])
+                p = parents[p]
+            del ends[n]
+            if remaining[0] == 0:
+                break
+            if remaining[n] == 0:
+                continue
+
+        # model moves
+        for t in CompiledPetriNetSemantics.enabled_transitions(cnet, m):
+            traversed += 1
+            new_m = CompiledPetriNetSemantics.fire(cnet, t, m)
+            if (n, new_m) not in closed:
+                queued += 1
+                counter += 1
+                new_g = g + model_costs[t]
+                heapq.heappush(open_set, (new_g + heuristics[n], neg_l - 1, counter, new_g, n, new_m,
+                                          (back, (None, t))))
+
+        # log moves and synchronous moves (towards the children of the current node)
+        for c, label in children[n]:
+            if remaining[c] == 0:
+                continue
+            moves = [(None, m, log_move_costs[c])]
+            if label in label_transitions:
+                for t in label_transitions[label]:
+                    if CompiledPetriNetSemantics.is_enabled(cnet, t, m):
+                        moves.append((t, CompiledPetriNetSemantics.fire(cnet, t, m), sync_costs[t]))
+            for t, new_m, cost in moves:
+                traversed += 1
+                if (c, new_m) not in closed:
+                    queued += 1
+                    counter += 1
+                    new_g = g + cost
+                    heapq.heappush(open_set, (new_g + heuristics[c], neg_l - 1, counter, new_g, c, new_m,
+                                              (back, (c, t))))
+
+    return alignments
+
+
+def __reconstruct_alignment(back, g, transitions, nodes, visited, queued, traversed, ret_tuple_as_trans_desc):
+    moves = []
+    while back is not None:
+        back, move = back
+        moves.append(move)
+    moves.reverse()
+
+    alignment = []
+    for c, t in moves:
+        if c is None:
+            # model move
+            name = (utils.SKIP, transitions[t].name)
+            label = (utils.SKIP, transitions[t].label)
+        else:
+            activity = nodes[c].label
+            trace_name = "t_" + str(activity) + "_" + str(nodes[c].depth - 1)
+            if t is None:
+                # log move
+                name = (trace_name, utils.SKIP)
+                label = (activity, utils.SKIP)
+            else:
+                # synchronous move
+                name = (trace_name, transitions[t].name)
+                label = (activity, transitions[t].label)
+        alignment.append((name, label) if ret_tuple_as_trans_desc else label)
+
+    return {'alignment': alignment, 'cost': g, 'visited_states': visited, 'queued_states': queued,
+            'traversed_arcs': traversed, 'lp_solved': 0}
@@ -36,12 +36,14 @@ from enum import Enum
 
 import numpy as np
 
+from pm4py.algo.conformance.alignments.petri_net.utils.lp_heuristics import LpHeuristicsCache
 from pm4py.objects.log import obj as log_implementation
 from pm4py.objects.petri_net.utils import align_utils as utils
 from pm4py.objects.petri_net.utils.incidence_matrix import construct as inc_mat_construct
 from pm4py.objects.petri_net.utils.synchronous_product import construct_cost_aware, construct
-from pm4py.objects.petri_net.utils.petri_utils import construct_trace_net_cost_aware, decorate_places_preset_trans, \
-    decorate_transitions_prepostset
+from pm4py.objects.petri_net.utils.petri_utils import construct_trace_net_cost_aware
+from pm4py.objects.petri_net.compiled.obj import CompiledPetriNet
+from pm4py.objects.petri_net.compiled.semantics import CompiledPetriNetSemantics
 from pm4py.util import exec_utils
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
 from pm4py.util.lp import solver as lp_solver
@@ -67,6 +69,7 @@ class Parameters(Enum):
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
     RETURN_SYNC_COST_FUNCTION = "return_sync_cost_function"
+    LP_HEURISTICS_CACHE = "lp_heuristics_cache"
 
 
 PARAM_TRACE_COST_FUNCTION = Parameters.PARAM_TRACE_COST_FUNCTION.value
@@ -375,10 +378,11 @@ def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_
 
     max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
                                                       sys.maxsize)
+    lp_heuristics_cache = exec_utils.get_param_value(Parameters.LP_HEURISTICS_CACHE, parameters, None)
 
     alignment = apply_sync_prod(sync_prod, sync_initial_marking, sync_final_marking, cost_function,
                            utils.SKIP, ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
-                           max_align_time_trace=max_align_time_trace)
+                           max_align_time_trace=max_align_time_trace, lp_heuristics_cache=lp_heuristics_cache)
 
     return_sync_cost = exec_utils.get_param_value(Parameters.RETURN_SYNC_COST_FUNCTION, parameters, False)
     if return_sync_cost:
@@ -389,7 +393,7 @@ def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_
 
 
 def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, skip, ret_tuple_as_trans_desc=False,
-                    max_align_time_trace=sys.maxsize):
+                    max_align_time_trace=sys.maxsize, lp_heuristics_cache=None):
     """
     Performs the basic alignment search on top of the synchronous product net, given a cost function and skip-symbol
 
@@ -400,6 +404,8 @@ def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, sk
     final_marking: :class:`pm4py.objects.petri.net.Marking` final marking in the synchronous product net
     cost_function: :class:`dict` cost function mapping transitions to the synchronous product net
     skip: :class:`Any` symbol to use for skips in the alignment
+    lp_heuristics_cache: :class:`LpHeuristicsCache` (optional) cache of the solutions of the LP, shared among
+    the alignments of the variants of a log
 
     Returns
     -------
@@ -407,16 +413,17 @@ def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, sk
     and **traversed_arcs**
     """
     return __search(sync_prod, initial_marking, final_marking, cost_function, skip,
-                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time_trace=max_align_time_trace)
+                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time_trace=max_align_time_trace,
+                    lp_heuristics_cache=lp_heuristics_cache)
 
 
 def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=False,
-             max_align_time_trace=sys.maxsize):
+             max_align_time_trace=sys.maxsize, lp_heuristics_cache=None):
     start_time = time.time()
 
-    decorate_transitions_prepostset(sync_net)
-    decorate_places_preset_trans(sync_net)
-
+    # the search is done on the compiled synchronous product net (markings are tuples of integers),
+    # which shares the indexing of places and transitions with the incidence matrix
+    cnet = CompiledPetriNet(sync_net)
     incidence_matrix = inc_mat_construct(sync_net)
     ini_vec, fin_vec, cost_vec = utils.__vectorize_initial_final_cost(incidence_matrix, ini, fin, cost_function)
 
@@ -440,19 +447,30 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
         h_cvx = matrix(h_cvx)
         cost_vec = matrix(cost_vec)
 
-    h, x = utils.__compute_exact_heuristic_new_version(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, incidence_matrix,
-                                                       ini,
-                                                       fin_vec, lp_solver.DEFAULT_LP_SOLVER_VARIANT,
-                                                       use_cvxopt=use_cvxopt)
+    # the solutions of the LP are re-used when the same marking (or, across the variants of a log, a marking
+    # with the same model part and the same suffix of the trace) is reached again
+    if lp_heuristics_cache is None:
+        lp_heuristics_cache = LpHeuristicsCache()
+    lp_heuristics_cache = lp_heuristics_cache.bind(sync_net, incidence_matrix, cost_function, skip)
+
+    ini = cnet.encode_marking(ini)
+    fin = cnet.encode_marking(fin)
+
+    lp_solved = 0
+    h, x, solved = __get_exact_heuristic(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, incidence_matrix, cnet, ini,
+                                         fin_vec, use_cvxopt, lp_heuristics_cache)
+    lp_solved += solved
     ini_state = utils.SearchTuple(0 + h, 0, h, ini, None, None, x, True)
     open_set = [ini_state]
     heapq.heapify(open_set)
     visited = 0
     queued = 0
     traversed = 0
-    lp_solved = 1
 
-    trans_empty_preset = set(t for t in sync_net.transitions if len(t.in_arcs) == 0)
+    # transitions of the synchronous product that are neither a log move nor a model move are never fired
+    transitions = cnet.transitions
+    costs = [cost_function[t] for t in transitions]
+    allowed = [not (utils.__is_log_move(t, skip) and utils.__is_model_move(t, skip)) for t in transitions]
 
     while not len(open_set) == 0:
         if (time.time() - start_time) > max_align_time_trace:
@@ -472,11 +490,9 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
                 current_marking = curr.m
                 continue
 
-            h, x = utils.__compute_exact_heuristic_new_version(sync_net, a_matrix, h_cvx, g_matrix, cost_vec,
-                                                               incidence_matrix, curr.m,
-                                                               fin_vec, lp_solver.DEFAULT_LP_SOLVER_VARIANT,
-                                                               use_cvxopt=use_cvxopt)
-            lp_solved += 1
+            h, x, solved = __get_exact_heuristic(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, incidence_matrix,
+                                                 cnet, curr.m, fin_vec, use_cvxopt, lp_heuristics_cache)
+            lp_solved += solved
 
             # 11/10/19: shall not a state for which we compute the exact heuristics be
             # by nature a trusted solution?
@@ -506,22 +522,17 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
         closed.add(current_marking)
         visited += 1
 
-        enabled_trans = copy(trans_empty_preset)
-        for p in current_marking:
-            for t in p.ass_trans:
-                if t.sub_marking <= current_marking:
-                    enabled_trans.add(t)
-
-        trans_to_visit_with_cost = [(t, cost_function[t]) for t in enabled_trans if not (
-                t is not None and utils.__is_log_move(t, skip) and utils.__is_model_move(t, skip))]
+        for t_idx in CompiledPetriNetSemantics.enabled_transitions(cnet, current_marking):
+            if not allowed[t_idx]:
+                continue
 
-        for t, cost in trans_to_visit_with_cost:
             traversed += 1
-            new_marking = utils.add_markings(current_marking, t.add_marking)
+            new_marking = CompiledPetriNetSemantics.fire(cnet, t_idx, current_marking)
 
             if new_marking in closed:
                 continue
-            g = curr.g + cost
+            t = transitions[t_idx]
+            g = curr.g + costs[t_idx]
 
             queued += 1
             h, x = utils.__derive_heuristic(incidence_matrix, cost_vec, curr.x, t, curr.h)
@@ -530,3 +541,19 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
 
             tp = utils.SearchTuple(new_f, g, h, new_marking, curr, t, x, trustable)
             heapq.heappush(open_set, tp)
+
+
+def __get_exact_heuristic(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, incidence_matrix, cnet, marking, fin_vec,
+                          use_cvxopt, lp_heuristics_cache):
+    if lp_heuristics_cache is not None:
+        h, x = lp_heuristics_cache.get(marking, fin_vec)
+        if h is not None:
+            return h, x, 0
+
+    h, x = utils.__compute_exact_heuristic_new_version(sync_net, a_matrix, h_cvx, g_matrix, cost_vec, incidence_matrix,
+                                                       cnet.decode_marking(marking), fin_vec,
+                                                       lp_solver.DEFAULT_LP_SOLVER_VARIANT, use_cvxopt=use_cvxopt)
+    if lp_heuristics_cache is not None:
+        lp_heuristics_cache.put(marking, fin_vec, h, x)
+
+    return h, x, 1
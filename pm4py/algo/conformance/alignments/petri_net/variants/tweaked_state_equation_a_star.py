@@ -22,6 +22,7 @@ from enum import Enum
 
 from pm4py import util as pm4pyutil
 from pm4py.algo.analysis.marking_equation.variants import classic as marking_equation
+from pm4py.algo.conformance.alignments.petri_net.utils.lp_heuristics import LpHeuristicsCache
 from pm4py.objects.log import obj as log_implementation
 from pm4py.objects.petri_net.utils import align_utils as utils
 from pm4py.objects.petri_net.utils.incidence_matrix import construct as inc_mat_construct
@@ -53,6 +54,7 @@ class Parameters(Enum):
     PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
+    LP_HEURISTICS_CACHE = "lp_heuristics_cache"
 
 
 PARAM_TRACE_COST_FUNCTION = Parameters.PARAM_TRACE_COST_FUNCTION.value
@@ -367,20 +369,22 @@ def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_
 
     max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
                                                       sys.maxsize)
+    lp_heuristics_cache = exec_utils.get_param_value(Parameters.LP_HEURISTICS_CACHE, parameters, None)
 
     return apply_sync_prod(sync_prod, sync_initial_marking, sync_final_marking, cost_function,
                            utils.SKIP, ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
-                           max_align_time_trace=max_align_time_trace)
+                           max_align_time_trace=max_align_time_trace, lp_heuristics_cache=lp_heuristics_cache)
 
 
 def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, skip, ret_tuple_as_trans_desc=False,
-                    max_align_time_trace=sys.maxsize):
+                    max_align_time_trace=sys.maxsize, lp_heuristics_cache=None):
     return __search(sync_prod, initial_marking, final_marking, cost_function, skip,
-                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time_trace=max_align_time_trace)
+                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time_trace=max_align_time_trace,
+                    lp_heuristics_cache=lp_heuristics_cache)
 
 
 def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=False,
-             max_align_time_trace=sys.maxsize):
+             max_align_time_trace=sys.maxsize, lp_heuristics_cache=None):
     start_time = time.time()
 
     decorate_transitions_prepostset(sync_net)
@@ -403,8 +407,13 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
     queued = 0
     traversed = 0
     me = marking_equation.build(sync_net, ini, fin, parameters=parameters)
-    h, x = me.solve()
-    lp_solved = 1
+
+    # the solutions of the marking equation are re-used across the variants of a log
+    if lp_heuristics_cache is None:
+        lp_heuristics_cache = LpHeuristicsCache()
+    lp_heuristics_cache = lp_heuristics_cache.bind(sync_net, incidence_matrix, cost_function, skip)
+
+    h, x, lp_solved = __solve_marking_equation(me, incidence_matrix, ini, fin_vec, lp_heuristics_cache)
 
     # try to see if the firing sequence is already fine
     firing_sequence, reach_fm, explained_events = me.get_firing_sequence(x)
@@ -460,12 +469,11 @@ def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=Fa
                 current_marking = curr.m
                 continue
 
-            me.change_ini_vec(curr.m)
-            h, x = me.solve()
+            h, x, solved = __solve_marking_equation(me, incidence_matrix, curr.m, fin_vec, lp_heuristics_cache)
 
             __update_heu_dict_specific_point(heu_dict, heu_max_ind_dict, mm, index, h, x)
 
-            lp_solved += 1
+            lp_solved += solved
             tp = utils.TweakedSearchTuple(curr.g + h, curr.g, h, curr.m, curr.p, curr.t, x, True, True)
             curr = heapq.heappushpop(open_set, tp)
             current_marking = curr.m
@@ -593,6 +601,25 @@ def __update_heu_dict_specific_point(heu_dict, heu_max_ind_dict, mm, index, h, x
     heu_max_ind_dict[mm] = max(heu_max_ind_dict[mm], index)
 
 
+def __solve_marking_equation(me, incidence_matrix, marking, fin_vec, lp_heuristics_cache):
+    """
+    Solves the marking equation in the given marking, re-using the solution stored in the cache
+    (if available)
+    """
+    m_vec = incidence_matrix.encode_marking(marking)
+    if lp_heuristics_cache is not None:
+        h, x = lp_heuristics_cache.get(m_vec, fin_vec)
+        if h is not None:
+            return h, [int(y) for y in x], 0
+
+    me.change_ini_vec(marking)
+    h, x = me.solve()
+    if lp_heuristics_cache is not None and h is not None:
+        lp_heuristics_cache.put(m_vec, fin_vec, h, x)
+
+    return h, x, 1
+
+
 def __get_heu_from_dict(heu_dict, heu_max_ind_dict, mm, index):
     """
     Retrieves a value for an heuristics that has already been calculated,
@@ -14,7 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.conformance.tokenreplay.variants import token_replay, backwards
+from pm4py.algo.conformance.tokenreplay.variants import token_replay, backwards, batched
 from enum import Enum
 from pm4py.util import exec_utils
 from typing import Optional, Dict, Any, Union
@@ -27,8 +27,9 @@ from pm4py.util import typing
 class Variants(Enum):
     TOKEN_REPLAY = token_replay
     BACKWARDS = backwards
+    BATCHED = batched
 
-VERSIONS = {Variants.TOKEN_REPLAY, Variants.BACKWARDS}
+VERSIONS = {Variants.TOKEN_REPLAY, Variants.BACKWARDS, Variants.BATCHED}
 DEFAULT_VARIANT = Variants.TOKEN_REPLAY
 
 
@@ -53,6 +54,7 @@ def apply(log: Union[EventLog, EventStream, pd.DataFrame], net: PetriNet, initia
         Variant of the algorithm to use:
             - Variants.TOKEN_REPLAY
             - Variants.BACKWARDS
+            - Variants.BATCHED
     """
     if parameters is None:
         parameters = {}
@@ -74,6 +76,7 @@ def get_diagnostics_dataframe(log: Union[EventLog, EventStream, pd.DataFrame], t
         Variant of the algorithm to use:
             - Variants.TOKEN_REPLAY
             - Variants.BACKWARDS
+            - Variants.BATCHED
 
     Returns
     --------------
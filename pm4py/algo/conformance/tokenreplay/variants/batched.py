@@ -0,0 +1,402 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Batched token-based replay.
+
+All the variants of the log are replayed simultaneously: the markings of the variants are the rows of an integer
+matrix, and at each step the pre/post matrices of the fired transitions (one per variant) are gathered from the
+compiled Petri net, the missing tokens are added where needed, and the incidence of the transitions is applied.
+
+The invisible transitions are handled as in the classic token-based replay: when the transition of an event is not
+enabled, the classic walk through the invisible transitions is attempted, and at the end of the replay the classic
+procedure to reach the final marking through invisible transitions is applied. Both depend only on the current
+marking, hence they are computed once per distinct (marking, transition) and marking, and shared among the variants.
+
+The approach returns the same diagnostics as the classic token-based replay when every visible label is associated
+with exactly one transition (e.g., the Petri nets discovered by the inductive miner). For the other Petri nets
+(and for the options that require the classic replay, such as the place/transition level fitness), the computation
+is delegated to the classic token-based replay.
+"""
+import warnings
+from copy import copy
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.conformance.tokenreplay.variants import token_replay
+from pm4py.objects.conversion.log import converter as log_converter
+from pm4py.objects.log.obj import EventLog
+from pm4py.objects.petri_net.compiled.obj import CompiledPetriNet
+from pm4py.objects.petri_net.compiled.semantics import CompiledPetriNetSemantics
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.utils import align_utils
+from pm4py.objects.petri_net.utils.petri_utils import get_places_shortest_path_by_hidden
+from pm4py.util import exec_utils, constants, pandas_utils, typing
+from pm4py.util import xes_constants as xes_util
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    RETURN_NAMES = "return_names"
+    STOP_IMMEDIATELY_UNFIT = "stop_immediately_unfit"
+    CLEANING_TOKEN_FLOOD = "cleaning_token_flood"
+    CONSIDER_REMAINING_IN_FITNESS = "consider_remaining_in_fitness"
+    CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS = "consider_activities_not_in_model_in_fitness"
+    ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
+    WALK_THROUGH_HIDDEN_TRANS = "walk_through_hidden_trans"
+    TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN = "try_to_reach_final_marking_through_hidden"
+    BATCH_SIZE = "batch_size"
+
+
+def is_applicable(net: PetriNet) -> bool:
+    """
+    Checks if the batched token-based replay can be applied on the given Petri net
+    (every visible label is associated with exactly one transition)
+
+    Parameters
+    ----------------
+    net
+        Petri net
+
+    Returns
+    ----------------
+    boolean
+        Boolean value
+    """
+    labels = [t.label for t in net.transitions if t.label is not None]
+    return len(labels) == len(set(labels))
+
+
+def apply(log: Union[EventLog, pd.DataFrame], net: PetriNet, initial_marking: Marking, final_marking: Marking,
+          parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> typing.ListAlignments:
+    """
+    Applies the batched token-based replay
+
+    Parameters
+    ----------------
+    log
+        Event log / Pandas dataframe
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm, including:
+            - Parameters.ACTIVITY_KEY => the attribute of the log to be used as activity
+            - Parameters.CASE_ID_KEY => the attribute of the dataframe to be used as case identifier
+            - Parameters.CONSIDER_REMAINING_IN_FITNESS => considers the remaining tokens in the fitness of the trace
+            - Parameters.RETURN_NAMES => returns the names of the transitions/places instead of the objects
+            - Parameters.WALK_THROUGH_HIDDEN_TRANS => walks through the invisible transitions to enable the visible ones
+            - Parameters.TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN => tries to reach the final marking through the
+            invisible transitions at the end of the replay
+            - Parameters.BATCH_SIZE => number of variants that are replayed together (default: 10000)
+
+    Returns
+    ----------------
+    replay_results
+        List of dictionaries (one per case) containing the results of the token-based replay
+    """
+    if parameters is None:
+        parameters = {}
+
+    enable_pltr_fitness = exec_utils.get_param_value(Parameters.ENABLE_PLTR_FITNESS, parameters, False)
+    stop_immediately_unfit = exec_utils.get_param_value(Parameters.STOP_IMMEDIATELY_UNFIT, parameters, False)
+    cleaning_token_flood = exec_utils.get_param_value(Parameters.CLEANING_TOKEN_FLOOD, parameters, False)
+    consider_activities_not_in_model_in_fitness = exec_utils.get_param_value(
+        Parameters.CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS, parameters, False)
+
+    if not is_applicable(net) or enable_pltr_fitness or stop_immediately_unfit or cleaning_token_flood or \
+            consider_activities_not_in_model_in_fitness:
+        if constants.SHOW_INTERNAL_WARNINGS:
+            warnings.warn(
+                "the batched token-based replay is not applicable on the given Petri net/options. Falling back to the classic token-based replay.")
+        return token_replay.apply(log, net, initial_marking, final_marking, parameters=parameters)
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    consider_remaining_in_fitness = exec_utils.get_param_value(Parameters.CONSIDER_REMAINING_IN_FITNESS, parameters,
+                                                               True)
+    return_names = exec_utils.get_param_value(Parameters.RETURN_NAMES, parameters, False)
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 10000)
+    walk_through_hidden_trans = exec_utils.get_param_value(Parameters.WALK_THROUGH_HIDDEN_TRANS, parameters, True)
+    try_to_reach_final_marking_through_hidden = exec_utils.get_param_value(
+        Parameters.TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN, parameters, True)
+
+    if pandas_utils.check_is_pandas_dataframe(log):
+        traces = [tuple(x) for x in log.groupby(case_id_key)[activity_key].agg(list).to_dict().values()]
+    else:
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
+        traces = [tuple(x[activity_key] for x in trace) for trace in log]
+
+    variants_idx = {}
+    for trace in traces:
+        if trace not in variants_idx:
+            variants_idx[trace] = len(variants_idx)
+    variants = list(variants_idx)
+
+    cnet = CompiledPetriNet(net)
+    results = apply_variants(variants, cnet, initial_marking, final_marking,
+                             consider_remaining_in_fitness=consider_remaining_in_fitness,
+                             return_names=return_names, batch_size=batch_size,
+                             walk_through_hidden_trans=walk_through_hidden_trans,
+                             try_to_reach_final_marking_through_hidden=try_to_reach_final_marking_through_hidden)
+
+    return [results[variants_idx[trace]] for trace in traces]
+
+
+def apply_variants(variants: List[Tuple[str, ...]], cnet: CompiledPetriNet, initial_marking: Marking,
+                   final_marking: Marking, consider_remaining_in_fitness: bool = True, return_names: bool = False,
+                   batch_size: int = 10000, walk_through_hidden_trans: bool = True,
+                   try_to_reach_final_marking_through_hidden: bool = True) -> List[Dict[str, Any]]:
+    """
+    Replays a list of variants on a compiled Petri net (with unique visible labels)
+
+    Parameters
+    ----------------
+    variants
+        List of variants (tuples of activities)
+    cnet
+        Compiled Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    consider_remaining_in_fitness
+        Considers the remaining tokens in the fitness of the trace
+    return_names
+        Returns the names of the transitions/places instead of the objects
+    batch_size
+        Number of variants that are replayed together
+    walk_through_hidden_trans
+        Walks through the invisible transitions to enable the visible ones
+    try_to_reach_final_marking_through_hidden
+        Tries to reach the final marking through the invisible transitions at the end of the replay
+
+    Returns
+    ----------------
+    replay_results
+        List of dictionaries (one per variant) containing the results of the token-based replay
+    """
+    label_to_transition = {t.label: i for i, t in enumerate(cnet.transitions) if t.label is not None}
+    im_vec = np.array(cnet.encode_marking(initial_marking), dtype=np.int64)
+    fm_vec = np.array(cnet.encode_marking(final_marking), dtype=np.int64)
+
+    has_hidden = any(t.label is None for t in cnet.transitions)
+    hidden = None
+    if has_hidden and (walk_through_hidden_trans or
+                       try_to_reach_final_marking_through_hidden):
+        # the results of the classic procedures on the invisible transitions are shared among the batches
+        hidden = {"walk": walk_through_hidden_trans, "reach_final": try_to_reach_final_marking_through_hidden,
+                  "final_marking": final_marking, "walk_cache": {}, "reach_final_cache": {},
+                  "places_shortest_path_by_hidden": get_places_shortest_path_by_hidden(
+                      cnet.net, token_replay.TechnicalParameters.MAX_REC_DEPTH.value)}
+
+    # the variants are replayed in batches of variants having similar length
+    order = sorted(range(len(variants)), key=lambda i: len(variants[i]))
+    results = [None] * len(variants)
+
+    for start in range(0, len(order), batch_size):
+        batch = order[start:start + batch_size]
+        # matrix of the fired transitions (-1: padding or activity not contained in the model)
+        fired = np.full((len(batch), max(1, max(len(variants[i]) for i in batch))), -1, dtype=np.int64)
+        for row, i in enumerate(batch):
+            fired[row, :len(variants[i])] = [label_to_transition.get(act, -1) for act in variants[i]]
+
+        markings, problems, missing, remaining, consumed, produced, is_fit, fitness, hidden_fired = __replay_batch(
+            cnet, fired, im_vec, fm_vec, consider_remaining_in_fitness, hidden)
+        # the enabled transitions are computed once per distinct reached marking
+        reached_markings, reached_idx = np.unique(markings, axis=0, return_inverse=True)
+        if has_hidden:
+            # as in the classic token-based replay, the visible transitions that can be enabled by firing
+            # invisible transitions are reported
+            enabled = [align_utils.get_visible_transitions_eventually_enabled_by_marking(
+                cnet.net, cnet.decode_marking(m.tolist())) for m in reached_markings]
+        else:
+            enabled = [{cnet.transitions[t] for t in np.nonzero(x)[0]} for x in
+                       CompiledPetriNetSemantics.enabled_transitions_matrix(cnet, reached_markings)]
+        reached_idx = reached_idx.reshape(-1)
+
+        for row, i in enumerate(batch):
+            results[i] = __transcribe_result(cnet, fired[row], hidden_fired.get(row, {}), problems[row], markings[row],
+                                             enabled[reached_idx[row]],
+                                             bool(is_fit[row]), float(fitness[row]), int(missing[row]),
+                                             int(consumed[row]), int(remaining[row]), int(produced[row]),
+                                             return_names)
+
+    return results
+
+
+def __walk_hidden(cnet, hidden, marking, t):
+    """
+    Applies the classic walk through the invisible transitions to enable the given transition
+    (the result depends only on the marking and the transition)
+    """
+    key = (marking.tobytes(), t)
+    if key not in hidden["walk_cache"]:
+        new_marking, fired = token_replay.apply_hidden_trans(cnet.transitions[t], cnet.net,
+                                                             cnet.decode_marking(marking.tolist()),
+                                                             hidden["places_shortest_path_by_hidden"], [], 0, set(),
+                                                             [])[1:3]
+        hidden["walk_cache"][key] = (np.array(cnet.encode_marking(new_marking), dtype=np.int64),
+                                     [cnet.encode_transition(x) for x in fired])
+    return hidden["walk_cache"][key]
+
+
+def __reach_final_marking(cnet, hidden, marking):
+    """
+    Applies the classic procedure to reach the final marking through the invisible transitions
+    (the result depends only on the marking)
+    """
+    key = marking.tobytes()
+    if key not in hidden["reach_final_cache"]:
+        new_marking, fired = token_replay.reach_final_marking_through_hidden(
+            cnet.net, cnet.decode_marking(marking.tolist()), hidden["final_marking"],
+            hidden["places_shortest_path_by_hidden"])
+        hidden["reach_final_cache"][key] = (np.array(cnet.encode_marking(new_marking), dtype=np.int64),
+                                            [cnet.encode_transition(x[0]) for x in fired])
+    return hidden["reach_final_cache"][key]
+
+
+def __replay_batch(cnet, fired, im_vec, fm_vec, consider_remaining_in_fitness, hidden):
+    pre_matrix = cnet.pre_matrix
+    post_matrix = cnet.post_matrix
+    pre_sum = pre_matrix.sum(axis=1)
+    post_sum = post_matrix.sum(axis=1)
+
+    num_variants = fired.shape[0]
+    markings = np.tile(im_vec, (num_variants, 1))
+    problems = np.zeros(fired.shape, dtype=bool)
+    missing = np.zeros(num_variants, dtype=np.int64)
+    consumed = np.zeros(num_variants, dtype=np.int64)
+    produced = np.full(num_variants, im_vec.sum(), dtype=np.int64)
+    # invisible transitions fired by the variants (variant -> step -> transitions, -1 for the end of the replay)
+    hidden_fired = {}
+
+    for step in range(fired.shape[1]):
+        rows = np.nonzero(fired[:, step] >= 0)[0]
+        if len(rows) == 0:
+            continue
+        trans = fired[rows, step]
+        pre = pre_matrix[trans]
+        current = markings[rows]
+        lacking = current < pre
+        if hidden is not None and hidden["walk"]:
+            blocked = np.nonzero(lacking.any(axis=1))[0]
+            for k in blocked:
+                new_marking, walk = __walk_hidden(cnet, hidden, current[k], trans[k])
+                if walk:
+                    current[k] = new_marking
+                    consumed[rows[k]] += pre_sum[walk].sum()
+                    produced[rows[k]] += post_sum[walk].sum()
+                    hidden_fired.setdefault(rows[k], {})[step] = walk
+            if len(blocked) > 0:
+                lacking = current < pre
+        step_missing = np.where(lacking, pre - current, 0).sum(axis=1)
+        problems[rows, step] = step_missing > 0
+        missing[rows] += step_missing
+        consumed[rows] += pre_sum[trans]
+        produced[rows] += post_sum[trans]
+        # as in the classic token-based replay, the whole weight of the arc is added to the places lacking tokens
+        markings[rows] = current + np.where(lacking, pre, 0) - pre + post_matrix[trans]
+
+    if hidden is not None and hidden["reach_final"]:
+        reached_markings, reached_idx = np.unique(markings, axis=0, return_inverse=True)
+        reached_idx = reached_idx.reshape(-1)
+        for j in range(len(reached_markings)):
+            new_marking, walk = __reach_final_marking(cnet, hidden, reached_markings[j])
+            if walk:
+                rows = np.nonzero(reached_idx == j)[0]
+                markings[rows] = new_marking
+                consumed[rows] += pre_sum[walk].sum()
+                produced[rows] += post_sum[walk].sum()
+                for row in rows:
+                    hidden_fired.setdefault(row, {})[-1] = walk
+
+    remaining = np.maximum(markings - fm_vec, 0).sum(axis=1)
+    if consider_remaining_in_fitness:
+        is_fit = (missing == 0) & (remaining == 0)
+    else:
+        is_fit = missing == 0
+
+    consumed += fm_vec.sum()
+    missing += np.maximum(fm_vec - markings, 0).sum(axis=1)
+
+    fitness = np.ones(num_variants, dtype=np.float64)
+    mask = (consumed > 0) & (produced > 0)
+    fitness[mask] = 0.5 * (1.0 - missing[mask] / consumed[mask]) + 0.5 * (1.0 - remaining[mask] / produced[mask])
+
+    return markings, problems, missing, remaining, consumed, produced, is_fit, fitness, hidden_fired
+
+
+def __transcribe_result(cnet, fired, hidden_fired, problems, marking, enabled, is_fit, fitness, missing, consumed, remaining,
+                        produced, return_names):
+    transitions = cnet.transitions
+    activated_transitions = []
+    for step, t in enumerate(fired):
+        if t >= 0:
+            activated_transitions.extend(transitions[x] for x in hidden_fired.get(step, []))
+            activated_transitions.append(transitions[t])
+    activated_transitions.extend(transitions[x] for x in hidden_fired.get(-1, []))
+    transitions_with_problems = [transitions[fired[j]] for j in np.nonzero(problems)[0]]
+    enabled_transitions = enabled
+    reached_marking = cnet.decode_marking(marking.tolist())
+
+    corr_value = {"trace_is_fit": is_fit,
+                  "trace_fitness": fitness,
+                  "activated_transitions": activated_transitions,
+                  "reached_marking": reached_marking,
+                  "enabled_transitions_in_marking": enabled_transitions,
+                  "transitions_with_problems": transitions_with_problems,
+                  "missing_tokens": missing,
+                  "consumed_tokens": consumed,
+                  "remaining_tokens": remaining,
+                  "produced_tokens": produced}
+
+    if return_names:
+        corr_value["activated_transitions_labels"] = [x.label for x in activated_transitions]
+        corr_value["activated_transitions"] = [x.name for x in activated_transitions]
+        corr_value["enabled_transitions_in_marking_labels"] = [x.label for x in enabled_transitions]
+        corr_value["enabled_transitions_in_marking"] = [x.name for x in enabled_transitions]
+        corr_value["transitions_with_problems"] = [x.name for x in transitions_with_problems]
+        corr_value["reached_marking"] = {x.name: y for x, y in reached_marking.items()}
+
+    return corr_value
+
+
+def get_diagnostics_dataframe(log: EventLog, tbr_output: typing.ListAlignments,
+                              parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> pd.DataFrame:
+    """
+    Gets the results of token-based replay in a dataframe
+
+    Parameters
+    --------------
+    log
+        Event log
+    tbr_output
+        Output of the token-based replay technique
+
+    Returns
+    --------------
+    dataframe
+        Diagnostics dataframe
+    """
+    return token_replay.get_diagnostics_dataframe(log, tbr_output, parameters=parameters)
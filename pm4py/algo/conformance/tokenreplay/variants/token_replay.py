@@ -367,6 +367,65 @@ def break_condition_final_marking(marking, final_marking):
     return final_marking_dict_keys.issubset(marking_dict_keys)
 
 
+def reach_final_marking_through_hidden(net, marking, final_marking, places_shortest_path_by_hidden):
+    """
+    Tries to reach the final marking from the marking reached at the end of the replay of a trace,
+    firing hidden transitions
+
+    Parameters
+    -----------
+    net
+        Petri net
+    marking
+        Marking reached at the end of the replay of the trace
+    final_marking
+        Final marking
+    places_shortest_path_by_hidden
+        Minimal connection between places by hidden transitions
+
+    Returns
+    -----------
+    marking
+        Reached marking
+    fired_transitions
+        List of the fired hidden transitions, each one along with the marking reached after its firing
+    """
+    fired_transitions = []
+    for i in range(TechnicalParameters.MAX_IT_FINAL1.value):
+        if not break_condition_final_marking(marking, final_marking):
+            hidden_transitions_to_enable = get_req_transitions_for_final_marking(marking, final_marking,
+                                                                                 places_shortest_path_by_hidden)
+            for group in hidden_transitions_to_enable:
+                for t in group:
+                    if semantics.is_enabled(t, net, marking):
+                        marking = semantics.execute(t, net, marking)
+                        fired_transitions.append((t, marking))
+                if break_condition_final_marking(marking, final_marking):
+                    break
+        else:
+            break
+    # try to reach the final marking in a different fashion, if not already reached
+    if not break_condition_final_marking(marking, final_marking):
+        if len(final_marking) == 1:
+            sink_place = list(final_marking)[0]
+            connections_to_sink = []
+            for place in marking:
+                if place in places_shortest_path_by_hidden and sink_place in places_shortest_path_by_hidden[place]:
+                    connections_to_sink.append([place, places_shortest_path_by_hidden[place][sink_place]])
+            connections_to_sink = sorted(connections_to_sink, key=lambda x: len(x[1]))
+            for i in range(TechnicalParameters.MAX_IT_FINAL2.value):
+                for j in range(len(connections_to_sink)):
+                    for z in range(len(connections_to_sink[j][1])):
+                        t = connections_to_sink[j][1][z]
+                        if semantics.is_enabled(t, net, marking):
+                            marking = semantics.execute(t, net, marking)
+                            fired_transitions.append((t, marking))
+                            continue
+                        else:
+                            break
+    return marking, fired_transitions
+
+
 def apply_trace(trace, net, initial_marking, final_marking, trans_map, enable_pltr_fitness, place_fitness,
                 transition_fitness, notexisting_activities_in_model,
                 places_shortest_path_by_hidden, consider_remaining_in_fitness, activity_key="concept:name",
@@ -582,67 +641,22 @@ def apply_trace(trace, net, initial_marking, final_marking, trans_map, enable_pl
                      ""])
 
     if try_to_reach_final_marking_through_hidden and not used_postfix_cache:
-        for i in range(TechnicalParameters.MAX_IT_FINAL1.value):
-            if not break_condition_final_marking(marking, final_marking):
-                hidden_transitions_to_enable = get_req_transitions_for_final_marking(marking, final_marking,
-                                                                                     places_shortest_path_by_hidden)
-
-                for group in hidden_transitions_to_enable:
-                    for t in group:
-                        if semantics.is_enabled(t, net, marking):
-                            marking = semantics.execute(t, net, marking)
-                            act_trans.append(t)
-                            vis_mark.append(marking)
-                            c, cmap = get_consumed_tokens(t)
-                            p, pmap = get_produced_tokens(t)
-                            if enable_pltr_fitness:
-                                for pl2 in cmap:
-                                    if pl2 in place_fitness:
-                                        place_fitness[pl2]["c"] += cmap[pl2] * trace_occurrences
-                                for pl2 in pmap:
-                                    if pl2 in place_fitness:
-                                        place_fitness[pl2]["p"] += pmap[pl2] * trace_occurrences
-                            consumed = consumed + c
-                            produced = produced + p
-                    if break_condition_final_marking(marking, final_marking):
-                        break
-            else:
-                break
-
-        # try to reach the final marking in a different fashion, if not already reached
-        if not break_condition_final_marking(marking, final_marking):
-            if len(final_marking) == 1:
-                sink_place = list(final_marking)[0]
-
-                connections_to_sink = []
-                for place in marking:
-                    if place in places_shortest_path_by_hidden and sink_place in places_shortest_path_by_hidden[place]:
-                        connections_to_sink.append([place, places_shortest_path_by_hidden[place][sink_place]])
-                connections_to_sink = sorted(connections_to_sink, key=lambda x: len(x[1]))
-
-                for i in range(TechnicalParameters.MAX_IT_FINAL2.value):
-                    for j in range(len(connections_to_sink)):
-                        for z in range(len(connections_to_sink[j][1])):
-                            t = connections_to_sink[j][1][z]
-                            if semantics.is_enabled(t, net, marking):
-                                marking = semantics.execute(t, net, marking)
-                                act_trans.append(t)
-                                c, cmap = get_consumed_tokens(t)
-                                p, pmap = get_produced_tokens(t)
-                                if enable_pltr_fitness:
-                                    for pl2 in cmap:
-                                        if pl2 in place_fitness:
-                                            place_fitness[pl2]["c"] += cmap[pl2] * trace_occurrences
-                                    for pl2 in pmap:
-                                        if pl2 in place_fitness:
-                                            place_fitness[pl2]["p"] += pmap[pl2] * trace_occurrences
-                                consumed = consumed + c
-                                produced = produced + p
-                                vis_mark.append(marking)
-                                continue
-                            else:
-                                break
-
+        marking, fired_hidden = reach_final_marking_through_hidden(net, marking, final_marking,
+                                                                   places_shortest_path_by_hidden)
+        for t, t_marking in fired_hidden:
+            act_trans.append(t)
+            vis_mark.append(t_marking)
+            c, cmap = get_consumed_tokens(t)
+            p, pmap = get_produced_tokens(t)
+            if enable_pltr_fitness:
+                for pl2 in cmap:
+                    if pl2 in place_fitness:
+                        place_fitness[pl2]["c"] += cmap[pl2] * trace_occurrences
+                for pl2 in pmap:
+                    if pl2 in place_fitness:
+                        place_fitness[pl2]["p"] += pmap[pl2] * trace_occurrences
+            consumed = consumed + c
+            produced = produced + p
     marking_before_cleaning = copy(marking)
 
     # 25/02/2020: fix to the missing tokens mark (if the final marking is not reached)
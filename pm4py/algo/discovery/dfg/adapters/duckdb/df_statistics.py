@@ -0,0 +1,125 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import numpy as np
+
+from pm4py.util import constants, duckdb_utils
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
+
+# SQL aggregations of the flow time for the different performance aggregation keys
+AGGREGATIONS = {"mean": "AVG(flow_time)", "median": "MEDIAN(flow_time)", "max": "MAX(flow_time)",
+                "min": "MIN(flow_time)", "sum": "SUM(flow_time)", "stdev": "STDDEV_SAMP(flow_time)",
+                "std": "STDDEV_SAMP(flow_time)", "raw_values": "LIST(flow_time)"}
+
+
+def __get_successions_query(activity_key, case_id_glue, start_timestamp_key, timestamp_key, st_eq_ct):
+    # couples each event with the next one of the same case
+    window = "OVER (PARTITION BY " + case_id_glue + " ORDER BY " + start_timestamp_key + ", " + timestamp_key + ", " + duckdb_utils.INDEX_COLUMN + ")"
+    next_start = "LEAD(" + start_timestamp_key + ") " + window
+    if not st_eq_ct:
+        # in the arc performance calculation, make sure to consider positive or null values
+        next_start = "GREATEST(" + next_start + ", " + timestamp_key + ")"
+
+    return "SELECT * FROM (SELECT " + activity_key + " AS act1, LEAD(" + activity_key + ") " + window + " AS act2, " \
+           "EPOCH_US(" + timestamp_key + ") AS time1, EPOCH_US(" + next_start + ") AS time2 FROM " + \
+           duckdb_utils.INDEXED_LOG_TABLE + ") WHERE act2 IS NOT NULL"
+
+
+def get_dfg_graph(log, measure="frequency", activity_key="concept:name", case_id_glue="case:concept:name",
+                  start_timestamp_key=None, timestamp_key="time:timestamp", perf_aggregation_key="mean",
+                  business_hours=False, business_hours_slot=None, workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR):
+    """
+    Get DFG graph from a DuckDB relation, or from a Parquet file (or a directory of Parquet files).
+    The aggregations are pushed down to DuckDB, so the log is never loaded entirely in memory
+    (except when the business hours are considered, since the flow times are then computed in Python)
+
+    Parameters
+    -----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    measure
+        Measure to use (frequency/performance/both)
+    activity_key
+        Activity key to use in the grouping
+    case_id_glue
+        Case ID identifier
+    start_timestamp_key
+        Start timestamp key
+    timestamp_key
+        Timestamp key
+    perf_aggregation_key
+        Performance aggregation key (mean, median, min, max, sum, stdev, all, raw_values)
+    business_hours
+        Enables/disables the computation based on the business hours
+    business_hours_slot
+        Work schedule of the company
+    workcalendar
+        Work calendar (for the business hours)
+
+    Returns
+    -----------
+    dfg
+        DFG in the chosen measure (may be only the frequency, only the performance, or both)
+    """
+    st_eq_ct = start_timestamp_key is None or start_timestamp_key == timestamp_key
+    if start_timestamp_key is None:
+        start_timestamp_key = timestamp_key
+
+    successions = __get_successions_query(duckdb_utils.quote(activity_key), duckdb_utils.quote(case_id_glue),
+                                          duckdb_utils.quote(start_timestamp_key), duckdb_utils.quote(timestamp_key),
+                                          st_eq_ct)
+
+    dfg_frequency = {}
+    dfg_performance = {}
+
+    if measure == "frequency" or measure == "both":
+        rows = duckdb_utils.fetch(log, "SELECT act1, act2, COUNT(*) FROM (" + successions + ") GROUP BY act1, act2")
+        dfg_frequency = {(x, y): z for x, y, z in rows}
+
+    if measure == "performance" or measure == "both":
+        keys = ["mean", "median", "max", "min", "sum", "stdev"] if perf_aggregation_key == "all" else [perf_aggregation_key]
+
+        if business_hours:
+            if business_hours_slot is None:
+                business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+            df = duckdb_utils.query(log, successions).df()
+            df[constants.DEFAULT_FLOW_TIME] = soj_time_business_hours_diff_vectorized(
+                df["time1"].to_numpy().astype("datetime64[us]"), df["time2"].to_numpy().astype("datetime64[us]"),
+                business_hours_slot, workcalendar)
+            grouped = df.groupby(["act1", "act2"])[constants.DEFAULT_FLOW_TIME]
+            pandas_aggregations = {"stdev": "std", "raw_values": list}
+            aggregations = {k: grouped.agg(pandas_aggregations.get(k, k)).to_dict() for k in keys}
+            rows = [(a, b) + tuple(aggregations[k][(a, b)] for k in keys) for (a, b) in aggregations[keys[0]]]
+        else:
+            rows = duckdb_utils.fetch(log, "SELECT act1, act2, " + ", ".join(AGGREGATIONS[k] for k in keys) +
+                                      " FROM (SELECT act1, act2, (time2 - time1) / 1000000 AS flow_time FROM (" +
+                                      successions + ")) GROUP BY act1, act2")
+
+        for row in rows:
+            values = [np.nan if (k in ["stdev", "std"] and v is None) else v for k, v in zip(keys, row[2:])]
+            if perf_aggregation_key == "all":
+                dfg_performance[(row[0], row[1])] = {k: v for k, v in zip(keys, values)}
+            else:
+                dfg_performance[(row[0], row[1])] = values[0]
+
+    if measure == "frequency":
+        return dfg_frequency
+
+    if measure == "performance":
+        return dfg_performance
+
+    if measure == "both":
+        return [dfg_frequency, dfg_performance]
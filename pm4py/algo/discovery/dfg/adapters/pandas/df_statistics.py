@@ -15,7 +15,8 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.util import xes_constants, pandas_utils, constants
-from pm4py.util.business_hours import soj_time_business_hours_diff
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
+from pm4py.objects.log.util import dataframe_index
 
 
 def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_glue="case:concept:name",
@@ -64,12 +65,27 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
     if target_activity_key is None:
         target_activity_key = activity_key
 
+    # re-uses the index of the dataframe (if available), when the events are sorted in the same way
+    if measure in ["frequency", "performance", "both"] and window == 1 and not keep_once_per_case and \
+            not business_hours and target_activity_key == activity_key and sort_caseid_required and \
+            sort_timestamp_along_case_id and (start_timestamp_key == timestamp_key or (
+            start_timestamp_key is None and xes_constants.DEFAULT_START_TIMESTAMP_KEY not in df.columns)):
+        index = dataframe_index.get(df, case_id_glue, activity_key, timestamp_key)
+        if index is not None:
+            if measure == "frequency":
+                return index.get_dfg()
+            elif measure == "performance":
+                return index.get_dfg_performance(perf_aggregation_key)
+            return [index.get_dfg(), index.get_dfg_performance(perf_aggregation_key)]
+
     # if not differently specified, set the start timestamp key to the timestamp key
     # to avoid retro-compatibility problems
     st_eq_ct = start_timestamp_key == timestamp_key
     if start_timestamp_key is None:
         start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
         if start_timestamp_key not in df.columns:
+            # the column is added to a shallow copy, leaving the dataframe of the caller (and its index) unchanged
+            df = df.copy(deep=False)
             df[start_timestamp_key] = df[timestamp_key]
         st_eq_ct = True
 
@@ -123,8 +139,8 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         if business_hours:
             if business_hours_slot is None:
                 business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-            df_successive_rows[constants.DEFAULT_FLOW_TIME] = df_successive_rows.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+            df_successive_rows[constants.DEFAULT_FLOW_TIME] = soj_time_business_hours_diff_vectorized(
+                df_successive_rows[timestamp_key], df_successive_rows[start_timestamp_key + '_2'], business_hours_slot, workcalendar)
         else:
             difference = df_successive_rows[start_timestamp_key + '_2'] - df_successive_rows[timestamp_key]
             df_successive_rows[constants.DEFAULT_FLOW_TIME] = pandas_utils.get_total_seconds(difference)
@@ -210,6 +226,8 @@ def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="tim
         start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
 
     if start_timestamp_key not in df:
+        # the column is added to a shallow copy, leaving the dataframe of the caller unchanged
+        df = df.copy(deep=False)
         df[start_timestamp_key] = df[timestamp_key]
 
     # to increase the speed of the approaches reduce dataframe to case, activity (and possibly complete timestamp)
@@ -243,8 +261,8 @@ def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="tim
     if business_hours:
         if business_hours_slot is None:
             business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-        df[constants.DEFAULT_FLOW_TIME] = df.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+        df[constants.DEFAULT_FLOW_TIME] = soj_time_business_hours_diff_vectorized(
+            df[timestamp_key], df[start_timestamp_key + '_2'], business_hours_slot, workcalendar)
     else:
         df[constants.DEFAULT_FLOW_TIME] = pandas_utils.get_total_seconds(df[start_timestamp_key + "_2"] - df[timestamp_key])
 
@@ -293,6 +311,8 @@ def get_concurrent_events_dataframe(df, start_timestamp_key=None, timestamp_key=
     # to avoid retro-compatibility problems
     if start_timestamp_key is None:
         start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
+        # the column is added to a shallow copy, leaving the dataframe of the caller unchanged
+        df = df.copy(deep=False)
         df[start_timestamp_key] = df[timestamp_key]
 
     # to get rows belonging to same case ID together, we need to sort on case ID
@@ -0,0 +1,116 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import polars as pl
+
+from pm4py.util import constants, polars_utils
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
+
+
+def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_glue="case:concept:name",
+                  start_timestamp_key=None, timestamp_key="time:timestamp", perf_aggregation_key="mean",
+                  business_hours=False, business_hours_slot=None, workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR):
+    """
+    Get DFG graph from a Polars dataframe (the query is executed by the multi-threaded engine of Polars)
+
+    Parameters
+    -----------
+    df
+        Polars DataFrame or LazyFrame
+    measure
+        Measure to use (frequency/performance/both)
+    activity_key
+        Activity key to use in the grouping
+    case_id_glue
+        Case ID identifier
+    start_timestamp_key
+        Start timestamp key
+    timestamp_key
+        Timestamp key
+    perf_aggregation_key
+        Performance aggregation key (mean, median, min, max, sum, stdev, all, raw_values)
+    business_hours
+        Enables/disables the computation based on the business hours
+    business_hours_slot
+        Work schedule of the company
+    workcalendar
+        Work calendar (for the business hours)
+
+    Returns
+    -----------
+    dfg
+        DFG in the chosen measure (may be only the frequency, only the performance, or both)
+    """
+    st_eq_ct = start_timestamp_key is None or start_timestamp_key == timestamp_key
+    if start_timestamp_key is None:
+        start_timestamp_key = timestamp_key
+
+    df = polars_utils.to_lazy(df).select(list({case_id_glue, activity_key, start_timestamp_key, timestamp_key}))
+    df = df.sort([case_id_glue, start_timestamp_key, timestamp_key], maintain_order=True)
+    # couples each event with the next one (of the same case)
+    df = df.with_columns(pl.col(case_id_glue).shift(-1).alias(case_id_glue + "_2"),
+                         pl.col(activity_key).shift(-1).alias(activity_key + "_2"),
+                         pl.col(start_timestamp_key).shift(-1).alias(start_timestamp_key + "_2"))
+    df = df.filter(pl.col(case_id_glue) == pl.col(case_id_glue + "_2"))
+
+    dfg_frequency = {}
+    dfg_performance = {}
+
+    if measure == "frequency" or measure == "both":
+        frequency = df.group_by([activity_key, activity_key + "_2"]).len().collect()
+        dfg_frequency = {(x, y): z for x, y, z in frequency.iter_rows()}
+
+    if measure == "performance" or measure == "both":
+        if not st_eq_ct:
+            # in the arc performance calculation, make sure to consider positive or null values
+            df = df.with_columns(pl.max_horizontal(start_timestamp_key + "_2", timestamp_key).alias(start_timestamp_key + "_2"))
+
+        if business_hours:
+            if business_hours_slot is None:
+                business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+            df = df.collect()
+            df = df.with_columns(pl.Series(constants.DEFAULT_FLOW_TIME, soj_time_business_hours_diff_vectorized(
+                df[timestamp_key].to_pandas(), df[start_timestamp_key + "_2"].to_pandas(), business_hours_slot,
+                workcalendar))).lazy()
+        else:
+            df = df.with_columns(((pl.col(start_timestamp_key + "_2") - pl.col(timestamp_key)).dt.total_microseconds() / 10 ** 6).alias(constants.DEFAULT_FLOW_TIME))
+
+        flow_time = pl.col(constants.DEFAULT_FLOW_TIME)
+        aggregations = {"mean": flow_time.mean(), "median": flow_time.median(), "max": flow_time.max(),
+                        "min": flow_time.min(), "sum": flow_time.sum(), "stdev": flow_time.std().fill_null(float("nan")),
+                        "std": flow_time.std().fill_null(float("nan")), "raw_values": flow_time}
+        if perf_aggregation_key == "all":
+            keys = ["mean", "median", "max", "min", "sum", "stdev"]
+        else:
+            keys = [perf_aggregation_key]
+
+        performance = df.group_by([activity_key, activity_key + "_2"]).agg(
+            *[aggregations[k].alias(k) for k in keys]).collect()
+        for row in performance.iter_rows(named=True):
+            arc = (row[activity_key], row[activity_key + "_2"])
+            if perf_aggregation_key == "all":
+                dfg_performance[arc] = {k: row[k] for k in keys}
+            else:
+                dfg_performance[arc] = row[perf_aggregation_key]
+
+    if measure == "frequency":
+        return dfg_frequency
+
+    if measure == "performance":
+        return dfg_performance
+
+    if measure == "both":
+        return [dfg_frequency, dfg_performance]
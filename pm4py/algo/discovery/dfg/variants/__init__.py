@@ -14,7 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.discovery.dfg.variants import native, performance, freq_triples, case_attributes, clean
+from pm4py.algo.discovery.dfg.variants import native, performance, freq_triples, case_attributes, clean, partitioned
 import importlib.util
 
 if importlib.util.find_spec("polars"):
@@ -16,12 +16,12 @@
 '''
 import time
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
 import polars as pl
 
 from pm4py.objects.dfg.obj import DFG
-from pm4py.util import constants, exec_utils
+from pm4py.util import constants, exec_utils, polars_utils
 from pm4py.util import xes_constants as xes_util
 
 
@@ -36,7 +36,7 @@ CONST_AUX_CASE = 'aux_case_'
 CONST_COUNT = 'count_'
 
 
-def apply(log: pl.DataFrame, parameters: Optional[Dict[str, Any]] = None) -> DFG:
+def apply(log: Union[pl.DataFrame, pl.LazyFrame], parameters: Optional[Dict[str, Any]] = None) -> DFG:
     parameters = {} if parameters is None else parameters
     act_key = exec_utils.get_param_value(
         Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
@@ -46,24 +46,32 @@ def apply(log: pl.DataFrame, parameters: Optional[Dict[str, Any]] = None) -> DFG
         Parameters.TIMESTAMP_KEY, parameters, xes_util.DEFAULT_TIMESTAMP_KEY)
     aux_act = CONST_AUX_ACT + str(time.time())
     aux_case = CONST_AUX_CASE + str(time.time())
-    df = log[[cid_key, act_key, time_key]].clone()
-    df = df.sort([cid_key, time_key])
-    df = df[[cid_key, act_key]]
-    df = df.with_column(df[act_key].shift(-1).alias(aux_act))
-    df = df.with_column(df[cid_key].shift(-1).alias(aux_case))
+    df = polars_utils.to_lazy(log).select(cid_key, act_key, time_key)
+    df = df.sort([cid_key, time_key], maintain_order=True)
+    df = df.select(cid_key, act_key)
+    df = df.with_columns(pl.col(act_key).shift(-1).alias(aux_act), pl.col(cid_key).shift(-1).alias(aux_case))
+    # the queries on the lazy dataframe are executed together by the Polars engine
+    starters, borders, arcs = pl.collect_all([
+        df.head(1),
+        df.filter(pl.col(cid_key).ne_missing(pl.col(aux_case))),
+        df.filter(pl.col(cid_key) == pl.col(aux_case)).group_by([act_key, aux_act]).len(CONST_COUNT)])
     dfg = DFG()
 
-    excl_starter = df[0, act_key]
-    borders = df.filter(df[cid_key] != df[aux_case])
+    if len(starters) == 0:
+        return dfg
 
-    for d in filter(lambda d: d[aux_act] is not None, borders.groupby([aux_act]).count().to_dicts()):
-        v = d['count'] + 1 if d[aux_act] == excl_starter else d['count']
+    excl_starter = starters[0, act_key]
+
+    for d in filter(lambda d: d[aux_act] is not None, borders.group_by([aux_act]).len(CONST_COUNT).to_dicts()):
+        v = d[CONST_COUNT] + 1 if d[aux_act] == excl_starter else d[CONST_COUNT]
         dfg.start_activities[d[aux_act]] = v
+    if excl_starter not in dfg.start_activities:
+        dfg.start_activities[excl_starter] = 1
 
-    for d in filter(lambda d: d[act_key] is not None, borders.groupby([act_key]).count().to_dicts()):
-        dfg.end_activities[d[act_key]] = d['count']
+    for d in filter(lambda d: d[act_key] is not None, borders.group_by([act_key]).len(CONST_COUNT).to_dicts()):
+        dfg.end_activities[d[act_key]] = d[CONST_COUNT]
 
-    for d in df.filter((df[cid_key] == df[aux_case])).groupby([act_key, aux_act]).count().to_dicts():
-        dfg.graph[(d[act_key], d[aux_act])] = d['count']
+    for d in arcs.to_dicts():
+        dfg.graph[(d[act_key], d[aux_act])] = d[CONST_COUNT]
 
     return dfg
@@ -0,0 +1,222 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from typing import Optional, Dict, Any, Union, Tuple, List
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import constants, exec_utils, xes_constants
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    MEASURE = "measure"
+    AGGREGATION_MEASURE = "aggregationMeasure"
+    BUSINESS_HOURS = "business_hours"
+    BUSINESS_HOUR_SLOTS = "business_hour_slots"
+    WORKCALENDAR = "workcalendar"
+    CORES = "cores"
+    NUM_PARTITIONS = "num_partitions"
+    PARTITION_COLUMN = "partition_column"
+
+
+# aggregation measures that cannot be computed from the partial aggregates (count, sum, sum of squares, min, max)
+RAW_VALUES_MEASURES = {"median", "raw_values", "all"}
+
+
+def __discover_partition(partition: Union[pd.DataFrame, str], parameters: Dict[Any, Any]) -> Tuple[Dict[Tuple[str, str], Any], Dict[str, int], Dict[str, int]]:
+    from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    measure = exec_utils.get_param_value(Parameters.MEASURE, parameters, "frequency")
+    aggregation_measure = exec_utils.get_param_value(Parameters.AGGREGATION_MEASURE, parameters, "mean")
+
+    if isinstance(partition, str):
+        columns = [case_id_key, activity_key, timestamp_key]
+        if start_timestamp_key is not None and start_timestamp_key not in columns:
+            columns.append(start_timestamp_key)
+        partition = pd.read_parquet(partition, columns=columns)
+
+    if start_timestamp_key is None:
+        # avoids the insertion of the start timestamp column in the partition
+        start_timestamp_key = timestamp_key
+
+    # as in the start/end activities of Pandas dataframes, the first/last events of the cases follow the order
+    # of the dataframe
+    first_events = ~partition[case_id_key].duplicated(keep="first")
+    last_events = ~partition[case_id_key].duplicated(keep="last")
+    start_activities = partition[activity_key][first_events].value_counts().to_dict()
+    end_activities = partition[activity_key][last_events].value_counts().to_dict()
+
+    if measure == "frequency":
+        dfg = df_statistics.get_dfg_graph(partition, activity_key=activity_key, timestamp_key=timestamp_key,
+                                          start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key)
+        return dict(dfg), start_activities, end_activities
+
+    values = df_statistics.get_dfg_graph(partition, activity_key=activity_key, timestamp_key=timestamp_key,
+                                         start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
+                                         measure="performance", perf_aggregation_key="raw_values",
+                                         business_hours=exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False),
+                                         business_hours_slot=exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, None),
+                                         workcalendar=exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR))
+
+    # partial aggregates of the durations of each arc (the raw values are kept only when they are needed)
+    dfg = {}
+    for arc, arc_values in values.items():
+        arc_values = np.asarray(arc_values, dtype=np.float64)
+        dfg[arc] = (len(arc_values), float(arc_values.sum()), float((arc_values ** 2).sum()), float(arc_values.min()),
+                    float(arc_values.max()), arc_values if aggregation_measure in RAW_VALUES_MEASURES else None)
+    return dfg, start_activities, end_activities
+
+
+def __merge_performance(partials: List[Tuple[int, float, float, float, float, Optional[np.ndarray]]], aggregation_measure: str) -> Any:
+    count = sum(p[0] for p in partials)
+    total = sum(p[1] for p in partials)
+    total_sq = sum(p[2] for p in partials)
+    measures = {"mean": total / count, "min": min(p[3] for p in partials), "max": max(p[4] for p in partials),
+                "sum": total}
+    # sample standard deviation (as in Pandas, not defined for a single value)
+    measures["stdev"] = float(np.sqrt(max(0.0, (total_sq - total * total / count) / (count - 1)))) if count > 1 else np.nan
+
+    if aggregation_measure in RAW_VALUES_MEASURES:
+        values = np.concatenate([p[5] for p in partials])
+        if aggregation_measure == "raw_values":
+            return values.tolist()
+        measures["median"] = float(np.median(values))
+        if aggregation_measure == "all":
+            return {"mean": measures["mean"], "median": measures["median"], "max": measures["max"],
+                    "min": measures["min"], "sum": measures["sum"], "stdev": measures["stdev"]}
+
+    return measures[aggregation_measure]
+
+
+def apply(log: Union[pd.DataFrame, str], parameters: Optional[Dict[Any, Any]] = None) -> Tuple[Dict[Tuple[str, str], Any], Dict[str, int], Dict[str, int]]:
+    """
+    Discovers a (frequency or performance) DFG, along with the start and end activities, from a dataframe
+    (or a directory of Parquet files) partitioned by case identifier.
+    The partitions are processed in a pool of processes, each one computing partial aggregates (frequency, count/sum/
+    sum of squares/min/max of the durations, and the raw durations only if needed), which are then merged.
+
+    Parameters
+    ----------------
+    log
+        Pandas dataframe, or path to a Parquet file / to a directory of Parquet files (each file containing
+        complete cases)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY => the attribute to be used as activity
+        - Parameters.TIMESTAMP_KEY => the attribute to be used as timestamp
+        - Parameters.START_TIMESTAMP_KEY => the attribute to be used as start timestamp (performance)
+        - Parameters.CASE_ID_KEY => the attribute to be used as case identifier
+        - Parameters.MEASURE => frequency (default) or performance
+        - Parameters.AGGREGATION_MEASURE => aggregation of the performance (mean, median, min, max, sum, stdev,
+                                            raw_values, all)
+        - Parameters.BUSINESS_HOURS => enables the computation of the performance based on the business hours
+        - Parameters.BUSINESS_HOUR_SLOTS => work schedule (used with Parameters.BUSINESS_HOURS)
+        - Parameters.WORKCALENDAR => work calendar (used with Parameters.BUSINESS_HOURS)
+        - Parameters.CORES => number of processes of the pool (default: number of CPUs)
+        - Parameters.NUM_PARTITIONS => number of partitions of the dataframe (default: number of processes).
+                                        If the dataframe contains the partitioning column, it is used instead.
+        - Parameters.PARTITION_COLUMN => column containing the partitioning (default: @@partitioning, see
+                                        pm4py.objects.log.util.dataframe_utils.insert_partitioning)
+
+    Returns
+    ----------------
+    dfg
+        Frequency / performance DFG
+    start_activities
+        Start activities
+    end_activities
+        End activities
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    measure = exec_utils.get_param_value(Parameters.MEASURE, parameters, "frequency")
+    aggregation_measure = exec_utils.get_param_value(Parameters.AGGREGATION_MEASURE, parameters, "mean")
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count())
+    num_partitions = exec_utils.get_param_value(Parameters.NUM_PARTITIONS, parameters, cores)
+    partition_column = exec_utils.get_param_value(Parameters.PARTITION_COLUMN, parameters, "@@partitioning")
+
+    if isinstance(log, str):
+        if os.path.isdir(log):
+            partitions = sorted(os.path.join(log, f) for f in os.listdir(log) if f.endswith(".parquet"))
+        else:
+            partitions = [log]
+    else:
+        columns = [case_id_key, activity_key, timestamp_key]
+        if start_timestamp_key is not None and start_timestamp_key not in columns:
+            columns.append(start_timestamp_key)
+        if partition_column in log.columns:
+            partitioning = log[partition_column].to_numpy()
+        else:
+            from pm4py.objects.log.util import dataframe_utils
+            partitioning = dataframe_utils.insert_partitioning(log[[case_id_key]].copy(), num_partitions,
+                                                               parameters={dataframe_utils.Parameters.CASE_ID_KEY: case_id_key,
+                                                                           dataframe_utils.Parameters.PARTITION_COLUMN: partition_column})[partition_column].to_numpy()
+        log = log[columns]
+        partitions = [log[partitioning == p] for p in np.unique(partitioning)]
+
+    partition_parameters = {Parameters.ACTIVITY_KEY: activity_key, Parameters.TIMESTAMP_KEY: timestamp_key,
+                            Parameters.START_TIMESTAMP_KEY: start_timestamp_key, Parameters.CASE_ID_KEY: case_id_key,
+                            Parameters.MEASURE: measure, Parameters.AGGREGATION_MEASURE: aggregation_measure,
+                            Parameters.BUSINESS_HOURS: exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False),
+                            Parameters.BUSINESS_HOUR_SLOTS: exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, None),
+                            Parameters.WORKCALENDAR: exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)}
+
+    if cores > 1 and len(partitions) > 1:
+        with ProcessPoolExecutor(max_workers=min(cores, len(partitions))) as executor:
+            results = list(executor.map(__discover_partition, partitions, [partition_parameters] * len(partitions)))
+    else:
+        results = [__discover_partition(partition, partition_parameters) for partition in partitions]
+
+    start_activities = Counter()
+    end_activities = Counter()
+    for result in results:
+        start_activities.update(result[1])
+        end_activities.update(result[2])
+
+    if measure == "frequency":
+        dfg = Counter()
+        for result in results:
+            dfg.update(result[0])
+        return dict(dfg), dict(start_activities), dict(end_activities)
+
+    partials = {}
+    for result in results:
+        for arc, partial in result[0].items():
+            if arc not in partials:
+                partials[arc] = []
+            partials[arc].append(partial)
+    dfg = {arc: __merge_performance(arc_partials, aggregation_measure) for arc, arc_partials in partials.items()}
+
+    return dfg, dict(start_activities), dict(end_activities)
@@ -59,7 +59,7 @@ def apply(*args, variant=None, parameters: Optional[Dict[Any, Any]] = None) -> D
         Footprints object
     """
     if variant is None:
-        if type(args[0]) is EventLog:
+        if isinstance(args[0], EventLog):
             variant = Variants.TRACE_BY_TRACE
         elif type(args[0]) is PetriNet:
             variant = Variants.PETRI_REACH_GRAPH
@@ -19,6 +19,7 @@ from enum import Enum
 from pm4py.algo.discovery.heuristics.variants import classic, plusplus
 from pm4py.objects.conversion.log import converter as log_conversion
 from pm4py.objects.heuristics_net.obj import HeuristicsNet
+from pm4py.objects.heuristics_net.statistics import HeuristicsStatistics
 from pm4py.util import exec_utils, pandas_utils
 from typing import Optional, Dict, Any, Union, Tuple
 from pm4py.objects.log.obj import EventLog, EventStream
@@ -209,3 +210,100 @@ def apply_heu_dfg(dfg: Dict[Tuple[str, str], int], activities=None, activities_o
                                                          start_activities=start_activities,
                                                          end_activities=end_activities,
                                                          parameters=parameters)
+
+
+def discover_statistics(log: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional[Dict[Any, Any]] = None, variant=CLASSIC) -> HeuristicsStatistics:
+    """
+    Computes the statistics from which heuristics nets with any combination of the thresholds can be derived
+    (through the apply_statistics/apply_heu_statistics methods), without accessing again the event log
+
+    Parameters
+    ------------
+    log
+        Event log
+    parameters
+        Possible parameters of the algorithm,
+        including:
+            - Parameters.ACTIVITY_KEY
+            - Parameters.TIMESTAMP_KEY
+            - Parameters.CASE_ID_KEY
+            - Parameters.HEU_NET_DECORATION
+    variant
+        Variant of the algorithm:
+            - Variants.CLASSIC
+            - Variants.PLUSPLUS
+
+    Returns
+    ------------
+    statistics
+        Heuristics statistics
+    """
+    if pandas_utils.check_is_pandas_dataframe(log):
+        return exec_utils.get_variant(variant).discover_statistics_pandas(log, parameters=parameters)
+
+    return exec_utils.get_variant(variant).discover_statistics(log_conversion.apply(log, variant=log_conversion.Variants.TO_EVENT_LOG, parameters=parameters),
+                                                               parameters=parameters)
+
+
+def apply_statistics(statistics: HeuristicsStatistics, parameters: Optional[Dict[Any, Any]] = None, variant=CLASSIC) -> Tuple[PetriNet, Marking, Marking]:
+    """
+    Discovers a Petri net using Heuristics Miner, starting from the statistics computed on the log
+
+    Parameters
+    ------------
+    statistics
+        Heuristics statistics (see discover_statistics)
+    parameters
+        Possible parameters of the algorithm,
+        including:
+            - Parameters.DEPENDENCY_THRESH
+            - Parameters.AND_MEASURE_THRESH
+            - Parameters.MIN_ACT_COUNT
+            - Parameters.MIN_DFG_OCCURRENCES
+            - Parameters.DFG_PRE_CLEANING_NOISE_THRESH
+            - Parameters.LOOP_LENGTH_TWO_THRESH
+    variant
+        Variant of the algorithm:
+            - Variants.CLASSIC
+            - Variants.PLUSPLUS
+
+    Returns
+    ------------
+    net
+        Petri net
+    im
+        Initial marking
+    fm
+        Final marking
+    """
+    return exec_utils.get_variant(variant).apply_statistics(statistics, parameters=parameters)
+
+
+def apply_heu_statistics(statistics: HeuristicsStatistics, parameters: Optional[Dict[Any, Any]] = None, variant=CLASSIC) -> HeuristicsNet:
+    """
+    Discovers an Heuristics Net using Heuristics Miner, starting from the statistics computed on the log
+
+    Parameters
+    ------------
+    statistics
+        Heuristics statistics (see discover_statistics)
+    parameters
+        Possible parameters of the algorithm,
+        including:
+            - Parameters.DEPENDENCY_THRESH
+            - Parameters.AND_MEASURE_THRESH
+            - Parameters.MIN_ACT_COUNT
+            - Parameters.MIN_DFG_OCCURRENCES
+            - Parameters.DFG_PRE_CLEANING_NOISE_THRESH
+            - Parameters.LOOP_LENGTH_TWO_THRESH
+    variant
+        Variant of the algorithm:
+            - Variants.CLASSIC
+            - Variants.PLUSPLUS
+
+    Returns
+    ------------
+    heu
+        Heuristics Net
+    """
+    return exec_utils.get_variant(variant).apply_heu_statistics(statistics, parameters=parameters)
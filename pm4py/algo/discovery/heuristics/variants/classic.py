@@ -33,6 +33,7 @@ from pm4py.objects.log.obj import EventLog
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 import pandas as pd
 from pm4py.objects.heuristics_net.obj import HeuristicsNet
+from pm4py.objects.heuristics_net.statistics import HeuristicsStatistics
 
 
 class Parameters(Enum):
@@ -197,13 +198,58 @@ def apply_heu(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> Heu
     if parameters is None:
         parameters = {}
 
+    start_activities, end_activities, activities_occurrences, dfg, dfg_window_2, freq_triples, performance_dfg = discover_abstraction_log(
+        log, parameters=parameters)
+    activities = list(activities_occurrences.keys())
+
+    return apply_heu_dfg(dfg, activities=activities, activities_occurrences=activities_occurrences,
+                         start_activities=start_activities,
+                         end_activities=end_activities, dfg_window_2=dfg_window_2, freq_triples=freq_triples,
+                         performance_dfg=performance_dfg, parameters=parameters)
+
+
+def discover_abstraction_log(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[
+    Any, Any, Any, Any, Any, Any, Any]:
+    """
+    Discovers an abstraction from a log that is useful for the Heuristics Miner algorithm
+
+    Parameters
+    --------------
+    log
+        Event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY
+        - Parameters.TIMESTAMP_KEY
+        - Parameters.CASE_ID_KEY
+        - Parameters.HEU_NET_DECORATION
+
+    Returns
+    --------------
+    start_activities
+        Start activities
+    end_activities
+        End activities
+    activities_occurrences
+        Activities along with their number of occurrences
+    dfg
+        Directly-follows graph
+    dfg_window_2
+        DFG of window 2
+    freq_triples
+        Frequency triples
+    performance_dfg
+        (Performance) Directly-follows graph (only if the performance decoration is required)
+    """
+    if parameters is None:
+        parameters = {}
+
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes.DEFAULT_NAME_KEY)
     heu_net_decoration = exec_utils.get_param_value(Parameters.HEU_NET_DECORATION, parameters, "frequency")
 
     start_activities = log_sa_filter.get_start_activities(log, parameters=parameters)
     end_activities = log_ea_filter.get_end_activities(log, parameters=parameters)
     activities_occurrences = log_attributes.get_attribute_values(log, activity_key, parameters=parameters)
-    activities = list(activities_occurrences.keys())
     dfg = dfg_alg.apply(log, parameters=parameters)
     parameters_w2 = deepcopy(parameters)
     parameters_w2["window"] = 2
@@ -213,10 +259,7 @@ def apply_heu(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> Heu
     if heu_net_decoration == "performance":
         performance_dfg = dfg_alg.apply(log, variant=dfg_alg.Variants.PERFORMANCE, parameters=parameters)
 
-    return apply_heu_dfg(dfg, activities=activities, activities_occurrences=activities_occurrences,
-                         start_activities=start_activities,
-                         end_activities=end_activities, dfg_window_2=dfg_window_2, freq_triples=freq_triples,
-                         performance_dfg=performance_dfg, parameters=parameters)
+    return start_activities, end_activities, activities_occurrences, dfg, dfg_window_2, freq_triples, performance_dfg
 
 
 def apply_heu_pandas(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> HeuristicsNet:
@@ -248,6 +291,55 @@ def apply_heu_pandas(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Para
     if parameters is None:
         parameters = {}
 
+    start_activities, end_activities, activities_occurrences, dfg, dfg_window_2, frequency_triples, performance_dfg = discover_abstraction_dataframe(
+        df, parameters=parameters)
+    activities = list(activities_occurrences.keys())
+
+    heu_net = apply_heu_dfg(dfg, activities=activities, activities_occurrences=activities_occurrences,
+                            start_activities=start_activities, end_activities=end_activities,
+                            dfg_window_2=dfg_window_2,
+                            freq_triples=frequency_triples, performance_dfg=performance_dfg, parameters=parameters)
+
+    return heu_net
+
+
+def discover_abstraction_dataframe(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[
+    Any, Any, Any, Any, Any, Any, Any]:
+    """
+    Discovers an abstraction from a dataframe that is useful for the Heuristics Miner algorithm
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY
+        - Parameters.START_TIMESTAMP_KEY
+        - Parameters.TIMESTAMP_KEY
+        - Parameters.CASE_ID_KEY
+        - Parameters.HEU_NET_DECORATION
+
+    Returns
+    --------------
+    start_activities
+        Start activities
+    end_activities
+        End activities
+    activities_occurrences
+        Activities along with their number of occurrences
+    dfg
+        Directly-follows graph
+    dfg_window_2
+        DFG of window 2
+    freq_triples
+        Frequency triples
+    performance_dfg
+        (Performance) Directly-follows graph (only if the performance decoration is required)
+    """
+    if parameters is None:
+        parameters = {}
+
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes.DEFAULT_NAME_KEY)
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters,
@@ -262,7 +354,6 @@ def apply_heu_pandas(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Para
     start_activities = pd_sa_filter.get_start_activities(df, parameters=parameters)
     end_activities = pd_ea_filter.get_end_activities(df, parameters=parameters)
     activities_occurrences = pd_attributes.get_attribute_values(df, activity_key, parameters=parameters)
-    activities = list(activities_occurrences.keys())
     heu_net_decoration = exec_utils.get_param_value(Parameters.HEU_NET_DECORATION, parameters, "frequency")
 
     if timestamp_key in df:
@@ -294,12 +385,7 @@ def apply_heu_pandas(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Para
                                                       start_timestamp_key=start_timestamp_key,
                                                       measure="performance")
 
-    heu_net = apply_heu_dfg(dfg, activities=activities, activities_occurrences=activities_occurrences,
-                            start_activities=start_activities, end_activities=end_activities,
-                            dfg_window_2=dfg_window_2,
-                            freq_triples=frequency_triples, performance_dfg=performance_dfg, parameters=parameters)
-
-    return heu_net
+    return start_activities, end_activities, activities_occurrences, dfg, dfg_window_2, frequency_triples, performance_dfg
 
 
 def apply_heu_dfg(dfg, activities=None, activities_occurrences=None, start_activities=None, end_activities=None,
@@ -369,6 +455,144 @@ def apply_heu_dfg(dfg, activities=None, activities_occurrences=None, start_activ
     return heu_net
 
 
+def discover_statistics(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> HeuristicsStatistics:
+    """
+    Computes (from an event log) the statistics from which heuristics nets with any combination of the
+    thresholds can be derived, without accessing again the event log
+
+    Parameters
+    ------------
+    log
+        Event log
+    parameters
+        Possible parameters of the algorithm,
+        including:
+            - Parameters.ACTIVITY_KEY
+            - Parameters.TIMESTAMP_KEY
+            - Parameters.CASE_ID_KEY
+            - Parameters.HEU_NET_DECORATION
+
+    Returns
+    ------------
+    statistics
+        Heuristics statistics
+    """
+    start_activities, end_activities, activities_occurrences, dfg, dfg_window_2, freq_triples, performance_dfg = discover_abstraction_log(
+        log, parameters=parameters)
+
+    return HeuristicsStatistics.build(activities_occurrences, start_activities, end_activities, dfg,
+                                      dfg_window_2=dfg_window_2, freq_triples=freq_triples,
+                                      performance_dfg=performance_dfg)
+
+
+def discover_statistics_pandas(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> HeuristicsStatistics:
+    """
+    Computes (from a dataframe) the statistics from which heuristics nets with any combination of the
+    thresholds can be derived, without accessing again the dataframe
+
+    Parameters
+    ------------
+    df
+        Pandas dataframe
+    parameters
+        Possible parameters of the algorithm,
+        including:
+            - Parameters.ACTIVITY_KEY
+            - Parameters.START_TIMESTAMP_KEY
+            - Parameters.TIMESTAMP_KEY
+            - Parameters.CASE_ID_KEY
+            - Parameters.HEU_NET_DECORATION
+
+    Returns
+    ------------
+    statistics
+        Heuristics statistics
+    """
+    start_activities, end_activities, activities_occurrences, dfg, dfg_window_2, freq_triples, performance_dfg = discover_abstraction_dataframe(
+        df, parameters=parameters)
+
+    return HeuristicsStatistics.build(activities_occurrences, start_activities, end_activities, dfg,
+                                      dfg_window_2=dfg_window_2, freq_triples=freq_triples,
+                                      performance_dfg=performance_dfg)
+
+
+def apply_statistics(statistics: HeuristicsStatistics, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[PetriNet, Marking, Marking]:
+    """
+    Discovers a Petri net using Heuristics Miner, starting from the statistics computed on the log
+
+    Parameters
+    ------------
+    statistics
+        Heuristics statistics
+    parameters
+        Possible parameters of the algorithm,
+        including:
+            - Parameters.DEPENDENCY_THRESH
+            - Parameters.AND_MEASURE_THRESH
+            - Parameters.MIN_ACT_COUNT
+            - Parameters.MIN_DFG_OCCURRENCES
+            - Parameters.DFG_PRE_CLEANING_NOISE_THRESH
+            - Parameters.LOOP_LENGTH_TWO_THRESH
+            - Parameters.HEU_NET_DECORATION
+
+    Returns
+    ------------
+    net
+        Petri net
+    im
+        Initial marking
+    fm
+        Final marking
+    """
+    if parameters is None:
+        parameters = {}
+
+    heu_net = apply_heu_statistics(statistics, parameters=parameters)
+
+    return hn_conv_alg.apply(heu_net, parameters=parameters)
+
+
+def apply_heu_statistics(statistics: HeuristicsStatistics, parameters: Optional[Dict[Any, Any]] = None) -> HeuristicsNet:
+    """
+    Discovers an Heuristics Net using Heuristics Miner, starting from the statistics computed on the log.
+    The performance decoration is available only if it has been required when computing the statistics.
+
+    Parameters
+    ------------
+    statistics
+        Heuristics statistics
+    parameters
+        Possible parameters of the algorithm,
+        including:
+            - Parameters.DEPENDENCY_THRESH
+            - Parameters.AND_MEASURE_THRESH
+            - Parameters.MIN_ACT_COUNT
+            - Parameters.MIN_DFG_OCCURRENCES
+            - Parameters.DFG_PRE_CLEANING_NOISE_THRESH
+            - Parameters.LOOP_LENGTH_TWO_THRESH
+            - Parameters.HEU_NET_DECORATION
+
+    Returns
+    ------------
+    heu
+        Heuristics Net
+    """
+    if parameters is None:
+        parameters = {}
+
+    heu_net_decoration = exec_utils.get_param_value(Parameters.HEU_NET_DECORATION, parameters, "frequency")
+
+    activities_occurrences = statistics.get_activities_occurrences()
+    performance_dfg = statistics.get_performance_dfg() if heu_net_decoration == "performance" else None
+
+    return apply_heu_dfg(statistics.get_dfg(), activities=list(activities_occurrences.keys()),
+                         activities_occurrences=activities_occurrences,
+                         start_activities=statistics.get_start_activities(),
+                         end_activities=statistics.get_end_activities(),
+                         dfg_window_2=statistics.get_dfg_window_2(), freq_triples=statistics.get_freq_triples(),
+                         performance_dfg=performance_dfg, parameters=parameters)
+
+
 def calculate(heu_net, dependency_thresh=defaults.DEFAULT_DEPENDENCY_THRESH,
               and_measure_thresh=defaults.DEFAULT_AND_MEASURE_THRESH, min_act_count=defaults.DEFAULT_MIN_ACT_COUNT,
               min_dfg_occurrences=defaults.DEFAULT_MIN_DFG_OCCURRENCES,
@@ -26,6 +26,7 @@ from pm4py.objects.conversion.heuristics_net import converter as hn_conv_alg
 from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.objects.heuristics_net import defaults
 from pm4py.objects.heuristics_net.obj import HeuristicsNet
+from pm4py.objects.heuristics_net.statistics import HeuristicsStatistics
 from pm4py.objects.heuristics_net.node import Node
 from pm4py.objects.log.obj import EventLog
 from pm4py.objects.log.util import interval_lifecycle
@@ -166,6 +167,14 @@ def apply_heu(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> Heu
     if parameters is None:
         parameters = {}
 
+    log, parameters = __to_interval_log(log, parameters)
+    start_activities, end_activities, activities_occurrences, dfg, performance_dfg, sojourn_time, concurrent_activities = discover_abstraction_log(
+        log, parameters=parameters)
+    return discover_heu_net_plus_plus(start_activities, end_activities, activities_occurrences, dfg, performance_dfg,
+                                      sojourn_time, concurrent_activities, parameters=parameters)
+
+
+def __to_interval_log(log: EventLog, parameters: Dict[Any, Any]) -> Tuple[EventLog, Dict[Any, Any]]:
     log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
     log = interval_lifecycle.to_interval(log, parameters=parameters)
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters,
@@ -174,10 +183,7 @@ def apply_heu(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> Heu
         start_timestamp_key = xes.DEFAULT_START_TIMESTAMP_KEY
         parameters = copy(parameters)
         parameters[Parameters.START_TIMESTAMP_KEY] = start_timestamp_key
-    start_activities, end_activities, activities_occurrences, dfg, performance_dfg, sojourn_time, concurrent_activities = discover_abstraction_log(
-        log, parameters=parameters)
-    return discover_heu_net_plus_plus(start_activities, end_activities, activities_occurrences, dfg, performance_dfg,
-                                      sojourn_time, concurrent_activities, parameters=parameters)
+    return log, parameters
 
 
 def discover_abstraction_log(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[
@@ -400,6 +406,128 @@ def discover_heu_net_plus_plus(start_activities, end_activities, activities_occu
     return calculate(heu_net, dependency_thresh, and_measure_thresh, heu_net_decoration)
 
 
+def discover_statistics(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> HeuristicsStatistics:
+    """
+    Computes (from an event log) the statistics from which heuristics nets (Heuristics Miner ++) with any
+    combination of the thresholds can be derived, without accessing again the event log
+
+    Parameters
+    --------------
+    log
+        Event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY
+        - Parameters.START_TIMESTAMP_KEY
+        - Parameters.TIMESTAMP_KEY
+
+    Returns
+    --------------
+    statistics
+        Heuristics statistics
+    """
+    if parameters is None:
+        parameters = {}
+
+    log, parameters = __to_interval_log(log, parameters)
+    start_activities, end_activities, activities_occurrences, dfg, performance_dfg, sojourn_time, concurrent_activities = discover_abstraction_log(
+        log, parameters=parameters)
+    return HeuristicsStatistics.build(activities_occurrences, start_activities, end_activities, dfg,
+                                      performance_dfg=performance_dfg, concurrent_activities=concurrent_activities,
+                                      sojourn_time=sojourn_time)
+
+
+def discover_statistics_pandas(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> HeuristicsStatistics:
+    """
+    Computes (from a dataframe) the statistics from which heuristics nets (Heuristics Miner ++) with any
+    combination of the thresholds can be derived, without accessing again the dataframe
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY
+        - Parameters.START_TIMESTAMP_KEY
+        - Parameters.TIMESTAMP_KEY
+        - Parameters.CASE_ID_KEY
+
+    Returns
+    --------------
+    statistics
+        Heuristics statistics
+    """
+    start_activities, end_activities, activities_occurrences, dfg, performance_dfg, sojourn_time, concurrent_activities = discover_abstraction_dataframe(
+        df, parameters=parameters)
+    return HeuristicsStatistics.build(activities_occurrences, start_activities, end_activities, dfg,
+                                      performance_dfg=performance_dfg, concurrent_activities=concurrent_activities,
+                                      sojourn_time=sojourn_time)
+
+
+def apply_statistics(statistics: HeuristicsStatistics, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[PetriNet, Marking, Marking]:
+    """
+    Discovers a Petri net using the Heuristics Miner ++ algorithm, starting from the statistics computed on the log
+
+    Parameters
+    --------------
+    statistics
+        Heuristics statistics
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.DEPENDENCY_THRESH
+        - Parameters.AND_MEASURE_THRESH
+        - Parameters.MIN_ACT_COUNT
+        - Parameters.MIN_DFG_OCCURRENCES
+        - Parameters.HEU_NET_DECORATION
+
+    Returns
+    --------------
+    net
+        Petri net
+    im
+        Initial marking
+    fm
+        Final marking
+    """
+    heu_net = apply_heu_statistics(statistics, parameters=parameters)
+    net, im, fm = hn_conv_alg.apply(heu_net, parameters=parameters)
+    return net, im, fm
+
+
+def apply_heu_statistics(statistics: HeuristicsStatistics, parameters: Optional[Dict[Any, Any]] = None) -> HeuristicsNet:
+    """
+    Discovers an heuristics net using the Heuristics Miner ++ algorithm, starting from the statistics computed
+    on the log
+
+    Parameters
+    --------------
+    statistics
+        Heuristics statistics
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.DEPENDENCY_THRESH
+        - Parameters.AND_MEASURE_THRESH
+        - Parameters.MIN_ACT_COUNT
+        - Parameters.MIN_DFG_OCCURRENCES
+        - Parameters.HEU_NET_DECORATION
+
+    Returns
+    --------------
+    heu_net
+        Heuristics net
+    """
+    if statistics.concurrent_activities is None:
+        raise Exception("the statistics have not been computed for the Heuristics Miner ++ algorithm.")
+
+    performance_dfg = statistics.get_performance_dfg()
+    return discover_heu_net_plus_plus(statistics.get_start_activities(), statistics.get_end_activities(),
+                                      statistics.get_activities_occurrences(), statistics.get_dfg(),
+                                      performance_dfg if performance_dfg is not None else {},
+                                      statistics.get_sojourn_time(), statistics.get_concurrent_activities(),
+                                      parameters=parameters)
+
+
 def calculate(heu_net: HeuristicsNet, dependency_thresh: float, and_measure_thresh: float,
               heu_net_decoration: str) -> HeuristicsNet:
     """
@@ -29,12 +29,14 @@ from pm4py.objects.log.util import filtering_utils
 from pm4py.util.lp import solver as lp_solver
 from pm4py.objects.petri_net.utils import petri_utils
 from pm4py.objects.log.util import artificial
-from copy import copy, deepcopy
+from copy import deepcopy
 from pm4py.algo.discovery.causal import algorithm as causal_discovery
 from pm4py.algo.discovery.dfg import algorithm as dfg_discovery
 from pm4py.objects.petri_net.utils import murata
 from pm4py.objects.petri_net.utils import reduction
 import importlib.util
+import multiprocessing
+from scipy import sparse
 
 
 class Parameters(Enum):
@@ -44,24 +46,145 @@ class Parameters(Enum):
     CAUSAL_RELATION = "causal_relation"
     SHOW_PROGRESS_BAR = "show_progress_bar"
     ALPHA = "alpha"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
 
 
-def __transform_log_to_matrix(log: EventLog, activities: List[str], activity_key: str):
+def __get_prefix_tree(log: EventLog, log0: EventLog, activities: List[str], activity_key: str):
     """
     Internal method
-    Transforms the event log in a numeric matrix that is used to construct the linear problem.
+    Encodes the (unique) prefixes of the traces of the event log as the nodes of a prefix tree (the node 0 being the
+    empty prefix). The nodes are numbered in the order of their first visit (so a parent precedes its children).
+
+    Returns, for each node: the parent, the activity, the depth, the number of variants and of traces sharing the
+    prefix, and the position (in the sequence of the events of the log) of the first visit of the node as a proper
+    prefix of a trace and as a complete trace (-1 if the prefix is never visited as such).
     """
-    matr = []
-    for trace in log:
-        vect = []
-        rep = np.array([0] * len(activities))
+    activities_idx = {x: i for i, x in enumerate(activities)}
+    children = [{}]
+    parent = [-1]
+    activity = [-1]
+    depth = [0]
+    num_variants = [0]
+    num_traces = [0]
+    first_inner = [-1]
+    first_end = [-1]
+    position = 0
+    for j, trace in enumerate(log):
+        trace_occ = log0[j].attributes["@@num_traces"]
+        node = 0
         for i in range(len(trace)):
-            repi = rep.copy()
-            repi[activities.index(trace[i][activity_key])] += 1
-            vect.append(repi)
-            rep = repi
-        matr.append(vect)
-    return matr
+            act = activities_idx[trace[i][activity_key]]
+            child = children[node].get(act)
+            if child is None:
+                child = len(parent)
+                children[node][act] = child
+                children.append({})
+                parent.append(node)
+                activity.append(act)
+                depth.append(i + 1)
+                num_variants.append(0)
+                num_traces.append(0)
+                first_inner.append(-1)
+                first_end.append(-1)
+            node = child
+            num_variants[node] += 1
+            num_traces[node] += trace_occ
+            if i < len(trace) - 1:
+                if first_inner[node] < 0:
+                    first_inner[node] = position
+            elif first_end[node] < 0:
+                first_end[node] = position
+            position += 1
+
+    return np.array(parent), np.array(activity), np.array(depth), np.array(num_variants), np.array(num_traces), \
+        np.array(first_inner), np.array(first_end)
+
+
+def __get_parikh_vectors(parent: np.ndarray, activity: np.ndarray, depth: np.ndarray, num_activities: int) -> np.ndarray:
+    """
+    Internal method
+    Computes the Parikh vector of each prefix of the prefix tree (proceeding level by level)
+    """
+    parikh = np.zeros((len(parent), num_activities), dtype=np.int64)
+    for d in range(1, int(depth.max()) + 1):
+        nodes = np.flatnonzero(depth == d)
+        parikh[nodes] = parikh[parent[nodes]]
+        parikh[nodes, activity[nodes]] += 1
+    return parikh
+
+
+def __get_included_prefixes(parent: np.ndarray, activity: np.ndarray, depth: np.ndarray, num_traces: np.ndarray,
+                            parikh: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Internal method
+    Filters the prefixes using the sequence encoding graph (whose nodes are the Parikh vectors of the prefixes).
+    A prefix is kept if its arc in the sequence encoding graph is frequent enough (with respect to the most frequent
+    arc outgoing the same node), and if its parent prefix is kept.
+    """
+    included = np.ones(len(parent), dtype=bool)
+    if alpha >= 1.0 or len(parent) <= 1:
+        return included
+
+    nodes = np.arange(1, len(parent))
+    # the arc of the prefix goes from the Parikh vector of the parent to the same vector increased on the activity
+    prev_ids = np.unique(parikh[parent[nodes]], axis=0, return_inverse=True)[1].reshape(-1)
+    arcs, arcs_ids = np.unique(prev_ids * parikh.shape[1] + activity[nodes], return_inverse=True)
+    arcs_ids = arcs_ids.reshape(-1)
+    arcs_weight = np.bincount(arcs_ids, weights=num_traces[nodes])
+    max_child = np.zeros(int(prev_ids.max()) + 1)
+    np.maximum.at(max_child, arcs // parikh.shape[1], arcs_weight)
+
+    included[nodes] = arcs_weight[arcs_ids] >= (1 - alpha) * max_child[prev_ids]
+    for d in range(2, int(depth.max()) + 1):
+        level = np.flatnonzero(depth == d)
+        included[level] &= included[parent[level]]
+    return included
+
+
+def __get_constraints(parikh: np.ndarray, parent: np.ndarray, nodes: np.ndarray, first_visit: np.ndarray):
+    """
+    Internal method
+    Gets the (sparse) matrix of the constraints associated to the given prefixes, sorted by the first visit of the
+    prefixes and without duplicate rows
+    """
+    nodes = nodes[np.argsort(first_visit[nodes], kind="stable")]
+    rows = np.hstack([-parikh[parent[nodes]], parikh[nodes], -np.ones((len(nodes), 1), dtype=np.int64)])
+    if len(rows) > 0:
+        rows = rows[np.sort(np.unique(rows, axis=0, return_index=True)[1])]
+    return sparse.csr_matrix(rows.astype(np.float64))
+
+
+def __solve_causal_relations(lp: Dict[str, Any], causal_relations: List[Tuple[int, int]]) -> List[Optional[List[int]]]:
+    """
+    Internal method
+    Solves the linear problem associated to each causal relation (expressed as couple of activity indexes),
+    returning the found places (None if the problem is not feasible)
+    """
+    num_activities = len(lp["c"]) // 2
+    ret = []
+    for act1, act2 in causal_relations:
+        const = sparse.csr_matrix(([1.0, 1.0], ([0, 1], [act1, num_activities + act2])),
+                                  shape=(2, 2 * num_activities + 1))
+        Aeq1 = sparse.vstack([lp["Aeq"], const], format="csr")
+        beq1 = np.concatenate([lp["beq"], [1, 1]])
+
+        sol = lp_solver.apply(lp["c"], lp["Aub"], lp["bub"], Aeq1, beq1, variant=lp_solver.SCIPY,
+                              parameters={"integrality": lp["integrality"]})
+        ret.append(lp_solver.get_points_from_sol(sol, variant=lp_solver.SCIPY) if sol.success else None)
+    return ret
+
+
+# state of the worker processes (set once per process by the initializer)
+__WORKER_STATE = {}
+
+
+def __initialize_worker(lp):
+    __WORKER_STATE["lp"] = lp
+
+
+def __solve_causal_relations_worker(causal_relations):
+    return __solve_causal_relations(__WORKER_STATE["lp"], causal_relations)
 
 
 def __manage_solution(sol, added_places, explored_solutions, net, activities, trans_map):
@@ -69,8 +192,7 @@ def __manage_solution(sol, added_places, explored_solutions, net, activities, tr
     Internal method.
     Manages the solution of the linear problem and possibly adds it as a place of the Petri net
     """
-    if sol.success:
-        sol = lp_solver.get_points_from_sol(sol, variant=lp_solver.SCIPY)
+    if sol is not None:
         sol = [round(x) for x in sol]
 
         if tuple(sol) not in added_places:
@@ -118,6 +240,9 @@ def apply(log0: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional
         Parameters of the algorithm, including:
         - Parameters.ACTIVITY_KEY => the attribute to be used as activity
         - Parameters.SHOW_PROGRESS_BAR => decides if the progress bar should be shown
+        - Parameters.ALPHA => noise threshold for the sequence encoding graph (1.0: no filtering)
+        - Parameters.MULTIPROCESSING => solves the linear problems of the causal relations in a pool of processes
+        - Parameters.CORES => number of processes of the pool (default: number of CPUs)
 
     Returns
     ---------------
@@ -145,6 +270,9 @@ def apply(log0: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional
     causal = exec_utils.get_param_value(Parameters.CAUSAL_RELATION, parameters, causal_discovery.apply(dfg_discovery.apply(log, parameters=parameters)))
     # noise threshold for the sequence encoding graph (when alpha=1, no filtering is applied; when alpha=0, the greatest filtering is applied)
     alpha = exec_utils.get_param_value(Parameters.ALPHA, parameters, 1.0)
+    enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters,
+                                                        constants.ENABLE_MULTIPROCESSING_DEFAULT)
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count())
 
     activities = sorted(list(set(x[activity_key] for trace in log for x in trace)))
 
@@ -160,8 +288,6 @@ def apply(log0: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional
         if constants.SHOW_INTERNAL_WARNINGS:
             warnings.warn("The conditions needed to ensure a relaxed sound WF-net as output are not satisfied.")
 
-    matr = __transform_log_to_matrix(log, activities, activity_key)
-
     net = PetriNet("ilp")
     im = Marking()
     fm = Marking()
@@ -185,85 +311,44 @@ def apply(log0: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional
         elif act == artificial_end_activity:
             petri_utils.add_arc_from_to(trans_map[act], sink, net)
 
-    # STEP B) construction of the sequence encoding graph
-    seq_enc_graph = {}
-    for j in range(len(matr)):
-        trace = matr[j]
-        trace_occ = log0[j].attributes["@@num_traces"]
-        for i in range(len(trace)):
-            prev = -trace[i-1] if i > 0 else np.zeros(len(activities))
-            curr = trace[i]
-            prev = tuple(prev)
-            curr = tuple(curr)
-            if prev not in seq_enc_graph:
-                seq_enc_graph[prev] = {}
-            if curr not in seq_enc_graph[prev]:
-                seq_enc_graph[prev][curr] = 0
-            seq_enc_graph[prev][curr] += trace_occ
-    max_child_seq_enc_graph = {x: max(y.values()) for x, y in seq_enc_graph.items()}
+    # STEP B) construction of the prefix tree of the log, and filtering of the prefixes
+    # through the sequence encoding graph
+    parent, activity, depth, num_variants, num_traces, first_inner, first_end = __get_prefix_tree(log, log0, activities,
+                                                                                                  activity_key)
+    parikh = __get_parikh_vectors(parent, activity, depth, len(activities))
+    included = __get_included_prefixes(parent, activity, depth, num_traces, parikh, alpha)
+    included[0] = False
 
     # STEP C) construction of the base linear problem
     # which will be 'extended' in each step
-    c = np.zeros(2*len(activities))
-    Aub = []
-    bub = []
-    Aeq = []
-    beq = []
-
-    added_rows_Aub = set()
-    added_rows_Aeq = set()
-
-    for trace in matr:
-        for i in range(len(trace)):
-            row1 = -trace[i-1] if i > 0 else np.zeros(len(activities))
-            row2 = trace[i]
-            prev = tuple(row1)
-            curr = tuple(row2)
-
-            if seq_enc_graph[prev][curr] >= (1-alpha) * max_child_seq_enc_graph[prev]:
-                row = row1.tolist() + row2.tolist() + [-1]
-                if i < len(trace)-1:
-                    if tuple(row) not in added_rows_Aub:
-                        added_rows_Aub.add(tuple(row))
-                        Aub.append(row)
-                        bub.append(0)
-                else:
-                    if tuple(row) not in added_rows_Aeq:
-                        # deviation 1: impose that the place is empty at the end of every trace of the log
-                        added_rows_Aeq.add(tuple(row))
-                        Aeq.append(row)
-                        beq.append(0)
-
-                crow = row2.tolist() + (-row2).tolist()
-                c += crow
-            else:
-                # break not only the current node but all his children
-                break
-
-    Aub.append([-1] * (2*len(activities)) + [0])
+    # (every unique prefix contributes to the objective function as many times as the variants sharing it)
+    weighted_parikh = num_variants[included] @ parikh[included]
+    c = np.concatenate([weighted_parikh, -weighted_parikh, [1]]).astype(np.float64)
+
+    Aub = __get_constraints(parikh, parent, np.flatnonzero(included & (first_inner >= 0)), first_inner)
+    # deviation 1: impose that the place is empty at the end of every trace of the log
+    Aeq = __get_constraints(parikh, parent, np.flatnonzero(included & (first_end >= 0)), first_end)
+    bub = [0] * Aub.shape[0]
+    beq = [0] * Aeq.shape[0]
+
+    num_variables = 2 * len(activities) + 1
+    Aub = sparse.vstack([Aub, sparse.csr_matrix([[-1] * (2 * len(activities)) + [0]], dtype=np.float64)])
     bub.append(-1)
 
-    for i in range(2*len(activities)+1):
-        row1 = [0] * (2*len(activities)+1)
-        row1[i] = -1
-        Aub.append(row1)
-        bub.append(0)
-        row2 = [0] * (2*len(activities)+1)
-        row2[i] = 1
-        Aub.append(row2)
-        bub.append(1)
+    # each variable is bounded between 0 and 1
+    Aub = sparse.vstack([Aub, sparse.csr_matrix(([-1.0, 1.0] * num_variables, (
+        list(range(2 * num_variables)), [i // 2 for i in range(2 * num_variables)])),
+                                                shape=(2 * num_variables, num_variables))])
+    bub.extend([0, 1] * num_variables)
 
     # deviation 2: seek only for places that contains initially 0 tokens
-    const = [0] * (2 * len(activities)) + [1]
-    Aub.append(const)
+    Aub = sparse.vstack([Aub, sparse.csr_matrix([[0] * (2 * len(activities)) + [1]], dtype=np.float64)], format="csr")
     bub.append(0)
 
-    c = c.tolist()
-    c.append(1)
+    integrality = [1] * num_variables
 
-    integrality = [1] * (2*len(activities)+1)
+    lp = {"c": c, "Aub": Aub, "bub": np.array(bub), "Aeq": Aeq, "beq": np.array(beq), "integrality": integrality}
 
-    ite = 0
     added_places = set()
     explored_solutions = set()
 
@@ -273,28 +358,28 @@ def apply(log0: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional
         progress = tqdm(total=len(causal), desc="discovering Petri net using ILP miner, completed causal relations :: ")
 
     # STEP D) explore all the causal relations in the log
-    # to find places
-    for ca in causal:
-        Aeq1 = copy(Aeq)
-        beq1 = copy(beq)
-
-        const1 = [0] * (2*len(activities) + 1)
-        const1[activities.index(ca[0])] = 1
-        Aeq1.append(const1)
-        beq1.append(1)
-
-        const2 = [0] * (2*len(activities) + 1)
-        const2[len(activities) + activities.index(ca[1])] = 1
-        Aeq1.append(const2)
-        beq1.append(1)
-
-        sol = lp_solver.apply(c, Aub, bub, Aeq1, beq1, variant=lp_solver.SCIPY, parameters={"integrality": integrality})
-        __manage_solution(sol, added_places, explored_solutions, net, activities, trans_map)
-
-        ite += 1
-
-        if progress is not None:
-            progress.update()
+    # to find places (the linear problems of the causal relations are independent)
+    causal_relations = [(activities.index(ca[0]), activities.index(ca[1])) for ca in causal]
+    if enable_multiprocessing and len(causal_relations) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        num_chunks = min(len(causal_relations), 4 * cores)
+        chunks = [causal_relations[i::num_chunks] for i in range(num_chunks)]
+        # the linear problem is shipped once to every worker (through the initializer)
+        with ProcessPoolExecutor(max_workers=cores, initializer=__initialize_worker, initargs=(lp,)) as executor:
+            solutions = [None] * len(causal_relations)
+            for i, sols in enumerate(executor.map(__solve_causal_relations_worker, chunks)):
+                solutions[i::num_chunks] = sols
+                if progress is not None:
+                    progress.update(len(sols))
+        for sol in solutions:
+            __manage_solution(sol, added_places, explored_solutions, net, activities, trans_map)
+    else:
+        for ca in causal_relations:
+            sol = __solve_causal_relations(lp, [ca])[0]
+            __manage_solution(sol, added_places, explored_solutions, net, activities, trans_map)
+
+            if progress is not None:
+                progress.update()
 
     # gracefully close progress bar
     if progress is not None:
@@ -65,7 +65,10 @@ def apply(obj: Union[EventLog, pd.DataFrame, DFG, UVCL], parameters: Optional[Di
                 warnings.warn('Inductive Miner Variant requested for DFG artefact is not IMD, resorting back to IMD')
         imd = IMD(parameters)
         idfg = InductiveDFG(dfg=obj, skip=False)
-        process_tree = imd.apply(IMDataStructureDFG(idfg), parameters)
+        try:
+            process_tree = imd.apply(IMDataStructureDFG(idfg), parameters)
+        finally:
+            imd.close()
     else:
         if type(obj) in [UVCL]:
             uvcl = obj
@@ -74,14 +77,23 @@ def apply(obj: Union[EventLog, pd.DataFrame, DFG, UVCL], parameters: Optional[Di
 
         if variant is Variants.IM:
             im = IMUVCL(parameters)
-            process_tree = im.apply(IMDataStructureUVCL(uvcl), parameters)
+            try:
+                process_tree = im.apply(IMDataStructureUVCL(uvcl), parameters)
+            finally:
+                im.close()
         if variant is Variants.IMf:
             imf = IMFUVCL(parameters)
-            process_tree = imf.apply(IMDataStructureUVCL(uvcl), parameters)
+            try:
+                process_tree = imf.apply(IMDataStructureUVCL(uvcl), parameters)
+            finally:
+                imf.close()
         if variant is Variants.IMd:
             imd = IMD(parameters)
             idfg = InductiveDFG(dfg=comut.discover_dfg_uvcl(uvcl), skip=() in uvcl)
-            process_tree = imd.apply(IMDataStructureDFG(idfg), parameters)
+            try:
+                process_tree = imd.apply(IMDataStructureDFG(idfg), parameters)
+            finally:
+                imd.close()
 
     process_tree = pt_util.fold(process_tree)
     tree_sort(process_tree)
@@ -15,7 +15,6 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from abc import ABC
-from collections import Counter
 from typing import List, Collection, Any, Optional, Generic, Dict
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
@@ -88,13 +87,12 @@ class ConcurrencyCutUVCL(ConcurrencyCut[IMDataStructureUVCL]):
 
     @classmethod
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
-        r = list()
-        for g in groups:
-            c = Counter()
-            for t in obj.data_structure:
-                c[tuple(filter(lambda e: e in g, t))] = obj.data_structure[t]
-            r.append(c)
-        return list(map(lambda l: IMDataStructureUVCL(l), r))
+        # as in the projection of the (merged) UVCL, the variants having the same projection on a group keep
+        # the count of the last one
+        encoded = obj.encoded.merge_variants()
+        return [IMDataStructureUVCL.from_encoded(
+            encoded.project_activities(encoded.get_activities_mask(g)).merge_variants(keep_last_count=True))
+            for g in groups]
 
 
 class ConcurrencyCutDFG(ConcurrencyCut[IMDataStructureDFG]):
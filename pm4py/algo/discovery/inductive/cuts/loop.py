@@ -15,8 +15,9 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from abc import ABC
-from collections import Counter
-from typing import List, Optional, Collection, Any, Tuple, Generic, Dict
+from typing import List, Optional, Collection, Any, Generic, Dict
+
+import numpy as np
 
 from pm4py.util import nx_utils
 
@@ -26,7 +27,6 @@ from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMD
 from pm4py.objects.dfg import util as dfu
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
-from pm4py.util.compression.dtypes import UVCL
 
 
 class LoopCut(Cut[T], ABC, Generic[T]):
@@ -160,40 +160,47 @@ class LoopCutUVCL(LoopCut[IMDataStructureUVCL]):
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
         do = groups[0]
         redo = groups[1:]
-        redo_activities = [y for x in redo for y in x]
-        do_log = Counter()
-        redo_logs = [Counter() for i in range(len(redo))]
-        for t in obj.data_structure:
-            do_trace = tuple()
-            redo_trace = tuple()
-            for e in t:
-                if e in do:
-                    do_trace = do_trace + (e,)
-                    if len(redo_trace) > 0:
-                        redo_logs = cls._append_trace_to_redo_log(redo_trace, redo_logs, redo, obj.data_structure[t])
-                        redo_trace = tuple()
-                else:
-                    if e in redo_activities:
-                        redo_trace = redo_trace + (e,)
-                        if len(do_trace) > 0:
-                            do_log.update({do_trace: obj.data_structure[t]})
-                            do_trace = tuple()
-            if len(redo_trace) > 0:
-                redo_logs = cls._append_trace_to_redo_log(redo_trace, redo_logs, redo)
-            do_log.update({do_trace: obj.data_structure[t]})
-        logs = [do_log]
-        logs.extend(redo_logs)
-        return list(map(lambda l: IMDataStructureUVCL(l), logs))
-
-    @classmethod
-    def _append_trace_to_redo_log(cls, redo_trace: Tuple, redo_logs: List[UVCL], redo_groups: List[Collection[Any]],
-                                  cardinality, parameters: Optional[Dict[str, Any]] = None) -> \
-            List[UVCL]:
-        activities = set(x for x in redo_trace)
-        inte = [(i, len(activities.intersection(redo_groups[i]))) for i in range(len(redo_groups))]
-        inte = sorted(inte, key=lambda x: (x[1], x[0]), reverse=True)
-        redo_logs[inte[0][0]].update({redo_trace: cardinality})
-        return redo_logs
+        encoded = obj.encoded
+        group_of_activity = np.full(len(encoded.activities), len(redo), dtype=np.int64)
+        for index, group in enumerate(redo):
+            group_of_activity[encoded.get_activities_mask(group)] = index
+        do_mask = encoded.get_activities_mask(do)
+        encoded = encoded.project_activities(do_mask | (group_of_activity < len(redo)))
+
+        # every variant is split in maximal runs of events of the do part and of the redo part
+        variants = np.arange(len(encoded.counts))
+        variant_index = np.repeat(variants, encoded.get_lengths())
+        is_do = do_mask[encoded.events]
+        is_start = np.ones(len(encoded.events), dtype=bool)
+        is_start[1:] = (is_do[1:] != is_do[:-1]) | (variant_index[1:] != variant_index[:-1])
+        starts = np.flatnonzero(is_start)
+        ends = np.append(starts[1:], len(encoded.events))
+        run_variants = variant_index[starts]
+        is_do_run = is_do[starts]
+
+        # the do log contains also an empty trace for the variants that do not end with an event of the do part
+        non_empty = encoded.get_lengths() > 0
+        last_not_do = ~non_empty
+        last_not_do[non_empty] = ~is_do[encoded.offsets[1:][non_empty] - 1]
+        empty_variants = np.flatnonzero(last_not_do)
+        do_starts = np.concatenate((starts[is_do_run], encoded.offsets[1:][empty_variants]))
+        do_ends = np.concatenate((ends[is_do_run], encoded.offsets[1:][empty_variants]))
+        do_variants = np.concatenate((run_variants[is_do_run], empty_variants))
+        order = np.lexsort((do_variants, do_starts))
+        logs = [encoded.extract_segments(do_starts[order], do_ends[order], do_variants[order])]
+
+        # every run of the redo part goes to the redo group sharing most activities with it (ties broken in favor
+        # of the last group)
+        run_index = np.cumsum(is_start) - 1
+        distinct = np.unique(run_index[~is_do] * len(encoded.activities) + encoded.events[~is_do])
+        count = np.zeros((len(starts), len(redo) + 1), dtype=np.int64)
+        np.add.at(count, (distinct // len(encoded.activities),
+                          group_of_activity[distinct % len(encoded.activities)]), 1)
+        chosen = len(redo) - 1 - np.argmax(count[:, len(redo) - 1::-1], axis=1)
+        for index in range(len(redo)):
+            selected = ~is_do_run & (chosen == index)
+            logs.append(encoded.extract_segments(starts[selected], ends[selected], run_variants[selected]))
+        return list(map(lambda l: IMDataStructureUVCL.from_encoded(l), logs))
 
 
 class LoopCutDFG(LoopCut[IMDataStructureDFG]):
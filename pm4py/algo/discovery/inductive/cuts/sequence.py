@@ -19,7 +19,8 @@ import sys
 from abc import ABC
 from collections import Counter
 from typing import Collection, Any, List, Optional, Generic, Dict
-from typing import Tuple
+
+import numpy as np
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut
 from pm4py.algo.discovery.inductive.cuts.abc import T
@@ -161,45 +162,33 @@ class SequenceCutUVCL(SequenceCut[IMDataStructureUVCL]):
 
     @classmethod
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
-        logs = [Counter() for g in groups]
-        for t in obj.data_structure:
-            i = 0
-            split_point = 0
-            act_union = set()
-            while i < len(groups):
-                new_split_point = cls._find_split_point(
-                    t, groups[i], split_point, act_union)
-                trace_i = tuple()
-                j = split_point
-                while j < new_split_point:
-                    if t[j] in groups[i]:
-                        trace_i = trace_i + (t[j],)
-                    j = j + 1
-                logs[i].update({trace_i: obj.data_structure[t]})
-                split_point = new_split_point
-                act_union = act_union.union(set(groups[i]))
-                i = i + 1
-        return list(map(lambda l: IMDataStructureUVCL(l), logs))
-
-    @classmethod
-    def _find_split_point(cls, t: Tuple[Any], group: Collection[Any], start: int, ignore: Collection[Any], parameters: Optional[Dict[str, Any]] = None) -> int:
-        least_cost = 0
-        position_with_least_cost = start
-        cost = 0
-        i = start
-        while i < len(t):
-            if t[i] in group:
-                cost = cost - 1
-            elif t[i] not in ignore:
-                cost = cost + 1
-
-            if cost < least_cost:
-                least_cost = cost
-                position_with_least_cost = i + 1
-
-            i = i + 1
-
-        return position_with_least_cost
+        encoded = obj.encoded
+        variants = np.arange(len(encoded.counts))
+        variant_index = np.repeat(variants, encoded.get_lengths())
+        positions = np.arange(len(encoded.events))
+        split_points = encoded.offsets[:-1]
+        ignore = np.zeros(len(encoded.activities), dtype=bool)
+        logs = []
+        for g in groups:
+            mask = encoded.get_activities_mask(g)
+            # the split point of every variant follows the first position reaching the minimum cost (if negative)
+            # after the previous split point, where the events of the group decrease the cost and the events of the
+            # following groups increase it
+            active = positions >= split_points[variant_index]
+            step = np.where(mask[encoded.events], -1, np.where(ignore[encoded.events], 0, 1))
+            cost = np.cumsum(np.where(active, step, 0))
+            cost = cost - np.concatenate(([0], cost))[encoded.offsets[:-1]][variant_index]
+            least_cost = np.zeros(len(variants), dtype=np.int64)
+            np.minimum.at(least_cost, variant_index[active], cost[active])
+            reached = np.flatnonzero(active & (cost == least_cost[variant_index]) & (least_cost[variant_index] < 0))
+            reached_variants, first = np.unique(variant_index[reached], return_index=True)
+            new_split_points = split_points.copy()
+            new_split_points[reached_variants] = reached[first] + 1
+            logs.append(IMDataStructureUVCL.from_encoded(
+                encoded.extract_segments(split_points, new_split_points, variants, mask[encoded.events])))
+            split_points = new_split_points
+            ignore |= mask
+        return logs
 
 
 class StrictSequenceCutUVCL(StrictSequenceCut[IMDataStructureUVCL], SequenceCutUVCL):
@@ -15,9 +15,10 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from abc import ABC
-from collections import Counter
 from typing import Optional, List, Collection, Any, Generic, Dict
 
+import numpy as np
+
 from pm4py.util import nx_utils
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
@@ -61,20 +62,21 @@ class ExclusiveChoiceCut(Cut[T], ABC, Generic[T]):
 class ExclusiveChoiceCutUVCL(ExclusiveChoiceCut[IMDataStructureUVCL]):
     @classmethod
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
-        logs = [Counter() for g in groups]
-        for t in obj.data_structure:
-            count = {i: 0 for i in range(len(groups))}
-            for index, group in enumerate(groups):
-                for e in t:
-                    if e in group:
-                        count[index] += 1
-            count = sorted(list((x, y) for x, y in count.items()), key=lambda x: (x[1], x[0]), reverse=True)
-            new_trace = tuple()
-            for e in t:
-                if e in groups[count[0][0]]:
-                    new_trace = new_trace + (e,)
-            logs[count[0][0]].update({new_trace: obj.data_structure[t]})
-        return list(map(lambda l: IMDataStructureUVCL(l), logs))
+        encoded = obj.encoded
+        group_of_activity = np.full(len(encoded.activities) + 1, len(groups), dtype=np.int64)
+        for index, group in enumerate(groups):
+            group_of_activity[:-1][encoded.get_activities_mask(group)] = index
+        # count of the events of each variant belonging to each group (the last column collects the other events)
+        variant_index = np.repeat(np.arange(len(encoded.counts)), encoded.get_lengths())
+        count = np.zeros((len(encoded.counts), len(groups) + 1), dtype=np.int64)
+        np.add.at(count, (variant_index, group_of_activity[encoded.events]), 1)
+        # each variant is assigned to the group with most events (ties broken in favor of the last group)
+        chosen = len(groups) - 1 - np.argmax(count[:, len(groups) - 1::-1], axis=1)
+        logs = []
+        for index, group in enumerate(groups):
+            log = encoded.select_variants(chosen == index).project_activities(encoded.get_activities_mask(group))
+            logs.append(IMDataStructureUVCL.from_encoded(log))
+        return logs
 
 
 class ExclusiveChoiceCutDFG(ExclusiveChoiceCut[IMDataStructureDFG]):
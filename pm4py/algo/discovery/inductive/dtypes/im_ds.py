@@ -20,7 +20,7 @@ from typing import TypeVar, Generic, Optional
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
 from pm4py.objects.dfg.obj import DFG
 from pm4py.util.compression import util as comut
-from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression.dtypes import UVCL, EncodedUVCL
 
 T = TypeVar('T')
 
@@ -54,15 +54,35 @@ class IMDataStructureLog(IMDataStructure[T], ABC, Generic[T]):
 class IMDataStructureUVCL(IMDataStructureLog[UVCL]):
     """
     Log-Based data structure class that represents the event log as a 'Univariate Variant Compressed Log (UVCL)'
+
+    The log is also kept in its integer-encoded form (EncodedUVCL), from which the DFG is computed and the sub-logs
+    can be derived (see from_encoded). In the latter case, the UVCL is decoded only when it is needed.
     """
 
-    def __init__(self, obj: UVCL, dfg: Optional[DFG] = None):
+    def __init__(self, obj: Optional[UVCL], dfg: Optional[DFG] = None, encoded: Optional[EncodedUVCL] = None):
         super().__init__(obj)
+        self._encoded = encoded
         if dfg is None:
-            self._dfg = comut.discover_dfg_uvcl(self._obj)
+            self._dfg = self.encoded.discover_dfg()
         else:
             self._dfg = dfg
 
+    @staticmethod
+    def from_encoded(encoded: EncodedUVCL, dfg: Optional[DFG] = None) -> "IMDataStructureUVCL":
+        return IMDataStructureUVCL(None, dfg=dfg, encoded=encoded)
+
+    @property
+    def data_structure(self) -> UVCL:
+        if self._obj is None:
+            self._obj = self._encoded.to_uvcl()
+        return self._obj
+
+    @property
+    def encoded(self) -> EncodedUVCL:
+        if self._encoded is None:
+            self._encoded = EncodedUVCL.from_uvcl(self._obj)
+        return self._encoded
+
     @property
     def dfg(self) -> DFG:
         return self._dfg
@@ -14,7 +14,6 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from collections import Counter
 from typing import Optional, Tuple, List, Any, Dict
 
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
@@ -22,8 +21,6 @@ from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
 from pm4py.algo.discovery.inductive.fall_through.abc import FallThrough
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree, Operator
-from pm4py.util.compression import util as comut
-from pm4py.util.compression.dtypes import UVCL
 from enum import Enum
 from pm4py.util import exec_utils, constants
 
@@ -36,11 +33,11 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
     MULTI_PROCESSING_LOWER_BOUND = 20
 
     @classmethod
-    def _process_candidate(cls, c: Any, log: UVCL, queue=None, ev=None, parameters: Optional[Dict[str, Any]] = None):
-        l_alt = Counter()
-        for t in log:
-            l_alt[tuple(filter(lambda e: e != c, t))] = log[t]
-        cut = cls._find_cut(IMDataStructureUVCL(l_alt), ev, parameters=parameters)
+    def _process_candidate(cls, c: Any, obj: IMDataStructureUVCL, queue=None, ev=None, parameters: Optional[Dict[str, Any]] = None):
+        # the log without the candidate is derived from the encoded log (the UVCL is decoded only if a cut is found)
+        encoded = obj.encoded
+        l_alt = encoded.project_activities(encoded.get_activities_mask(set(encoded.activities).difference({c})))
+        cut = cls._find_cut(IMDataStructureUVCL.from_encoded(l_alt), ev, parameters=parameters)
         if queue is not None:
             queue.put((c, cut))
         return cut if cut is not None else None
@@ -52,11 +49,10 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
 
         enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT)
 
-        log = obj.data_structure
-        candidates = sorted(list(comut.get_alphabet(log)))
+        candidates = obj.encoded.get_alphabet()
         if pool is None or manager is None or not enable_multiprocessing or len(candidates) <= ActivityConcurrentUVCL.MULTI_PROCESSING_LOWER_BOUND:
             for a in candidates:
-                cut = cls._process_candidate(a, log, parameters=parameters)
+                cut = cls._process_candidate(a, obj, parameters=parameters)
                 if cut is not None:
                     return a
         else:
@@ -67,7 +63,7 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
             manager.support_list.append(ev)
 
             for a in candidates:
-                pool.apply_async(cls._process_candidate, (a, log, q, ev, parameters))
+                pool.apply_async(cls._process_candidate, (a, obj, q, ev, parameters))
             potentials = set(candidates)
             while len(potentials) > 0:
                 (c, cut) = q.get(block=True)
@@ -99,10 +95,8 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
         candidate = cls._get_candidate(obj, pool, manager, parameters)
         if candidate is None:
             return None
-        log = obj.data_structure
-        l_a = Counter()
-        l_other = Counter()
-        for t in log:
-            l_a.update({tuple(filter(lambda e: e == candidate, t)): log[t]})
-            l_other.update({tuple(filter(lambda e: e != candidate, t)): log[t]})
-        return ProcessTree(operator=Operator.PARALLEL), [IMDataStructureUVCL(l_a), IMDataStructureUVCL(l_other)]
+        encoded = obj.encoded
+        mask = encoded.get_activities_mask({candidate})
+        l_a = IMDataStructureUVCL.from_encoded(encoded.project_activities(mask))
+        l_other = IMDataStructureUVCL.from_encoded(encoded.project_activities(~mask))
+        return ProcessTree(operator=Operator.PARALLEL), [l_a, l_other]
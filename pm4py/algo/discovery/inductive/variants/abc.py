@@ -15,12 +15,15 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import os
+from copy import copy
 from abc import abstractmethod, ABC
 from typing import Optional, Tuple, List, TypeVar, Generic, Dict, Any
 
+import numpy as np
+
 from pm4py.algo.discovery.inductive.base_case.factory import BaseCaseFactory
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL
 from pm4py.algo.discovery.inductive.fall_through.factory import FallThroughFactory
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
@@ -33,6 +36,9 @@ T = TypeVar('T', bound=IMDataStructure)
 
 class Parameters(Enum):
     MULTIPROCESSING = "multiprocessing"
+    PARALLEL_RECURSION = "parallel_recursion"
+    CORES = "cores"
+    PARALLEL_MIN_SIZE = "parallel_min_size"
 
 
 class InductiveMinerFramework(ABC, Generic[T]):
@@ -61,6 +67,12 @@ class InductiveMinerFramework(ABC, Generic[T]):
             self._pool = None
             self._manager = None
 
+        # when enabled, the sub-logs produced by a cut are mined concurrently (the pool is created lazily)
+        self._parallel_recursion = exec_utils.get_param_value(Parameters.PARALLEL_RECURSION, parameters, False)
+        self._cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, os.cpu_count() - 1))
+        self._parallel_min_size = exec_utils.get_param_value(Parameters.PARALLEL_MIN_SIZE, parameters, 10000)
+        self._executor = None
+
     def apply_base_cases(self, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[ProcessTree]:
         return BaseCaseFactory.apply_base_cases(obj, self.instance(), parameters=parameters)
 
@@ -82,12 +94,66 @@ class InductiveMinerFramework(ABC, Generic[T]):
         return tree
 
     def _recurse(self, tree: ProcessTree, objs: List[T], parameters: Optional[Dict[str, Any]] = None):
-        children = [self.apply(obj, parameters=parameters) for obj in objs]
+        children = [None] * len(objs)
+
+        if self._parallel_recursion and self._cores > 1:
+            # the sub-logs that are big enough are submitted to the pool (the idle workers pick the next one),
+            # while the others are mined in-process. When a single sub-log is big, it is also mined in-process,
+            # so that the cuts found on it can be parallelized.
+            big = [i for i, obj in enumerate(objs) if self._get_size(obj) >= self._parallel_min_size]
+            if len(big) > 1:
+                if self._executor is None:
+                    from concurrent.futures import ProcessPoolExecutor
+                    self._executor = ProcessPoolExecutor(max_workers=self._cores)
+                worker_parameters = copy(parameters) if parameters is not None else {}
+                worker_parameters[Parameters.MULTIPROCESSING] = False
+                worker_parameters[Parameters.PARALLEL_RECURSION] = False
+                futures = {i: self._executor.submit(InductiveMinerFramework._apply_in_worker, type(self), objs[i],
+                                                    worker_parameters) for i in big}
+                for i in range(len(objs)):
+                    if i not in futures:
+                        children[i] = self.apply(objs[i], parameters=parameters)
+                # the children are assembled following the order of the sub-logs
+                for i, future in futures.items():
+                    children[i] = future.result()
+
+        for i, obj in enumerate(objs):
+            if children[i] is None:
+                children[i] = self.apply(obj, parameters=parameters)
+
         for c in children:
             c.parent = tree
         tree.children.extend(children)
         return tree
 
+    def _get_size(self, obj: T) -> int:
+        # size of the data structure (number of events for the logs), used to decide if it is worth to mine it
+        # in a different process (computed on the encoded log, which is not decoded)
+        if isinstance(obj, IMDataStructureUVCL):
+            encoded = obj.encoded
+            return int(np.dot(encoded.get_lengths(), encoded.counts))
+        return 0
+
+    def close(self):
+        """
+        Shuts down the pools used by the miner
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._pool is not None:
+            self._pool.close()
+            self._manager.shutdown()
+            self._pool = None
+            self._manager = None
+
+    @staticmethod
+    def _apply_in_worker(miner_class, obj: T, parameters: Dict[str, Any]) -> ProcessTree:
+        miner = miner_class(parameters)
+        tree = miner.apply(obj, parameters=parameters)
+        tree.parent = None
+        return tree
+
     @abstractmethod
     def instance(self) -> IMInstance:
         pass
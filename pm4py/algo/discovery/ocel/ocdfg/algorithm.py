@@ -16,13 +16,14 @@
 '''
 from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any
-from pm4py.algo.discovery.ocel.ocdfg.variants import classic
+from pm4py.algo.discovery.ocel.ocdfg.variants import classic, aggregated
 from enum import Enum
 from pm4py.util import exec_utils
 
 
 class Variants(Enum):
     CLASSIC = classic
+    AGGREGATED = aggregated
 
 
 def apply(ocel: OCEL, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
@@ -37,7 +38,8 @@ def apply(ocel: OCEL, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, A
         Object-centric event log
     variant
         Variant of the algorithm to use:
-        - Variants.CLASSIC
+        - Variants.CLASSIC: computes the sets of events/objects associated to the activities and the edges
+        - Variants.AGGREGATED: computes only the counts of events/objects associated to the activities and the edges
     parameters
         Variant-specific parameters
 
@@ -0,0 +1,212 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from typing import Optional, Dict, Any, List
+from enum import Enum
+from pm4py.util import exec_utils, pandas_utils, constants
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
+from pm4py.objects.ocel import constants as ocel_constants
+from pm4py.objects.ocel.obj import OCEL
+import pandas as pd
+import numpy as np
+
+
+class Parameters(Enum):
+    EVENT_ID = ocel_constants.PARAM_EVENT_ID
+    OBJECT_ID = ocel_constants.PARAM_OBJECT_ID
+    EVENT_ACTIVITY = ocel_constants.PARAM_EVENT_ACTIVITY
+    EVENT_TIMESTAMP = ocel_constants.PARAM_EVENT_TIMESTAMP
+    OBJECT_TYPE = ocel_constants.PARAM_OBJECT_TYPE
+    COMPUTE_EDGES_PERFORMANCE = "compute_edges_performance"
+    BUSINESS_HOURS = "business_hours"
+    BUSINESS_HOUR_SLOTS = "business_hour_slots"
+    WORKCALENDAR = "workcalendar"
+
+
+SOURCE_EVENT = "@@source_event"
+TARGET_EVENT = "@@target_event"
+SOURCE_ACTIVITY = "@@source_activity"
+TARGET_ACTIVITY = "@@target_activity"
+FLOW_TIME = "@@flow_time"
+
+
+def __to_dict(series: pd.Series, dtype=int) -> Dict[Any, Any]:
+    """
+    Converts a series indexed by (object type, *key) (or by key only) to a nested dictionary
+    """
+    ret = {}
+    for key, value in series.items():
+        if not isinstance(series.index, pd.MultiIndex):
+            ret[key] = dtype(value)
+        else:
+            if key[0] not in ret:
+                ret[key[0]] = {}
+            ret[key[0]][key[1] if len(key) == 2 else tuple(key[1:])] = dtype(value)
+    return ret
+
+
+def __count(relations: pd.DataFrame, keys: List[str], event_id: str, object_id: str) -> Dict[str, Dict[Any, Any]]:
+    """
+    Counts the events, the unique objects and the total objects (event-object relationships) per group
+    """
+    grouped = relations.groupby(keys, sort=False)
+
+    ret = {}
+    ret["events"] = __to_dict(grouped[event_id].nunique())
+    ret["unique_objects"] = __to_dict(grouped[object_id].nunique())
+    ret["total_objects"] = __to_dict(grouped.size())
+    return ret
+
+
+def __performance(edges: pd.DataFrame, keys: List[str]) -> Dict[str, Dict[Any, Dict[str, float]]]:
+    """
+    Aggregates the times between the activities of the edges
+    """
+    stats = edges.groupby(keys, sort=False)[FLOW_TIME].agg(["mean", "median", "max", "min", "sum", "std"])
+    stats = stats.rename(columns={"std": "stdev"})
+
+    ret = {}
+    for measure in stats.columns:
+        for ot, edges_ot in __to_dict(stats[measure], dtype=float).items():
+            if ot not in ret:
+                ret[ot] = {}
+            for edge, value in edges_ot.items():
+                if edge not in ret[ot]:
+                    ret[ot][edge] = {}
+                ret[ot][edge][measure] = value
+    return ret
+
+
+def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
+    """
+    Discovers an OC-DFG model from an object-centric event log, computing only the counts of the
+    events/unique objects/total objects (instead of the sets of identifiers returned by the classic variant),
+    along with the aggregated performance of the edges.
+
+    All the metrics are computed using vectorized operations on the relations of the object-centric event log,
+    so the sets of event identifiers, object identifiers and event-object combinations are never materialized.
+    The output can be visualized as the output of the classic variant (which should be used when a drill-down
+    on the identifiers is needed).
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ID => the event identifier
+        - Parameters.OBJECT_ID => the object identifier
+        - Parameters.EVENT_ACTIVITY => the attribute to be used as activity
+        - Parameters.EVENT_TIMESTAMP => the timestamp
+        - Parameters.OBJECT_TYPE => the attribute to be used as object type
+        - Parameters.COMPUTE_EDGES_PERFORMANCE => (boolean) enables/disables the computation of the performance on the edges
+        - Parameters.BUSINESS_HOURS => enables/disables the business hours
+        - Parameters.BUSINESS_HOUR_SLOTS => work schedule of the company (see the classic variant)
+        - Parameters.WORKCALENDAR => work calendar (if the business hours are enabled)
+
+    Returns
+    -----------------
+    ocdfg
+        Object-centric directly-follows graph, expressed as a dictionary with the same properties as the output of
+        the classic variant, where every set is replaced by its size:
+        - activities: complete set of activities derived from the object-centric event log
+        - object_types: complete set of object types derived from the object-centric event log
+        - edges: dictionary linking each metric (event_couples, unique_objects, total_objects) to a dictionary
+                connecting each object type to the directly-follows arcs between activities and their count.
+        - activities_indep: dictionary linking each metric (events, unique_objects, total_objects) to a dictionary
+                            connecting each activity to its count
+        - activities_ot: dictionary linking each metric (events, unique_objects, total_objects) to a dictionary
+                        connecting each object type and activity to its count
+        - start_activities: as activities_ot, for the start activities of the objects
+        - end_activities: as activities_ot, for the end activities of the objects
+        - edges_performance: dictionary linking each metric (event_couples, total_objects) to a dictionary
+                        connecting each object type and directly-follows arc to the aggregated times between the
+                        activities (mean, median, max, min, sum, stdev), expressed in seconds.
+    """
+    if parameters is None:
+        parameters = {}
+
+    event_id = exec_utils.get_param_value(Parameters.EVENT_ID, parameters, ocel.event_id_column)
+    object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, ocel.event_activity)
+    timestamp_key = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters, ocel.event_timestamp)
+    object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
+    compute_edges_performance = exec_utils.get_param_value(Parameters.COMPUTE_EDGES_PERFORMANCE, parameters, True)
+    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
+    business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters,
+                                                      constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters,
+                                              constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+
+    relations = ocel.relations[[event_id, event_activity, object_id, object_type]]
+
+    ret = {}
+    ret["activities"] = set(pandas_utils.format_unique(ocel.events[event_activity].unique()))
+    ret["object_types"] = set(pandas_utils.format_unique(ocel.objects[object_type].unique()))
+
+    ret["activities_indep"] = __count(relations, [event_activity], event_id, object_id)
+    ret["activities_ot"] = __count(relations, [object_type, event_activity], event_id, object_id)
+    ret["start_activities"] = __count(relations.drop_duplicates(object_id, keep="first"),
+                                      [object_type, event_activity], event_id, object_id)
+    ret["end_activities"] = __count(relations.drop_duplicates(object_id, keep="last"),
+                                    [object_type, event_activity], event_id, object_id)
+
+    # the lifecycle of every object follows the order of the events in the log
+    positions = pd.Index(ocel.events[event_id]).get_indexer(relations[event_id])
+    rows = np.nonzero(positions >= 0)[0]
+    objects = pd.factorize(relations[object_id].to_numpy()[rows])[0]
+    order = np.lexsort((positions[rows], objects))
+    rows = rows[order]
+    objects = objects[order]
+    successive = np.nonzero(objects[1:] == objects[:-1])[0]
+    source_rows = rows[successive]
+    target_rows = rows[successive + 1]
+
+    edges = pd.DataFrame({object_type: relations[object_type].to_numpy()[target_rows],
+                          SOURCE_ACTIVITY: relations[event_activity].to_numpy()[source_rows],
+                          TARGET_ACTIVITY: relations[event_activity].to_numpy()[target_rows],
+                          SOURCE_EVENT: relations[event_id].to_numpy()[source_rows],
+                          TARGET_EVENT: relations[event_id].to_numpy()[target_rows],
+                          object_id: relations[object_id].to_numpy()[target_rows]})
+    keys = [object_type, SOURCE_ACTIVITY, TARGET_ACTIVITY]
+
+    if compute_edges_performance:
+        timestamps = ocel.events[timestamp_key]
+        source_timestamps = timestamps.iloc[positions[source_rows]].reset_index(drop=True)
+        target_timestamps = timestamps.iloc[positions[target_rows]].reset_index(drop=True)
+        if business_hours:
+            edges[FLOW_TIME] = soj_time_business_hours_diff_vectorized(source_timestamps, target_timestamps,
+                                                                       business_hours_slots, workcalendar)
+        else:
+            edges[FLOW_TIME] = (target_timestamps - source_timestamps).dt.total_seconds().to_numpy()
+
+    event_couples = edges.drop_duplicates(keys + [SOURCE_EVENT, TARGET_EVENT])
+    total_objects = edges.drop_duplicates(keys + [SOURCE_EVENT, TARGET_EVENT, object_id])
+
+    ret["edges"] = {}
+    ret["edges"]["event_couples"] = __to_dict(event_couples.groupby(keys, sort=False).size())
+    ret["edges"]["unique_objects"] = __to_dict(edges.groupby(keys, sort=False)[object_id].nunique())
+    ret["edges"]["total_objects"] = __to_dict(total_objects.groupby(keys, sort=False).size())
+
+    ret["edges_performance"] = {}
+    ret["edges_performance"]["event_couples"] = {}
+    ret["edges_performance"]["total_objects"] = {}
+
+    if compute_edges_performance:
+        ret["edges_performance"]["event_couples"] = __performance(event_couples, keys)
+        ret["edges_performance"]["total_objects"] = __performance(total_objects, keys)
+
+    return ret
@@ -59,8 +59,10 @@ def __discover_petri_and_consumption_stats_tbr(ocel: OCEL, obj_types, parameters
     saw_weights = {}
     ocpn_nets = {}
 
+    flat_logs = dict(flattening.flatten_per_type(ocel))
+
     for ot in obj_types:
-        flat_log = log_converter.apply(flattening.flatten(ocel, ot), variant=log_converter.Variants.TO_EVENT_LOG)
+        flat_log = log_converter.apply(flat_logs[ot], variant=log_converter.Variants.TO_EVENT_LOG)
         process_tree = inductive_miner.apply(flat_log, parameters=parameters)
         net, im, fm = pt_converter.apply(process_tree)
         ocpn_nets[ot] = (net, im, fm)
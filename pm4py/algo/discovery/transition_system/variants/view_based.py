@@ -67,7 +67,7 @@ def apply(log: Union[EventLog, EventStream, pd.DataFrame],
     transition_system = ts.TransitionSystem()
     view_sequence = []
     for i in range(len(control_flow_log)):
-        provided_case = log[i] if type(log) is EventLog else None
+        provided_case = log[i] if isinstance(log, EventLog) else None
         view_sequence.append(__compute_view_sequence(control_flow_log[i], provided_case, parameters=parameters))
     for vs in view_sequence:
         __construct_state_path(vs, transition_system, include_data=include_data)
@@ -0,0 +1,98 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List
+
+from pm4py.util import exec_utils, duckdb_utils
+from pm4py.util.constants import PARAMETER_CONSTANT_ATTRIBUTE_KEY, PARAMETER_CONSTANT_CASEID_KEY, CASE_CONCEPT_NAME
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+
+class Parameters(Enum):
+    ATTRIBUTE_KEY = PARAMETER_CONSTANT_ATTRIBUTE_KEY
+    CASE_ID_KEY = PARAMETER_CONSTANT_CASEID_KEY
+    POSITIVE = "positive"
+
+
+def apply_events(log: Any, values: List[Any], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Any:
+    """
+    Filter a log on attribute values (filter events). The filter is pushed down to DuckDB
+
+    Parameters
+    ----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    values
+        Values to filter on
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ATTRIBUTE_KEY -> Attribute to filter
+            Parameters.POSITIVE -> Specifies if the filter should be applied including events (positive=True)
+            or excluding events (positive=False)
+
+    Returns
+    ----------
+    relation
+        Filtered DuckDB relation
+    """
+    if parameters is None:
+        parameters = {}
+
+    attribute_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.ATTRIBUTE_KEY, parameters, DEFAULT_NAME_KEY))
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    condition = attribute_key + " IN " + duckdb_utils.literal_list(values)
+    if not positive:
+        # as in Pandas, the events with an empty value are kept by the negative filter
+        condition = "NOT COALESCE(" + condition + ", FALSE)"
+
+    return duckdb_utils.query(log, "SELECT * FROM " + duckdb_utils.LOG_TABLE + " WHERE " + condition)
+
+
+def apply(log: Any, values: List[Any], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Any:
+    """
+    Filter a log on attribute values (filter cases, keeping/removing the cases with at least one event
+    having one of the values). The filter is pushed down to DuckDB
+
+    Parameters
+    ----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    values
+        Values to filter on
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ATTRIBUTE_KEY -> Attribute to filter
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+            Parameters.POSITIVE -> Specifies if the filter should be applied including cases (positive=True)
+            or excluding cases (positive=False)
+
+    Returns
+    ----------
+    relation
+        Filtered DuckDB relation
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = duckdb_utils.quote(exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME))
+    attribute_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.ATTRIBUTE_KEY, parameters, DEFAULT_NAME_KEY))
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    cases = "SELECT " + case_id_glue + " FROM " + duckdb_utils.LOG_TABLE + " WHERE " + attribute_key + " IN " + duckdb_utils.literal_list(values)
+
+    return duckdb_utils.query(log, "SELECT * FROM " + duckdb_utils.LOG_TABLE + " WHERE " + case_id_glue + (" IN " if positive else " NOT IN ") + "(" + cases + ")")
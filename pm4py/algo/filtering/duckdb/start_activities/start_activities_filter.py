@@ -0,0 +1,67 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List
+
+from pm4py.util import exec_utils, duckdb_utils
+from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY, PARAMETER_CONSTANT_ACTIVITY_KEY, \
+    PARAMETER_CONSTANT_TIMESTAMP_KEY, CASE_CONCEPT_NAME
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TIMESTAMP_KEY
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = PARAMETER_CONSTANT_TIMESTAMP_KEY
+    POSITIVE = "positive"
+
+
+def apply(log: Any, values: List[str], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Any:
+    """
+    Filter the cases having one of the provided start activities. The filter is pushed down to DuckDB
+
+    Parameters
+    ----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    values
+        Allowed start activities
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ID_KEY -> Case ID column
+            Parameters.ACTIVITY_KEY -> Column that represents the activity
+            Parameters.TIMESTAMP_KEY -> Column that represents the timestamp
+            Parameters.POSITIVE -> Specifies if the filter should be applied including traces (positive=True)
+            or excluding traces (positive=False)
+
+    Returns
+    ----------
+    relation
+        Filtered DuckDB relation
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = duckdb_utils.quote(exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME))
+    activity_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY))
+    timestamp_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY))
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    cases = "SELECT " + case_id_glue + " FROM " + duckdb_utils.INDEXED_LOG_TABLE + " GROUP BY " + case_id_glue + " HAVING ARG_MIN(" + \
+            activity_key + ", ROW(" + timestamp_key + ", " + duckdb_utils.INDEX_COLUMN + ")) IN " + duckdb_utils.literal_list(values)
+
+    return duckdb_utils.query(log, "SELECT * FROM " + duckdb_utils.LOG_TABLE + " WHERE " + case_id_glue + (" IN " if positive else " NOT IN ") + "(" + cases + ")")
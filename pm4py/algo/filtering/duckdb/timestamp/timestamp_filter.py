@@ -0,0 +1,138 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import datetime
+from enum import Enum
+from typing import Optional, Dict, Any, Union
+
+from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
+from pm4py.util import exec_utils, duckdb_utils
+from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY, PARAMETER_CONSTANT_CASEID_KEY, CASE_CONCEPT_NAME
+from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
+
+
+class Parameters(Enum):
+    TIMESTAMP_KEY = PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = PARAMETER_CONSTANT_CASEID_KEY
+
+
+def __get_interval(log: Any, timestamp_key: str, dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime]):
+    dt1 = duckdb_utils.get_comparable_datetime(log, timestamp_key, get_dt_from_string(dt1))
+    dt2 = duckdb_utils.get_comparable_datetime(log, timestamp_key, get_dt_from_string(dt2))
+    return duckdb_utils.literal(dt1), duckdb_utils.literal(dt2)
+
+
+def __filter_cases(log: Any, case_id_glue: str, timestamp_key: str, condition: str) -> Any:
+    # keeps the cases for which the condition (expressed on the first and the last timestamp of the case) holds
+    cases = "SELECT " + case_id_glue + " FROM (SELECT " + case_id_glue + ", MIN(" + timestamp_key + ") AS first_timestamp, MAX(" + \
+            timestamp_key + ") AS last_timestamp FROM " + duckdb_utils.LOG_TABLE + " GROUP BY " + case_id_glue + ") WHERE " + condition
+    return duckdb_utils.query(log, "SELECT * FROM " + duckdb_utils.LOG_TABLE + " WHERE " + case_id_glue + " IN (" + cases + ")")
+
+
+def filter_traces_contained(log: Any, dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Any:
+    """
+    Get traces that are contained in the given interval. The filter is pushed down to DuckDB
+
+    Parameters
+    ----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    dt1
+        Lower bound to the interval (possibly expressed as string, but automatically converted)
+    dt2
+        Upper bound to the interval (possibly expressed as string, but automatically converted)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> Attribute to use as timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    ----------
+    relation
+        Filtered DuckDB relation
+    """
+    if parameters is None:
+        parameters = {}
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+    dt1, dt2 = __get_interval(log, timestamp_key, dt1, dt2)
+
+    return __filter_cases(log, duckdb_utils.quote(case_id_glue), duckdb_utils.quote(timestamp_key),
+                          "first_timestamp >= " + dt1 + " AND last_timestamp <= " + dt2)
+
+
+def filter_traces_intersecting(log: Any, dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Any:
+    """
+    Filter traces intersecting the given interval. The filter is pushed down to DuckDB
+
+    Parameters
+    ----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    dt1
+        Lower bound to the interval (possibly expressed as string, but automatically converted)
+    dt2
+        Upper bound to the interval (possibly expressed as string, but automatically converted)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> Attribute to use as timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    ----------
+    relation
+        Filtered DuckDB relation
+    """
+    if parameters is None:
+        parameters = {}
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+    dt1, dt2 = __get_interval(log, timestamp_key, dt1, dt2)
+
+    # same conditions of the Pandas filter: the case starts, or ends, in the interval, or contains the interval
+    return __filter_cases(log, duckdb_utils.quote(case_id_glue), duckdb_utils.quote(timestamp_key),
+                          "(first_timestamp > " + dt1 + " AND first_timestamp < " + dt2 + ") OR (last_timestamp > " + dt1 +
+                          " AND last_timestamp < " + dt2 + ") OR (first_timestamp < " + dt1 + " AND last_timestamp > " + dt2 + ")")
+
+
+def apply_events(log: Any, dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Any:
+    """
+    Get a new log containing all the events contained in the given interval. The filter is pushed down to DuckDB
+
+    Parameters
+    ----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    dt1
+        Lower bound to the interval (possibly expressed as string, but automatically converted)
+    dt2
+        Upper bound to the interval (possibly expressed as string, but automatically converted)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> Attribute to use as timestamp
+
+    Returns
+    ----------
+    relation
+        Filtered DuckDB relation
+    """
+    if parameters is None:
+        parameters = {}
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+    dt1, dt2 = __get_interval(log, timestamp_key, dt1, dt2)
+
+    return duckdb_utils.query(log, "SELECT * FROM " + duckdb_utils.LOG_TABLE + " WHERE " + duckdb_utils.quote(timestamp_key) +
+                              " BETWEEN " + dt1 + " AND " + dt2)
@@ -15,6 +15,7 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.statistics.end_activities.pandas.get import get_end_activities
+from pm4py.objects.log.util import dataframe_index
 from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.util import xes_constants as xes
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY
@@ -94,6 +95,14 @@ def filter_df_on_end_activities(df, values, case_id_glue=CASE_CONCEPT_NAME,
     df
         Filtered dataframe
     """
+    index = dataframe_index.get_sorted(df, case_id_glue, activity_key) if grouped_df is None else None
+    if index is not None:
+        # re-uses the index of the dataframe (the last events of the cases are located through the offsets of the cases)
+        selected = index.activities.isin(values)[index.activity_codes[index.case_offsets[1:] - 1]]
+        ret = df[selected[index.case_codes] if positive else ~selected[index.case_codes]]
+        ret.attrs = copy(df.attrs) if hasattr(df, 'attrs') else {}
+        return ret
+
     if grouped_df is None:
         grouped_df = df.groupby(case_id_glue, sort=False)
     gdf = grouped_df[activity_key].last().isin(values)
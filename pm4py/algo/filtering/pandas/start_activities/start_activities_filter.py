@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from pm4py.objects.log.util import dataframe_index
 from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.statistics.start_activities.pandas.get import get_start_activities
 from pm4py.util import xes_constants as xes
@@ -97,6 +98,14 @@ def filter_df_on_start_activities(df, values, case_id_glue=CASE_CONCEPT_NAME,
         Filtered dataframe
     """
 
+    index = dataframe_index.get_sorted(df, case_id_glue, activity_key) if grouped_df is None else None
+    if index is not None:
+        # re-uses the index of the dataframe (the first events of the cases are located through the offsets of the cases)
+        selected = index.activities.isin(values)[index.activity_codes[index.case_offsets[:-1]]]
+        ret = df[selected[index.case_codes] if positive else ~selected[index.case_codes]]
+        ret.attrs = copy(df.attrs) if hasattr(df, 'attrs') else {}
+        return ret
+
     if grouped_df is None:
         grouped_df = df.groupby(case_id_glue, sort=False)
     gdf = grouped_df[activity_key].first().isin(values)
@@ -0,0 +1,102 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List
+
+import polars as pl
+
+from pm4py.util import exec_utils, polars_utils
+from pm4py.util.constants import PARAMETER_CONSTANT_ATTRIBUTE_KEY, PARAMETER_CONSTANT_CASEID_KEY, CASE_CONCEPT_NAME
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+
+class Parameters(Enum):
+    ATTRIBUTE_KEY = PARAMETER_CONSTANT_ATTRIBUTE_KEY
+    CASE_ID_KEY = PARAMETER_CONSTANT_CASEID_KEY
+    POSITIVE = "positive"
+
+
+def apply_events(df: Union[pl.DataFrame, pl.LazyFrame], values: List[Any], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Filter a Polars dataframe on attribute values (filter events)
+
+    Parameters
+    ----------
+    df
+        Polars DataFrame or LazyFrame
+    values
+        Values to filter on
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ATTRIBUTE_KEY -> Attribute to filter
+            Parameters.POSITIVE -> Specifies if the filter should be applied including events (positive=True)
+            or excluding events (positive=False)
+
+    Returns
+    ----------
+    df
+        Filtered dataframe (of the same type of the provided dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+
+    attribute_key = exec_utils.get_param_value(Parameters.ATTRIBUTE_KEY, parameters, DEFAULT_NAME_KEY)
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    condition = pl.col(attribute_key).is_in(list(values))
+    if not positive:
+        # as in Pandas, the events with an empty value are kept by the negative filter
+        condition = ~condition.fill_null(False)
+
+    return polars_utils.return_same_type(df, polars_utils.to_lazy(df).filter(condition))
+
+
+def apply(df: Union[pl.DataFrame, pl.LazyFrame], values: List[Any], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Filter a Polars dataframe on attribute values (filter cases, keeping/removing the cases
+    with at least one event having one of the values)
+
+    Parameters
+    ----------
+    df
+        Polars DataFrame or LazyFrame
+    values
+        Values to filter on
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ATTRIBUTE_KEY -> Attribute to filter
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+            Parameters.POSITIVE -> Specifies if the filter should be applied including cases (positive=True)
+            or excluding cases (positive=False)
+
+    Returns
+    ----------
+    df
+        Filtered dataframe (of the same type of the provided dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+    attribute_key = exec_utils.get_param_value(Parameters.ATTRIBUTE_KEY, parameters, DEFAULT_NAME_KEY)
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    condition = pl.col(attribute_key).is_in(list(values)).fill_null(False).any().over(case_id_glue)
+    if not positive:
+        condition = ~condition
+
+    return polars_utils.return_same_type(df, polars_utils.to_lazy(df).filter(condition))
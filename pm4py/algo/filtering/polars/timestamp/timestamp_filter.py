@@ -0,0 +1,141 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import datetime
+from enum import Enum
+from typing import Optional, Dict, Any, Union
+
+import polars as pl
+
+from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
+from pm4py.util import exec_utils, polars_utils
+from pm4py.util.constants import PARAMETER_CONSTANT_TIMESTAMP_KEY, PARAMETER_CONSTANT_CASEID_KEY, CASE_CONCEPT_NAME
+from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
+
+
+class Parameters(Enum):
+    TIMESTAMP_KEY = PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = PARAMETER_CONSTANT_CASEID_KEY
+
+
+def __get_interval(df: pl.LazyFrame, timestamp_key: str, dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime]):
+    dtype = df.collect_schema()[timestamp_key]
+    return polars_utils.get_comparable_datetime(get_dt_from_string(dt1), dtype), \
+        polars_utils.get_comparable_datetime(get_dt_from_string(dt2), dtype)
+
+
+def filter_traces_contained(df: Union[pl.DataFrame, pl.LazyFrame], dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Get traces that are contained in the given interval
+
+    Parameters
+    ----------
+    df
+        Polars DataFrame or LazyFrame
+    dt1
+        Lower bound to the interval (possibly expressed as string, but automatically converted)
+    dt2
+        Upper bound to the interval (possibly expressed as string, but automatically converted)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> Attribute to use as timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    ----------
+    df
+        Filtered dataframe (of the same type of the provided dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+
+    lazy_df = polars_utils.to_lazy(df)
+    dt1, dt2 = __get_interval(lazy_df, timestamp_key, dt1, dt2)
+    timestamp = pl.col(timestamp_key)
+    lazy_df = lazy_df.filter((timestamp.min().over(case_id_glue) >= dt1) & (timestamp.max().over(case_id_glue) <= dt2))
+
+    return polars_utils.return_same_type(df, lazy_df)
+
+
+def filter_traces_intersecting(df: Union[pl.DataFrame, pl.LazyFrame], dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Filter traces intersecting the given interval
+
+    Parameters
+    ----------
+    df
+        Polars DataFrame or LazyFrame
+    dt1
+        Lower bound to the interval (possibly expressed as string, but automatically converted)
+    dt2
+        Upper bound to the interval (possibly expressed as string, but automatically converted)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> Attribute to use as timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    ----------
+    df
+        Filtered dataframe (of the same type of the provided dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+
+    lazy_df = polars_utils.to_lazy(df)
+    dt1, dt2 = __get_interval(lazy_df, timestamp_key, dt1, dt2)
+    first = pl.col(timestamp_key).min().over(case_id_glue)
+    last = pl.col(timestamp_key).max().over(case_id_glue)
+    # same conditions of the Pandas filter: the case starts, or ends, in the interval, or contains the interval
+    lazy_df = lazy_df.filter(((first > dt1) & (first < dt2)) | ((last > dt1) & (last < dt2)) | ((first < dt1) & (last > dt2)))
+
+    return polars_utils.return_same_type(df, lazy_df)
+
+
+def apply_events(df: Union[pl.DataFrame, pl.LazyFrame], dt1: Union[str, datetime.datetime], dt2: Union[str, datetime.datetime], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """
+    Get a new dataframe containing all the events contained in the given interval
+
+    Parameters
+    ----------
+    df
+        Polars DataFrame or LazyFrame
+    dt1
+        Lower bound to the interval (possibly expressed as string, but automatically converted)
+    dt2
+        Upper bound to the interval (possibly expressed as string, but automatically converted)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.TIMESTAMP_KEY -> Attribute to use as timestamp
+
+    Returns
+    ----------
+    df
+        Filtered dataframe (of the same type of the provided dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+
+    lazy_df = polars_utils.to_lazy(df)
+    dt1, dt2 = __get_interval(lazy_df, timestamp_key, dt1, dt2)
+    lazy_df = lazy_df.filter(pl.col(timestamp_key).is_between(dt1, dt2))
+
+    return polars_utils.return_same_type(df, lazy_df)
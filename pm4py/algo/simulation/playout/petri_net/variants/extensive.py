@@ -24,6 +24,8 @@ from pm4py.objects import petri_net
 from pm4py.objects.log import obj as log_instance
 from pm4py.objects.log.obj import EventLog
 from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.compiled.obj import CompiledPetriNet
+from pm4py.objects.petri_net.compiled.semantics import CompiledPetriNetSemantics
 from pm4py.util.dt_parsing.variants import strpfromiso
 from pm4py.util import constants
 from pm4py.util import exec_utils
@@ -74,11 +76,36 @@ def apply(net: PetriNet, initial_marking: Marking, final_marking: Marking = None
     max_trace_length = exec_utils.get_param_value(Parameters.MAX_TRACE_LENGTH, parameters, 10)
     return_elements = exec_utils.get_param_value(Parameters.RETURN_ELEMENTS, parameters, False)
     max_marking_occ = exec_utils.get_param_value(Parameters.MAX_MARKING_OCC, parameters, sys.maxsize)
-    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, petri_net.semantics.ClassicSemantics())
+    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, None)
+
+    if semantics is None:
+        # classic semantics: the exploration is done on the compiled Petri net
+        feasible_elements = __explore_compiled(net, initial_marking, final_marking, max_trace_length, max_marking_occ)
+    else:
+        feasible_elements = __explore(net, initial_marking, final_marking, max_trace_length, max_marking_occ,
+                                      semantics)
+
+    if return_elements:
+        return feasible_elements
 
     # assigns to each event an increased timestamp from 1970
     curr_timestamp = 10000000
 
+    log = log_instance.EventLog()
+    for elements in feasible_elements:
+        log_trace = log_instance.Trace()
+        log_trace.attributes[case_id_key] = str(len(log))
+        activities = [x.label for x in elements if type(x) is PetriNet.Transition and x.label is not None]
+        for act in activities:
+            curr_timestamp = curr_timestamp + 1
+            log_trace.append(
+                log_instance.Event({activity_key: act, timestamp_key: strpfromiso.fix_naivety(datetime.datetime.fromtimestamp(curr_timestamp))}))
+        log.append(log_trace)
+
+    return log
+
+
+def __explore(net, initial_marking, final_marking, max_trace_length, max_marking_occ, semantics):
     feasible_elements = []
 
     to_visit = [(initial_marking, (), ())]
@@ -122,18 +149,68 @@ def apply(net: PetriNet, initial_marking: Marking, final_marking: Marking = None
                 continue
             to_visit.append(new_state)
 
-    if return_elements:
-        return feasible_elements
+    return feasible_elements
 
-    log = log_instance.EventLog()
-    for elements in feasible_elements:
-        log_trace = log_instance.Trace()
-        log_trace.attributes[case_id_key] = str(len(log))
-        activities = [x.label for x in elements if type(x) is PetriNet.Transition and x.label is not None]
-        for act in activities:
-            curr_timestamp = curr_timestamp + 1
-            log_trace.append(
-                log_instance.Event({activity_key: act, timestamp_key: strpfromiso.fix_naivety(datetime.datetime.fromtimestamp(curr_timestamp))}))
-        log.append(log_trace)
 
-    return log
+def __explore_compiled(net, initial_marking, final_marking, max_trace_length, max_marking_occ):
+    cnet = CompiledPetriNet(net)
+    transitions = cnet.transitions
+    cfm = cnet.encode_marking(final_marking) if final_marking is not None else None
+
+    feasible_elements = []
+
+    to_visit = [(cnet.encode_marking(initial_marking), (), ())]
+    visited = set()
+
+    while len(to_visit) > 0:
+        state = to_visit.pop(0)
+
+        m = state[POSITION_MARKING]
+        trace = state[POSITION_TRACE]
+        elements = state[POSITION_ELEMENTS]
+
+        if (m, trace) in visited:
+            continue
+        visited.add((m, trace))
+
+        en_t = CompiledPetriNetSemantics.enabled_transitions(cnet, m)
+
+        if (cfm is not None and m == cfm) or (cfm is None and len(en_t) == 0):
+            if len(trace) <= max_trace_length:
+                feasible_elements.append(elements)
+
+        for t in en_t:
+            new_elements = elements + (m,)
+            new_elements = new_elements + (transitions[t],)
+
+            counter_elements = Counter(new_elements)
+
+            if counter_elements[m] > max_marking_occ:
+                continue
+
+            new_m = CompiledPetriNetSemantics.fire(cnet, t, m)
+            if transitions[t].label is not None:
+                new_trace = trace + (transitions[t].label,)
+            else:
+                new_trace = trace
+
+            new_state = (new_m, new_trace, new_elements)
+
+            if new_state in visited or len(new_trace) > max_trace_length:
+                continue
+            to_visit.append(new_state)
+
+    # the markings in the visited elements are decoded back to markings of the Petri net
+    decoded = {}
+    ret = []
+    for elements in feasible_elements:
+        decoded_elements = []
+        for x in elements:
+            if type(x) is tuple:
+                if x not in decoded:
+                    decoded[x] = cnet.decode_marking(x)
+                x = decoded[x]
+            decoded_elements.append(x)
+        ret.append(tuple(decoded_elements))
+
+    return ret
@@ -31,6 +31,7 @@ from pm4py.objects.bpmn.obj import BPMN
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.powl.obj import POWL
 from pm4py.objects.heuristics_net.obj import HeuristicsNet
+from pm4py.objects.heuristics_net.statistics import HeuristicsStatistics
 from pm4py.objects.transition_system.obj import TransitionSystem
 from pm4py.objects.trie.obj import Trie
 from pm4py.objects.log.obj import EventLog
@@ -38,23 +39,27 @@ from pm4py.objects.log.obj import EventStream
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 from pm4py.objects.process_tree.obj import ProcessTree
 from pm4py.util.pandas_utils import check_is_pandas_dataframe, check_pandas_dataframe_columns
+from pm4py.util.polars_utils import check_is_polars_dataframe, check_polars_dataframe_columns
+from pm4py.util.duckdb_utils import check_is_duckdb_relation
 from pm4py.utils import get_properties, __event_log_deprecation_warning
 from pm4py.util import constants, pandas_utils
 import deprecation
 import importlib.util
+import os
 
 
-def discover_dfg(log: Union[EventLog, pd.DataFrame], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[dict, dict, dict]:
+def discover_dfg(log: Union[EventLog, pd.DataFrame, str], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name", multi_processing: bool = False) -> Tuple[dict, dict, dict]:
     """
     Discovers a Directly-Follows Graph (DFG) from a log.
 
     This method returns a dictionary with the couples of directly-following activities (in the log)
     as keys and the frequency of relation as value.
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / Polars dataframe / DuckDB relation / Parquet file / directory of Parquet files (partitioned by case identifier)
     :param activity_key: attribute to be used for the activity
     :param timestamp_key: attribute to be used for the timestamp
     :param case_id_key: attribute to be used as case identifier
+    :param multi_processing: (boolean) partitions the dataframe by case identifier and discovers the DFG of the partitions in a process pool (default: False). Always enabled for a directory of Parquet files.
     :rtype: ``Tuple[dict, dict, dict]``
 
     .. code-block:: python3
@@ -63,11 +68,38 @@ def discover_dfg(log: Union[EventLog, pd.DataFrame], activity_key: str = "concep
 
         dfg, start_activities, end_activities = pm4py.discover_dfg(dataframe, case_id_key='case:concept:name', activity_key='concept:name', timestamp_key='time:timestamp')
     """
+    if (isinstance(log, str) and os.path.isdir(log)) or (multi_processing and check_is_pandas_dataframe(log)):
+        return __discover_dfg_partitioned(log, "frequency", activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+
     __event_log_deprecation_warning(log)
 
     properties = get_properties(
         log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.algo.discovery.dfg.adapters.duckdb.df_statistics import get_dfg_graph
+        dfg = get_dfg_graph(log, activity_key=activity_key,
+                            timestamp_key=timestamp_key,
+                            case_id_glue=case_id_key)
+        from pm4py.statistics.start_activities.duckdb import get as start_activities_module
+        from pm4py.statistics.end_activities.duckdb import get as end_activities_module
+        start_activities = start_activities_module.get_start_activities(
+            log, parameters=properties)
+        end_activities = end_activities_module.get_end_activities(
+            log, parameters=properties)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(
+            log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        from pm4py.algo.discovery.dfg.adapters.polars.df_statistics import get_dfg_graph
+        dfg = get_dfg_graph(log, activity_key=activity_key,
+                            timestamp_key=timestamp_key,
+                            case_id_glue=case_id_key)
+        from pm4py.statistics.start_activities.polars import get as start_activities_module
+        from pm4py.statistics.end_activities.polars import get as end_activities_module
+        start_activities = start_activities_module.get_start_activities(
+            log, parameters=properties)
+        end_activities = end_activities_module.get_end_activities(
+            log, parameters=properties)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(
             log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.util import constants
@@ -127,11 +159,9 @@ def discover_dfg_typed(log: pd.DataFrame, case_id_key: str = "case:concept:name"
     parameters = get_properties(
         log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
 
-    if importlib.util.find_spec("polars"):
-        import polars as pl
-        if type(log) is pl.DataFrame:
-            from pm4py.algo.discovery.dfg.variants import clean_polars
-            return clean_polars.apply(log, parameters)
+    if check_is_polars_dataframe(log):
+        from pm4py.algo.discovery.dfg.variants import clean_polars
+        return clean_polars.apply(log, parameters)
 
     if pandas_utils.check_is_pandas_dataframe(log):
         return clean.apply(log, parameters)
@@ -139,19 +169,20 @@ def discover_dfg_typed(log: pd.DataFrame, case_id_key: str = "case:concept:name"
         raise TypeError('pm4py.discover_dfg_typed is only defined for dataFrames')
         
 
-def discover_performance_dfg(log: Union[EventLog, pd.DataFrame], business_hours: bool = False, business_hour_slots=constants.DEFAULT_BUSINESS_HOUR_SLOTS, workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[dict, dict, dict]:
+def discover_performance_dfg(log: Union[EventLog, pd.DataFrame, str], business_hours: bool = False, business_hour_slots=constants.DEFAULT_BUSINESS_HOUR_SLOTS, workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name", multi_processing: bool = False) -> Tuple[dict, dict, dict]:
     """
     Discovers a performance directly-follows graph from an event log.
 
     This method returns a dictionary with the couples of directly-following activities (in the log)
     as keys and the performance of relation as value.
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / Polars dataframe / DuckDB relation / Parquet file / directory of Parquet files (partitioned by case identifier)
     :param business_hours: enables/disables the computation based on the business hours (default: False)
     :param business_hour_slots: work schedule of the company, provided as a list of tuples where each tuple represents one time slot of business hours. One slot i.e. one tuple consists of one start and one end time given in seconds since week start, e.g. [(7 * 60 * 60, 17 * 60 * 60), ((24 + 7) * 60 * 60, (24 + 12) * 60 * 60), ((24 + 13) * 60 * 60, (24 + 17) * 60 * 60),] meaning that business hours are Mondays 07:00 - 17:00 and Tuesdays 07:00 - 12:00 and 13:00 - 17:00
     :param activity_key: attribute to be used for the activity
     :param timestamp_key: attribute to be used for the timestamp
     :param case_id_key: attribute to be used as case identifier
+    :param multi_processing: (boolean) partitions the dataframe by case identifier and discovers the performance DFG of the partitions in a process pool (default: False). Always enabled for a directory of Parquet files.
     :rtype: ``Tuple[dict, dict, dict]``
 
     .. code-block:: python3
@@ -160,12 +191,37 @@ def discover_performance_dfg(log: Union[EventLog, pd.DataFrame], business_hours:
 
         performance_dfg, start_activities, end_activities = pm4py.discover_performance_dfg(dataframe, case_id_key='case:concept:name', activity_key='concept:name', timestamp_key='time:timestamp')
     """
+    if (isinstance(log, str) and os.path.isdir(log)) or (multi_processing and check_is_pandas_dataframe(log)):
+        return __discover_dfg_partitioned(log, "performance", business_hours=business_hours, business_hour_slots=business_hour_slots, workcalendar=workcalendar, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+
     __event_log_deprecation_warning(log)
 
     properties = get_properties(
         log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
 
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.algo.discovery.dfg.adapters.duckdb.df_statistics import get_dfg_graph
+        dfg = get_dfg_graph(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_glue=case_id_key, measure="performance", perf_aggregation_key="all",
+                            business_hours=business_hours, business_hours_slot=business_hour_slots, workcalendar=workcalendar)
+        from pm4py.statistics.start_activities.duckdb import get as start_activities_module
+        from pm4py.statistics.end_activities.duckdb import get as end_activities_module
+        start_activities = start_activities_module.get_start_activities(
+            log, parameters=properties)
+        end_activities = end_activities_module.get_end_activities(
+            log, parameters=properties)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(
+            log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        from pm4py.algo.discovery.dfg.adapters.polars.df_statistics import get_dfg_graph
+        dfg = get_dfg_graph(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_glue=case_id_key, measure="performance", perf_aggregation_key="all",
+                            business_hours=business_hours, business_hours_slot=business_hour_slots, workcalendar=workcalendar)
+        from pm4py.statistics.start_activities.polars import get as start_activities_module
+        from pm4py.statistics.end_activities.polars import get as end_activities_module
+        start_activities = start_activities_module.get_start_activities(
+            log, parameters=properties)
+        end_activities = end_activities_module.get_end_activities(
+            log, parameters=properties)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(
             log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.util import constants
@@ -194,6 +250,24 @@ def discover_performance_dfg(log: Union[EventLog, pd.DataFrame], business_hours:
     return dfg, start_activities, end_activities
 
 
+def __discover_dfg_partitioned(log: Union[pd.DataFrame, str], measure: str, business_hours: bool = False, business_hour_slots=constants.DEFAULT_BUSINESS_HOUR_SLOTS, workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[dict, dict, dict]:
+    from pm4py.algo.discovery.dfg.variants import partitioned
+
+    if check_is_pandas_dataframe(log):
+        check_pandas_dataframe_columns(
+            log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+
+    parameters = {partitioned.Parameters.ACTIVITY_KEY: activity_key, partitioned.Parameters.TIMESTAMP_KEY: timestamp_key,
+                  partitioned.Parameters.CASE_ID_KEY: case_id_key, partitioned.Parameters.MEASURE: measure}
+    if measure == "performance":
+        parameters[partitioned.Parameters.AGGREGATION_MEASURE] = "all"
+        parameters[partitioned.Parameters.BUSINESS_HOURS] = business_hours
+        parameters[partitioned.Parameters.BUSINESS_HOUR_SLOTS] = business_hour_slots
+        parameters[partitioned.Parameters.WORKCALENDAR] = workcalendar
+
+    return partitioned.apply(log, parameters=parameters)
+
+
 def discover_petri_net_alpha(log: Union[EventLog, pd.DataFrame], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[PetriNet, Marking, Marking]:
     """
     Discovers a Petri net using the Alpha Miner.
@@ -220,7 +294,7 @@ def discover_petri_net_alpha(log: Union[EventLog, pd.DataFrame], activity_key: s
     return alpha_miner.apply(log, variant=alpha_miner.Variants.ALPHA_VERSION_CLASSIC, parameters=get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key))
 
 
-def discover_petri_net_ilp(log: Union[EventLog, pd.DataFrame], alpha: float = 1.0, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[PetriNet, Marking, Marking]:
+def discover_petri_net_ilp(log: Union[EventLog, pd.DataFrame], alpha: float = 1.0, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name", multi_processing: bool = constants.ENABLE_MULTIPROCESSING_DEFAULT) -> Tuple[PetriNet, Marking, Marking]:
     """
     Discovers a Petri net using the ILP Miner.
 
@@ -229,6 +303,7 @@ def discover_petri_net_ilp(log: Union[EventLog, pd.DataFrame], alpha: float = 1.
     :param activity_key: attribute to be used for the activity
     :param timestamp_key: attribute to be used for the timestamp
     :param case_id_key: attribute to be used as case identifier
+    :param multi_processing: boolean that enables/disables the solution of the linear problems in a pool of processes
     :rtype: ``Tuple[PetriNet, Marking, Marking]``
 
     .. code-block:: python3
@@ -245,6 +320,7 @@ def discover_petri_net_ilp(log: Union[EventLog, pd.DataFrame], alpha: float = 1.
 
     parameters = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
     parameters["alpha"] = alpha
+    parameters["multiprocessing"] = multi_processing
 
     from pm4py.algo.discovery.ilp import algorithm as ilp_miner
     return ilp_miner.apply(log, variant=ilp_miner.Variants.CLASSIC, parameters=parameters)
@@ -313,7 +389,7 @@ def discover_petri_net_inductive(log: Union[EventLog, pd.DataFrame, DFG], multi_
     return convert_to_petri_net(pt)
 
 
-def discover_petri_net_heuristics(log: Union[EventLog, pd.DataFrame], dependency_threshold: float = 0.5,
+def discover_petri_net_heuristics(log: Union[EventLog, pd.DataFrame, HeuristicsStatistics], dependency_threshold: float = 0.5,
                                   and_threshold: float = 0.65,
                                   loop_two_threshold: float = 0.5, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[PetriNet, Marking, Marking]:
     """
@@ -321,7 +397,7 @@ def discover_petri_net_heuristics(log: Union[EventLog, pd.DataFrame], dependency
 
     Heuristics Miner is an algorithm that acts on the Directly-Follows Graph, providing way to handle with noise and to find common constructs (dependency between two activities, AND). The output of the Heuristics Miner is an Heuristics Net, so an object that contains the activities and the relationships between them. The Heuristics Net can be then converted into a Petri net. The paper can be visited by clicking on the upcoming link: this link).
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / heuristics statistics (see ``pm4py.discover_heuristics_statistics``)
     :param dependency_threshold: dependency threshold (default: 0.5)
     :param and_threshold: AND threshold (default: 0.65)
     :param loop_two_threshold: loop two threshold (default: 0.5)
@@ -346,7 +422,9 @@ def discover_petri_net_heuristics(log: Union[EventLog, pd.DataFrame], dependency
     parameters[heu_parameters.AND_MEASURE_THRESH] = and_threshold
     parameters[heu_parameters.LOOP_LENGTH_TWO_THRESH] = loop_two_threshold
 
-    if check_is_pandas_dataframe(log):
+    if isinstance(log, HeuristicsStatistics):
+        return heuristics_miner.apply_statistics(log, parameters=parameters)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(
             log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         return heuristics_miner.apply_pandas(log, parameters=parameters)
@@ -398,7 +476,7 @@ def discover_process_tree_inductive(log: Union[EventLog, pd.DataFrame, DFG], noi
     return inductive_miner.apply(log, variant=variant, parameters=parameters)
 
 
-def discover_heuristics_net(log: Union[EventLog, pd.DataFrame], dependency_threshold: float = 0.5,
+def discover_heuristics_net(log: Union[EventLog, pd.DataFrame, HeuristicsStatistics], dependency_threshold: float = 0.5,
                             and_threshold: float = 0.65,
                             loop_two_threshold: float = 0.5, min_act_count: int = 1, min_dfg_occurrences: int = 1, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name", decoration: str = "frequency") -> HeuristicsNet:
     """
@@ -406,7 +484,7 @@ def discover_heuristics_net(log: Union[EventLog, pd.DataFrame], dependency_thres
 
     Heuristics Miner is an algorithm that acts on the Directly-Follows Graph, providing way to handle with noise and to find common constructs (dependency between two activities, AND). The output of the Heuristics Miner is an Heuristics Net, so an object that contains the activities and the relationships between them. The Heuristics Net can be then converted into a Petri net. The paper can be visited by clicking on the upcoming link: this link).
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / heuristics statistics (see ``pm4py.discover_heuristics_statistics``)
     :param dependency_threshold: dependency threshold (default: 0.5)
     :param and_threshold: AND threshold (default: 0.65)
     :param loop_two_threshold: loop two threshold (default: 0.5)
@@ -437,7 +515,9 @@ def discover_heuristics_net(log: Union[EventLog, pd.DataFrame], dependency_thres
     parameters[heu_parameters.MIN_DFG_OCCURRENCES] = min_dfg_occurrences
     parameters[heu_parameters.HEU_NET_DECORATION] = decoration
     
-    if check_is_pandas_dataframe(log):
+    if isinstance(log, HeuristicsStatistics):
+        return heuristics_miner.apply_heu_statistics(log, parameters=parameters)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(
             log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         return heuristics_miner.apply_heu_pandas(log, parameters=parameters)
@@ -445,6 +525,43 @@ def discover_heuristics_net(log: Union[EventLog, pd.DataFrame], dependency_thres
         return heuristics_miner.apply_heu(log, parameters=parameters)
 
 
+def discover_heuristics_statistics(log: Union[EventLog, pd.DataFrame], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name", decoration: str = "frequency") -> HeuristicsStatistics:
+    """
+    Computes the statistics of the log needed by the Heuristics Miner (directly-follows counts, counts of the couples at distance 2, loops of length two), stored as NumPy matrices indexed by activity.
+
+    The statistics can be provided (in place of the log) to ``pm4py.discover_heuristics_net`` and ``pm4py.discover_petri_net_heuristics``, in order to derive the models for different thresholds without accessing again the log. The statistics can be pickled, or serialized as a dictionary through their ``to_dict`` method.
+
+    :param log: event log / Pandas dataframe
+    :param activity_key: attribute to be used for the activity
+    :param timestamp_key: attribute to be used for the timestamp
+    :param case_id_key: attribute to be used as case identifier
+    :param decoration: the decoration that should be supported by the heuristics nets (frequency, performance)
+    :rtype: ``HeuristicsStatistics``
+
+    .. code-block:: python3
+
+        import pm4py
+
+        statistics = pm4py.discover_heuristics_statistics(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
+        for dependency_threshold in [0.5, 0.7, 0.9]:
+            heu_net = pm4py.discover_heuristics_net(statistics, dependency_threshold=dependency_threshold)
+    """
+    __event_log_deprecation_warning(log)
+
+    from pm4py.algo.discovery.heuristics.variants import classic as heuristics_miner
+    heu_parameters = heuristics_miner.Parameters
+    parameters = get_properties(
+        log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+    parameters[heu_parameters.HEU_NET_DECORATION] = decoration
+
+    if check_is_pandas_dataframe(log):
+        check_pandas_dataframe_columns(
+            log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        return heuristics_miner.discover_statistics_pandas(log, parameters=parameters)
+    else:
+        return heuristics_miner.discover_statistics(log, parameters=parameters)
+
+
 def derive_minimum_self_distance(log: Union[DataFrame, EventLog, EventStream], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Dict[str, int]:
     """
     This algorithm computes the minimum self-distance for each activity observed in an event log.
@@ -26,6 +26,8 @@ from pm4py.objects.log.obj import EventLog, EventStream
 from pm4py.util import constants, xes_constants, pandas_utils, nx_utils
 import warnings
 from pm4py.util.pandas_utils import check_is_pandas_dataframe, check_pandas_dataframe_columns
+from pm4py.util.polars_utils import check_is_polars_dataframe, check_polars_dataframe_columns
+from pm4py.util.duckdb_utils import check_is_duckdb_relation
 from pm4py.utils import get_properties, __event_log_deprecation_warning
 from pm4py.objects.ocel.obj import OCEL
 import datetime
@@ -72,7 +74,7 @@ Union[EventLog, pd.DataFrame]:
     """
     Filter cases having a start activity in the provided list
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / DuckDB relation / Parquet file (or directory of Parquet files)
     :param activities: collection of start activities
     :param retain: if True, we retain the traces containing the given start activities, if false, we drop the traces
     :param activity_key: attribute to be used for the activity
@@ -89,7 +91,11 @@ Union[EventLog, pd.DataFrame]:
     __event_log_deprecation_warning(log)
 
     parameters = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.algo.filtering.duckdb.start_activities import start_activities_filter
+        parameters[start_activities_filter.Parameters.POSITIVE] = retain
+        return start_activities_filter.apply(log, activities, parameters=parameters)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.algo.filtering.pandas.start_activities import start_activities_filter
         parameters[start_activities_filter.Parameters.POSITIVE] = retain
@@ -107,7 +113,7 @@ def filter_end_activities(log: Union[EventLog, pd.DataFrame], activities:  Union
     """
     Filter cases having an end activity in the provided list
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / DuckDB relation / Parquet file (or directory of Parquet files)
     :param activities: collection of end activities
     :param retain: if True, we retain the traces containing the given end activities, if false, we drop the traces
     :param activity_key: attribute to be used for the activity
@@ -124,7 +130,11 @@ def filter_end_activities(log: Union[EventLog, pd.DataFrame], activities:  Union
     __event_log_deprecation_warning(log)
 
     parameters = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.algo.filtering.duckdb.end_activities import end_activities_filter
+        parameters[end_activities_filter.Parameters.POSITIVE] = retain
+        return end_activities_filter.apply(log, activities, parameters=parameters)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.algo.filtering.pandas.end_activities import end_activities_filter
         parameters[end_activities_filter.Parameters.POSITIVE] = retain
@@ -142,7 +152,7 @@ def filter_event_attribute_values(log: Union[EventLog, pd.DataFrame], attribute_
     """
     Filter a log object on the values of some event attribute
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / Polars dataframe / DuckDB relation / Parquet file (or directory of Parquet files)
     :param attribute_key: attribute to filter
     :param values: admitted (or forbidden) values
     :param level: specifies how the filter should be applied ('case' filters the cases where at least one occurrence happens, 'event' filter the events eventually trimming the cases)
@@ -160,7 +170,22 @@ def filter_event_attribute_values(log: Union[EventLog, pd.DataFrame], attribute_
 
     parameters = get_properties(log, case_id_key=case_id_key)
     parameters[constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY] = attribute_key
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.algo.filtering.duckdb.attributes import attributes_filter
+        parameters[attributes_filter.Parameters.POSITIVE] = retain
+        if level == "event":
+            return attributes_filter.apply_events(log, values, parameters=parameters)
+        elif level == "case":
+            return attributes_filter.apply(log, values, parameters=parameters)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(log, case_id_key=case_id_key)
+        from pm4py.algo.filtering.polars.attributes import attributes_filter
+        parameters[attributes_filter.Parameters.POSITIVE] = retain
+        if level == "event":
+            return attributes_filter.apply_events(log, values, parameters=parameters)
+        elif level == "case":
+            return attributes_filter.apply(log, values, parameters=parameters)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, case_id_key=case_id_key)
         from pm4py.algo.filtering.pandas.attributes import attributes_filter
         if level == "event":
@@ -220,7 +245,7 @@ def filter_variants(log: Union[EventLog, pd.DataFrame], variants:  Union[Set[str
     """
     Filter a log on a specified set of variants
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / Polars dataframe / DuckDB relation / Parquet file (or directory of Parquet files)
     :param variants: collection of variants to filter; A variant should be specified as a list of tuples of activity names, e.g., [('a', 'b', 'c')]
     :param retain: boolean; if True all traces conforming to the specified variants are retained; if False, all those traces are removed
     :param activity_key: attribute to be used for the activity
@@ -238,7 +263,16 @@ def filter_variants(log: Union[EventLog, pd.DataFrame], variants:  Union[Set[str
 
     from pm4py.util import variants_util
     parameters = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.algo.filtering.duckdb.variants import variants_filter
+        parameters[variants_filter.Parameters.POSITIVE] = retain
+        return variants_filter.apply(log, variants, parameters=parameters)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        from pm4py.algo.filtering.polars.variants import variants_filter
+        parameters[variants_filter.Parameters.POSITIVE] = retain
+        return variants_filter.apply(log, variants, parameters=parameters)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.algo.filtering.pandas.variants import variants_filter
         parameters[variants_filter.Parameters.POSITIVE] = retain
@@ -353,7 +387,7 @@ def filter_time_range(log: Union[EventLog, pd.DataFrame], dt1: str, dt2: str, mo
     """
     Filter a log on a time interval
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / Polars dataframe / DuckDB relation / Parquet file (or directory of Parquet files)
     :param dt1: left extreme of the interval
     :param dt2: right extreme of the interval
     :param mode: modality of filtering (events, traces_contained, traces_intersecting). events: any event that fits the time frame is retained; traces_contained: any trace completely contained in the timeframe is retained; traces_intersecting: any trace intersecting with the time-frame is retained.
@@ -372,7 +406,31 @@ def filter_time_range(log: Union[EventLog, pd.DataFrame], dt1: str, dt2: str, mo
     __event_log_deprecation_warning(log)
 
     properties = get_properties(log, timestamp_key=timestamp_key, case_id_key=case_id_key)
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.algo.filtering.duckdb.timestamp import timestamp_filter
+        if mode == "events":
+            return timestamp_filter.apply_events(log, dt1, dt2, parameters=properties)
+        elif mode == "traces_contained":
+            return timestamp_filter.filter_traces_contained(log, dt1, dt2, parameters=properties)
+        elif mode == "traces_intersecting":
+            return timestamp_filter.filter_traces_intersecting(log, dt1, dt2, parameters=properties)
+        else:
+            if constants.SHOW_INTERNAL_WARNINGS:
+                warnings.warn('mode provided: ' + mode + ' is not recognized; original log returned!')
+            return log
+    elif check_is_polars_dataframe(log):
+        from pm4py.algo.filtering.polars.timestamp import timestamp_filter
+        if mode == "events":
+            return timestamp_filter.apply_events(log, dt1, dt2, parameters=properties)
+        elif mode == "traces_contained":
+            return timestamp_filter.filter_traces_contained(log, dt1, dt2, parameters=properties)
+        elif mode == "traces_intersecting":
+            return timestamp_filter.filter_traces_intersecting(log, dt1, dt2, parameters=properties)
+        else:
+            if constants.SHOW_INTERNAL_WARNINGS:
+                warnings.warn('mode provided: ' + mode + ' is not recognized; original log returned!')
+            return log
+    elif check_is_pandas_dataframe(log):
         from pm4py.algo.filtering.pandas.timestamp import timestamp_filter
         if mode == "events":
             return timestamp_filter.apply_events(log, dt1, dt2, parameters=properties)
@@ -1069,7 +1127,17 @@ def filter_ocel_objects(ocel: OCEL, object_identifiers: Collection[str], positiv
         filtered_ocel = pm4py.filter_ocel_objects(ocel, ['o1'], level=1)
     """
     object_identifiers = set(object_identifiers)
-    if level > 1:
+    # the index is used (and checked for changes) only to expand the set of objects
+    index = ocel.get_index() if level > 1 else None
+    if index is not None:
+        # expands the set of objects through the adjacency arrays of the index
+        objects = index.objects_index.get_indexer(list(object_identifiers))
+        objects = objects[objects >= 0]
+        while level > 1:
+            objects = index.get_interacting_objects(objects)
+            object_identifiers.update(index.object_ids[objects].tolist())
+            level = level - 1
+    elif level > 1:
         ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
         objects_ids = ocel.objects[ocel.object_id_column].to_numpy().tolist()
         graph = {o: set() for o in objects_ids}
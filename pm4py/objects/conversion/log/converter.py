@@ -16,7 +16,8 @@
 '''
 from enum import Enum
 
-from pm4py.objects.conversion.log.variants import to_event_stream, to_event_log, to_data_frame, to_nx
+from pm4py.objects.conversion.log.variants import to_event_stream, to_event_log, to_data_frame, to_nx, \
+    to_columnar_event_log
 
 
 class Variants(Enum):
@@ -24,11 +25,13 @@ class Variants(Enum):
     TO_EVENT_STREAM = to_event_stream
     TO_DATA_FRAME = to_data_frame
     TO_NX = to_nx
+    TO_COLUMNAR_EVENT_LOG = to_columnar_event_log
 
 
 TO_EVENT_LOG = Variants.TO_EVENT_LOG
 TO_EVENT_STREAM = Variants.TO_EVENT_STREAM
 TO_DATA_FRAME = Variants.TO_DATA_FRAME
+TO_COLUMNAR_EVENT_LOG = Variants.TO_COLUMNAR_EVENT_LOG
 
 
 def apply(log, parameters=None, variant=None):
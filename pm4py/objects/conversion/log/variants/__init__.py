@@ -14,4 +14,5 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.objects.conversion.log.variants import to_data_frame, to_event_stream, to_event_log, df_to_event_log_1v, df_to_event_log_nv
+from pm4py.objects.conversion.log.variants import to_data_frame, to_event_stream, to_event_log, df_to_event_log_1v, df_to_event_log_nv, \
+    to_columnar_event_log
@@ -0,0 +1,135 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from copy import copy
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.conversion.log.variants import to_data_frame
+from pm4py.objects.log import obj as log_instance
+from pm4py.util import constants as pmconstants
+from pm4py.util import exec_utils, pandas_utils, xes_constants
+
+
+class Parameters(Enum):
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+    CASE_ID_KEY = pmconstants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def apply(log, parameters=None):
+    """
+    Converts a dataframe (or an event log / event stream object) to a columnar event log,
+    in which the values of the attributes are kept in the arrays of the columns of the dataframe
+    (without copying them) and the traces/events are lazy views on such arrays.
+
+    Parameters
+    -----------------
+    log
+        Dataframe / event log / event stream
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the attribute to be used as case identifier (default: case:concept:name)
+        - Parameters.CASE_ATTRIBUTE_PREFIX => the prefix of the case attributes (default: case:)
+
+    Returns
+    -----------------
+    columnar_log
+        Columnar event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    if isinstance(log, log_instance.ColumnarEventLog):
+        return log
+
+    glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, pmconstants.CASE_CONCEPT_NAME)
+    case_pref = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters, "case:")
+
+    if not pandas_utils.check_is_pandas_dataframe(log):
+        log = to_data_frame.apply(log, parameters=parameters)
+
+    return __transform_dataframe_to_columnar_event_log(log, case_glue=glue, case_attribute_prefix=case_pref)
+
+
+def __get_column_values(series):
+    """
+    Gets the values of a column of the dataframe, without copying them.
+    The columns backed by a NumPy array are returned as such; the other columns (timestamps, categoricals,
+    nullable types) are returned as Pandas extension arrays, whose items are the same values returned by the
+    conversion of the dataframe to a list of dictionaries.
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind not in "mM":
+        return series.to_numpy(copy=False)
+    return series.array
+
+
+def __transform_dataframe_to_columnar_event_log(dataframe, case_glue=pmconstants.CASE_CONCEPT_NAME,
+                                                case_attribute_prefix="case:"):
+    """
+    Transforms a dataframe to a columnar event log
+
+    Parameters
+    ------------------
+    dataframe
+        Pandas dataframe
+    case_glue
+        Case identifier
+    case_attribute_prefix
+        Prefix of the case attributes
+
+    Returns
+    ------------------
+    columnar_log
+        Columnar event log
+    """
+    # the cases are sorted by their first occurrence in the dataframe (as in the conversion to event log)
+    codes, uniques = pd.factorize(dataframe[case_glue], use_na_sentinel=False)
+    counts = np.bincount(codes, minlength=len(uniques))
+    case_offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+    np.cumsum(counts, out=case_offsets[1:])
+    events_order = None
+    if len(codes) > 1 and not np.all(codes[1:] >= codes[:-1]):
+        events_order = np.argsort(codes, kind="stable")
+
+    columns = {}
+    case_columns = {}
+    for col in dataframe.columns:
+        values = __get_column_values(dataframe[col])
+        if type(col) is str and col.startswith(case_attribute_prefix):
+            case_columns[col.replace(case_attribute_prefix, "")] = values
+        else:
+            columns[col] = values
+
+    if hasattr(dataframe, 'attrs'):
+        properties = copy(dataframe.attrs)
+        if pmconstants.PARAMETER_CONSTANT_CASEID_KEY in properties:
+            del properties[pmconstants.PARAMETER_CONSTANT_CASEID_KEY]
+    else:
+        properties = {}
+
+    log = log_instance.ColumnarEventLog(columns, case_offsets, case_columns=case_columns,
+                                        case_ids=__get_column_values(dataframe[case_glue]),
+                                        events_order=events_order, attributes={'origin': 'csv'},
+                                        properties=properties)
+    for ex in log_instance.XESExtension:
+        if any(single_key == ex.prefix for col in dataframe.columns for single_key in str(col).split(':')):
+            log.extensions[ex.name] = {
+                xes_constants.KEY_PREFIX: ex.prefix,
+                xes_constants.KEY_URI: ex.uri}
+
+    return log
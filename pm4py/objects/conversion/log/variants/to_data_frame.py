@@ -57,7 +57,7 @@ def apply(log, parameters=None):
     if pandas_utils.check_is_pandas_dataframe(log):
         return log
 
-    if type(log) is log_instance.EventLog:
+    if isinstance(log, log_instance.EventLog):
         new_parameters = copy(parameters)
         new_parameters["deepcopy"] = False
         log = to_event_stream.apply(log, parameters=new_parameters)
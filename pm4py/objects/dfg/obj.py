@@ -14,8 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+import math
 from collections import Counter
-from typing import Tuple, Any, Counter as TCounter
+from typing import Tuple, Any, Counter as TCounter, Dict, Optional, Sequence
+
+from pm4py.util import constants
 
 
 class DirectlyFollowsGraph:
@@ -56,3 +59,362 @@ class DirectlyFollowsGraph:
 
 
 DFG = DirectlyFollowsGraph
+
+
+class PerformanceSketch(object):
+    """
+    Mergeable summary of a collection of performance values (e.g., the durations of the occurrences of an arc).
+
+    Keeps the count, the sum, the sum of squares, the minimum and the maximum of the values, along with a quantile
+    sketch (logarithmic buckets guaranteeing the provided relative accuracy on the quantiles). Values can be added
+    and removed, and two sketches can be merged (provided that they have the same relative accuracy).
+    After the removal of the current minimum/maximum, the minimum/maximum are estimated from the quantile sketch.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.count = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._exact_bounds = True
+        self.zero_count = 0
+        self.positive_buckets = Counter()
+        self.negative_buckets = Counter()
+
+    def __bucket(self, value: float) -> int:
+        return int(math.ceil(math.log(value) / self.log_gamma))
+
+    def __bucket_value(self, bucket: int) -> float:
+        return 2.0 * self.gamma ** bucket / (self.gamma + 1.0)
+
+    def add(self, value: float, count: int = 1):
+        """
+        Adds a value (possibly with a multiplicity) to the sketch
+        """
+        self.count += count
+        self.sum += value * count
+        self.sum_sq += value * value * count
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        if value > 0:
+            self.positive_buckets[self.__bucket(value)] += count
+        elif value < 0:
+            self.negative_buckets[self.__bucket(-value)] += count
+        else:
+            self.zero_count += count
+
+    def remove(self, value: float, count: int = 1):
+        """
+        Removes a value (possibly with a multiplicity), previously added, from the sketch
+        """
+        self.count -= count
+        self.sum -= value * count
+        self.sum_sq -= value * value * count
+        if value > 0:
+            buckets, bucket = self.positive_buckets, self.__bucket(value)
+        elif value < 0:
+            buckets, bucket = self.negative_buckets, self.__bucket(-value)
+        else:
+            buckets, bucket = None, None
+        if buckets is not None:
+            buckets[bucket] -= count
+            if buckets[bucket] <= 0:
+                del buckets[bucket]
+        else:
+            self.zero_count -= count
+        if self.count <= 0:
+            self.__init__(self.relative_accuracy)
+        elif value <= self._min or value >= self._max:
+            self._exact_bounds = False
+
+    def merge(self, other: "PerformanceSketch"):
+        """
+        Merges another sketch (having the same relative accuracy) into the current one
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise Exception("cannot merge sketches having a different relative accuracy")
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_sq += other.sum_sq
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._exact_bounds = self._exact_bounds and other._exact_bounds
+        self.zero_count += other.zero_count
+        self.positive_buckets.update(other.positive_buckets)
+        self.negative_buckets.update(other.negative_buckets)
+
+    @property
+    def min(self) -> float:
+        if self._exact_bounds or self.count == 0:
+            return self._min
+        return self.quantile(0.0)
+
+    @property
+    def max(self) -> float:
+        if self._exact_bounds or self.count == 0:
+            return self._max
+        return self.quantile(1.0)
+
+    def mean(self) -> float:
+        return self.sum / self.count if self.count > 0 else 0.0
+
+    def stdev(self) -> float:
+        # sample standard deviation
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(max(0.0, (self.sum_sq - self.sum * self.sum / self.count) / (self.count - 1)))
+
+    def __value_at_rank(self, rank: int) -> float:
+        value = self._max
+        seen = 0
+        for bucket in sorted(self.negative_buckets, reverse=True):
+            seen += self.negative_buckets[bucket]
+            if seen > rank:
+                value = -self.__bucket_value(bucket)
+                break
+        else:
+            seen += self.zero_count
+            if seen > rank:
+                return 0.0
+            for bucket in sorted(self.positive_buckets):
+                seen += self.positive_buckets[bucket]
+                if seen > rank:
+                    value = self.__bucket_value(bucket)
+                    break
+        if self._exact_bounds:
+            # the estimate is kept within the (exact) bounds
+            value = min(max(value, self._min), self._max)
+        return value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the provided quantile (0 <= q <= 1) of the values (interpolating linearly between the closest
+        ranks, as Pandas/Numpy do)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        lower = int(math.floor(rank))
+        value = self.__value_at_rank(lower)
+        if rank > lower:
+            value += (rank - lower) * (self.__value_at_rank(lower + 1) - value)
+        return value
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the sketch into a (JSON-compatible) dictionary
+        """
+        return {"relative_accuracy": self.relative_accuracy, "count": self.count, "sum": self.sum,
+                "sum_sq": self.sum_sq, "min": self._min if self.count else None,
+                "max": self._max if self.count else None, "exact_bounds": self._exact_bounds,
+                "zero_count": self.zero_count,
+                "positive_buckets": [[k, v] for k, v in self.positive_buckets.items()],
+                "negative_buckets": [[k, v] for k, v in self.negative_buckets.items()]}
+
+    @staticmethod
+    def from_dict(dct: Dict[str, Any]) -> "PerformanceSketch":
+        """
+        Deserializes a sketch from a dictionary (obtained with to_dict)
+        """
+        sketch = PerformanceSketch(dct["relative_accuracy"])
+        sketch.count = dct["count"]
+        sketch.sum = dct["sum"]
+        sketch.sum_sq = dct["sum_sq"]
+        sketch._min = dct["min"] if dct["min"] is not None else math.inf
+        sketch._max = dct["max"] if dct["max"] is not None else -math.inf
+        sketch._exact_bounds = dct["exact_bounds"]
+        sketch.zero_count = dct["zero_count"]
+        sketch.positive_buckets = Counter({k: v for k, v in dct["positive_buckets"]})
+        sketch.negative_buckets = Counter({k: v for k, v in dct["negative_buckets"]})
+        return sketch
+
+
+class IncrementalDirectlyFollowsGraph(DirectlyFollowsGraph):
+    """
+    Directly-follows graph that can be maintained incrementally, by adding and removing whole cases (e.g., to keep
+    the DFG of a sliding window of the log), along with a mergeable performance sketch per arc.
+    Two incremental DFGs built on disjoint sets of cases (e.g., the partitions of a log) can be merged, and the
+    object can be serialized into a JSON-compatible dictionary.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        DirectlyFollowsGraph.__init__(self)
+        self.relative_accuracy = relative_accuracy
+        self._performance = {}
+        # for each case, the activities and the durations of its directly-follows relations (needed for the removal)
+        self._cases = {}
+
+    @property
+    def performance(self) -> Dict[Tuple[Any, Any], PerformanceSketch]:
+        return self._performance
+
+    @property
+    def cases(self) -> Dict[Any, Tuple[Tuple[Any, ...], Tuple[float, ...]]]:
+        return self._cases
+
+    def __update(self, activities: Sequence[Any], durations: Sequence[float], sign: int):
+        if activities:
+            self._start_activities[activities[0]] += sign
+            self._end_activities[activities[-1]] += sign
+            if self._start_activities[activities[0]] <= 0:
+                del self._start_activities[activities[0]]
+            if self._end_activities[activities[-1]] <= 0:
+                del self._end_activities[activities[-1]]
+        for i in range(len(activities) - 1):
+            arc = (activities[i], activities[i + 1])
+            self._graph[arc] += sign
+            if arc not in self._performance:
+                self._performance[arc] = PerformanceSketch(self.relative_accuracy)
+            if sign > 0:
+                self._performance[arc].add(durations[i])
+            else:
+                self._performance[arc].remove(durations[i])
+            if self._graph[arc] <= 0:
+                del self._graph[arc]
+                del self._performance[arc]
+
+    def add_case(self, case_id: Any, activities: Sequence[Any], timestamps: Optional[Sequence[Any]] = None):
+        """
+        Adds a case to the DFG
+
+        Parameters
+        ----------------
+        case_id
+            Identifier of the case (should not be already contained in the DFG)
+        activities
+            Activities of the case (sorted by timestamp)
+        timestamps
+            Timestamps of the events of the case (datetimes or numbers, in seconds), used for the performance.
+            If not provided, the durations are set to 0.
+        """
+        if case_id in self._cases:
+            raise Exception("the case " + str(case_id) + " is already contained in the DFG")
+        activities = tuple(activities)
+        if timestamps is None:
+            durations = tuple(0.0 for i in range(len(activities) - 1))
+        else:
+            durations = []
+            for i in range(len(activities) - 1):
+                diff = timestamps[i + 1] - timestamps[i]
+                durations.append(diff.total_seconds() if hasattr(diff, "total_seconds") else float(diff))
+            durations = tuple(durations)
+        self._cases[case_id] = (activities, durations)
+        self.__update(activities, durations, 1)
+
+    def remove_case(self, case_id: Any):
+        """
+        Removes a case (previously added) from the DFG
+        """
+        activities, durations = self._cases.pop(case_id)
+        self.__update(activities, durations, -1)
+
+    def add_log(self, log: Any, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp",
+                case_id_key: str = "case:concept:name"):
+        """
+        Adds all the cases of an event log / Pandas dataframe to the DFG
+
+        Parameters
+        ----------------
+        log
+            Event log / Pandas dataframe
+        activity_key
+            Attribute to be used as activity
+        timestamp_key
+            Attribute to be used as timestamp
+        case_id_key
+            Attribute to be used as case identifier
+        """
+        import pandas as pd
+
+        if isinstance(log, pd.DataFrame):
+            df = log[[case_id_key, activity_key, timestamp_key]].sort_values([case_id_key, timestamp_key],
+                                                                            kind="stable")
+            case_ids = df[case_id_key].tolist()
+            activities = df[activity_key].tolist()
+            if pd.api.types.is_datetime64_any_dtype(df[timestamp_key]) and len(df) > 0:
+                # seconds elapsed from the first timestamp (independent of the resolution of the column)
+                timestamps = ((df[timestamp_key] - df[timestamp_key].iloc[0]) / pd.Timedelta(seconds=1)).tolist()
+            else:
+                timestamps = df[timestamp_key].tolist()
+            start = 0
+            for i in range(1, len(case_ids) + 1):
+                if i == len(case_ids) or case_ids[i] != case_ids[start]:
+                    self.add_case(case_ids[start], activities[start:i], timestamps[start:i])
+                    start = i
+        else:
+            trace_id_key = case_id_key[len(constants.CASE_ATTRIBUTE_PREFIX):] if case_id_key.startswith(
+                constants.CASE_ATTRIBUTE_PREFIX) else case_id_key
+            for index, trace in enumerate(log):
+                self.add_case(trace.attributes[trace_id_key] if trace_id_key in trace.attributes else index,
+                              [ev[activity_key] for ev in trace], [ev[timestamp_key] for ev in trace])
+
+    def merge(self, other: "IncrementalDirectlyFollowsGraph"):
+        """
+        Merges another incremental DFG, built on a disjoint set of cases, into the current one
+        """
+        common = set(self._cases).intersection(other._cases)
+        if common:
+            raise Exception("the DFGs share some cases: " + str(list(common)[:10]))
+        self._cases.update(other._cases)
+        self._graph.update(other._graph)
+        self._start_activities.update(other._start_activities)
+        self._end_activities.update(other._end_activities)
+        for arc, sketch in other._performance.items():
+            if arc not in self._performance:
+                self._performance[arc] = PerformanceSketch(self.relative_accuracy)
+            self._performance[arc].merge(sketch)
+
+    def get_performance(self, aggregation_measure: str = "mean") -> Dict[Tuple[Any, Any], Any]:
+        """
+        Gets the performance DFG
+
+        Parameters
+        ----------------
+        aggregation_measure
+            Aggregation measure (mean, median, min, max, sum, stdev, or all to get all of them)
+
+        Returns
+        ----------------
+        performance_dfg
+            Performance DFG
+        """
+        measures = {"mean": lambda s: s.mean(), "median": lambda s: s.median(), "min": lambda s: s.min,
+                    "max": lambda s: s.max, "sum": lambda s: s.sum, "stdev": lambda s: s.stdev()}
+        if aggregation_measure == "all":
+            return {arc: {m: f(sketch) for m, f in measures.items()} for arc, sketch in self._performance.items()}
+        return {arc: measures[aggregation_measure](sketch) for arc, sketch in self._performance.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the incremental DFG into a (JSON-compatible, if the activities and the case identifiers are
+        JSON-compatible) dictionary
+        """
+        return {"relative_accuracy": self.relative_accuracy,
+                "graph": [[a, b, c] for (a, b), c in self._graph.items()],
+                "start_activities": [[a, c] for a, c in self._start_activities.items()],
+                "end_activities": [[a, c] for a, c in self._end_activities.items()],
+                "performance": [[a, b, s.to_dict()] for (a, b), s in self._performance.items()],
+                "cases": [[case_id, list(act), list(dur)] for case_id, (act, dur) in self._cases.items()]}
+
+    @staticmethod
+    def from_dict(dct: Dict[str, Any]) -> "IncrementalDirectlyFollowsGraph":
+        """
+        Deserializes an incremental DFG from a dictionary (obtained with to_dict)
+        """
+        dfg = IncrementalDirectlyFollowsGraph(dct["relative_accuracy"])
+        dfg._graph.update({(a, b): c for a, b, c in dct["graph"]})
+        dfg._start_activities.update({a: c for a, c in dct["start_activities"]})
+        dfg._end_activities.update({a: c for a, c in dct["end_activities"]})
+        dfg._performance = {(a, b): PerformanceSketch.from_dict(s) for a, b, s in dct["performance"]}
+        dfg._cases = {case_id: (tuple(act), tuple(dur)) for case_id, act, dur in dct["cases"]}
+        return dfg
+
+
+IncrementalDFG = IncrementalDirectlyFollowsGraph
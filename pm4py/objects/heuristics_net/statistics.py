@@ -0,0 +1,264 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
+
+
+class HeuristicsStatistics(object):
+    """
+    Statistics of an event log needed by the Heuristics Miner, stored as dense NumPy vectors/matrices indexed by
+    the position of the activities. The statistics are computed once (the expensive step of the discovery), and
+    heuristics nets for any combination of the thresholds are derived from them without accessing the log again.
+
+    Attributes
+    ----------------
+    activities
+        Activities (the position of an activity is its index in the vectors/matrices)
+    activities_occurrences
+        Number of occurrences of each activity
+    start_activities
+        Number of cases starting with each activity
+    end_activities
+        Number of cases ending with each activity
+    dfg
+        Directly-follows counts (dfg[i, j] is the number of times activities[j] follows activities[i]).
+        For the Heuristics Miner ++, the counts of the intervals directly following each other.
+    dfg_window_2
+        (Classic) Counts of the couples of activities at distance 2
+    loops_length_two
+        (Classic) loops_length_two[i, j] is the number of occurrences of the pattern activities[i], activities[j],
+        activities[i] (with i != j)
+    performance_dfg
+        (If computed) Performance of the paths of the DFG (NaN for the paths not in the performance DFG)
+    concurrent_activities
+        (Heuristics Miner ++) Symmetric matrix counting the overlaps of the intervals of the couples of activities
+    sojourn_time
+        (Heuristics Miner ++) Sojourn time of each activity (NaN if not available)
+    """
+
+    def __init__(self, activities: List[str], activities_occurrences: np.ndarray, start_activities: np.ndarray,
+                 end_activities: np.ndarray, dfg: np.ndarray, dfg_window_2: Optional[np.ndarray] = None,
+                 loops_length_two: Optional[np.ndarray] = None, performance_dfg: Optional[np.ndarray] = None,
+                 concurrent_activities: Optional[np.ndarray] = None, sojourn_time: Optional[np.ndarray] = None):
+        self.activities = list(activities)
+        self.activities_occurrences = activities_occurrences
+        self.start_activities = start_activities
+        self.end_activities = end_activities
+        self.dfg = dfg
+        self.dfg_window_2 = dfg_window_2
+        self.loops_length_two = loops_length_two
+        self.performance_dfg = performance_dfg
+        self.concurrent_activities = concurrent_activities
+        self.sojourn_time = sojourn_time
+
+    @staticmethod
+    def build(activities_occurrences: Dict[str, int], start_activities: Dict[str, int],
+              end_activities: Dict[str, int], dfg: Dict[Tuple[str, str], int],
+              dfg_window_2: Optional[Dict[Tuple[str, str], int]] = None,
+              freq_triples: Optional[Dict[Tuple[str, str, str], int]] = None,
+              performance_dfg: Optional[Dict[Tuple[str, str], float]] = None,
+              concurrent_activities: Optional[Dict[Tuple[str, str], int]] = None,
+              sojourn_time: Optional[Dict[str, float]] = None) -> "HeuristicsStatistics":
+        """
+        Builds the statistics from the dictionaries computed on the event log
+
+        Parameters
+        ----------------
+        activities_occurrences
+            Activities along with their number of occurrences
+        start_activities
+            Start activities
+        end_activities
+            End activities
+        dfg
+            Directly-follows graph
+        dfg_window_2
+            (Classic) DFG of window 2
+        freq_triples
+            (Classic) Frequency triples
+        performance_dfg
+            (If provided) Performance DFG
+        concurrent_activities
+            (Heuristics Miner ++) Concurrent activities
+        sojourn_time
+            (Heuristics Miner ++) Sojourn time of the activities
+
+        Returns
+        ----------------
+        statistics
+            Heuristics statistics
+        """
+        activities = list(activities_occurrences)
+        for couple in dfg:
+            activities.extend(x for x in couple if x not in activities_occurrences)
+        activities = list(dict.fromkeys(activities))
+        positions = {x: i for i, x in enumerate(activities)}
+        n = len(activities)
+
+        def vector(dictio, dtype=np.int64, missing=0):
+            vec = np.full(n, missing, dtype=dtype)
+            for act, value in dictio.items():
+                if act in positions:
+                    vec[positions[act]] = value
+            return vec
+
+        def matrix(couples, dtype=np.int64, missing=0):
+            mat = np.full((n, n), missing, dtype=dtype)
+            for (act1, act2), value in couples:
+                if act1 in positions and act2 in positions:
+                    mat[positions[act1], positions[act2]] = value
+            return mat
+
+        loops_length_two = None
+        if freq_triples is not None:
+            # only the triples of the form (a, b, a) are used by the Heuristics Miner
+            loops_length_two = matrix(((x[0], x[1]), y) for x, y in freq_triples.items() if x[0] == x[2] and x[0] != x[1])
+
+        concurrent_matrix = None
+        if concurrent_activities is not None:
+            concurrent_matrix = matrix(concurrent_activities.items())
+            concurrent_matrix = np.maximum(concurrent_matrix, concurrent_matrix.T)
+
+        return HeuristicsStatistics(activities, vector(activities_occurrences), vector(start_activities),
+                                    vector(end_activities), matrix(dfg.items()),
+                                    dfg_window_2=matrix(dfg_window_2.items()) if dfg_window_2 is not None else None,
+                                    loops_length_two=loops_length_two,
+                                    performance_dfg=matrix(performance_dfg.items(), dtype=np.float64,
+                                                           missing=np.nan) if performance_dfg is not None else None,
+                                    concurrent_activities=concurrent_matrix,
+                                    sojourn_time=vector(sojourn_time, dtype=np.float64,
+                                                        missing=np.nan) if sojourn_time is not None else None)
+
+    def __decode_vector(self, vec: np.ndarray) -> Dict[str, Any]:
+        return {self.activities[i]: vec[i].item() for i in np.flatnonzero(~np.isnan(vec) if vec.dtype.kind == "f"
+                                                                             else vec)}
+
+    def __decode_matrix(self, mat: np.ndarray) -> Dict[Tuple[str, str], Any]:
+        rows, cols = np.nonzero(~np.isnan(mat) if mat.dtype.kind == "f" else mat)
+        return {(self.activities[i], self.activities[j]): mat[i, j].item() for i, j in zip(rows.tolist(), cols.tolist())}
+
+    def get_activities_occurrences(self) -> Dict[str, int]:
+        """
+        Gets the activities along with their number of occurrences
+        """
+        return self.__decode_vector(self.activities_occurrences)
+
+    def get_start_activities(self) -> Dict[str, int]:
+        """
+        Gets the start activities
+        """
+        return self.__decode_vector(self.start_activities)
+
+    def get_end_activities(self) -> Dict[str, int]:
+        """
+        Gets the end activities
+        """
+        return self.__decode_vector(self.end_activities)
+
+    def get_dfg(self) -> Dict[Tuple[str, str], int]:
+        """
+        Gets the directly-follows graph
+        """
+        return self.__decode_matrix(self.dfg)
+
+    def get_dfg_window_2(self) -> Optional[Dict[Tuple[str, str], int]]:
+        """
+        Gets the DFG of window 2 (if computed)
+        """
+        return self.__decode_matrix(self.dfg_window_2) if self.dfg_window_2 is not None else None
+
+    def get_freq_triples(self) -> Optional[Dict[Tuple[str, str, str], int]]:
+        """
+        Gets the frequency triples used by the Heuristics Miner, i.e., the ones of the form (a, b, a) (if computed)
+        """
+        if self.loops_length_two is None:
+            return None
+        return {(x[0], x[1], x[0]): y for x, y in self.__decode_matrix(self.loops_length_two).items()}
+
+    def get_performance_dfg(self) -> Optional[Dict[Tuple[str, str], float]]:
+        """
+        Gets the performance DFG (if computed)
+        """
+        return self.__decode_matrix(self.performance_dfg) if self.performance_dfg is not None else None
+
+    def get_concurrent_activities(self) -> Optional[Dict[Tuple[str, str], int]]:
+        """
+        Gets the concurrent activities, with the couples expressed as sorted tuples (if computed)
+        """
+        if self.concurrent_activities is None:
+            return None
+        return {tuple(sorted(x)): y for x, y in self.__decode_matrix(self.concurrent_activities).items()}
+
+    def get_sojourn_time(self) -> Optional[Dict[str, float]]:
+        """
+        Gets the sojourn time of the activities (if computed)
+        """
+        return self.__decode_vector(self.sojourn_time) if self.sojourn_time is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the statistics as a dictionary of lists (that can be stored as JSON)
+
+        Returns
+        ----------------
+        dictio
+            Dictionary
+        """
+        return {x: (y.tolist() if isinstance(y, np.ndarray) else y) for x, y in self.__get_fields().items()}
+
+    @staticmethod
+    def from_dict(dictio: Dict[str, Any]) -> "HeuristicsStatistics":
+        """
+        Restores the statistics serialized through the to_dict method
+
+        Parameters
+        ----------------
+        dictio
+            Dictionary
+
+        Returns
+        ----------------
+        statistics
+            Heuristics statistics
+        """
+        n = len(dictio["activities"])
+        fields = {}
+        for key, value in dictio.items():
+            if key == "activities" or value is None:
+                fields[key] = value
+            else:
+                dtype = np.float64 if key in ("performance_dfg", "sojourn_time") else np.int64
+                fields[key] = np.array(value, dtype=dtype).reshape((n, n) if key not in (
+                    "activities_occurrences", "start_activities", "end_activities", "sojourn_time") else (n,))
+        return HeuristicsStatistics(**fields)
+
+    def __get_fields(self) -> Dict[str, Any]:
+        return {"activities": self.activities, "activities_occurrences": self.activities_occurrences,
+                "start_activities": self.start_activities, "end_activities": self.end_activities, "dfg": self.dfg,
+                "dfg_window_2": self.dfg_window_2, "loops_length_two": self.loops_length_two,
+                "performance_dfg": self.performance_dfg, "concurrent_activities": self.concurrent_activities,
+                "sojourn_time": self.sojourn_time}
+
+    def __getstate__(self):
+        return self.__get_fields()
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __repr__(self):
+        return "HeuristicsStatistics(activities=%d, paths=%d)" % (len(self.activities), int(np.count_nonzero(self.dfg)))
@@ -17,7 +17,8 @@
 from enum import Enum
 from pm4py.util import constants
 
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex, rustxes
+from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex, rustxes, \
+    parallel_chunks
 
 
 class Variants(Enum):
@@ -27,6 +28,7 @@ class Variants(Enum):
     ITERPARSE_20 = iterparse_20
     CHUNK_REGEX = chunk_regex
     RUSTXES = rustxes
+    PARALLEL_CHUNKS = parallel_chunks
 
 
 def __get_variant(variant_str: str):
@@ -48,6 +50,8 @@ def __get_variant(variant_str: str):
         variant = Variants.ITERPARSE_MEM_COMPRESSED
     elif variant_str == "rustxes":
         variant = Variants.RUSTXES
+    elif variant_str == "parallel_chunks":
+        variant = Variants.PARALLEL_CHUNKS
 
     return variant
 
@@ -0,0 +1,393 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import gzip
+import math
+import multiprocessing
+import os
+import re
+from copy import copy
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List, Tuple
+
+import pandas as pd
+
+from pm4py.objects.conversion.log import converter as log_converter
+from pm4py.objects.log.obj import EventLog
+from pm4py.util import constants, exec_utils, pandas_utils
+from pm4py.util.dt_parsing.variants import strpfromiso
+
+
+class Parameters(Enum):
+    ENCODING = "encoding"
+    RETURN_LEGACY_LOG_OBJECT = "return_legacy_log_object"
+    CORES = "cores"
+    CHUNK_SIZE = "chunk_size"
+
+
+TRACE_START = b"<trace"
+TAG_PATTERN = re.compile(r"<(/?)([A-Za-z_][\w.:-]*)([^>]*)>")
+KEY_VALUE_PATTERN = re.compile(r"\s+key=\"([^\"]*)\"\s+value=\"([^\"]*)\"\s*/?\s*$")
+ATTRIBUTE_PATTERN = re.compile(r"([\w.:-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+TIMEZONE_PATTERN = r"(Z|[+-]\d{2}:?\d{2})$"
+ENTITY_PATTERN = re.compile(r"&(?:#([0-9]+)|#[xX]([0-9a-fA-F]+)|(lt|gt|amp|quot|apos));")
+XML_ENTITIES = {"lt": "<", "gt": ">", "amp": "&", "quot": "\"", "apos": "'"}
+CASE_ATTRIBUTE_PREFIX = "case:"
+
+
+def __find_trace_start(content: bytes, start: int = 0) -> int:
+    """
+    Finds the position of the first <trace> tag (at or after the given position) in the content
+    """
+    while True:
+        idx = content.find(TRACE_START, start)
+        if idx == -1 or idx + len(TRACE_START) >= len(content) or content[
+                idx + len(TRACE_START):idx + len(TRACE_START) + 1] in (b" ", b"\t", b"\r", b"\n", b">", b"/"):
+            return idx
+        start = idx + 1
+
+
+def __rfind_trace_start(content: bytes) -> int:
+    """
+    Finds the position of the last (complete) <trace> tag in the content
+    """
+    end = len(content)
+    while True:
+        idx = content.rfind(TRACE_START, 0, end)
+        if idx == -1 or idx + len(TRACE_START) < len(content) and content[
+                idx + len(TRACE_START):idx + len(TRACE_START) + 1] in (b" ", b"\t", b"\r", b"\n", b">", b"/"):
+            return idx
+        end = idx
+
+
+def __get_boundaries(file_path: str, file_size: int, chunk_size: int) -> List[int]:
+    """
+    Splits an uncompressed XES file at the <trace> tags, in chunks of (approximately) the given size
+
+    Returns
+    --------------
+    boundaries
+        Positions of the <trace> tags starting the chunks (the first one is the end of the header),
+        followed by the size of the file
+    """
+    boundaries = []
+    block_size = 2 ** 16
+    with open(file_path, "rb") as F:
+        for i in range(max(1, math.ceil(file_size / chunk_size))):
+            position = i * chunk_size
+            if boundaries and position <= boundaries[-1]:
+                continue
+            F.seek(position)
+            content = F.read(block_size + len(TRACE_START))
+            while content:
+                idx = __find_trace_start(content)
+                if idx > -1 and idx + len(TRACE_START) < len(content):
+                    boundaries.append(position + idx)
+                    break
+                position += block_size
+                F.seek(position)
+                content = F.read(block_size + len(TRACE_START))
+            if not content:
+                break
+    boundaries.append(file_size)
+    return boundaries
+
+
+def __replace_entity(match) -> str:
+    if match.group(1) is not None:
+        return chr(int(match.group(1)))
+    elif match.group(2) is not None:
+        return chr(int(match.group(2), 16))
+    return XML_ENTITIES[match.group(3)]
+
+
+def __parse_value(tag: str, value: str):
+    if "&" in value:
+        # decodes the predefined entities and the (decimal or hexadecimal) character references, as the XML parsers
+        value = ENTITY_PATTERN.sub(__replace_entity, value)
+    if tag == "int":
+        return int(value)
+    elif tag == "float":
+        return float(value)
+    elif tag == "boolean":
+        return value.lower() == "true"
+    return value
+
+
+def __append_row(columns: Dict[str, list], n: int, row: Dict[str, Any]):
+    for key, value in row.items():
+        column = columns.get(key)
+        if column is None:
+            column = []
+            columns[key] = column
+        if len(column) < n:
+            column.extend([math.nan] * (n - len(column)))
+        column.append(value)
+
+
+def __parse_content(content: str) -> Tuple[Dict[str, list], int, List[str]]:
+    """
+    Parses a chunk of a XES file (containing complete traces) into column buffers
+
+    Parameters
+    --------------
+    content
+        Chunk of the XES file
+
+    Returns
+    --------------
+    columns
+        Dictionary associating to each attribute the list of its values (the dates are kept as strings)
+    n
+        Number of events
+    date_keys
+        Attributes of type date
+    """
+    columns = {}
+    n = 0
+    date_keys = set()
+    stack = []
+    trace_attributes = None
+    events = None
+
+    for closing, tag, rest in TAG_PATTERN.findall(content):
+        self_closing = rest.endswith("/")
+        if closing:
+            if stack:
+                kind = stack.pop()
+                if kind == "trace":
+                    case_attributes = {CASE_ATTRIBUTE_PREFIX + k: v for k, v in trace_attributes.items()}
+                    for event in events:
+                        event.update(case_attributes)
+                        __append_row(columns, n, event)
+                        n += 1
+                    trace_attributes = None
+                    events = None
+            continue
+        if tag == "trace":
+            trace_attributes = {}
+            events = []
+            if not self_closing:
+                stack.append("trace")
+            continue
+        elif tag == "event":
+            event = {}
+            if events is not None:
+                events.append(event)
+            if not self_closing:
+                stack.append(event)
+            continue
+        elif tag in ("string", "date", "int", "float", "boolean", "id"):
+            parent = stack[-1] if stack else None
+            if parent is not None and parent != "other":
+                key_value = KEY_VALUE_PATTERN.match(rest)
+                if key_value is not None:
+                    key, value = key_value.groups()
+                else:
+                    attributes = dict((x[0], x[1] if x[2] == "" else x[2]) for x in ATTRIBUTE_PATTERN.findall(rest))
+                    key, value = attributes.get("key"), attributes.get("value")
+                if key is not None and value is not None:
+                    if parent == "trace":
+                        trace_attributes[key] = __parse_value(tag, value)
+                        if tag == "date":
+                            date_keys.add(CASE_ATTRIBUTE_PREFIX + key)
+                    else:
+                        parent[key] = __parse_value(tag, value)
+                        if tag == "date":
+                            date_keys.add(key)
+        if not self_closing:
+            # the children of the attributes (and the lists/containers) are not included in the dataframe
+            stack.append("other")
+
+    for column in columns.values():
+        if len(column) < n:
+            column.extend([math.nan] * (n - len(column)))
+
+    return columns, n, sorted(date_keys)
+
+
+def __parse_chunk(file_path: str, start: int, end: int, encoding: str) -> Tuple[Dict[str, list], int, List[str]]:
+    """
+    Parses the chunk of the (uncompressed) XES file between the given positions
+    """
+    with open(file_path, "rb") as F:
+        F.seek(start)
+        content = F.read(end - start)
+    return __parse_content(content.decode(encoding))
+
+
+def __parse_bytes(content: bytes, encoding: str) -> Tuple[Dict[str, list], int, List[str]]:
+    """
+    Parses a chunk of a XES file provided as bytes
+    """
+    return __parse_content(content.decode(encoding))
+
+
+def __iterate_compressed_chunks(file_path: str, chunk_size: int):
+    """
+    Decompresses a gzipped XES file, splitting the content at the <trace> tags in chunks of
+    (approximately) the given size. The first chunk returned is the header.
+    """
+    buffer = b""
+    header_sent = False
+    with gzip.open(file_path, "rb") as F:
+        while True:
+            content = F.read(chunk_size)
+            buffer += content
+            if not header_sent:
+                idx = __find_trace_start(buffer)
+                if idx > -1 and idx + len(TRACE_START) < len(buffer):
+                    yield buffer[:idx]
+                    buffer = buffer[idx:]
+                    header_sent = True
+                elif not content:
+                    yield buffer
+                    return
+                else:
+                    continue
+            if not content:
+                if buffer:
+                    yield buffer
+                return
+            idx = __rfind_trace_start(buffer)
+            if idx > 0:
+                yield buffer[:idx]
+                buffer = buffer[idx:]
+
+
+def __merge_chunks(results: List[Tuple[Dict[str, list], int, List[str]]]) -> pd.DataFrame:
+    """
+    Merges the column buffers of the chunks into a dataframe, parsing the dates in a vectorized way
+    """
+    columns = {}
+    date_keys = set()
+    n = 0
+    for chunk_columns, chunk_n, chunk_date_keys in results:
+        for key, values in chunk_columns.items():
+            column = columns.get(key)
+            if column is None:
+                column = []
+                columns[key] = column
+            if len(column) < n:
+                column.extend([math.nan] * (n - len(column)))
+            column.extend(values)
+        date_keys.update(chunk_date_keys)
+        n += chunk_n
+    for column in columns.values():
+        if len(column) < n:
+            column.extend([math.nan] * (n - len(column)))
+
+    dataframe = pandas_utils.instantiate_dataframe(columns)
+    for key in date_keys:
+        # as in the default date parser, the timezone offset is not considered
+        serie = dataframe[key].str.replace(TIMEZONE_PATTERN, "", regex=True)
+        serie = pandas_utils.dataframe_column_string_to_datetime(serie, format="ISO8601")
+        dataframe[key] = strpfromiso.fix_dataframe_column(serie)
+
+    return dataframe
+
+
+def apply(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Union[EventLog, pd.DataFrame]:
+    return import_log(filename, parameters)
+
+
+def import_log(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Union[EventLog, pd.DataFrame]:
+    """
+    Imports a XES file, splitting it at the <trace> tags in chunks that are parsed in parallel
+    (in a pool of processes) directly into column buffers, which are then merged in a dataframe.
+    The dates are parsed in a vectorized way after the merge.
+
+    For uncompressed files, the workers read their chunk from the file. For gzipped files, the content
+    is decompressed by the main process (gzip does not allow random access) and the chunks are sent to the workers.
+    The attributes of type list/container, and the nested attributes, are not imported. As in the other
+    text-based importers, the character '>' is expected to be escaped in the values of the attributes.
+
+    Parameters
+    -----------------
+    filename
+        Path to the XES file
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ENCODING => the encoding of the file (default: utf-8)
+        - Parameters.RETURN_LEGACY_LOG_OBJECT => returns an EventLog object (default: True) or a dataframe
+        - Parameters.CORES => number of processes to use
+        - Parameters.CHUNK_SIZE => (approximate) size, in bytes, of the chunks (default: 32 MB)
+
+    Returns
+    -----------------
+    log
+        Event log / dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    return_legacy_log_object = exec_utils.get_param_value(Parameters.RETURN_LEGACY_LOG_OBJECT, parameters, True)
+    num_cores = max(1, exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2))
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 2 ** 25)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(max_workers=num_cores) if num_cores > 1 else None
+    futures = []
+    results = []
+
+    try:
+        if filename.lower().endswith(".gz"):
+            chunks = __iterate_compressed_chunks(filename, chunk_size)
+            header = next(chunks)
+            for content in chunks:
+                if executor is not None:
+                    futures.append(executor.submit(__parse_bytes, content, encoding))
+                else:
+                    results.append(__parse_bytes(content, encoding))
+        else:
+            boundaries = __get_boundaries(filename, os.stat(filename).st_size, chunk_size)
+            with open(filename, "rb") as F:
+                header = F.read(boundaries[0])
+            for i in range(len(boundaries) - 1):
+                if executor is not None:
+                    futures.append(executor.submit(__parse_chunk, filename, boundaries[i], boundaries[i + 1],
+                                                   encoding))
+                else:
+                    results.append(__parse_chunk(filename, boundaries[i], boundaries[i + 1], encoding))
+        for future in futures:
+            results.append(future.result())
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    dataframe = __merge_chunks(results)
+
+    if not return_legacy_log_object:
+        return dataframe
+
+    this_parameters = copy(parameters)
+    this_parameters["stream_postprocessing"] = True
+    log = log_converter.apply(dataframe, variant=log_converter.Variants.TO_EVENT_LOG, parameters=this_parameters)
+
+    # the attributes, extensions, globals and classifiers of the log are read from the header
+    from pm4py.objects.log.importer.xes import importer as xes_importer
+    if b"</log>" not in header:
+        # the header stops at the first trace (if the log contains no trace, it already closes the log)
+        header = header + b"</log>"
+    header_log = xes_importer.deserialize(header, parameters={"encoding": encoding})
+    log._attributes = header_log.attributes
+    log._extensions = header_log.extensions
+    log._omni = header_log.omni_present
+    log._classifiers = header_log.classifiers
+
+    return log
@@ -18,6 +18,8 @@ import copy
 from collections.abc import Mapping, Sequence
 from enum import Enum
 
+import numpy as np
+
 
 class XESExtension(Enum):
     ArtifactLifecycle = (
@@ -375,3 +377,259 @@ class EventLog(EventStream):
                 if self[i] != other[i]:
                     return False
         return True
+
+
+class ColumnarEvent(Event):
+    """
+    Lazy view on an event of a ColumnarEventLog (the values are read from, and written to, the columns of the log)
+    """
+
+    def __init__(self, log, row):
+        self._log = log
+        self._row = row
+
+    def _get_dict(self):
+        return {k: v for k, v in self.items()}
+
+    _dict = property(_get_dict)
+
+    def __getitem__(self, key):
+        value = self._log._get_value(key, self._row)
+        if value is ColumnarEventLog.ABSENT:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._log._set_value(key, self._row, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._log._set_value(key, self._row, ColumnarEventLog.ABSENT)
+
+    def __contains__(self, key):
+        return self._log._get_value(key, self._row) is not ColumnarEventLog.ABSENT
+
+    def __iter__(self):
+        for key in list(self._log._columns):
+            if self._log._get_value(key, self._row) is not ColumnarEventLog.ABSENT:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return Event, (self._dict,)
+
+
+class ColumnarTrace(Trace):
+    """
+    Lazy view on a case of a ColumnarEventLog. The events are instantiated as views only when they are accessed,
+    unless the list of the events is requested (or modified), in which case it is materialized.
+    """
+
+    def __init__(self, log, index):
+        self._log = log
+        self._index = index
+        self._events = None
+        self._trace_attributes = None
+        self._properties = {}
+
+    def _get_rows(self):
+        return self._log._get_rows(self._index)
+
+    def _get_list(self):
+        if self._events is None:
+            self._events = [ColumnarEvent(self._log, row) for row in self._get_rows()]
+        return self._events
+
+    def _set_list(self, events):
+        self._events = list(events)
+
+    def _get_attributes(self):
+        if self._trace_attributes is None:
+            self._trace_attributes = self._log._get_case_attributes(self._index)
+        return self._trace_attributes
+
+    def _set_attributes(self, attributes):
+        self._trace_attributes = attributes
+
+    _list = property(_get_list, _set_list)
+    _attributes = property(_get_attributes, _set_attributes)
+    attributes = property(_get_attributes)
+
+    def __getitem__(self, key):
+        if self._events is not None:
+            return self._events[key]
+        rows = self._get_rows()
+        if isinstance(key, slice):
+            return [ColumnarEvent(self._log, row) for row in rows[key]]
+        return ColumnarEvent(self._log, rows[key])
+
+    def __iter__(self):
+        if self._events is not None:
+            return iter(self._events)
+        return (ColumnarEvent(self._log, row) for row in self._get_rows())
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __len__(self):
+        if self._events is not None:
+            return len(self._events)
+        return len(self._get_rows())
+
+    def __hash__(self):
+        ret = 0
+        for ev in self:
+            ret += hash(ev)
+            ret = ret % 479001599
+        return ret
+
+    def __eq__(self, other):
+        if len(self) != len(other):
+            return False
+        elif self.attributes != other.attributes:
+            return False
+        else:
+            for ev1, ev2 in zip(self, other):
+                if ev1 != ev2:
+                    return False
+        return True
+
+    def __reduce__(self):
+        return Trace, ([Event(ev._dict) for ev in self],), {"_attributes": self.attributes,
+                                                             "_properties": self._properties}
+
+
+class ColumnarEventLog(EventLog):
+    """
+    Event log storing the values of the events column-wise (an array for each attribute, the values of the
+    case attributes are read from the first event of the case), along with an index of the events of each case.
+
+    The traces and the events are lazy views on the columns (see ColumnarTrace and ColumnarEvent), hence the log
+    exposes the same interface as an EventLog while the memory occupation is the one of the arrays. The arrays are
+    not copied at construction: when they are shared with a dataframe, the dataframe should not be modified while
+    the log is in use. Writing the value of an attribute replaces the column with a private (object-typed) copy.
+    """
+
+    # value of the positions of a column where the event does not have the attribute
+    ABSENT = object()
+
+    def __init__(self, columns, case_offsets, case_columns=None, case_ids=None, events_order=None, **kwargs):
+        """
+        Parameters
+        ----------------
+        columns
+            Dictionary associating to each event attribute the array of its values (indexed by row)
+        case_offsets
+            Array containing, for each case, the position of its first event (and, as last element, the number
+            of events)
+        case_columns
+            Dictionary associating to each case attribute the array of its values (indexed by row)
+        case_ids
+            Array of the case identifiers (indexed by row), used as trace name when not provided as case attribute
+        events_order
+            Permutation of the rows sorting the events by case (None if the rows are already sorted by case)
+        """
+        self._attributes = kwargs['attributes'] if 'attributes' in kwargs else {}
+        self._extensions = kwargs['extensions'] if 'extensions' in kwargs else {}
+        self._omni = kwargs['omni_present'] if 'omni_present' in kwargs else kwargs[
+            'globals'] if 'globals' in kwargs else {}
+        self._classifiers = kwargs['classifiers'] if 'classifiers' in kwargs else {}
+        self._properties = kwargs['properties'] if 'properties' in kwargs else {}
+        self._columns = dict(columns)
+        self._case_columns = dict(case_columns) if case_columns is not None else {}
+        self._case_ids = case_ids
+        self._case_offsets = np.asarray(case_offsets, dtype=np.int64)
+        self._events_order = events_order
+        self._n_events = int(self._case_offsets[-1]) if len(self._case_offsets) > 0 else 0
+        self._owned_columns = set()
+        self._traces = [None] * (len(self._case_offsets) - 1 if len(self._case_offsets) > 0 else 0)
+
+    @staticmethod
+    def _box(value):
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def _get_value(self, key, row):
+        if key not in self._columns:
+            return ColumnarEventLog.ABSENT
+        return self._box(self._columns[key][row])
+
+    def _set_value(self, key, row, value):
+        if key not in self._columns:
+            self._columns[key] = np.full(self._n_events, ColumnarEventLog.ABSENT, dtype=object)
+            self._owned_columns.add(key)
+        elif key not in self._owned_columns:
+            # copy-on-write: the columns shared with the originating object are never modified
+            self._columns[key] = np.array([self._box(x) for x in self._columns[key]], dtype=object)
+            self._owned_columns.add(key)
+        self._columns[key][row] = value
+
+    def _get_rows(self, index):
+        start = int(self._case_offsets[index])
+        end = int(self._case_offsets[index + 1])
+        if self._events_order is not None:
+            return self._events_order[start:end].tolist()
+        return range(start, end)
+
+    def _get_case_attributes(self, index):
+        from pm4py.util import xes_constants
+
+        first_row = self._get_rows(index)[0]
+        attributes = {k: self._box(v[first_row]) for k, v in self._case_columns.items()}
+        if xes_constants.DEFAULT_TRACEID_KEY not in attributes and self._case_ids is not None:
+            attributes[xes_constants.DEFAULT_TRACEID_KEY] = self._box(self._case_ids[first_row])
+        return attributes
+
+    def _get_trace(self, index):
+        trace = self._traces[index]
+        if trace is None:
+            trace = ColumnarTrace(self, index)
+            self._traces[index] = trace
+        return trace
+
+    def _get_list(self):
+        for i in range(len(self._traces)):
+            if self._traces[i] is None:
+                self._traces[i] = ColumnarTrace(self, i)
+        return self._traces
+
+    def _set_list(self, traces):
+        self._traces = list(traces)
+
+    _list = property(_get_list, _set_list)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._get_trace(i) for i in range(len(self._traces))[key]]
+        if key < 0:
+            key += len(self._traces)
+        if not 0 <= key < len(self._traces):
+            raise IndexError("trace index out of range")
+        return self._get_trace(key)
+
+    def __iter__(self):
+        for i in range(len(self._traces)):
+            yield self._get_trace(i)
+
+    def __len__(self):
+        return len(self._traces)
+
+    def __contains__(self, item):
+        return any(trace == item for trace in self)
+
+    def __reversed__(self):
+        for i in range(len(self._traces) - 1, -1, -1):
+            yield self._get_trace(i)
+
+    def __repr__(self):
+        if len(self) == 0:
+            ret = []
+        elif len(self) == 1:
+            ret = [self[0].__repr__(ret_list=True)]
+        else:
+            ret = [self[0].__repr__(ret_list=True), "....", self[-1].__repr__(ret_list=True)]
+        return str(ret)
@@ -17,4 +17,4 @@
 from pm4py.objects.log.util import insert_classifier, log, sampling, \
     sorting, index_attribute, get_class_representation, get_prefixes, \
     get_log_encoded, interval_lifecycle, basic_filter, \
-    filtering_utils, split_train_test, xes, artificial, dataframe_utils
+    filtering_utils, split_train_test, xes, artificial, dataframe_utils, dataframe_index
@@ -0,0 +1,337 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import weakref
+from enum import Enum
+from typing import Optional, Dict, Any, Tuple, List
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import constants, xes_constants, exec_utils
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+# indices attached to the dataframes (identified by their id), along with a weak reference to the dataframe
+__ATTACHED_INDICES = {}
+
+
+def __get_buffer_address(series: pd.Series) -> int:
+    """
+    Gets the address of the memory buffer storing the values of a column of the dataframe
+    (changes when the column is re-assigned, or the rows of the dataframe are re-ordered)
+    """
+    values = series.values
+    if not isinstance(values, np.ndarray):
+        values = getattr(values, "_ndarray", values)
+    if isinstance(values, np.ndarray):
+        return values.__array_interface__["data"][0]
+    return id(values)
+
+
+def __get_fingerprint(df: pd.DataFrame, keys: Tuple[str, ...]) -> Optional[Tuple[Any, ...]]:
+    if not all(k in df.columns for k in keys):
+        return None
+    return (len(df), id(df.index)) + tuple(__get_buffer_address(df[k]) for k in keys)
+
+
+class DataframeIndex(object):
+    """
+    Index of the cases of a dataframe: the cases and the activities are encoded as integers (the codes of
+    the cases follow the sorting of the case identifiers), and the events are sorted by case, timestamp
+    and position in the dataframe (the same order imposed by pm4py.format_dataframe).
+
+    Attributes
+    ----------------
+    cases
+        Identifiers of the cases (sorted)
+    activities
+        Activities of the dataframe
+    order
+        Positions of the events of the dataframe, sorted by case, timestamp and position
+    case_codes
+        Codes of the cases of the events (in the sorted order)
+    activity_codes
+        Codes of the activities of the events (in the sorted order)
+    timestamps
+        Timestamps of the events (in the sorted order)
+    case_offsets
+        Position (in the sorted order) of the first event of each case, followed by the number of events
+    case_lengths
+        Number of events of each case
+    is_sorted
+        Boolean value, true if the events of the dataframe are already in the sorted order (as in the dataframes
+        returned by pm4py.format_dataframe), i.e., the positions in the index are the positions in the dataframe
+    """
+
+    def __init__(self, df: pd.DataFrame, case_id_key: str, activity_key: str, timestamp_key: str):
+        self.keys = (case_id_key, activity_key, timestamp_key)
+
+        case_codes, self.cases = pd.factorize(df[case_id_key], sort=True)
+        case_codes = case_codes.astype(np.int32)
+        activity_codes, self.activities = pd.factorize(df[activity_key])
+        activity_codes = activity_codes.astype(np.int32)
+        timestamps = df[timestamp_key].values
+
+        if not np.issubdtype(timestamps.dtype, np.datetime64):
+            raise Exception("the index can be built only on dataframes with a timestamp column of datetime type.")
+        if len(df) > 0 and (case_codes.min() < 0 or activity_codes.min() < 0 or np.isnat(timestamps).any()):
+            raise Exception("the index can be built only on dataframes without missing case identifiers,"
+                            " activities or timestamps (see pm4py.format_dataframe).")
+
+        self.order = np.lexsort((timestamps.view(np.int64), case_codes))
+        self.is_sorted = bool(np.all(self.order[1:] > self.order[:-1]))
+        self.case_codes = case_codes[self.order]
+        self.activity_codes = activity_codes[self.order]
+        self.timestamps = timestamps[self.order]
+        self.case_lengths = np.bincount(case_codes, minlength=len(self.cases))
+        self.case_offsets = np.zeros(len(self.cases) + 1, dtype=np.int64)
+        np.cumsum(self.case_lengths, out=self.case_offsets[1:])
+
+    def get_start_activities(self) -> Dict[str, int]:
+        """
+        Gets the start activities (along with their number of occurrences)
+        """
+        counts = np.bincount(self.activity_codes[self.case_offsets[:-1]], minlength=len(self.activities))
+        return {self.activities[i]: int(counts[i]) for i in np.nonzero(counts)[0]}
+
+    def get_end_activities(self) -> Dict[str, int]:
+        """
+        Gets the end activities (along with their number of occurrences)
+        """
+        counts = np.bincount(self.activity_codes[self.case_offsets[1:] - 1], minlength=len(self.activities))
+        return {self.activities[i]: int(counts[i]) for i in np.nonzero(counts)[0]}
+
+    def get_variants(self) -> Tuple[Dict[Tuple[str, ...], int], Dict[str, Tuple[str, ...]]]:
+        """
+        Gets the variants of the dataframe
+
+        Returns
+        ----------------
+        variants_dict
+            Dictionary associating to each variant the number of cases
+        case_variant
+            Dictionary associating to each case the corresponding variant
+        """
+        cases, variant_ids, variants, counts = self.get_variants_ids()
+        variants_dict = {variants[i]: int(counts[i]) for i in range(len(variants))}
+        case_variant = dict(zip(cases, [variants[i] for i in variant_ids.tolist()]))
+        return variants_dict, case_variant
+
+    def get_variants_ids(self) -> Tuple[List[Any], np.ndarray, List[Tuple[str, ...]], np.ndarray]:
+        """
+        Gets the variants of the dataframe, identifying the variant of every case by its position
+
+        Returns
+        ----------------
+        cases
+            Identifiers of the cases (sorted)
+        variant_ids
+            For each case, the position of its variant in the list of variants
+        variants
+            Variants of the dataframe (sorted by the first case following them)
+        counts
+            Number of cases of each variant
+        """
+        from pm4py.objects.log.util import pandas_numpy_variants
+
+        variant_ids, representatives, counts = pandas_numpy_variants.encode_variants(self.activity_codes,
+                                                                                      self.case_offsets)
+        variants = pandas_numpy_variants.decode_variants(self.activity_codes, self.case_offsets, representatives,
+                                                         list(self.activities))
+        return list(self.cases), variant_ids, variants, counts
+
+    def get_directly_follows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the couples of events (of the same case) that directly follow each other
+
+        Returns
+        ----------------
+        positions
+            Positions (in the sorted order) of the source events
+        pair_codes
+            Code of the couple of activities (source code * number of activities + target code)
+        """
+        positions = np.nonzero(self.case_codes[:-1] == self.case_codes[1:])[0]
+        pair_codes = self.activity_codes[positions].astype(np.int64) * len(self.activities) + \
+                     self.activity_codes[positions + 1]
+        return positions, pair_codes
+
+    def decode_pair(self, pair_code: int) -> Tuple[str, str]:
+        """
+        Decodes the code of a couple of activities
+        """
+        return self.activities[pair_code // len(self.activities)], self.activities[pair_code % len(self.activities)]
+
+    def get_dfg(self) -> Dict[Tuple[str, str], int]:
+        """
+        Gets the frequency directly-follows graph of the dataframe
+        """
+        positions, pair_codes = self.get_directly_follows()
+        codes, counts = np.unique(pair_codes, return_counts=True)
+        return {self.decode_pair(int(c)): int(n) for c, n in zip(codes, counts)}
+
+    def get_dfg_performance(self, aggregation: Any = "mean") -> Dict[Tuple[str, str], Any]:
+        """
+        Gets the performance directly-follows graph of the dataframe (the times are expressed in seconds)
+
+        Parameters
+        ----------------
+        aggregation
+            Aggregation measure (mean, median, min, max, sum, std, all, raw_values)
+        """
+        positions, pair_codes = self.get_directly_follows()
+        times = (self.timestamps[positions + 1] - self.timestamps[positions]) / np.timedelta64(1, "s")
+        grouping = pd.Series(times).groupby(pair_codes)
+        if aggregation == "all":
+            measures = {x: grouping.agg(x).to_dict() for x in ["mean", "median", "max", "min", "sum", "std"]}
+            return {self.decode_pair(c): {"mean": measures["mean"][c], "median": measures["median"][c],
+                                          "max": measures["max"][c], "min": measures["min"][c],
+                                          "sum": measures["sum"][c], "stdev": measures["std"][c]}
+                    for c in measures["mean"]}
+        elif aggregation == "raw_values":
+            aggregation = list
+        return {self.decode_pair(c): v for c, v in grouping.agg(aggregation).to_dict().items()}
+
+
+def build(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> DataframeIndex:
+    """
+    Builds the index of the cases of the dataframe, and attaches it to the dataframe (in order
+    to be re-used by the algorithms applied on the same dataframe, until the dataframe is modified)
+
+    Parameters
+    ----------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ACTIVITY_KEY => the activity
+        - Parameters.TIMESTAMP_KEY => the timestamp
+
+    Returns
+    ----------------
+    index
+        Index of the dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+
+    index = DataframeIndex(df, case_id_key, activity_key, timestamp_key)
+    invalidate(df)
+    __ATTACHED_INDICES[id(df)] = (weakref.ref(df), __get_fingerprint(df, index.keys), index)
+    weakref.finalize(df, __ATTACHED_INDICES.pop, id(df), None)
+
+    return index
+
+
+def get(df: Any, case_id_key: str = constants.CASE_CONCEPT_NAME,
+        activity_key: str = xes_constants.DEFAULT_NAME_KEY,
+        timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY) -> Optional[DataframeIndex]:
+    """
+    Gets the index attached to the dataframe, if it has been built on the given columns and the dataframe
+    has not been modified afterwards (re-assignment of the columns, sorting, insertion/removal of rows).
+    The in-place modification of single values is not detected: in such case, the index should be invalidated
+    explicitly.
+
+    Parameters
+    ----------------
+    df
+        Dataframe
+    case_id_key
+        Case identifier
+    activity_key
+        Activity
+    timestamp_key
+        Timestamp
+
+    Returns
+    ----------------
+    index
+        Index of the dataframe (None if there is no valid index)
+    """
+    index = __get_valid_index(df)
+    if index is None or index.keys != (case_id_key, activity_key, timestamp_key):
+        return None
+    return index
+
+
+def get_sorted(df: Any, case_id_key: str = constants.CASE_CONCEPT_NAME,
+               activity_key: Optional[str] = None) -> Optional[DataframeIndex]:
+    """
+    Gets the index attached to the dataframe, if it has been built on the given case identifier (and activity),
+    the events of the dataframe are already sorted as in the index, and the dataframe has not been modified
+    afterwards (see the get method).
+    Used by the algorithms that follow the order of the events in the dataframe.
+
+    Parameters
+    ----------------
+    df
+        Dataframe
+    case_id_key
+        Case identifier
+    activity_key
+        (if provided) Activity
+
+    Returns
+    ----------------
+    index
+        Index of the dataframe (None if there is no valid index)
+    """
+    index = __get_valid_index(df)
+    if index is None or index.keys[0] != case_id_key or not index.is_sorted:
+        return None
+    if activity_key is not None and index.keys[1] != activity_key:
+        return None
+    return index
+
+
+def __get_valid_index(df: Any) -> Optional[DataframeIndex]:
+    entry = __ATTACHED_INDICES.get(id(df))
+    if entry is None:
+        return None
+    df_ref, fingerprint, index = entry
+    if df_ref() is not df:
+        return None
+    if __get_fingerprint(df, index.keys) != fingerprint:
+        # the dataframe has been modified: the index is dropped
+        invalidate(df)
+        return None
+    return index
+
+
+def invalidate(df: pd.DataFrame):
+    """
+    Removes the index attached to the dataframe
+
+    Parameters
+    ----------------
+    df
+        Dataframe
+    """
+    entry = __ATTACHED_INDICES.get(id(df))
+    if entry is not None and entry[0]() is df:
+        del __ATTACHED_INDICES[id(df)]
@@ -17,9 +17,10 @@
 import pandas as pd
 from enum import Enum
 from pm4py.util import constants, xes_constants, pandas_utils, exec_utils
+from pm4py.objects.log.util import dataframe_index
 import numpy as np
 from collections import Counter
-from typing import Tuple, Dict, Collection
+from typing import Tuple, Dict, Collection, List, Any
 import importlib.util
 
 
@@ -30,6 +31,15 @@ class Parameters(Enum):
     INDEX_KEY = "index_key"
 
 
+# odd multipliers (the arithmetic on the first hash is modulo 2^64)
+__HASH_BASE = np.uint64(0x100000001B3)
+__LENGTH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+# the second (independent) hash is computed modulo a prime, so that it does not share the weaknesses
+# of the hashes modulo 2^64 (e.g., on the Thue-Morse sequences)
+__CHECK_HASH_MODULUS = 2 ** 31 - 1
+__CHECK_HASH_BASE = 1000003
+
+
 def apply(dataframe: pd.DataFrame, parameters=None) -> Tuple[Dict[Collection[str], int], Dict[str, Collection[str]]]:
     """
     Efficient method returning the variants from a Pandas dataframe (through Numpy)
@@ -71,32 +81,222 @@ def apply(dataframe: pd.DataFrame, parameters=None) -> Tuple[Dict[Collection[str
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
     index_key = exec_utils.get_param_value(Parameters.INDEX_KEY, parameters, constants.DEFAULT_INDEX_KEY)
 
-    if not (hasattr(dataframe, "attrs") and dataframe.attrs):
-        # dataframe has not been initialized through format_dataframe
-        dataframe = pandas_utils.insert_index(dataframe, index_key)
-        dataframe.sort_values([case_id_key, timestamp_key, index_key])
-
-    case_variant = dict()
+    index = dataframe_index.get(dataframe, case_id_key, activity_key, timestamp_key)
+    if index is not None:
+        return index.get_variants()
 
     if importlib.util.find_spec("cudf"):
+        if not (hasattr(dataframe, "attrs") and dataframe.attrs):
+            # dataframe has not been initialized through format_dataframe
+            dataframe = pandas_utils.insert_index(dataframe, index_key)
+            dataframe = dataframe.sort_values([case_id_key, timestamp_key, index_key])
         case_variant = dataframe.groupby(case_id_key)[activity_key].agg(list).to_dict()
         case_variant = {x: tuple(y) for x, y in case_variant.items()}
         variants_counter = Counter(case_variant.values())
-    else:
-        variants_counter = Counter()
-        cases = dataframe[case_id_key].to_numpy()
-        activities = dataframe[activity_key].to_numpy()
-
-        c_unq, c_ind, c_counts = np.unique(cases, return_index=True, return_counts=True)
+        return dict(variants_counter), case_variant
 
-        for i in range(len(c_ind)):
-            si = c_ind[i]
-            ei = si + c_counts[i]
-            acts = tuple(activities[si:ei])
-            variants_counter[acts] += 1
-            case_variant[c_unq[i]] = acts
+    cases, variant_ids, variants, counts = get_variants_ids(dataframe, parameters=parameters)
 
-    # return as Python dictionary
-    variants_dict = {x: y for x, y in variants_counter.items()}
+    variants_dict = {variants[i]: int(counts[i]) for i in range(len(variants))}
+    case_variant = dict(zip(cases, [variants[i] for i in variant_ids.tolist()]))
 
     return variants_dict, case_variant
+
+
+def get_variants_ids(dataframe: pd.DataFrame, parameters=None) -> Tuple[List[Any], np.ndarray, List[Tuple[str, ...]], np.ndarray]:
+    """
+    Identifies the variants of the cases of a Pandas dataframe without building a tuple of activities for every case:
+    the activities are encoded as integers, the cases are grouped by a polynomial hash of their sequence of codes
+    (verified through a second, independent hash), and the tuples of activities
+    are materialized only for the distinct variants.
+
+    Parameters
+    ------------------
+    dataframe
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ACTIVITY_KEY => the activity
+        - Parameters.TIMESTAMP_KEY => the timestamp
+        - Parameters.INDEX_KEY => the index
+
+    Returns
+    ------------------
+    cases
+        Identifiers of the cases (sorted)
+    variant_ids
+        For each case, the position of its variant in the list of variants
+    variants
+        Variants of the dataframe (sorted by the first case following them)
+    counts
+        Number of cases of each variant
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    index_key = exec_utils.get_param_value(Parameters.INDEX_KEY, parameters, constants.DEFAULT_INDEX_KEY)
+
+    index = dataframe_index.get(dataframe, case_id_key, activity_key, timestamp_key)
+    if index is not None:
+        return index.get_variants_ids()
+
+    if not (hasattr(dataframe, "attrs") and dataframe.attrs):
+        # dataframe has not been initialized through format_dataframe
+        dataframe = pandas_utils.insert_index(dataframe, index_key)
+        dataframe = dataframe.sort_values([case_id_key, timestamp_key, index_key])
+
+    activity_codes, activities = __factorize(dataframe[activity_key].to_numpy())
+
+    # the cases are delimited comparing consecutive events (in a sorted dataframe, the events of every case are
+    # contiguous, and the cases follow the order of their identifiers)
+    case_values = dataframe[case_id_key].to_numpy()
+    case_offsets = np.concatenate(([0], np.flatnonzero(case_values[1:] != case_values[:-1]) + 1, [len(case_values)])) \
+        if len(case_values) > 0 else np.zeros(1, dtype=np.int64)
+    cases = case_values[case_offsets[:-1]]
+    if len(cases) > 1 and not np.all(cases[1:] > cases[:-1]):
+        # the events of every case are made contiguous, keeping their order in the dataframe
+        case_codes, cases = pd.factorize(case_values, sort=True)
+        activity_codes = activity_codes[np.argsort(case_codes, kind="stable")]
+        case_offsets = np.zeros(len(cases) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(case_codes, minlength=len(cases)), out=case_offsets[1:])
+        del case_codes
+    del case_values
+
+    variant_ids, representatives, counts = encode_variants(activity_codes, case_offsets)
+    variants = decode_variants(activity_codes, case_offsets, representatives, activities)
+
+    return list(cases), variant_ids, variants, counts
+
+
+def encode_variants(activity_codes: np.ndarray, case_offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Groups the cases having the same sequence of activities, working on the integer encoding of the events
+
+    Parameters
+    ------------------
+    activity_codes
+        Codes of the activities of the events (the events of every case are contiguous, the missing activities
+        have code -1)
+    case_offsets
+        Position of the first event of each case, followed by the number of events (every case has at least one event)
+
+    Returns
+    ------------------
+    variant_ids
+        For each case, the identifier of its variant (the variants are numbered by their first case)
+    representatives
+        For each variant, the first case following it
+    counts
+        Number of cases of each variant
+    """
+    num_cases = len(case_offsets) - 1
+    if num_cases == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    lengths = np.diff(case_offsets)
+    max_length = int(lengths.max())
+
+    # position of every event in its case (restarting from 0 at the first event of every case)
+    positions = np.ones(len(activity_codes), dtype=np.int32)
+    positions[0] = 0
+    positions[case_offsets[1:-1]] = 1 - lengths[:-1]
+    np.cumsum(positions, out=positions)
+
+    # codes of the activities (shifted by one, so that they are strictly positive)
+    shifted_codes = activity_codes.astype(np.uint32)
+    shifted_codes += np.uint32(1)
+
+    # polynomial hash (modulo 2^64) of the sequence of codes of each case, combined with its length
+    powers = np.cumprod(np.full(max_length, __HASH_BASE, dtype=np.uint64))
+    terms = powers[positions]
+    del powers
+    np.multiply(terms, shifted_codes, out=terms)
+    hashes = np.add.reduceat(terms, case_offsets[:-1]) ^ (lengths.astype(np.uint64) * __LENGTH_MULTIPLIER)
+    del terms
+
+    # second hash (modulo a prime) of the sequence of codes of each case, used to detect the collisions
+    check_powers = np.ones(1, dtype=np.uint64)
+    while len(check_powers) < max_length:
+        check_powers = np.concatenate((check_powers, check_powers * np.uint64(
+            pow(__CHECK_HASH_BASE, len(check_powers), __CHECK_HASH_MODULUS)) % np.uint64(__CHECK_HASH_MODULUS)))
+    terms = check_powers[positions]
+    del check_powers
+    del positions
+    np.multiply(terms, shifted_codes, out=terms)
+    del shifted_codes
+    np.remainder(terms, np.uint64(__CHECK_HASH_MODULUS), out=terms)
+    check_hashes = np.add.reduceat(terms, case_offsets[:-1]) % np.uint64(__CHECK_HASH_MODULUS)
+    del terms
+
+    _, representatives, variant_ids, counts = np.unique(hashes, return_index=True, return_inverse=True,
+                                                        return_counts=True)
+    variant_ids = variant_ids.reshape(-1)
+    del hashes
+
+    # collision check: every case should have the same length and second hash as the representative of its group
+    cases_representatives = representatives[variant_ids]
+    if not np.array_equal(lengths, lengths[cases_representatives]) or not np.array_equal(
+            check_hashes, check_hashes[cases_representatives]):
+        return __encode_variants_exact(activity_codes, case_offsets)
+    del cases_representatives
+
+    # numbers the variants by their first case
+    order = np.argsort(representatives, kind="stable")
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(len(order))
+
+    return ranks[variant_ids], representatives[order], counts[order]
+
+
+def decode_variants(activity_codes: np.ndarray, case_offsets: np.ndarray, representatives: np.ndarray,
+                    activities: List[Any]) -> List[Tuple[str, ...]]:
+    """
+    Materializes the tuples of activities of the variants, decoding the events of their representative cases
+
+    Parameters
+    ------------------
+    activity_codes
+        Codes of the activities of the events (the events of every case are contiguous)
+    case_offsets
+        Position of the first event of each case, followed by the number of events
+    representatives
+        For each variant, a case following it
+    activities
+        Activities (positioned by their code)
+
+    Returns
+    ------------------
+    variants
+        Variants (as tuples of activities, the missing activities, with code -1, are decoded as NaN)
+    """
+    return [tuple(activities[x] if x >= 0 else np.nan
+                  for x in activity_codes[case_offsets[i]:case_offsets[i + 1]].tolist())
+            for i in representatives.tolist()]
+
+
+def __factorize(values: np.ndarray, chunk_size: int = 2 ** 20) -> Tuple[np.ndarray, List[Any]]:
+    # encodes the values as integers (following their order of appearance), factorizing them chunk by chunk,
+    # as the hash table used by pd.factorize is sized on the number of values
+    codes = np.empty(len(values), dtype=np.int32)
+    uniques = {}
+    for start in range(0, len(values), chunk_size):
+        chunk_codes, chunk_uniques = pd.factorize(values[start:start + chunk_size])
+        # the missing values (code -1) are mapped to the last element of the mapping
+        mapping = np.array([uniques.setdefault(x, len(uniques)) for x in chunk_uniques] + [-1], dtype=np.int32)
+        codes[start:start + chunk_size] = mapping[chunk_codes]
+    return codes, list(uniques)
+
+
+def __encode_variants_exact(activity_codes: np.ndarray, case_offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # used only in the (unlikely) case of a collision of the hashes
+    encoded = {}
+    variant_ids = np.empty(len(case_offsets) - 1, dtype=np.int64)
+    for i in range(len(variant_ids)):
+        variant_ids[i] = encoded.setdefault(tuple(activity_codes[case_offsets[i]:case_offsets[i + 1]].tolist()),
+                                            len(encoded))
+    representatives = np.unique(variant_ids, return_index=True)[1]
+    return variant_ids, representatives, np.bincount(variant_ids, minlength=len(encoded))
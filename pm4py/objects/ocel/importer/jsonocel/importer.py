@@ -17,7 +17,7 @@
 from enum import Enum
 from typing import Optional, Dict, Any
 
-from pm4py.objects.ocel.importer.jsonocel.variants import classic, ocel20_standard, ocel20_rustxes
+from pm4py.objects.ocel.importer.jsonocel.variants import classic, ocel20_standard, ocel20_rustxes, ocel20_streaming
 from pm4py.objects.ocel.obj import OCEL
 from pm4py.util import exec_utils
 
@@ -26,6 +26,7 @@ class Variants(Enum):
     CLASSIC = classic
     OCEL20_STANDARD = ocel20_standard
     OCEL20_RUSTXES = ocel20_rustxes
+    OCEL20_STREAMING = ocel20_streaming
 
 
 def apply(file_path: str, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
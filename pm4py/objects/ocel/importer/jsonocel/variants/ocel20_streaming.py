@@ -0,0 +1,290 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import json
+from enum import Enum
+from typing import Optional, Dict, Any, Iterator, Tuple, List, Collection, TextIO
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.ocel import constants
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util import ocel_consistency
+from pm4py.objects.log.util import dataframe_utils
+from pm4py.util import exec_utils, constants as pm4_constants, pandas_utils
+
+
+class Parameters(Enum):
+    ENCODING = "encoding"
+    BATCH_SIZE = "batch_size"
+    CHUNK_SIZE = "chunk_size"
+
+
+WHITESPACE = " \t\n\r"
+
+
+class ColumnsBuffer(object):
+    """
+    Buffer storing a batch of rows (with possibly different attributes) as columns,
+    which are converted to a dataframe when the batch is full
+    """
+
+    def __init__(self):
+        self.columns = {}
+        self.num_rows = 0
+        self.dataframes = []
+
+    def append(self, row: Dict[str, Any]):
+        for key, value in row.items():
+            if key not in self.columns:
+                self.columns[key] = [np.nan] * self.num_rows
+            self.columns[key].append(value)
+        self.num_rows += 1
+        for column in self.columns.values():
+            if len(column) < self.num_rows:
+                column.append(np.nan)
+
+    def flush(self, timestamp_columns: Collection[str]):
+        if self.num_rows > 0:
+            dataframe = pandas_utils.instantiate_dataframe(self.columns)
+            if timestamp_columns:
+                dataframe = dataframe_utils.convert_timestamp_columns_in_df(
+                    dataframe, timest_format=pm4_constants.DEFAULT_XES_TIMESTAMP_PARSE_FORMAT,
+                    timest_columns=timestamp_columns)
+            self.dataframes.append(dataframe)
+        self.columns = {}
+        self.num_rows = 0
+
+    def get_dataframe(self, timestamp_columns: Collection[str]) -> Optional[pd.DataFrame]:
+        self.flush(timestamp_columns)
+        if not self.dataframes:
+            return None
+        dataframe = pandas_utils.concat(self.dataframes, ignore_index=True) if len(self.dataframes) > 1 else \
+            self.dataframes[0]
+        self.dataframes = []
+        return dataframe
+
+
+def iterate_arrays(F: TextIO, chunk_size: int = 2 ** 20) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally parses a JSON file whose root is an object, yielding one by one the elements of the arrays
+    associated to the keys of the root object (the other values are skipped). Only the element being
+    parsed (and a chunk of the file) are kept in memory.
+
+    Parameters
+    ----------------
+    F
+        File object (text mode)
+    chunk_size
+        Number of characters read at every access to the file
+
+    Returns
+    ----------------
+    iterator
+        Iterator of couples (key of the root object, element of the array)
+    """
+    decoder = json.JSONDecoder()
+    state = {"buffer": "", "pos": 0, "eof": False}
+
+    def read_more() -> bool:
+        if state["eof"]:
+            return False
+        data = F.read(chunk_size)
+        if not data:
+            state["eof"] = True
+            return False
+        state["buffer"] = state["buffer"][state["pos"]:] + data
+        state["pos"] = 0
+        return True
+
+    def peek() -> str:
+        # skips the whitespace and returns the next character ("" at the end of the file)
+        while True:
+            buffer, pos = state["buffer"], state["pos"]
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            state["pos"] = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                return ""
+
+    def expect(char: str):
+        if peek() != char:
+            raise Exception("malformed JSON: expected '%s' at character %d of the buffer" % (char, state["pos"]))
+        state["pos"] += 1
+
+    def decode() -> Any:
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(state["buffer"], state["pos"])
+                # a value at the end of the buffer could be truncated (e.g., a number)
+                if end < len(state["buffer"]) or state["eof"]:
+                    state["pos"] = end
+                    return value
+            except json.JSONDecodeError:
+                if state["eof"]:
+                    raise
+            read_more()
+
+    expect("{")
+    if peek() == "}":
+        return
+    while True:
+        key = decode()
+        expect(":")
+        if peek() == "[":
+            state["pos"] += 1
+            if peek() == "]":
+                state["pos"] += 1
+            else:
+                while True:
+                    yield key, decode()
+                    if peek() == ",":
+                        state["pos"] += 1
+                    else:
+                        expect("]")
+                        break
+        else:
+            decode()
+        if peek() == ",":
+            state["pos"] += 1
+        else:
+            expect("}")
+            break
+
+
+def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
+    """
+    Imports an OCEL from a JSON-OCEL 2 standard file, parsing the file incrementally.
+
+    The events and the objects are read one by one from the file, and are stored in column buffers that are
+    converted to dataframes every Parameters.BATCH_SIZE elements. Hence, the peak memory is close to the size of
+    the final dataframes (instead of the size of the JSON structure of the whole file).
+
+    Parameters
+    --------------
+    file_path
+        Path to the object-centric event log
+    parameters
+        Possible parameters of the method, including:
+        - Parameters.ENCODING
+        - Parameters.BATCH_SIZE => number of events/objects converted at once to a dataframe (default: 100000)
+        - Parameters.CHUNK_SIZE => number of characters read at every access to the file (default: 2^20)
+
+    Returns
+    -------------
+    ocel
+        Object-centric event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, pm4_constants.DEFAULT_ENCODING)
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 100000)
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 2 ** 20)
+
+    event_id = constants.DEFAULT_EVENT_ID
+    event_activity = constants.DEFAULT_EVENT_ACTIVITY
+    event_timestamp = constants.DEFAULT_EVENT_TIMESTAMP
+    object_id = constants.DEFAULT_OBJECT_ID
+    object_type = constants.DEFAULT_OBJECT_TYPE
+    qualifier = constants.DEFAULT_QUALIFIER
+    changed_field = constants.DEFAULT_CHNGD_FIELD
+
+    events = ColumnsBuffer()
+    relations = ColumnsBuffer()
+    objects = ColumnsBuffer()
+    o2o = ColumnsBuffer()
+    object_changes = ColumnsBuffer()
+
+    with open(file_path, "r", encoding=encoding) as F:
+        for key, element in iterate_arrays(F, chunk_size=chunk_size):
+            if key == "events":
+                row = {event_id: element["id"], event_timestamp: element["time"], event_activity: element["type"]}
+                if element.get("attributes"):
+                    for x in element["attributes"]:
+                        row[x["name"]] = x["value"]
+                events.append(row)
+                if element.get("relationships"):
+                    # one relation per relationship (an object can be related to the event with different qualifiers)
+                    for x in element["relationships"]:
+                        relations.append({event_id: element["id"], event_activity: element["type"],
+                                          event_timestamp: element["time"], object_id: x["objectId"],
+                                          qualifier: x["qualifier"]})
+                if events.num_rows >= batch_size:
+                    events.flush([event_timestamp])
+                if relations.num_rows >= batch_size:
+                    relations.flush([event_timestamp])
+            elif key == "objects":
+                row = {object_id: element["id"], object_type: element["type"]}
+                if element.get("attributes"):
+                    for x in element["attributes"]:
+                        if x["name"] in row:
+                            object_changes.append({object_id: element["id"], object_type: element["type"],
+                                                   changed_field: x["name"], x["name"]: x["value"],
+                                                   event_timestamp: x["time"]})
+                        else:
+                            row[x["name"]] = x["value"]
+                objects.append(row)
+                if element.get("relationships"):
+                    for x in element["relationships"]:
+                        o2o.append({object_id: element["id"], object_id + "_2": x["objectId"],
+                                    qualifier: x["qualifier"]})
+                if objects.num_rows >= batch_size:
+                    objects.flush([])
+                if o2o.num_rows >= batch_size:
+                    o2o.flush([])
+                if object_changes.num_rows >= batch_size:
+                    object_changes.flush([event_timestamp])
+
+    events = events.get_dataframe([event_timestamp])
+    relations = relations.get_dataframe([event_timestamp])
+    objects = objects.get_dataframe([])
+    o2o = o2o.get_dataframe([])
+    object_changes = object_changes.get_dataframe([event_timestamp])
+
+    if events is None:
+        events = pandas_utils.instantiate_dataframe({event_id: [], event_timestamp: [], event_activity: []})
+    if objects is None:
+        objects = pandas_utils.instantiate_dataframe({object_id: [], object_type: []})
+
+    if relations is not None:
+        # the object types are known only at the end of the file, and the relations with
+        # objects that are not contained in the log are discarded
+        types = objects.drop_duplicates(object_id, keep="last").set_index(object_id)[object_type]
+        relations[object_type] = relations[object_id].map(types)
+        relations = relations[relations[object_type].notna()]
+        relations = relations[[event_id, event_activity, event_timestamp, object_id, object_type, qualifier]]
+        relations = relations.sort_values(event_timestamp, kind="stable")
+
+    events = events.sort_values(event_timestamp, kind="stable")
+
+    globals = {}
+    globals[constants.OCEL_GLOBAL_LOG] = {}
+    globals[constants.OCEL_GLOBAL_EVENT] = {}
+    globals[constants.OCEL_GLOBAL_OBJECT] = {}
+
+    log = OCEL(events=events, objects=objects, relations=relations, o2o=o2o, object_changes=object_changes,
+               globals=globals, parameters=parameters)
+
+    log = ocel_consistency.apply(log, parameters=parameters)
+    log = filtering_utils.propagate_relations_filtering(log, parameters=parameters)
+
+    return log
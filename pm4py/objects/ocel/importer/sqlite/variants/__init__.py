@@ -15,4 +15,4 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from pm4py.objects.ocel.importer.sqlite.variants import pandas_importer
+from pm4py.objects.ocel.importer.sqlite.variants import pandas_importer, ocel20, ocel20_lazy
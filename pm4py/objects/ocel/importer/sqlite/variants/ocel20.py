@@ -52,6 +52,51 @@ def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None):
     validation = exec_utils.get_param_value(Parameters.VALIDATION, parameters, True)
     except_if_invalid = exec_utils.get_param_value(Parameters.EXCEPT_IF_INVALID, parameters, False)
 
+    if validation:
+        satisfied, unsatisfied = ocel20_rel_validation.apply(file_path)
+        if unsatisfied:
+            if pm4_constants.SHOW_INTERNAL_WARNINGS:
+                warnings.warn("There are unsatisfied OCEL 2.0 constraints in the given relational database: "+str(unsatisfied))
+
+            if except_if_invalid:
+                raise Exception("OCEL 2.0 validation failed.")
+
+    conn = sqlite3.connect(file_path)
+    ocel = read_connection(conn, parameters=parameters)
+    conn.close()
+
+    return ocel
+
+
+def read_connection(conn, events_table: Optional[str] = None, objects_table: Optional[str] = None,
+                    parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
+    """
+    Reads an OCEL 2.0 from an open connection to a relational (SQLite) database.
+
+    Optionally, the reading can be restricted to a selection of events and objects, provided as tables
+    (of the same connection) containing the identifiers of the events/objects in the column ocel_id.
+    In that case, only the selected rows of the tables of the database are read (along with the
+    relationships between the selected events and objects).
+
+    Parameters
+    ----------------
+    conn
+        Connection to the database
+    events_table
+        (optional) table containing the identifiers of the events to read
+    objects_table
+        (optional) table containing the identifiers of the objects to read
+    parameters
+        Parameters of the importer
+
+    Returns
+    ----------------
+    ocel
+        Object-centric event log
+    """
+    if parameters is None:
+        parameters = {}
+
     event_id = exec_utils.get_param_value(Parameters.EVENT_ID, parameters, constants.DEFAULT_EVENT_ID)
     event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, constants.DEFAULT_EVENT_ACTIVITY)
     event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters,
@@ -63,19 +108,13 @@ def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None):
     changed_field = exec_utils.get_param_value(Parameters.CHANGED_FIELD, parameters, constants.DEFAULT_CHNGD_FIELD)
     cumcount_field = exec_utils.get_param_value(Parameters.CUMCOUNT, parameters, "@@cumcount")
 
-    if validation:
-        satisfied, unsatisfied = ocel20_rel_validation.apply(file_path)
-        if unsatisfied:
-            if pm4_constants.SHOW_INTERNAL_WARNINGS:
-                warnings.warn("There are unsatisfied OCEL 2.0 constraints in the given relational database: "+str(unsatisfied))
+    # when the reading is restricted, the rows are explicitly sorted by rowid, so that they are returned in the same
+    # order as in a full scan of the tables
+    events_where = " WHERE ocel_id IN (SELECT ocel_id FROM " + events_table + ") ORDER BY rowid" if events_table is not None else ""
+    objects_where = " WHERE ocel_id IN (SELECT ocel_id FROM " + objects_table + ") ORDER BY rowid" if objects_table is not None else ""
 
-            if except_if_invalid:
-                raise Exception("OCEL 2.0 validation failed.")
-
-    conn = sqlite3.connect(file_path)
-
-    EVENTS = pd.read_sql("SELECT * FROM event", conn)
-    OBJECTS = pd.read_sql("SELECT * FROM object", conn)
+    EVENTS = pd.read_sql("SELECT * FROM event" + events_where, conn)
+    OBJECTS = pd.read_sql("SELECT * FROM object" + objects_where, conn)
 
     etypes = sorted(pandas_utils.format_unique(EVENTS["ocel_type"].unique()))
     otypes = sorted(pandas_utils.format_unique(OBJECTS["ocel_type"].unique()))
@@ -98,20 +137,23 @@ def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None):
 
     for act in etypes:
         act_red = events_type_map[act]
-        df = pd.read_sql("SELECT * FROM event_"+act_red, conn)
+        df = pd.read_sql("SELECT * FROM event_"+act_red+events_where, conn)
         df = df.rename(columns={"ocel_id": event_id, "ocel_time": event_timestamp})
         event_types_coll.append(df)
 
     for ot in otypes:
         ot_red = objects_type_map[ot]
-        df = pd.read_sql("SELECT * FROM object_"+ot_red, conn)
+        df = pd.read_sql("SELECT * FROM object_"+ot_red+objects_where, conn)
         df = df.rename(columns={"ocel_id": object_id, "ocel_time": event_timestamp})
         object_types_coll.append(df)
 
-    event_types_coll = pandas_utils.concat(event_types_coll)
+    # the (restricted) selection could contain no events/objects
+    event_types_coll = pandas_utils.concat(event_types_coll) if event_types_coll else \
+        pandas_utils.instantiate_dataframe({event_id: [], event_timestamp: []})
     event_types_coll[event_activity] = event_types_coll[event_id].map(events_id_type)
     event_types_coll = dataframe_utils.convert_timestamp_columns_in_df(event_types_coll, timest_format=pm4_constants.DEFAULT_TIMESTAMP_PARSE_FORMAT, timest_columns=[event_timestamp])
-    object_types_coll = pandas_utils.concat(object_types_coll)
+    object_types_coll = pandas_utils.concat(object_types_coll) if object_types_coll else \
+        pandas_utils.instantiate_dataframe({object_id: [], event_timestamp: []})
     object_types_coll[object_type] = object_types_coll[object_id].map(objects_id_type)
     object_types_coll = object_types_coll.rename(columns={"ocel_changed_field": changed_field})
 
@@ -135,19 +177,28 @@ def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None):
     del objects[event_timestamp]
     del objects[cumcount_field]
 
-    E2O = pd.read_sql("SELECT * FROM event_object", conn)
+    E2O_where = []
+    O2O_where = []
+    if events_table is not None:
+        E2O_where.append("ocel_event_id IN (SELECT ocel_id FROM " + events_table + ")")
+    if objects_table is not None:
+        E2O_where.append("ocel_object_id IN (SELECT ocel_id FROM " + objects_table + ")")
+        O2O_where.append("ocel_source_id IN (SELECT ocel_id FROM " + objects_table + ")")
+        O2O_where.append("ocel_target_id IN (SELECT ocel_id FROM " + objects_table + ")")
+    E2O_where = " WHERE " + " AND ".join(E2O_where) + " ORDER BY rowid" if E2O_where else ""
+    O2O_where = " WHERE " + " AND ".join(O2O_where) + " ORDER BY rowid" if O2O_where else ""
+
+    E2O = pd.read_sql("SELECT * FROM event_object" + E2O_where, conn)
     E2O = E2O.rename(columns={"ocel_event_id": event_id, "ocel_object_id": object_id, "ocel_qualifier": qualifier_field})
     E2O[event_activity] = E2O[event_id].map(events_id_type)
     E2O[event_timestamp] = E2O[event_id].map(events_timestamp)
     E2O[object_type] = E2O[object_id].map(objects_id_type)
 
-    O2O = pd.read_sql("SELECT * FROM object_object", conn)
+    O2O = pd.read_sql("SELECT * FROM object_object" + O2O_where, conn)
     O2O = O2O.rename(columns={"ocel_source_id": object_id, "ocel_target_id": object_id+"_2", "ocel_qualifier": qualifier_field})
     if len(O2O) == 0:
         O2O = None
 
-    conn.close()
-
     event_types_coll[internal_index] = event_types_coll.index
     E2O[internal_index] = E2O.index
 
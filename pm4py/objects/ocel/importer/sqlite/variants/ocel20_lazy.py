@@ -0,0 +1,460 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import datetime
+import math
+from typing import Optional, Dict, Any, Collection, List, Tuple, Union
+
+import pandas as pd
+
+from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
+from pm4py.objects.ocel.importer.sqlite.variants import ocel20
+from pm4py.objects.ocel.importer.sqlite.variants.ocel20 import Parameters
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import flattening
+
+
+EVENTS_LEVEL = "events"
+OBJECTS_LEVEL = "objects"
+
+SELECTED_EVENTS = "temp.pm4py_selected_events"
+SELECTED_OBJECTS = "temp.pm4py_selected_objects"
+SELECTED_RELATIONS = "temp.pm4py_selected_relations"
+
+
+class LazyOCEL(object):
+    """
+    Lazy view over an OCEL 2.0 stored in a SQLite database.
+
+    The filters applied on the view are not executed when they are requested, but recorded in the view
+    (every filter returns a new view). When the first result is requested (statistics, OC-DFG, flattening,
+    materialization), the selection of events and objects is computed inside SQLite, in temporary tables of a
+    connection kept by the view (see close()), with the same outcome as applying the filters in the order in which they
+    have been requested and propagating each of them as the corresponding in-memory filter (events -> objects for the
+    filters on the events, objects -> events for the filters on the objects). Only the result of the operation is then
+    read from the database.
+
+    The timestamps are compared inside SQLite as milliseconds since the epoch (obtained through the julianday
+    function), hence they should be stored in a format supported by the date and time functions of SQLite
+    (e.g., YYYY-mm-dd HH:MM:SS, optionally with fractional seconds and timezone).
+    """
+
+    def __init__(self, file_path: str, parameters: Optional[Dict[Any, Any]] = None,
+                 steps: Optional[Tuple[Tuple[str, str, Tuple[Any, ...]], ...]] = None):
+        self.file_path = file_path
+        self.parameters = parameters if parameters is not None else {}
+        self.steps = steps if steps is not None else tuple()
+        self.__connection = None
+
+    def __add_step(self, level: str, condition: str, values: Collection[Any]) -> "LazyOCEL":
+        return LazyOCEL(self.file_path, parameters=self.parameters,
+                        steps=self.steps + ((level, condition, tuple(values)),))
+
+    @staticmethod
+    def __timestamp(expression: str) -> str:
+        # milliseconds since the epoch (the rounding makes the differences between the timestamps exact)
+        return "CAST(ROUND((julianday(" + expression + ") - 2440587.5) * 86400000.0) AS INTEGER)"
+
+    @staticmethod
+    def __identifier(name: str) -> str:
+        return "\"" + name.replace("\"", "\"\"") + "\""
+
+    @staticmethod
+    def __in_condition(column: str, values: Collection[Any], positive: bool) -> str:
+        return column + (" IN (" if positive else " NOT IN (") + ", ".join(["?"] * len(values)) + ")"
+
+    def filter_activities(self, activities: Collection[str], positive: bool = True) -> "LazyOCEL":
+        """
+        Filters the events of the view on the provided activities
+
+        Parameters
+        ----------------
+        activities
+            Collection of activities
+        positive
+            Keeps (positive=True) or removes (positive=False) the events of the provided activities
+
+        Returns
+        ----------------
+        lazy_ocel
+            Filtered view
+        """
+        activities = list(activities)
+        return self.__add_step(EVENTS_LEVEL, self.__in_condition("ocel_type", activities, positive), activities)
+
+    def filter_object_types(self, object_types: Collection[str], positive: bool = True) -> "LazyOCEL":
+        """
+        Filters the objects of the view on the provided object types
+
+        Parameters
+        ----------------
+        object_types
+            Collection of object types
+        positive
+            Keeps (positive=True) or removes (positive=False) the objects of the provided object types
+
+        Returns
+        ----------------
+        lazy_ocel
+            Filtered view
+        """
+        object_types = list(object_types)
+        return self.__add_step(OBJECTS_LEVEL, self.__in_condition("ocel_type", object_types, positive), object_types)
+
+    def filter_timestamp(self, min_timest: Union[datetime.datetime, str],
+                         max_timest: Union[datetime.datetime, str]) -> "LazyOCEL":
+        """
+        Filters the events of the view keeping the ones in the provided timestamp range
+
+        Parameters
+        ----------------
+        min_timest
+            Left extreme of the allowed timestamp interval (provided in the format: YYYY-mm-dd HH:MM:SS)
+        max_timest
+            Right extreme of the allowed timestamp interval (provided in the format: YYYY-mm-dd HH:MM:SS)
+
+        Returns
+        ----------------
+        lazy_ocel
+            Filtered view
+        """
+        min_timest = get_dt_from_string(min_timest).isoformat()
+        max_timest = get_dt_from_string(max_timest).isoformat()
+        return self.__add_step(EVENTS_LEVEL, "ocel_time >= " + self.__timestamp("?") + " AND ocel_time <= " +
+                               self.__timestamp("?"), [min_timest, max_timest])
+
+    def __connect(self):
+        """
+        Opens a connection to the database, and computes the selected events/objects/relations
+        in temporary tables
+        """
+        import sqlite3
+
+        conn = sqlite3.connect(self.file_path)
+        cur = conn.cursor()
+
+        events_type_map = cur.execute("SELECT ocel_type, ocel_type_map FROM event_map_type").fetchall()
+        objects_type_map = cur.execute("SELECT ocel_type, ocel_type_map FROM object_map_type").fetchall()
+
+        cur.execute("CREATE TEMP TABLE pm4py_selected_events (ocel_id TEXT PRIMARY KEY, ocel_type TEXT, "
+                    "ocel_time INTEGER, ocel_index INTEGER)")
+        cur.execute("CREATE TEMP TABLE pm4py_selected_objects (ocel_id TEXT PRIMARY KEY, ocel_type TEXT)")
+
+        # the filters only shrink the selection, and the propagation of a filter to the other level is superseded by
+        # the propagation of any later filter on the same level. Hence, the selection equals the one obtained
+        # applying at once all the filters of every level, restricting the level of the last filter to the entities
+        # related to the other level (if filtered), and then propagating the last filter to the other level.
+        # Without filters, the events and objects without relationships are kept (as in the importer)
+        conditions = {EVENTS_LEVEL: [], OBJECTS_LEVEL: []}
+        values = {EVENTS_LEVEL: [], OBJECTS_LEVEL: []}
+        for level, condition, step_values in self.steps:
+            conditions[level].append(condition)
+            values[level].extend(step_values)
+
+        last_level = self.steps[-1][0] if self.steps else EVENTS_LEVEL
+        other_level = OBJECTS_LEVEL if last_level == EVENTS_LEVEL else EVENTS_LEVEL
+        related = {EVENTS_LEVEL: "ocel_id IN (SELECT ocel_event_id FROM event_object WHERE ocel_object_id IN "
+                                 "(SELECT ocel_id FROM " + SELECTED_OBJECTS + "))",
+                   OBJECTS_LEVEL: "ocel_id IN (SELECT ocel_object_id FROM event_object WHERE ocel_event_id IN "
+                                  "(SELECT ocel_id FROM " + SELECTED_EVENTS + "))"}
+        if conditions[other_level]:
+            conditions[last_level].append(related[last_level])
+
+        for level in [other_level, last_level]:
+            where = " AND ".join("(" + condition + ")" for condition in conditions[level]) if conditions[level] else "1"
+            if level == EVENTS_LEVEL:
+                # every event gets the position of its row in the table of its type, which (along with the activity)
+                # breaks the ties between the timestamps as in the sorting done by the importer
+                for act, act_red in events_type_map:
+                    cur.execute("INSERT OR IGNORE INTO " + SELECTED_EVENTS + " SELECT * FROM (SELECT e.ocel_id AS "
+                                "ocel_id, e.ocel_type AS ocel_type, " + self.__timestamp("t.ocel_time") + " AS "
+                                "ocel_time, t.ocel_index AS ocel_index FROM (SELECT ocel_id, ocel_time, ROW_NUMBER() "
+                                "OVER (ORDER BY rowid) AS ocel_index FROM " + self.__identifier("event_" + act_red) +
+                                ") t JOIN event e ON e.ocel_id = t.ocel_id WHERE e.ocel_type = ?) WHERE " + where,
+                                [act] + values[level])
+            else:
+                for ot, ot_red in objects_type_map:
+                    cur.execute("INSERT OR IGNORE INTO " + SELECTED_OBJECTS + " SELECT ocel_id, ocel_type FROM object "
+                                "WHERE ocel_type = ? AND ocel_id IN (SELECT ocel_id FROM " +
+                                self.__identifier("object_" + ot_red) + ") AND " + where, [ot] + values[level])
+
+        if self.steps:
+            cur.execute("DELETE FROM " + (SELECTED_EVENTS if other_level == EVENTS_LEVEL else SELECTED_OBJECTS) +
+                        " WHERE NOT (" + related[other_level] + ")")
+
+        cur.execute("CREATE TEMP TABLE pm4py_selected_relations AS SELECT eo.rowid AS ocel_rowid, "
+                    "eo.ocel_event_id AS ocel_event_id, eo.ocel_object_id AS ocel_object_id, "
+                    "e.ocel_type AS ocel_activity, o.ocel_type AS ocel_object_type, e.ocel_time AS ocel_time, "
+                    "e.ocel_index AS ocel_index FROM event_object eo JOIN " + SELECTED_EVENTS + " e ON "
+                    "e.ocel_id = eo.ocel_event_id JOIN " + SELECTED_OBJECTS + " o ON o.ocel_id = eo.ocel_object_id")
+        cur.close()
+
+        return conn
+
+    def __get_connection(self):
+        """
+        Gets the connection kept by the view (opening it, and computing the selection, at the first request)
+        """
+        if self.__connection is None:
+            self.__connection = self.__connect()
+        return self.__connection
+
+    def close(self):
+        """
+        Closes the connection to the database kept by the view (the selection is computed again
+        if another result is requested)
+        """
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    @staticmethod
+    def __query(conn, query: str) -> List[Tuple[Any, ...]]:
+        cur = conn.cursor()
+        ret = cur.execute(query).fetchall()
+        cur.close()
+        return ret
+
+    def get_activities_counts(self) -> Dict[str, int]:
+        """
+        Counts the events of the view per activity
+
+        Returns
+        ----------------
+        activities_counts
+            Dictionary associating each activity to its number of events
+        """
+        conn = self.__get_connection()
+        ret = {x[0]: x[1] for x in self.__query(conn, "SELECT ocel_type, COUNT(*) FROM " + SELECTED_EVENTS +
+                                                " GROUP BY ocel_type")}
+        return ret
+
+    def get_object_types_counts(self) -> Dict[str, int]:
+        """
+        Counts the objects of the view per object type
+
+        Returns
+        ----------------
+        object_types_counts
+            Dictionary associating each object type to its number of objects
+        """
+        conn = self.__get_connection()
+        ret = {x[0]: x[1] for x in self.__query(conn, "SELECT ocel_type, COUNT(*) FROM " + SELECTED_OBJECTS +
+                                                " GROUP BY ocel_type")}
+        return ret
+
+    def get_related_objects_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Counts, for every object type, the number of objects of the type related to the events of the view
+        (the events without related objects of the type are not reported)
+
+        Returns
+        ----------------
+        related_objects_counts
+            Dictionary associating each object type to a dictionary associating each event identifier to the
+            number of its related objects of the type
+        """
+        conn = self.__get_connection()
+        ret = {}
+        for ot, eid, count in self.__query(conn, "SELECT ocel_object_type, ocel_event_id, "
+                                                 "COUNT(DISTINCT ocel_object_id) FROM " + SELECTED_RELATIONS +
+                                                 " GROUP BY ocel_object_type, ocel_event_id"):
+            if ot not in ret:
+                ret[ot] = {}
+            ret[ot][eid] = count
+        return ret
+
+    @staticmethod
+    def __counts(rows: List[Tuple[Any, ...]], num_keys: int, metrics: List[str]) -> Dict[str, Dict[Any, Any]]:
+        """
+        Converts the rows (key columns followed by metric columns) returned by a grouped query to the
+        nested dictionaries of the OC-DFG (object type -> key -> value, or key -> value if there is a single key column)
+        """
+        ret = {m: {} for m in metrics}
+        for row in rows:
+            for i, m in enumerate(metrics):
+                if num_keys == 1:
+                    ret[m][row[0]] = row[num_keys + i]
+                else:
+                    if row[0] not in ret[m]:
+                        ret[m][row[0]] = {}
+                    ret[m][row[0]][row[1] if num_keys == 2 else tuple(row[1:num_keys])] = row[num_keys + i]
+        return ret
+
+    def __performance(self, conn, distinct_columns: str) -> Dict[str, Dict[Any, Dict[str, float]]]:
+        """
+        Aggregates the times between the activities of the edges (after removing the duplicates on the provided columns)
+        """
+        rows = self.__query(conn, "SELECT ocel_object_type, ocel_source_activity, ocel_activity, AVG(ocel_flow_time), "
+                                  "MAX(ocel_flow_time), MIN(ocel_flow_time), SUM(ocel_flow_time), "
+                                  "SUM(ocel_flow_time * ocel_flow_time), COUNT(*) FROM (SELECT DISTINCT "
+                                  + distinct_columns + ", ocel_flow_time FROM pm4py_edges) GROUP BY "
+                                  "ocel_object_type, ocel_source_activity, ocel_activity")
+        ret = {}
+        for ot, act1, act2, mean, max_value, min_value, sum_value, sum_squares, count in rows:
+            if ot not in ret:
+                ret[ot] = {}
+            stdev = math.sqrt(max(0.0, (sum_squares - sum_value * sum_value / count) / (count - 1))) \
+                if count > 1 else float("nan")
+            ret[ot][(act1, act2)] = {"mean": mean, "max": max_value, "min": min_value, "sum": sum_value,
+                                     "stdev": stdev}
+        return ret
+
+    def discover_ocdfg(self, compute_edges_performance: bool = True) -> Dict[str, Any]:
+        """
+        Discovers an OC-DFG from the view, computing all the counts inside SQLite.
+
+        The result has the same structure as the output of the aggregated variant of the OC-DFG discovery
+        (every set of identifiers is replaced by its size), and can be visualized as the output of the other variants.
+        The performance of the edges is expressed in seconds (mean, max, min, sum and stdev of the times between the
+        activities; the median is not computed).
+
+        Parameters
+        ----------------
+        compute_edges_performance
+            Enables/disables the computation of the performance on the edges
+
+        Returns
+        ----------------
+        ocdfg
+            Object-centric directly-follows graph
+        """
+        conn = self.__get_connection()
+
+        ret = {}
+        ret["activities"] = set(x[0] for x in self.__query(conn, "SELECT DISTINCT ocel_type FROM " + SELECTED_EVENTS))
+        ret["object_types"] = set(x[0] for x in self.__query(conn, "SELECT DISTINCT ocel_type FROM " +
+                                                                   SELECTED_OBJECTS))
+
+        metrics = ["events", "unique_objects", "total_objects"]
+        aggregations = "COUNT(DISTINCT ocel_event_id), COUNT(DISTINCT ocel_object_id), COUNT(*)"
+
+        ret["activities_indep"] = self.__counts(self.__query(conn, "SELECT ocel_activity, " + aggregations + " FROM " +
+                                                             SELECTED_RELATIONS + " GROUP BY ocel_activity"),
+                                                1, metrics)
+        ret["activities_ot"] = self.__counts(self.__query(conn, "SELECT ocel_object_type, ocel_activity, " +
+                                                          aggregations + " FROM " + SELECTED_RELATIONS +
+                                                          " GROUP BY ocel_object_type, ocel_activity"), 2, metrics)
+
+        # the start/end activities follow the order of the relations (timestamp, then position in the table)
+        for key, order in [("start_activities", "ocel_time, ocel_rowid"),
+                           ("end_activities", "ocel_time DESC, ocel_rowid DESC")]:
+            ret[key] = self.__counts(self.__query(conn, "SELECT ocel_object_type, ocel_activity, " + aggregations +
+                                                  " FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY ocel_object_id "
+                                                  "ORDER BY " + order + ") AS ocel_rank FROM " + SELECTED_RELATIONS +
+                                                  ") WHERE ocel_rank = 1 GROUP BY ocel_object_type, ocel_activity"),
+                                     2, metrics)
+
+        # the lifecycle of every object follows the order of the events
+        self.__query(conn, "CREATE TEMP TABLE IF NOT EXISTS pm4py_edges AS SELECT * FROM (SELECT ocel_object_type, ocel_object_id, "
+                           "ocel_event_id, ocel_activity, LAG(ocel_event_id) OVER w AS ocel_source_event_id, "
+                           "LAG(ocel_activity) OVER w AS ocel_source_activity, "
+                           "(ocel_time - LAG(ocel_time) OVER w) / 1000.0 AS ocel_flow_time FROM " +
+                           SELECTED_RELATIONS + " WINDOW w AS (PARTITION BY ocel_object_id ORDER BY ocel_time, "
+                           "ocel_index, ocel_activity)) WHERE ocel_source_event_id IS NOT NULL")
+
+        edges_keys = "ocel_object_type, ocel_source_activity, ocel_activity"
+        event_couples = edges_keys + ", ocel_source_event_id, ocel_event_id"
+        total_objects = event_couples + ", ocel_object_id"
+
+        ret["edges"] = {}
+        ret["edges"]["event_couples"] = self.__counts(self.__query(
+            conn, "SELECT " + edges_keys + ", COUNT(*) FROM (SELECT DISTINCT " + event_couples +
+                  " FROM pm4py_edges) GROUP BY " + edges_keys), 3, ["count"])["count"]
+        ret["edges"]["unique_objects"] = self.__counts(self.__query(
+            conn, "SELECT " + edges_keys + ", COUNT(DISTINCT ocel_object_id) FROM pm4py_edges GROUP BY " +
+                  edges_keys), 3, ["count"])["count"]
+        ret["edges"]["total_objects"] = self.__counts(self.__query(
+            conn, "SELECT " + edges_keys + ", COUNT(*) FROM (SELECT DISTINCT " + total_objects +
+                  " FROM pm4py_edges) GROUP BY " + edges_keys), 3, ["count"])["count"]
+
+        ret["edges_performance"] = {}
+        ret["edges_performance"]["event_couples"] = {}
+        ret["edges_performance"]["total_objects"] = {}
+
+        if compute_edges_performance:
+            ret["edges_performance"]["event_couples"] = self.__performance(conn, event_couples)
+            ret["edges_performance"]["total_objects"] = self.__performance(conn, total_objects)
+
+        return ret
+
+    def to_ocel(self) -> OCEL:
+        """
+        Materializes the view as an object-centric event log, reading from the database only the selected
+        events and objects (along with their attributes, changes and relationships)
+
+        Returns
+        ----------------
+        ocel
+            Object-centric event log
+        """
+        conn = self.__get_connection()
+        ocel = ocel20.read_connection(conn, events_table=SELECTED_EVENTS, objects_table=SELECTED_OBJECTS,
+                                      parameters=self.parameters)
+        return ocel
+
+    def flatten(self, object_type: str) -> pd.DataFrame:
+        """
+        Flattens the view on the provided object type.
+
+        The events and objects that are not related to the objects of the provided type are filtered out inside
+        SQLite, so only the part of the view needed for the flattening is materialized.
+
+        Parameters
+        ----------------
+        object_type
+            Object type
+
+        Returns
+        ----------------
+        flattened_log
+            Traditional event log (dataframe) with the objects of the provided type as cases
+        """
+        view = self.filter_object_types([object_type])
+        try:
+            return flattening.flatten(view.to_ocel(), object_type, parameters=self.parameters)
+        finally:
+            view.close()
+
+    def __repr__(self):
+        return "Lazy OCEL 2.0 view over " + str(self.file_path) + " (filters: " + str(len(self.steps)) + ")"
+
+    def __str__(self):
+        return str(self.__repr__())
+
+
+def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> LazyOCEL:
+    """
+    Opens a lazy view over an OCEL 2.0 stored in a SQLite database, on which the filters (on the activities,
+    the object types and the timestamps), the statistics, the OC-DFG discovery and the flattening are executed
+    inside SQLite, materializing only the result (see LazyOCEL).
+
+    Parameters
+    ----------------
+    file_path
+        Path to the SQLite database
+    parameters
+        Parameters of the OCEL 2.0 importer (used when the view is materialized)
+
+    Returns
+    ----------------
+    lazy_ocel
+        Lazy view over the object-centric event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    return LazyOCEL(file_path, parameters=parameters)
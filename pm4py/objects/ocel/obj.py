@@ -70,6 +70,9 @@ class OCEL(object):
         if self.qualifier not in relations:
             relations[self.qualifier] = [None] * len(relations)
 
+        self.__index = None
+        self.__is_indexed = False
+
         self.events = events
         self.objects = objects
         self.relations = relations
@@ -80,6 +83,101 @@ class OCEL(object):
 
         self.parameters = parameters
 
+    @property
+    def events(self) -> pd.DataFrame:
+        return self.__events
+
+    @events.setter
+    def events(self, events: pd.DataFrame):
+        self.__events = events
+        self.invalidate_index()
+
+    @property
+    def objects(self) -> pd.DataFrame:
+        return self.__objects
+
+    @objects.setter
+    def objects(self, objects: pd.DataFrame):
+        self.__objects = objects
+        self.invalidate_index()
+
+    @property
+    def relations(self) -> pd.DataFrame:
+        return self.__relations
+
+    @relations.setter
+    def relations(self, relations: pd.DataFrame):
+        self.__relations = relations
+        self.invalidate_index()
+
+    @property
+    def o2o(self) -> pd.DataFrame:
+        return self.__o2o
+
+    @o2o.setter
+    def o2o(self, o2o: pd.DataFrame):
+        self.__o2o = o2o
+        self.invalidate_index()
+
+    def build_index(self):
+        """
+        Enables the indexing of the object-centric event log, and builds the index
+        (CSR-style adjacency arrays for the event -> objects, object -> events and object -> objects relationships).
+        The index is cached, and is re-built (lazily) when one of the tables of the log is replaced, or when the
+        number of rows of the tables changes. The in-place modification of single values is not detected: in such
+        case, call invalidate_index().
+        When the index is enabled, the utilities and the filters use it instead of grouping the relations.
+
+        Returns
+        ----------------
+        index
+            Index of the object-centric event log (OCELIndex)
+        """
+        self.__is_indexed = True
+        return self.get_index()
+
+    def get_index(self):
+        """
+        Gets the index of the object-centric event log (building it if it is not up-to-date).
+        Returns None if the indexing has not been enabled through build_index().
+
+        Returns
+        ----------------
+        index
+            Index of the object-centric event log (OCELIndex), or None
+        """
+        if not self.__is_indexed:
+            return None
+        fingerprint = self.__get_index_fingerprint()
+        if self.__index is None or self.__index[1] != fingerprint:
+            from pm4py.objects.ocel.util.ocel_index import OCELIndex
+            self.__index = (OCELIndex(self), fingerprint)
+        return self.__index[0]
+
+    def invalidate_index(self):
+        """
+        Invalidates the cached index of the object-centric event log (if the indexing is enabled, the index
+        will be re-built at the next request). Needed only when the tables are modified in-place.
+        """
+        self.__index = None
+
+    def __get_index_fingerprint(self):
+        # cheap check of the in-place modifications of the tables (the replacement of a table is handled by the
+        # setters): the number of rows, and the address of the buffers of the columns the index is built on
+        # (identifiers, timestamps and object types), which changes when a column is re-assigned
+        columns = [(self.events, [self.event_id_column, self.event_timestamp]),
+                   (self.objects, [self.object_id_column, self.object_type_column]),
+                   (self.relations, [self.event_id_column, self.object_id_column]),
+                   (self.o2o, [self.object_id_column, self.object_id_column + "_2"])]
+        fingerprint = []
+        for table, table_columns in columns:
+            fingerprint.append(len(table))
+            for c in table_columns:
+                values = table[c].values if c in table.columns else None
+                values = getattr(values, "_ndarray", values)
+                fingerprint.append(values.__array_interface__["data"][0] if isinstance(values, np.ndarray) else id(values))
+        return tuple(fingerprint)
+
     def get_extended_table(self, ot_prefix=constants.DEFAULT_OBJECT_TYPE_PREFIX_EXTENDED) -> pd.DataFrame:
         """
         Transforms the current OCEL data structure into a Pandas dataframe containing the events with their
@@ -137,9 +235,24 @@ class OCEL(object):
     def __repr__(self):
         return str(self.get_summary())
 
+    def __setstate__(self, state):
+        # supports the objects pickled before the introduction of the index
+        for key in ["events", "objects", "relations", "o2o"]:
+            if key in state:
+                state["_OCEL__" + key] = state.pop(key)
+        state.setdefault("_OCEL__index", None)
+        state.setdefault("_OCEL__is_indexed", False)
+        self.__dict__.update(state)
+
     def __copy__(self):
-        return OCEL(self.events, self.objects, self.relations, copy(self.globals), copy(self.parameters), copy(self.o2o), copy(self.e2e), copy(self.object_changes))
+        ocel = OCEL(self.events, self.objects, self.relations, copy(self.globals), copy(self.parameters), copy(self.o2o), copy(self.e2e), copy(self.object_changes))
+        ocel.__is_indexed = self.__is_indexed
+        # the index can be shared, since it is never modified in-place
+        ocel.__index = self.__index
+        return ocel
 
     def __deepcopy__(self, memo):
-        return OCEL(self.events.copy(), self.objects.copy(), self.relations.copy(), deepcopy(self.globals),
+        ocel = OCEL(self.events.copy(), self.objects.copy(), self.relations.copy(), deepcopy(self.globals),
                     deepcopy(self.parameters), deepcopy(self.o2o), deepcopy(self.e2e), deepcopy(self.object_changes))
+        ocel.__is_indexed = self.__is_indexed
+        return ocel
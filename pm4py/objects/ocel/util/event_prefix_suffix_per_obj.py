@@ -71,6 +71,27 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
     left_suffix = exec_utils.get_param_value(Parameters.LEFT_SUFFIX, parameters, "_LEFT")
     right_suffix = exec_utils.get_param_value(Parameters.RIGHT_SUFFIX, parameters, "_RIGHT")
 
+    index = ocel.get_index()
+    if index is not None:
+        # uses the lifecycles of the objects stored in the index (sorted by timestamp)
+        ret = {}
+        indptr = index.object_events_indptr
+        for i in range(len(index.object_ids)):
+            obj = index.object_ids[i]
+            lifecycle = index.event_ids[index.object_events[indptr[i]:indptr[i + 1]]].tolist()
+            for j, e1 in enumerate(lifecycle):
+                # the other events of the prefix/suffix, without duplicates (in the order of the lifecycle)
+                related = dict.fromkeys(e2 for e2 in (lifecycle[:j] if prefix_or_suffix == "prefix" else
+                                                      lifecycle[j + 1:]) if e2 != e1)
+                if related:
+                    if e1 not in ret:
+                        ret[e1] = {}
+                    if obj in ret[e1]:
+                        # the event occurs more than once in the lifecycle of the object
+                        related = dict.fromkeys(ret[e1][obj] + list(related))
+                    ret[e1][obj] = list(related)
+        return ret
+
     relations = ocel.relations.copy()
     relations = pandas_utils.insert_index(relations, index_attribute, reset_index=False, copy_dataframe=False)
     relations_merged = relations.merge(relations, left_on=ocel.object_id_column, right_on=ocel.object_id_column, suffixes=(left_suffix, right_suffix))
@@ -15,8 +15,9 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple, List
 
+import numpy as np
 import pandas as pd
 
 from pm4py.objects.ocel import constants as ocel_constants
@@ -74,3 +75,108 @@ def flatten(ocel: OCEL, ot: str, parameters: Optional[Dict[Any, Any]] = None) ->
         columns={event_activity: xes_constants.DEFAULT_NAME_KEY, event_timestamp: xes_constants.DEFAULT_TIMESTAMP_KEY})
 
     return events
+
+
+def __flatten_sorted(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[
+    pd.DataFrame, List[str], np.ndarray]:
+    """
+    Flattens the object-centric event log on all the object types at once, sorting the rows
+    by object type, object and timestamp (the position in the events table is used to break ties).
+
+    Returns the flattened dataframe, the sorted object types and the row where each object type starts
+    """
+    if parameters is None:
+        parameters = {}
+
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters,
+                                                ocel.event_activity)
+    event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters,
+                                                 ocel.event_timestamp)
+
+    events_positions = pd.Index(ocel.events[ocel.event_id_column]).get_indexer(
+        ocel.relations[ocel.event_id_column])
+    objects_positions = pd.Index(ocel.objects[ocel.object_id_column]).get_indexer(
+        ocel.relations[ocel.object_id_column])
+    types_codes, object_types = pd.factorize(ocel.relations[ocel.object_type_column], sort=True)
+    events_ranks = ocel.events[event_timestamp].rank(method="first").to_numpy()
+
+    rows = np.nonzero((events_positions >= 0) & (objects_positions >= 0))[0]
+    events_positions = events_positions[rows]
+    objects_positions = objects_positions[rows]
+    types_codes = types_codes[rows]
+    order = np.lexsort((events_ranks[events_positions], objects_positions, types_codes))
+    events_positions = events_positions[order]
+    objects_positions = objects_positions[order]
+    types_codes = types_codes[order]
+
+    objects = ocel.objects.rename(columns={ocel.object_id_column: xes_constants.DEFAULT_TRACEID_KEY})
+    objects = objects.rename(columns={x: constants.CASE_ATTRIBUTE_PREFIX + x for x in objects.columns})
+
+    # every event (object) attribute is taken just once per relation, regardless of the object type
+    dataframe = pd.concat([ocel.events.take(events_positions).reset_index(drop=True),
+                           objects.take(objects_positions).reset_index(drop=True)], axis=1)
+    dataframe = dataframe.rename(
+        columns={event_activity: xes_constants.DEFAULT_NAME_KEY, event_timestamp: xes_constants.DEFAULT_TIMESTAMP_KEY})
+
+    starts = np.searchsorted(types_codes, np.arange(len(object_types) + 1))
+
+    return dataframe, list(object_types), starts
+
+
+def flatten_all(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> pd.DataFrame:
+    """
+    Flattens the object-centric event log on all the object types at once.
+    The result is a single dataframe (containing a row for every relation between an event and an object)
+    sorted by object type, object identifier and timestamp, where the object identifier is the case identifier
+    and the object type is reported in the case attribute case:ocel:type.
+
+    The slice of the dataframe related to an object type contains the same rows as the result of
+    flatten(ocel, ot, parameters).
+
+    Parameters
+    -------------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+
+    Returns
+    ------------------
+    dataframe
+        Flattened log (on all the object types) in the form of a Pandas dataframe
+    """
+    return __flatten_sorted(ocel, parameters=parameters)[0]
+
+
+def flatten_per_type(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Iterator[
+    Tuple[str, pd.DataFrame]]:
+    """
+    Flattens the object-centric event log on every object type, performing a single flattening operation
+    (see flatten_all) and yielding, for every object type, the slice of the flattened dataframe related to it.
+
+    Parameters
+    -------------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+
+    Returns
+    ------------------
+    iterator
+        Iterator of couples (object type, flattened log for the object type). Object types without any
+        related event are associated to an empty dataframe.
+    """
+    dataframe, object_types, starts = __flatten_sorted(ocel, parameters=parameters)
+
+    for i, ot in enumerate(object_types):
+        yield ot, dataframe.iloc[starts[i]:starts[i + 1]]
+
+    object_types = set(object_types)
+    for ot in sorted(set(ocel.objects[ocel.object_type_column].unique())):
+        if ot not in object_types:
+            yield ot, dataframe.iloc[0:0]
@@ -0,0 +1,186 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from typing import Any, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class OCELIndex(object):
+    """
+    Index of an object-centric event log, containing CSR-style adjacency arrays for the following relationships:
+    - event -> related objects (in the order of the relations table)
+    - object -> related events (sorted by timestamp, ties are broken by the position in the events table)
+    - object -> related objects (from the object-to-object relationships)
+
+    Events and objects are identified by their position in the events/objects table of the log. Relationships
+    involving an event (object) which is not contained in the events (objects) table are ignored.
+
+    The index is built through OCEL.build_index(), and is cached in the object-centric event log
+    (see OCEL.get_index()) until one of its tables is replaced.
+    """
+
+    def __init__(self, ocel: Any):
+        self.event_ids = ocel.events[ocel.event_id_column].to_numpy()
+        self.object_ids = ocel.objects[ocel.object_id_column].to_numpy()
+        self.events_index = pd.Index(self.event_ids)
+        self.objects_index = pd.Index(self.object_ids)
+        self.object_types, self.object_types_codes = self.__factorize(ocel.objects[ocel.object_type_column])
+
+        events_positions = self.events_index.get_indexer(ocel.relations[ocel.event_id_column])
+        objects_positions = self.objects_index.get_indexer(ocel.relations[ocel.object_id_column])
+        rows = np.nonzero((events_positions >= 0) & (objects_positions >= 0))[0]
+        events_positions = events_positions[rows]
+        objects_positions = objects_positions[rows]
+
+        self.event_objects_indptr, self.event_objects = self.__build_csr(events_positions, objects_positions,
+                                                                         len(self.event_ids))
+
+        events_ranks = ocel.events[ocel.event_timestamp].rank(method="first").to_numpy()
+        order = np.lexsort((events_ranks[events_positions], objects_positions))
+        self.object_events_indptr, self.object_events = self.__build_csr(objects_positions[order],
+                                                                         events_positions[order],
+                                                                         len(self.object_ids))
+
+        sources = self.objects_index.get_indexer(ocel.o2o[ocel.object_id_column])
+        targets = self.objects_index.get_indexer(ocel.o2o[ocel.object_id_column + "_2"])
+        rows = np.nonzero((sources >= 0) & (targets >= 0))[0]
+        self.object_objects_indptr, self.object_objects = self.__build_csr(sources[rows], targets[rows],
+                                                                           len(self.object_ids))
+
+    @staticmethod
+    def __factorize(values: pd.Series) -> Tuple[List[Any], np.ndarray]:
+        codes, uniques = pd.factorize(values, sort=True)
+        return list(uniques), codes
+
+    @staticmethod
+    def __build_csr(rows: np.ndarray, columns: np.ndarray, num_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+        # stable sorting keeps the provided order of the columns inside every row
+        order = np.argsort(rows, kind="stable")
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+        return indptr, columns[order]
+
+    def get_event_position(self, event_id: Any) -> int:
+        """
+        Gets the position of the given event in the events table (-1 if the event is not contained in the log)
+        """
+        return int(self.events_index.get_indexer([event_id])[0])
+
+    def get_object_position(self, object_id: Any) -> int:
+        """
+        Gets the position of the given object in the objects table (-1 if the object is not contained in the log)
+        """
+        return int(self.objects_index.get_indexer([object_id])[0])
+
+    def get_related_objects(self, event_id: Any) -> List[Any]:
+        """
+        Gets the objects related to the given event
+
+        Parameters
+        ----------------
+        event_id
+            Event identifier
+
+        Returns
+        ----------------
+        objects
+            List of object identifiers
+        """
+        pos = self.get_event_position(event_id)
+        if pos < 0:
+            return []
+        return self.object_ids[
+            self.event_objects[self.event_objects_indptr[pos]:self.event_objects_indptr[pos + 1]]].tolist()
+
+    def get_related_events(self, object_id: Any) -> List[Any]:
+        """
+        Gets the events related to the given object (i.e., its lifecycle), sorted by timestamp
+
+        Parameters
+        ----------------
+        object_id
+            Object identifier
+
+        Returns
+        ----------------
+        events
+            List of event identifiers
+        """
+        pos = self.get_object_position(object_id)
+        if pos < 0:
+            return []
+        return self.event_ids[
+            self.object_events[self.object_events_indptr[pos]:self.object_events_indptr[pos + 1]]].tolist()
+
+    def get_o2o_related_objects(self, object_id: Any) -> List[Any]:
+        """
+        Gets the objects which are the target of an object-to-object relationship starting from the given object
+
+        Parameters
+        ----------------
+        object_id
+            Object identifier
+
+        Returns
+        ----------------
+        objects
+            List of object identifiers
+        """
+        pos = self.get_object_position(object_id)
+        if pos < 0:
+            return []
+        return self.object_ids[
+            self.object_objects[self.object_objects_indptr[pos]:self.object_objects_indptr[pos + 1]]].tolist()
+
+    def get_objects_of_type(self, object_type: Any) -> np.ndarray:
+        """
+        Gets the positions of the objects of the given object type
+        """
+        if object_type not in self.object_types:
+            return np.zeros(0, dtype=np.int64)
+        return np.nonzero(self.object_types_codes == self.object_types.index(object_type))[0]
+
+    def get_interacting_objects(self, objects_positions: np.ndarray) -> np.ndarray:
+        """
+        Gets the positions of the objects sharing at least one event with one of the provided objects
+        (including the provided objects, if they are related to some event)
+        """
+        events = np.unique(self.object_events[self.__get_ranges(self.object_events_indptr, objects_positions)])
+        return np.unique(self.event_objects[self.__get_ranges(self.event_objects_indptr, events)])
+
+    @staticmethod
+    def __get_ranges(indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        # concatenates the ranges of the CSR structure associated to the given rows
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = indptr[rows]
+        lengths = indptr[rows + 1] - starts
+        if lengths.sum() == 0:
+            return np.zeros(0, dtype=np.int64)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return np.arange(lengths.sum()) + offsets
+
+    def get_lifecycles_endpoints(self, objects_positions: np.ndarray, last: bool = False) -> np.ndarray:
+        """
+        Gets the position of the first (or last) event of the lifecycle of the provided objects
+        (objects without related events are skipped)
+        """
+        objects_positions = np.asarray(objects_positions, dtype=np.int64)
+        starts = self.object_events_indptr[objects_positions]
+        ends = self.object_events_indptr[objects_positions + 1]
+        non_empty = ends > starts
+        return self.object_events[ends[non_empty] - 1 if last else starts[non_empty]]
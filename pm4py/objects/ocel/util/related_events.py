@@ -24,6 +24,16 @@ def related_events_dct(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None)
     if parameters is None:
         parameters = {}
 
+    index = ocel.get_index()
+    if index is not None:
+        # uses the object -> events adjacency of the index (the events are sorted by timestamp)
+        dct = {}
+        indptr = index.object_events_indptr
+        for ot in index.object_types:
+            dct[ot] = {index.object_ids[i]: index.event_ids[index.object_events[indptr[i]:indptr[i + 1]]].tolist()
+                       for i in index.get_objects_of_type(ot) if indptr[i + 1] > indptr[i]}
+        return {ot: y for ot, y in dct.items() if y}
+
     object_types = pandas_utils.format_unique(ocel.relations[ocel.object_type_column].unique())
     dct = {}
     for ot in object_types:
@@ -16,6 +16,8 @@
 '''
 from typing import Dict, Any, Optional, List
 
+import numpy as np
+
 from pm4py.objects.ocel.obj import OCEL
 from pm4py.util import pandas_utils
 
@@ -24,6 +26,23 @@ def related_objects_dct_per_type(ocel: OCEL, parameters: Optional[Dict[Any, Any]
     if parameters is None:
         parameters = {}
 
+    index = ocel.get_index()
+    if index is not None:
+        # uses the event -> objects adjacency of the index
+        dct = {}
+        events = np.repeat(np.arange(len(index.event_ids)), np.diff(index.event_objects_indptr))
+        types_codes = index.object_types_codes[index.event_objects]
+        for code, ot in enumerate(index.object_types):
+            rows = np.nonzero(types_codes == code)[0]
+            if len(rows) > 0:
+                # the rows of the same event are contiguous
+                ot_events = events[rows]
+                bounds = np.nonzero(ot_events[1:] != ot_events[:-1])[0] + 1
+                ot_objects = np.split(index.object_ids[index.event_objects[rows]], bounds)
+                dct[ot] = {index.event_ids[ot_events[i]]: objs.tolist() for i, objs in
+                           zip(np.concatenate(([0], bounds)), ot_objects)}
+        return dct
+
     object_types = pandas_utils.format_unique(ocel.relations[ocel.object_type_column].unique())
     dct = {}
     for ot in object_types:
@@ -36,6 +55,13 @@ def related_objects_dct_overall(ocel: OCEL, parameters: Optional[Dict[Any, Any]]
     if parameters is None:
         parameters = {}
 
+    index = ocel.get_index()
+    if index is not None:
+        # uses the event -> objects adjacency of the index
+        indptr = index.event_objects_indptr
+        return {index.event_ids[i]: index.object_ids[index.event_objects[indptr[i]:indptr[i + 1]]].tolist()
+                for i in range(len(index.event_ids))}
+
     evids = pandas_utils.format_unique(ocel.events[ocel.event_id_column].unique())
     dct = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
 
@@ -15,4 +15,4 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from pm4py.objects.petri_net import obj, properties, semantics, utils, saw_net, stochastic
+from pm4py.objects.petri_net import obj, properties, semantics, utils, saw_net, stochastic, compiled
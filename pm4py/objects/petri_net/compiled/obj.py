@@ -0,0 +1,169 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+
+CompiledMarking = Tuple[int, ...]
+
+
+class CompiledPetriNet(object):
+    """
+    Integer-indexed representation of a Petri net, to be used in the hot loops of the algorithms
+    (replay, alignments, playout, construction of the reachability graph).
+
+    Places and transitions are mapped to dense integers (using the same order as the incidence matrix of
+    pm4py.objects.petri_net.utils.incidence_matrix), the pre/post-sets are stored both as NumPy matrices
+    (transitions x places) and as tuples of (place, weight) couples, and markings are immutable tuples of integers
+    (one entry per place) that are cheap to hash and compare.
+    """
+
+    def __init__(self, net: PetriNet):
+        self.__net = net
+        self.__places = sorted([x for x in net.places], key=lambda x: (str(x.name), id(x)))
+        self.__transitions = sorted([x for x in net.transitions], key=lambda x: (str(x.name), id(x)))
+        self.__place_indices = {p: i for i, p in enumerate(self.__places)}
+        self.__transition_indices = {t: i for i, t in enumerate(self.__transitions)}
+
+        self.__pre_matrix = np.zeros((len(self.__transitions), len(self.__places)), dtype=np.int64)
+        self.__post_matrix = np.zeros((len(self.__transitions), len(self.__places)), dtype=np.int64)
+        for a in net.arcs:
+            if a.source in self.__place_indices:
+                self.__pre_matrix[self.__transition_indices[a.target], self.__place_indices[a.source]] += a.weight
+            else:
+                self.__post_matrix[self.__transition_indices[a.source], self.__place_indices[a.target]] += a.weight
+        self.__incidence_matrix = self.__post_matrix - self.__pre_matrix
+
+        self.__preset = []
+        self.__postset = []
+        self.__delta = []
+        for i in range(len(self.__transitions)):
+            pre = self.__pre_matrix[i]
+            post = self.__post_matrix[i]
+            delta = post - pre
+            self.__preset.append(tuple((int(p), int(pre[p])) for p in np.nonzero(pre)[0]))
+            self.__postset.append(tuple((int(p), int(post[p])) for p in np.nonzero(post)[0]))
+            self.__delta.append(tuple((int(p), int(delta[p])) for p in np.nonzero(delta)[0]))
+
+        # transitions having the place in their preset (for the efficient computation of the enabled transitions)
+        place_out_transitions = [[] for p in self.__places]
+        for i in range(len(self.__transitions)):
+            for p, w in self.__preset[i]:
+                place_out_transitions[p].append(i)
+        self.__place_out_transitions = [tuple(x) for x in place_out_transitions]
+        self.__empty_preset_transitions = tuple(i for i in range(len(self.__transitions)) if not self.__preset[i])
+
+    def __get_net(self) -> PetriNet:
+        return self.__net
+
+    def __get_places(self) -> List[PetriNet.Place]:
+        return self.__places
+
+    def __get_transitions(self) -> List[PetriNet.Transition]:
+        return self.__transitions
+
+    def __get_place_indices(self) -> Dict[PetriNet.Place, int]:
+        return self.__place_indices
+
+    def __get_transition_indices(self) -> Dict[PetriNet.Transition, int]:
+        return self.__transition_indices
+
+    def __get_pre_matrix(self) -> np.ndarray:
+        return self.__pre_matrix
+
+    def __get_post_matrix(self) -> np.ndarray:
+        return self.__post_matrix
+
+    def __get_incidence_matrix(self) -> np.ndarray:
+        return self.__incidence_matrix
+
+    def __get_preset(self) -> List[Tuple[Tuple[int, int], ...]]:
+        return self.__preset
+
+    def __get_postset(self) -> List[Tuple[Tuple[int, int], ...]]:
+        return self.__postset
+
+    def __get_delta(self) -> List[Tuple[Tuple[int, int], ...]]:
+        return self.__delta
+
+    def __get_place_out_transitions(self) -> List[Tuple[int, ...]]:
+        return self.__place_out_transitions
+
+    def __get_empty_preset_transitions(self) -> Tuple[int, ...]:
+        return self.__empty_preset_transitions
+
+    def encode_marking(self, marking: Marking) -> CompiledMarking:
+        """
+        Encodes a marking of the Petri net as a tuple of integers (one entry per place)
+        """
+        m = [0] * len(self.__places)
+        for p, c in marking.items():
+            m[self.__place_indices[p]] = c
+        return tuple(m)
+
+    def decode_marking(self, marking: CompiledMarking) -> Marking:
+        """
+        Decodes a tuple of integers as a marking of the Petri net
+        """
+        m = Marking()
+        for i, c in enumerate(marking):
+            if c > 0:
+                m[self.__places[i]] = c
+        return m
+
+    def encode_transition(self, transition: PetriNet.Transition) -> int:
+        return self.__transition_indices[transition]
+
+    def decode_transition(self, transition: int) -> PetriNet.Transition:
+        return self.__transitions[transition]
+
+    def __repr__(self):
+        return "CompiledPetriNet(places=" + str(len(self.__places)) + ", transitions=" + str(
+            len(self.__transitions)) + ")"
+
+    net = property(__get_net)
+    places = property(__get_places)
+    transitions = property(__get_transitions)
+    place_indices = property(__get_place_indices)
+    transition_indices = property(__get_transition_indices)
+    pre_matrix = property(__get_pre_matrix)
+    post_matrix = property(__get_post_matrix)
+    incidence_matrix = property(__get_incidence_matrix)
+    preset = property(__get_preset)
+    postset = property(__get_postset)
+    delta = property(__get_delta)
+    place_out_transitions = property(__get_place_out_transitions)
+    empty_preset_transitions = property(__get_empty_preset_transitions)
+
+
+def compile_net(net: PetriNet) -> CompiledPetriNet:
+    """
+    Compiles a Petri net into its integer-indexed representation
+
+    Parameters
+    ----------------
+    net
+        Petri net
+
+    Returns
+    ----------------
+    compiled_net
+        Compiled Petri net
+    """
+    return CompiledPetriNet(net)
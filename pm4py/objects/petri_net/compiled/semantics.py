@@ -0,0 +1,158 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from typing import List, Optional
+
+import numpy as np
+
+from pm4py.objects.petri_net.compiled.obj import CompiledPetriNet, CompiledMarking
+
+
+class CompiledPetriNetSemantics(object):
+    """
+    Semantics of a compiled Petri net. Transitions are identified by their index, and markings are tuples
+    of integers (see CompiledPetriNet).
+    """
+
+    @classmethod
+    def is_enabled(cls, cnet: CompiledPetriNet, transition: int, marking: CompiledMarking) -> bool:
+        """
+        Checks whether a given transition is enabled in a given marking
+
+        Parameters
+        ----------
+        :param cnet: compiled Petri net
+        :param transition: index of the transition to check
+        :param marking: marking to check
+
+        Returns
+        -------
+        :return: true if enabled, false otherwise
+        """
+        for p, w in cnet.preset[transition]:
+            if marking[p] < w:
+                return False
+        return True
+
+    @classmethod
+    def fire(cls, cnet: CompiledPetriNet, transition: int, marking: CompiledMarking) -> CompiledMarking:
+        """
+        Execute a transition.
+        For performance reasons, the method does not check if the transition is enabled, i.e., this should be
+        performed by the invoking algorithm (if needed). Hence, markings can become negative.
+
+        Parameters
+        ----------
+        :param cnet: compiled Petri net
+        :param transition: index of the transition to execute
+        :param marking: marking to use
+
+        Returns
+        -------
+        :return: newly reached marking
+        """
+        m_out = list(marking)
+        for p, d in cnet.delta[transition]:
+            m_out[p] += d
+        return tuple(m_out)
+
+    @classmethod
+    def execute(cls, cnet: CompiledPetriNet, transition: int, marking: CompiledMarking) -> Optional[CompiledMarking]:
+        """
+        Executes a transition if it is enabled
+
+        Parameters
+        ----------
+        :param cnet: compiled Petri net
+        :param transition: index of the transition to execute
+        :param marking: marking to use
+
+        Returns
+        -------
+        :return: newly reached marking if the transition is enabled, None otherwise
+        """
+        if not cls.is_enabled(cnet, transition, marking):
+            return None
+        return cls.fire(cnet, transition, marking)
+
+    @classmethod
+    def weak_execute(cls, cnet: CompiledPetriNet, transition: int, marking: CompiledMarking) -> CompiledMarking:
+        """
+        Execute a transition even if it is not fully enabled (the places of the preset without enough tokens
+        are emptied, as in pm4py.objects.petri_net.semantics.weak_execute)
+
+        Parameters
+        ----------
+        :param cnet: compiled Petri net
+        :param transition: index of the transition to execute
+        :param marking: marking to use
+
+        Returns
+        -------
+        :return: newly reached marking
+        """
+        m_out = list(marking)
+        for p, w in cnet.preset[transition]:
+            m_out[p] = max(0, m_out[p] - w)
+        for p, w in cnet.postset[transition]:
+            m_out[p] += w
+        return tuple(m_out)
+
+    @classmethod
+    def enabled_transitions(cls, cnet: CompiledPetriNet, marking: CompiledMarking) -> List[int]:
+        """
+        Returns the (indexes of the) transitions enabled in the given marking.
+        Only the transitions in the postset of the marked places are checked.
+
+        Parameters
+        ----------
+        :param cnet: compiled Petri net
+        :param marking: marking to use
+
+        Returns
+        -------
+        :return: sorted list of the indexes of the enabled transitions
+        """
+        enabled = set(cnet.empty_preset_transitions)
+        place_out_transitions = cnet.place_out_transitions
+        preset = cnet.preset
+        for p, c in enumerate(marking):
+            if c > 0:
+                for t in place_out_transitions[p]:
+                    if t not in enabled:
+                        for p1, w in preset[t]:
+                            if marking[p1] < w:
+                                break
+                        else:
+                            enabled.add(t)
+        return sorted(enabled)
+
+    @classmethod
+    def enabled_transitions_matrix(cls, cnet: CompiledPetriNet, markings: np.ndarray) -> np.ndarray:
+        """
+        Vectorized computation of the enabled transitions for a batch of markings
+
+        Parameters
+        ----------
+        :param cnet: compiled Petri net
+        :param markings: matrix of markings (one row per marking, one column per place)
+
+        Returns
+        -------
+        :return: boolean matrix (one row per marking, one column per transition)
+        """
+        markings = np.atleast_2d(markings)
+        return np.all(markings[:, np.newaxis, :] >= cnet.pre_matrix[np.newaxis, :, :], axis=2)
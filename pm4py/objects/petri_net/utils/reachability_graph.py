@@ -17,6 +17,8 @@
 import re
 
 from pm4py.objects import petri_net
+from pm4py.objects.petri_net.compiled.obj import CompiledPetriNet
+from pm4py.objects.petri_net.compiled.semantics import CompiledPetriNetSemantics
 from pm4py.objects.transition_system.obj import TransitionSystem
 from pm4py.objects.petri_net.utils import align_utils
 from pm4py.objects.transition_system import obj as ts
@@ -66,7 +68,11 @@ def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None
 
     # set a maximum execution time of 1 day (it can be changed by providing the parameter)
     max_exec_time = exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, 86400)
-    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, petri_net.semantics.ClassicSemantics())
+    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, None)
+
+    if semantics is None:
+        # classic semantics: the exploration is done on the compiled Petri net
+        return __marking_flow_compiled_petri(net, im, return_eventually_enabled, max_exec_time)
 
     start_time = time.time()
 
@@ -96,6 +102,50 @@ def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None
     return incoming_transitions, outgoing_transitions, eventually_enabled
 
 
+def __marking_flow_compiled_petri(net, im, return_eventually_enabled, max_exec_time):
+    """
+    Construct the marking flow of a Petri net (classic semantics), exploring the markings of the
+    compiled Petri net (tuples of integers) and decoding them only at the end
+    """
+    start_time = time.time()
+
+    cnet = CompiledPetriNet(net)
+    cim = cnet.encode_marking(im)
+
+    incoming = {cim: set()}
+    outgoing = {}
+
+    active = [cim]
+    while active:
+        if (time.time() - start_time) >= max_exec_time:
+            # interrupt the execution
+            break
+        m = active.pop()
+        outgoing[m] = {}
+        for t in CompiledPetriNetSemantics.enabled_transitions(cnet, m):
+            nm = CompiledPetriNetSemantics.fire(cnet, t, m)
+            outgoing[m][t] = nm
+            if nm not in incoming:
+                incoming[nm] = set()
+                active.append(nm)
+            incoming[nm].add(t)
+
+    transitions = cnet.transitions
+    decoded = {m: cnet.decode_marking(m) for m in incoming}
+    decoded[cim] = im
+
+    incoming_transitions = {decoded[m]: {transitions[t] for t in incoming[m]} for m in incoming}
+    outgoing_transitions = {decoded[m]: {transitions[t]: decoded[nm] for t, nm in outgoing[m].items()} for m in
+                            outgoing}
+    eventually_enabled = {}
+    if return_eventually_enabled:
+        for m in outgoing:
+            eventually_enabled[decoded[m]] = align_utils.get_visible_transitions_eventually_enabled_by_marking(
+                net, decoded[m])
+
+    return incoming_transitions, outgoing_transitions, eventually_enabled
+
+
 def construct_reachability_graph_from_flow(incoming_transitions, outgoing_transitions,
                                            use_trans_name=False, parameters=None):
     """
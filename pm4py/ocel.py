@@ -210,7 +210,7 @@ def ocel_objects_interactions_summary(ocel: OCEL) -> pd.DataFrame:
     return pandas_utils.instantiate_dataframe(stream)
 
 
-def discover_ocdfg(ocel: OCEL, business_hours=False, business_hour_slots=constants.DEFAULT_BUSINESS_HOUR_SLOTS) -> Dict[str, Any]:
+def discover_ocdfg(ocel: OCEL, business_hours=False, business_hour_slots=constants.DEFAULT_BUSINESS_HOUR_SLOTS, aggregated: bool = False) -> Dict[str, Any]:
     """
     Discovers an OC-DFG from an object-centric event log.
 
@@ -222,6 +222,7 @@ def discover_ocdfg(ocel: OCEL, business_hours=False, business_hour_slots=constan
     :param ocel: object-centric event log
     :param business_hours: boolean value that enables the usage of the business hours
     :param business_hour_slots: work schedule of the company, provided as a list of tuples where each tuple represents one time slot of business hours. One slot i.e. one tuple consists of one start and one end time given in seconds since week start, e.g. [(7 * 60 * 60, 17 * 60 * 60), ((24 + 7) * 60 * 60, (24 + 12) * 60 * 60), ((24 + 13) * 60 * 60, (24 + 17) * 60 * 60),] meaning that business hours are Mondays 07:00 - 17:00 and Tuesdays 07:00 - 12:00 and 13:00 - 17:00
+    :param aggregated: (boolean) computes only the counts of events/objects (and the aggregated performance of the edges), without collecting the sets of identifiers (suggested for large object-centric event logs)
 
     :rtype: ``Dict[str, Any]``
 
@@ -235,7 +236,8 @@ def discover_ocdfg(ocel: OCEL, business_hours=False, business_hour_slots=constan
     parameters["business_hours"] = business_hours
     parameters["business_hour_slots"] = business_hour_slots
     from pm4py.algo.discovery.ocel.ocdfg import algorithm as ocdfg_discovery
-    return ocdfg_discovery.apply(ocel, parameters=parameters)
+    variant = ocdfg_discovery.Variants.AGGREGATED if aggregated else ocdfg_discovery.Variants.CLASSIC
+    return ocdfg_discovery.apply(ocel, variant=variant, parameters=parameters)
 
 
 def discover_oc_petri_net(ocel: OCEL, inductive_miner_variant: str = "im", diagnostics_with_tbr: bool = False) -> Dict[str, Any]:
@@ -44,7 +44,7 @@ def read_xes(file_path: str, variant: Optional[str] = None, return_legacy_log_ob
     Returns a table (``pandas.DataFrame``) view of the event log.
 
     :param file_path: file path of the event log (``.xes`` file) on disk
-    :param variant: the variant of the importer to use. "iterparse" => traditional XML parser; "line_by_line" => text-based line-by-line importer ; "chunk_regex" => chunk-of-bytes importer (default); "iterparse20" => XES 2.0 importer
+    :param variant: the variant of the importer to use. "iterparse" => traditional XML parser; "line_by_line" => text-based line-by-line importer ; "chunk_regex" => chunk-of-bytes importer (default); "iterparse20" => XES 2.0 importer; "parallel_chunks" => chunks of traces parsed in parallel
     :param return_legacy_log_object: boolean value enabling returning a log object (default: False)
     :param encoding: the encoding to be used (default: utf-8)
     :rtype: ``DataFrame``
@@ -78,6 +78,8 @@ def read_xes(file_path: str, variant: Optional[str] = None, return_legacy_log_ob
         v = xes_importer.Variants.CHUNK_REGEX
     elif variant == "rustxes":
         v = xes_importer.Variants.RUSTXES
+    elif variant == "parallel_chunks":
+        v = xes_importer.Variants.PARALLEL_CHUNKS
 
     from copy import copy
     parameters = copy(kwargs)
@@ -336,7 +338,7 @@ def read_ocel2_json(file_path: str, variant_str: Optional[str] = None, encoding:
     Reads an OCEL2.0 event log from a JSON-OCEL(2) file
 
     :param file_path: path to the JSON file
-    :param variant_str: (optional) specification of the importer variant to be used
+    :param variant_str: (optional) specification of the importer variant to be used ("ocel20_streaming" parses the file incrementally, reducing the memory usage on large files)
     :param encoding: the encoding to be used (default: utf-8)
     :rtype: ``OCEL``
 
@@ -353,6 +355,8 @@ def read_ocel2_json(file_path: str, variant_str: Optional[str] = None, encoding:
     variant = jsonocel_importer.Variants.OCEL20_STANDARD
     if variant_str == "ocel20_rustxes":
         variant = jsonocel_importer.Variants.OCEL20_RUSTXES
+    elif variant_str == "ocel20_streaming":
+        variant = jsonocel_importer.Variants.OCEL20_STREAMING
 
     return jsonocel_importer.apply(file_path, variant=variant, parameters={"encoding": encoding})
 
@@ -15,3 +15,7 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.statistics.attributes import common, log, pandas
+import importlib.util
+
+if importlib.util.find_spec("polars"):
+    from pm4py.statistics.attributes import polars
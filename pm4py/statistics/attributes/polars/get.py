@@ -0,0 +1,62 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union
+
+import polars as pl
+
+from pm4py.util import exec_utils, constants, polars_utils
+
+
+class Parameters(Enum):
+    ATTRIBUTE_KEY = constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    KEEP_ONCE_PER_CASE = "keep_once_per_case"
+
+
+def get_attribute_values(df: Union[pl.DataFrame, pl.LazyFrame], attribute_key: str, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Dict[Any, int]:
+    """
+    Return list of attribute values contained in the specified column of the Polars dataframe
+
+    Parameters
+    -----------
+    df
+        Polars DataFrame or LazyFrame
+    attribute_key
+        Attribute for which we want to known the values and the count
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+            Parameters.KEEP_ONCE_PER_CASE -> Counts only one occurrence of each value per case
+
+    Returns
+    -----------
+    attributes_values_dict
+        Attributes in the specified column, along with their count
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    keep_once_per_case = exec_utils.get_param_value(Parameters.KEEP_ONCE_PER_CASE, parameters, False)
+
+    df = polars_utils.to_lazy(df)
+    if keep_once_per_case:
+        df = df.select(case_id_glue, attribute_key).unique()
+    values = df.filter(pl.col(attribute_key).is_not_null()).group_by(attribute_key).len().collect()
+
+    return dict(zip(values[attribute_key].to_list(), values["len"].to_list()))
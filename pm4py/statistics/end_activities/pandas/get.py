@@ -15,10 +15,11 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.util.constants import CASE_CONCEPT_NAME
-from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TIMESTAMP_KEY
 from pm4py.util.constants import GROUPED_DATAFRAME
 from pm4py.util import exec_utils
 from pm4py.util import constants
+from pm4py.objects.log.util import dataframe_index
 from enum import Enum
 from typing import Optional, Dict, Any, Union
 from collections import Counter
@@ -58,6 +59,13 @@ def get_end_activities(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Pa
 
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+
+    if GROUPED_DATAFRAME not in parameters:
+        index = dataframe_index.get(df, case_id_glue, activity_key, timestamp_key)
+        if index is not None:
+            return index.get_end_activities()
+
     grouped_df = parameters[GROUPED_DATAFRAME] if GROUPED_DATAFRAME in parameters else None
 
     if grouped_df is None:
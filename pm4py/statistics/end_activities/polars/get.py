@@ -0,0 +1,62 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union
+
+import polars as pl
+
+from pm4py.util import exec_utils, constants, polars_utils
+from pm4py.util.constants import CASE_CONCEPT_NAME
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TIMESTAMP_KEY
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def get_end_activities(df: Union[pl.DataFrame, pl.LazyFrame], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Dict[str, int]:
+    """
+    Get end activities count (from a Polars dataframe)
+
+    Parameters
+    -----------
+    df
+        Polars DataFrame or LazyFrame
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ID_KEY -> Case ID column in the dataframe
+            Parameters.ACTIVITY_KEY -> Column that represents the activity
+            Parameters.TIMESTAMP_KEY -> Column that represents the timestamp
+
+    Returns
+    -----------
+    endact_dict
+        Dictionary of end activities along with their count
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
+
+    end_activities = polars_utils.to_lazy(df).group_by(case_id_glue).agg(
+        pl.col(activity_key).sort_by(timestamp_key, maintain_order=True).last()).group_by(activity_key).len().collect()
+
+    return dict(zip(end_activities[activity_key].to_list(), end_activities["len"].to_list()))
@@ -15,3 +15,10 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.statistics.start_activities import common, log, pandas
+import importlib.util
+
+if importlib.util.find_spec("polars"):
+    from pm4py.statistics.start_activities import polars
+
+if importlib.util.find_spec("duckdb"):
+    from pm4py.statistics.start_activities import duckdb
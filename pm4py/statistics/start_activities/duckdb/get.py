@@ -0,0 +1,59 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union
+
+from pm4py.util import exec_utils, constants, duckdb_utils
+from pm4py.util.constants import CASE_CONCEPT_NAME
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TIMESTAMP_KEY
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def get_start_activities(log: Any, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Dict[str, int]:
+    """
+    Get start activities count (the query is executed by DuckDB)
+
+    Parameters
+    -----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ID_KEY -> Case ID column
+            Parameters.ACTIVITY_KEY -> Column that represents the activity
+            Parameters.TIMESTAMP_KEY -> Column that represents the timestamp
+
+    Returns
+    -----------
+    startact_dict
+        Dictionary of start activities along with their count
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = duckdb_utils.quote(exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME))
+    activity_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY))
+    timestamp_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY))
+
+    rows = duckdb_utils.fetch(log, "SELECT activity, COUNT(*) FROM (SELECT ARG_MIN(" + activity_key + ", ROW(" + timestamp_key + ", " + duckdb_utils.INDEX_COLUMN + ")) AS activity FROM " + duckdb_utils.INDEXED_LOG_TABLE + " GROUP BY " + case_id_glue + ") GROUP BY activity")
+
+    return {x: y for x, y in rows if x is not None}
@@ -0,0 +1,108 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List
+
+import numpy as np
+
+from pm4py.util import exec_utils, constants, duckdb_utils, xes_constants
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
+
+
+class Parameters(Enum):
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
+
+    BUSINESS_HOURS = "business_hours"
+    BUSINESS_HOUR_SLOTS = "business_hour_slots"
+    WORKCALENDAR = "workcalendar"
+
+
+def get_cases_description(log: Any, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get a description of the cases (the aggregation is executed by DuckDB, only one row per case is fetched)
+
+    Parameters
+    -----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+            Parameters.TIMESTAMP_KEY -> Column that contains the timestamp
+            Parameters.START_TIMESTAMP_KEY -> Column that contains the start timestamp (if provided)
+            Parameters.BUSINESS_HOURS -> Enables/disables the computation based on the business hours (default: False)
+            Parameters.BUSINESS_HOUR_SLOTS -> Work schedule of the company
+            Parameters.WORKCALENDAR -> Work calendar (for the business hours)
+
+    Returns
+    -----------
+    ret
+        Dictionary of cases associated to their start timestamp, their end timestamp and their duration
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = duckdb_utils.quote(exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME))
+    timestamp_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY))
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
+    start_timestamp_key = duckdb_utils.quote(start_timestamp_key) if start_timestamp_key is not None else timestamp_key
+
+    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
+    business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+
+    rows = duckdb_utils.fetch(log, "SELECT " + case_id_glue + ", EPOCH_US(MIN(" + start_timestamp_key + ")) AS start_time, EPOCH_US(MAX(" + timestamp_key + ")) AS end_time FROM " + duckdb_utils.LOG_TABLE + " GROUP BY " + case_id_glue + " ORDER BY start_time")
+    if not rows:
+        return {}
+
+    cases = [x[0] for x in rows]
+    start_times = np.array([x[1] for x in rows], dtype=np.int64)
+    end_times = np.array([x[2] for x in rows], dtype=np.int64)
+
+    if business_hours:
+        # the epochs are expressed as (UTC) wall times
+        durations = soj_time_business_hours_diff_vectorized(start_times.astype("datetime64[us]"),
+                                                             end_times.astype("datetime64[us]"),
+                                                             business_hours_slots, workcalendar)
+    else:
+        durations = (end_times - start_times) / 10 ** 6
+
+    return {cases[i]: {"startTime": int(start_times[i] // 10 ** 6), "endTime": int(end_times[i] // 10 ** 6),
+                       "caseDuration": float(durations[i])} for i in range(len(cases))}
+
+
+def get_all_case_durations(log: Any, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> List[float]:
+    """
+    Gets all the case durations (the aggregation is executed by DuckDB)
+
+    Parameters
+    -----------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    parameters
+        Possible parameters of the algorithm (see get_cases_description)
+
+    Returns
+    -----------
+    duration_values
+        List of all the (sorted) duration values
+    """
+    cases = get_cases_description(log, parameters=parameters)
+
+    return sorted(x["caseDuration"] for x in cases.values())
@@ -19,10 +19,11 @@ from typing import Optional, Dict, Any, Union, Tuple, List
 
 import pandas as pd
 
+from pm4py.objects.log.util import dataframe_index
 from pm4py.statistics.traces.generic.common import case_duration as case_duration_commons
 from pm4py.util import exec_utils, constants, pandas_utils
 from pm4py.util import xes_constants as xes
-from pm4py.util.business_hours import soj_time_business_hours_diff
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
 from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 from collections import Counter
@@ -172,21 +173,28 @@ def get_cases_description(df: pd.DataFrame, parameters: Optional[Dict[Union[str,
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
-    grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    # grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
-    first_eve_df = grouped_df.first()
-    last_eve_df = grouped_df.last()
-    del grouped_df
-    last_eve_df.columns = [str(col) + '_2' for col in first_eve_df.columns]
-    stacked_df = pandas_utils.concat([first_eve_df, last_eve_df], axis=1)
-    del first_eve_df
-    del last_eve_df
-    del stacked_df[case_id_glue]
-    del stacked_df[case_id_glue + "_2"]
+    index = dataframe_index.get_sorted(df, case_id_glue) if start_timestamp_key == timestamp_key else None
+    if index is not None and index.keys[2] == timestamp_key:
+        # re-uses the index of the dataframe (the first and last events of the cases are at the offsets of the cases)
+        stacked_df = pd.DataFrame({timestamp_key: df[timestamp_key].iloc[index.case_offsets[:-1]].array,
+                                   timestamp_key + "_2": df[timestamp_key].iloc[index.case_offsets[1:] - 1].array},
+                                  index=pd.Index(index.cases, name=case_id_glue))
+    else:
+        grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
+        # grouped_df = df[[case_id_glue, timestamp_key]].groupby(df[case_id_glue])
+        first_eve_df = grouped_df.first()
+        last_eve_df = grouped_df.last()
+        del grouped_df
+        last_eve_df.columns = [str(col) + '_2' for col in first_eve_df.columns]
+        stacked_df = pandas_utils.concat([first_eve_df, last_eve_df], axis=1)
+        del first_eve_df
+        del last_eve_df
+        del stacked_df[case_id_glue]
+        del stacked_df[case_id_glue + "_2"]
 
     if business_hours:
-        stacked_df['caseDuration'] = stacked_df.apply(
-            lambda x: soj_time_business_hours_diff(x[start_timestamp_key], x[timestamp_key + "_2"], business_hours_slots, workcalendar), axis=1)
+        stacked_df['caseDuration'] = soj_time_business_hours_diff_vectorized(
+            stacked_df[start_timestamp_key], stacked_df[timestamp_key + "_2"], business_hours_slots, workcalendar)
     else:
         stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[start_timestamp_key]
         stacked_df['caseDuration'] = pandas_utils.get_total_seconds(stacked_df['caseDuration'])
@@ -227,6 +235,13 @@ def get_variants_df(df, parameters=None):
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes.DEFAULT_NAME_KEY)
 
+    index = dataframe_index.get_sorted(df, case_id_glue, activity_key)
+    if index is not None:
+        # re-uses the index of the dataframe (the cases are sorted as in the dataframe)
+        cases, variant_ids, variants, counts = index.get_variants_ids()
+        return pd.DataFrame({"variant": [variants[i] for i in variant_ids.tolist()]},
+                            index=pd.Index(cases, name=case_id_glue))
+
     new_df = df.groupby(case_id_glue, sort=False)[activity_key].agg(tuple).to_frame()
 
     new_cols = list(new_df.columns)
@@ -284,8 +299,8 @@ def get_variants_df_with_case_duration(df, parameters=None):
     stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
     stacked_df['caseDuration'] = pandas_utils.get_total_seconds(stacked_df['caseDuration'])
     if business_hours:
-        stacked_df['caseDuration'] = stacked_df.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[timestamp_key + "_2"], business_hours_slots, workcalendar), axis=1)
+        stacked_df['caseDuration'] = soj_time_business_hours_diff_vectorized(
+            stacked_df[timestamp_key], stacked_df[timestamp_key + "_2"], business_hours_slots, workcalendar)
     else:
         stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
         stacked_df['caseDuration'] = pandas_utils.get_total_seconds(stacked_df['caseDuration'])
@@ -0,0 +1,106 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List
+
+import polars as pl
+
+from pm4py.util import exec_utils, constants, polars_utils, xes_constants
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
+
+
+class Parameters(Enum):
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
+
+    BUSINESS_HOURS = "business_hours"
+    BUSINESS_HOUR_SLOTS = "business_hour_slots"
+    WORKCALENDAR = "workcalendar"
+
+
+def get_cases_description(df: Union[pl.DataFrame, pl.LazyFrame], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get a description of the cases of a Polars dataframe
+
+    Parameters
+    -----------
+    df
+        Polars DataFrame or LazyFrame
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+            Parameters.TIMESTAMP_KEY -> Column that contains the timestamp
+            Parameters.START_TIMESTAMP_KEY -> Column that contains the start timestamp (if provided)
+            Parameters.BUSINESS_HOURS -> Enables/disables the computation based on the business hours (default: False)
+            Parameters.BUSINESS_HOUR_SLOTS -> Work schedule of the company
+            Parameters.WORKCALENDAR -> Work calendar (for the business hours)
+
+    Returns
+    -----------
+    ret
+        Dictionary of cases associated to their start timestamp, their end timestamp and their duration
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
+    if start_timestamp_key is None:
+        start_timestamp_key = timestamp_key
+
+    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
+    business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+
+    cases = polars_utils.to_lazy(df).group_by(case_id_glue).agg(
+        pl.col(start_timestamp_key).min().alias("startTime"), pl.col(timestamp_key).max().alias("endTime"))
+
+    if business_hours:
+        cases = cases.collect()
+        cases = cases.with_columns(pl.Series("caseDuration", soj_time_business_hours_diff_vectorized(
+            cases["startTime"].to_pandas(), cases["endTime"].to_pandas(), business_hours_slots, workcalendar)))
+    else:
+        cases = cases.with_columns(
+            ((pl.col("endTime") - pl.col("startTime")).dt.total_microseconds() / 10 ** 6).alias("caseDuration")).collect()
+
+    cases = cases.with_columns(pl.col("startTime").dt.epoch("s"), pl.col("endTime").dt.epoch("s")).sort("startTime", maintain_order=True)
+
+    return {row[case_id_glue]: {"startTime": row["startTime"], "endTime": row["endTime"], "caseDuration": row["caseDuration"]}
+            for row in cases.iter_rows(named=True)}
+
+
+def get_all_case_durations(df: Union[pl.DataFrame, pl.LazyFrame], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> List[float]:
+    """
+    Gets all the case durations out of the Polars dataframe
+
+    Parameters
+    -----------
+    df
+        Polars DataFrame or LazyFrame
+    parameters
+        Possible parameters of the algorithm (see get_cases_description)
+
+    Returns
+    -----------
+    duration_values
+        List of all the (sorted) duration values
+    """
+    cases = get_cases_description(df, parameters=parameters)
+
+    return sorted(x["caseDuration"] for x in cases.values())
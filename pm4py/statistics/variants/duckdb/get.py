@@ -0,0 +1,98 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union, Tuple, Set
+
+from pm4py.util import exec_utils, constants, duckdb_utils, xes_constants
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def get_variants_query(parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> str:
+    """
+    Gets the SQL query associating each case (column "case_id") to its variant (column "variant",
+    expressed as a list of activities)
+
+    Parameters
+    --------------
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Column that contains the activity
+            Parameters.TIMESTAMP_KEY -> Column that contains the timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    --------------
+    sql_query
+        SQL query (on the view duckdb_utils.LOG_TABLE)
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY))
+    timestamp_key = duckdb_utils.quote(exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY))
+    case_id_glue = duckdb_utils.quote(exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME))
+
+    return "SELECT " + case_id_glue + " AS case_id, LIST(" + activity_key + " ORDER BY " + timestamp_key + ", " + duckdb_utils.INDEX_COLUMN + ") AS variant FROM " + duckdb_utils.INDEXED_LOG_TABLE + " GROUP BY " + case_id_glue
+
+
+def get_variants_count(log: Any, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Dict[Tuple[str, ...], int]:
+    """
+    Gets the dictionary of variants (the query is executed by DuckDB)
+
+    Parameters
+    --------------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Column that contains the activity
+            Parameters.TIMESTAMP_KEY -> Column that contains the timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    --------------
+    variants_dict
+        Dictionary of variants (tuples of activities) in the log, along with their count
+    """
+    rows = duckdb_utils.fetch(log, "SELECT variant, COUNT(*) FROM (" + get_variants_query(parameters) + ") GROUP BY variant")
+
+    return {tuple(x): y for x, y in rows}
+
+
+def get_variants_set(log: Any, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Set[Tuple[str, ...]]:
+    """
+    Gets the set of variants (the query is executed by DuckDB)
+
+    Parameters
+    --------------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Column that contains the activity
+
+    Returns
+    --------------
+    variants_set
+        Set of variants in the log
+    """
+    return set(get_variants_count(log, parameters=parameters))
@@ -42,9 +42,9 @@ def get_variants_count(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] =
     if parameters is None:
         parameters = {}
 
-    variants_counter, case_variant = pandas_numpy_variants.apply(df, parameters=parameters)
+    cases, variant_ids, variants, counts = pandas_numpy_variants.get_variants_ids(df, parameters=parameters)
 
-    return variants_counter
+    return {variants[i]: int(counts[i]) for i in range(len(variants))}
 
 
 def get_variants_set(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> Union[Set[str], Set[List[str]]]:
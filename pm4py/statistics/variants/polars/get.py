@@ -0,0 +1,102 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Union, Tuple, Set
+
+import polars as pl
+
+from pm4py.util import exec_utils, constants, polars_utils, xes_constants
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def get_variants_df(df: Union[pl.DataFrame, pl.LazyFrame], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> pl.LazyFrame:
+    """
+    Gets a (lazy) dataframe associating each case to its variant (expressed as a list of activities)
+
+    Parameters
+    --------------
+    df
+        Polars DataFrame or LazyFrame
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Column that contains the activity
+            Parameters.TIMESTAMP_KEY -> Column that contains the timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    --------------
+    variants_df
+        Polars LazyFrame with the columns: case identifier, "variant"
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
+    case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+
+    return polars_utils.to_lazy(df).group_by(case_id_glue).agg(
+        pl.col(activity_key).sort_by(timestamp_key, maintain_order=True).alias("variant"))
+
+
+def get_variants_count(df: Union[pl.DataFrame, pl.LazyFrame], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Dict[Tuple[str, ...], int]:
+    """
+    Gets the dictionary of variants from the current Polars dataframe
+
+    Parameters
+    --------------
+    df
+        Polars DataFrame or LazyFrame
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Column that contains the activity
+            Parameters.TIMESTAMP_KEY -> Column that contains the timestamp
+            Parameters.CASE_ID_KEY -> Column that contains the case identifier
+
+    Returns
+    --------------
+    variants_dict
+        Dictionary of variants (tuples of activities) in the log, along with their count
+    """
+    variants = get_variants_df(df, parameters=parameters).group_by("variant").len().collect()
+
+    return {tuple(v): c for v, c in zip(variants["variant"].to_list(), variants["len"].to_list())}
+
+
+def get_variants_set(df: Union[pl.DataFrame, pl.LazyFrame], parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Set[Tuple[str, ...]]:
+    """
+    Gets the set of variants from the current Polars dataframe
+
+    Parameters
+    --------------
+    df
+        Polars DataFrame or LazyFrame
+    parameters
+        Possible parameters of the algorithm, including:
+            Parameters.ACTIVITY_KEY -> Column that contains the activity
+
+    Returns
+    --------------
+    variants_set
+        Set of variants in the log
+    """
+    return set(get_variants_count(df, parameters=parameters))
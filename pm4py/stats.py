@@ -27,6 +27,8 @@ import pandas as pd
 
 from pm4py.objects.log.obj import EventLog, Trace, EventStream
 from pm4py.util.pandas_utils import check_is_pandas_dataframe, check_pandas_dataframe_columns, insert_ev_in_tr_index
+from pm4py.util.polars_utils import check_is_polars_dataframe, check_polars_dataframe_columns
+from pm4py.util.duckdb_utils import check_is_duckdb_relation
 from pm4py.utils import get_properties, __event_log_deprecation_warning
 from pm4py.util import constants, pandas_utils
 from pm4py.objects.petri_net.obj import PetriNet
@@ -54,7 +56,14 @@ def get_start_activities(log: Union[EventLog, pd.DataFrame], activity_key: str =
 
     properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
 
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.statistics.start_activities.duckdb import get
+        return get.get_start_activities(log, parameters=properties)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        from pm4py.statistics.start_activities.polars import get
+        return get.get_start_activities(log, parameters=properties)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.statistics.start_activities.pandas import get
         return get.get_start_activities(log, parameters=properties)
@@ -83,7 +92,14 @@ def get_end_activities(log: Union[EventLog, pd.DataFrame], activity_key: str = "
 
     properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
 
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.statistics.end_activities.duckdb import get
+        return get.get_end_activities(log, parameters=properties)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        from pm4py.statistics.end_activities.polars import get
+        return get.get_end_activities(log, parameters=properties)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.statistics.end_activities.pandas import get
         return get.get_end_activities(log, parameters=properties)
@@ -159,7 +175,11 @@ def get_event_attribute_values(log: Union[EventLog, pd.DataFrame], attribute: st
 
     parameters = get_properties(log, case_id_key=case_id_key)
     parameters["keep_once_per_case"] = count_once_per_case
-    if check_is_pandas_dataframe(log):
+    if check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(log, case_id_key=case_id_key)
+        from pm4py.statistics.attributes.polars import get
+        return get.get_attribute_values(log, attribute, parameters=parameters)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, case_id_key=case_id_key)
         from pm4py.statistics.attributes.pandas import get
         return get.get_attribute_values(log, attribute, parameters=parameters)
@@ -248,7 +268,14 @@ def get_variants_as_tuples(log: Union[EventLog, pd.DataFrame], activity_key: str
 
     properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
 
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.statistics.variants.duckdb import get
+        return get.get_variants_count(log, parameters=properties)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        from pm4py.statistics.variants.polars import get
+        return get.get_variants_count(log, parameters=properties)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.statistics.variants.pandas import get
         return get.get_variants_count(log, parameters=properties)
@@ -661,7 +688,14 @@ def get_all_case_durations(log: Union[EventLog, pd.DataFrame], business_hours: b
     properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
     properties["business_hours"] = business_hours
     properties["business_hour_slots"] = business_hour_slots
-    if check_is_pandas_dataframe(log):
+    if check_is_duckdb_relation(log):
+        from pm4py.statistics.traces.generic.duckdb import case_statistics
+        return case_statistics.get_all_case_durations(log, parameters=properties)
+    elif check_is_polars_dataframe(log):
+        check_polars_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        from pm4py.statistics.traces.generic.polars import case_statistics
+        return case_statistics.get_all_case_durations(log, parameters=properties)
+    elif check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
         from pm4py.statistics.traces.generic.pandas import case_statistics
         cd = case_statistics.get_cases_description(log, parameters=properties)
@@ -0,0 +1,203 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import warnings
+from enum import Enum
+from typing import Optional, Dict, Any, List
+
+from pm4py.streaming.importer.xes.variants import xes_trace_stream
+from pm4py.util import exec_utils, xes_constants
+
+
+class Parameters(Enum):
+    BATCH_SIZE = "batch_size"
+    SCHEMA_INFERENCE_TRACES = "schema_inference_traces"
+    FORMAT = "format"
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+
+
+PARQUET = "parquet"
+FEATHER = "feather"
+
+
+def __flatten_trace(trace, case_attribute_prefix: str) -> List[Dict[str, Any]]:
+    """
+    Transforms a trace into a list of rows (one for each event), in which the attributes
+    of the trace are reported with the given prefix. Nested attributes are reported with their value.
+    """
+    case_attributes = {}
+    for k, v in trace.attributes.items():
+        case_attributes[case_attribute_prefix + k] = v[xes_constants.KEY_VALUE] if type(v) is dict else v
+    rows = []
+    for event in trace:
+        row = {}
+        for k, v in event.items():
+            row[k] = v[xes_constants.KEY_VALUE] if type(v) is dict else v
+        row.update(case_attributes)
+        rows.append(row)
+    return rows
+
+
+def __infer_schema(rows: List[Dict[str, Any]]):
+    """
+    Infers the schema of the output file from the given rows.
+    The timestamps are stored with nanosecond precision (as in Pandas), and the columns
+    that contain only missing values are typed as strings.
+    """
+    import pyarrow as pa
+
+    fields = []
+    for field in pa.Table.from_pylist(rows).schema:
+        if pa.types.is_timestamp(field.type):
+            field = field.with_type(pa.timestamp("ns", tz=field.type.tz))
+        elif pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields)
+
+
+def __to_record_batch(rows: List[Dict[str, Any]], schema, dropped_columns: set):
+    """
+    Transforms a list of rows into a record batch following the given schema.
+    The columns that are not in the schema are dropped (and reported in the provided set).
+    """
+    import pyarrow as pa
+
+    columns = {field.name: [] for field in schema}
+    for row in rows:
+        for k in row:
+            if k not in columns:
+                dropped_columns.add(k)
+        for name, values in columns.items():
+            values.append(row.get(name))
+
+    arrays = []
+    for field in schema:
+        array = None
+        try:
+            # the direct conversion to an integer type would silently truncate the floats: in such case, and when
+            # the direct conversion fails, the values are converted following their own type and then cast,
+            # checking that no value is truncated or overflows
+            if not pa.types.is_integer(field.type):
+                try:
+                    array = pa.array(columns[field.name], type=field.type)
+                except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+                    pass
+            if array is None:
+                array = pa.array(columns[field.name]).cast(field.type, safe=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError, OverflowError) as e:
+            raise Exception("the values of the attribute '" + str(field.name) + "' are not coherent with the type"
+                            " inferred from the first traces (" + str(field.type) + "). Consider increasing the"
+                            " number of traces used for the inference of the schema.") from e
+        arrays.append(array)
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def apply(xes_path: str, output_path: str, parameters: Optional[Dict[Any, Any]] = None) -> int:
+    """
+    Converts a XES file into a Parquet (or Feather) file, without materializing the event log in memory.
+    The traces are read one at a time by the streaming (iterparse-based) XES importer, and the events are
+    written in record batches of fixed size (each one is a row group of the Parquet file). The schema of the
+    output file is inferred from the first traces: the attributes that appear only later are not included.
+    The output file follows the format of the dataframes of pm4py (one row per event; the trace attributes
+    are reported with the case: prefix) and can be read with pd.read_parquet / pd.read_feather.
+
+    Parameters
+    ----------------
+    xes_path
+        Path to the XES file
+    output_path
+        Path to the output file
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.BATCH_SIZE => number of events of each record batch (default: 100000)
+        - Parameters.SCHEMA_INFERENCE_TRACES => number of traces used to infer the schema (default: 1000)
+        - Parameters.FORMAT => format of the output file: parquet (default) or feather
+        - Parameters.CASE_ATTRIBUTE_PREFIX => the prefix of the trace attributes (default: case:)
+
+    Returns
+    ----------------
+    num_events
+        Number of events written
+    """
+    if parameters is None:
+        parameters = {}
+
+    import pyarrow as pa
+
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 100000)
+    schema_inference_traces = exec_utils.get_param_value(Parameters.SCHEMA_INFERENCE_TRACES, parameters, 1000)
+    output_format = exec_utils.get_param_value(Parameters.FORMAT, parameters, PARQUET)
+    case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters, "case:")
+
+    if output_format not in [PARQUET, FEATHER]:
+        raise Exception("unsupported format: " + str(output_format))
+
+    reader = xes_trace_stream.apply(xes_path)
+
+    try:
+        rows = []
+        num_traces = 0
+        for trace in reader:
+            if trace is None:
+                continue
+            rows.extend(__flatten_trace(trace, case_attribute_prefix))
+            num_traces += 1
+            if num_traces >= schema_inference_traces:
+                break
+
+        if not rows:
+            return 0
+
+        schema = __infer_schema(rows)
+
+        if output_format == PARQUET:
+            import pyarrow.parquet as pq
+            writer = pq.ParquetWriter(output_path, schema)
+        else:
+            writer = pa.ipc.new_file(output_path, schema)
+
+        dropped_columns = set()
+        num_events = 0
+
+        try:
+            while True:
+                while len(rows) >= batch_size:
+                    writer.write_batch(__to_record_batch(rows[:batch_size], schema, dropped_columns))
+                    num_events += batch_size
+                    del rows[:batch_size]
+                trace = next(reader, None)
+                if trace is None:
+                    if not reader.reading_log:
+                        break
+                    continue
+                rows.extend(__flatten_trace(trace, case_attribute_prefix))
+
+            if rows:
+                writer.write_batch(__to_record_batch(rows, schema, dropped_columns))
+                num_events += len(rows)
+        finally:
+            writer.close()
+    finally:
+        reader.close()
+
+    if dropped_columns:
+        warnings.warn("the following attributes have not been included in the output file, since they were not"
+                      " present in the traces used to infer the schema: " + ", ".join(sorted(str(x) for x in
+                                                                                           dropped_columns)))
+
+    return num_events
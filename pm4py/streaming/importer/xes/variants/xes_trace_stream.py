@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+import gzip
 import logging
 from enum import Enum
 
@@ -65,6 +66,7 @@ class StreamingTraceXesReader:
         self.acceptance_condition = exec_utils.get_param_value(Parameters.ACCEPTANCE_CONDITION, parameters,
                                                                lambda x: True)
         self.date_parser = dt_parser.get()
+        self.file = None
         self.reset()
 
     def __iter__(self):
@@ -103,16 +105,29 @@ class StreamingTraceXesReader:
         # reset the variables
         from lxml import etree
 
+        self.close()
         self.context = None
         self.tree = None
         # initialize the variables
-        self.context = etree.iterparse(self.path, events=[_EVENT_START, _EVENT_END])
+        if self.path.lower().endswith(".gz"):
+            self.file = gzip.open(self.path, "rb")
+        else:
+            self.file = open(self.path, "rb")
+        self.context = etree.iterparse(self.file, events=[_EVENT_START, _EVENT_END])
         self.trace = None
         self.event = None
         self.reading_log = True
         self.reading_trace = False
         self.tree = {}
 
+    def close(self):
+        """
+        Closes the file handle of the XES log (if it is open)
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
     def read_trace(self):
         """
         Gets the next trace from the iterator
@@ -120,8 +135,11 @@ class StreamingTraceXesReader:
         Returns
         ------------
         trace
-            Trace
+            Trace (None if the end of the log has been reached)
         """
+        if not self.reading_log:
+            # the log has been entirely read (and the file closed)
+            return None
         tree = self.tree
         while True:
             tree_event, elem = next(self.context)
@@ -223,6 +241,7 @@ class StreamingTraceXesReader:
 
                 elif elem.tag.endswith(xes_constants.TAG_LOG):
                     self.reading_log = False
+                    self.close()
                     break
 
 
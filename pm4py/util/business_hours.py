@@ -15,8 +15,11 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 import math
-from datetime import timedelta, datetime, time
-from typing import List, Tuple
+from datetime import timedelta, datetime, time, date
+from typing import List, Tuple, Optional, Any
+
+import numpy as np
+import pandas as pd
 
 from pm4py.util import constants
 from pm4py.util.dt_parsing.variants import strpfromiso
@@ -79,8 +82,14 @@ class BusinessHours:
                 self.business_hour_slots_unified[-1][1] = max(self.business_hour_slots_unified[-1][1], end)
             else:
                 self.business_hour_slots_unified.append([begin, end])
+        if self.business_hour_slots_unified:
+            # a slot spanning over the end of the week stops where the first slot of the following week starts
+            # (to not count twice the overlapping time)
+            last_slot = self.business_hour_slots_unified[-1]
+            last_slot[1] = max(last_slot[0], min(last_slot[1], self.business_hour_slots_unified[0][0] + 7 * 24 * 60 * 60))
 
-        # work calendar (it permits querying if a given day is a working day in a given culture) - not used yet
+        # work calendar (it permits querying if a given day is a working day in a given culture): the occurrences
+        # of the business hour slots starting in a non-working day are not counted
         self.work_calendar = kwargs[
             "work_calendar"] if "work_calendar" in kwargs else constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR
 
@@ -99,8 +108,16 @@ class BusinessHours:
             bh_end = datetime.combine(week_start, time.min) + timedelta(days=end_day_of_week) + timedelta(
                 seconds=end_seconds_of_day)
 
+            if bhe > 7 * 24 * 60 * 60:
+                # the occurrence of the slot started in the previous week might span over the first timestamp
+                overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start - timedelta(days=7),
+                                                        bh_end - timedelta(days=7))
+                if overlapping_time > 0 and self.__is_working_day((bh_start - timedelta(days=7)).date()):
+                    sum += overlapping_time
+
             overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start, bh_end)
-            sum += overlapping_time
+            if overlapping_time > 0 and self.__is_working_day(bh_start.date()):
+                sum += overlapping_time
 
             while True:
                 bh_start += timedelta(days=7)
@@ -111,6 +128,174 @@ class BusinessHours:
                 if overlapping_time <= 0:
                     break
 
-                sum += overlapping_time
+                if self.__is_working_day(bh_start.date()):
+                    sum += overlapping_time
 
         return sum
+
+    def __is_working_day(self, day: date) -> bool:
+        return self.work_calendar is None or self.work_calendar.is_working_day(day)
+
+
+class VectorizedBusinessHours:
+    """
+    Vectorized computation of the business hours between couples of timestamps.
+
+    The occurrences of the (unified) business hour slots in the weeks covered by the timestamps are laid on a
+    timeline, along with the cumulative count of working seconds at their end. The working seconds elapsed
+    from the beginning of the timeline up to a timestamp are then obtained with an array lookup, and the business
+    hours between two timestamps as the difference of two lookups.
+    """
+
+    WEEK_NS = 7 * 24 * 60 * 60 * 10 ** 9
+    # 1970-01-05 (the first Monday after the epoch)
+    WEEK_ORIGIN_NS = 4 * 24 * 60 * 60 * 10 ** 9
+
+    def __init__(self, business_hour_slots: Optional[List[Tuple[int]]] = None,
+                 work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR):
+        if business_hour_slots is None:
+            business_hour_slots = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+
+        unified = []
+        for begin, end in sorted(business_hour_slots):
+            if unified and unified[-1][1] >= begin - 1:
+                unified[-1][1] = max(unified[-1][1], end)
+            else:
+                unified.append([begin, end])
+
+        self.slots_start = np.array([x[0] for x in unified], dtype=np.int64) * 10 ** 9
+        self.slots_end = np.array([x[1] for x in unified], dtype=np.int64) * 10 ** 9
+        self.work_calendar = work_calendar
+
+        self.__first_week = None
+        self.__last_week = None
+        self.__occ_start = None
+        self.__occ_end = None
+        self.__occ_lengths = None
+        self.__occ_cumulative = None
+
+    @staticmethod
+    def __to_naive_ns(timestamps: Any) -> np.ndarray:
+        timestamps = pd.to_datetime(pd.Series(timestamps) if not isinstance(timestamps, pd.Series) else timestamps)
+        if timestamps.dt.tz is not None:
+            # as in BusinessHours, the local time is considered (the timezone is dropped)
+            timestamps = timestamps.dt.tz_localize(None)
+        return timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+    def __build(self, first_week: int, last_week: int):
+        weeks = np.arange(first_week, last_week + 1, dtype=np.int64)
+        week_starts = self.WEEK_ORIGIN_NS + weeks * self.WEEK_NS
+        occ_start = (week_starts[:, None] + self.slots_start[None, :]).ravel()
+        occ_end = (week_starts[:, None] + self.slots_end[None, :]).ravel()
+        # slots spanning over the start of the following week should not be counted twice
+        occ_end = np.minimum(occ_end, np.append(occ_start[1:], occ_end[-1:]))
+        occ_end = np.maximum(occ_start, occ_end)
+        lengths = occ_end - occ_start
+
+        if self.work_calendar is not None:
+            days = occ_start.astype("datetime64[ns]").astype("datetime64[D]")
+            unique_days, inverse = np.unique(days, return_inverse=True)
+            working = np.array([bool(self.work_calendar.is_working_day(d.item())) for d in unique_days], dtype=bool)
+            lengths = np.where(working[inverse], lengths, 0)
+
+        self.__first_week = first_week
+        self.__last_week = last_week
+        self.__occ_start = occ_start
+        self.__occ_end = occ_end
+        self.__occ_lengths = lengths
+        self.__occ_cumulative = np.concatenate(([0], np.cumsum(lengths)))
+
+    def get_cumulative_ns(self, timestamps_ns: np.ndarray) -> np.ndarray:
+        """
+        Gets the working nanoseconds elapsed from the beginning of the timeline up to the provided timestamps
+        (the timeline is extended when needed, hence only the differences between values returned by the same call
+        are meaningful)
+
+        Parameters
+        -----------------
+        timestamps_ns
+            Naive timestamps (expressed as nanoseconds since the epoch)
+
+        Returns
+        -----------------
+        cumulative
+            Cumulative working nanoseconds
+        """
+        if len(timestamps_ns) == 0 or len(self.slots_start) == 0:
+            return np.zeros(len(timestamps_ns), dtype=np.int64)
+
+        # the week before the first timestamp is included, as its slots might end in the following week
+        first_week = int((timestamps_ns.min() - self.WEEK_ORIGIN_NS) // self.WEEK_NS) - 1
+        last_week = int((timestamps_ns.max() - self.WEEK_ORIGIN_NS) // self.WEEK_NS)
+        if self.__first_week is None or first_week < self.__first_week or last_week > self.__last_week:
+            if self.__first_week is not None:
+                first_week = min(first_week, self.__first_week)
+                last_week = max(last_week, self.__last_week)
+            self.__build(first_week, last_week)
+
+        # index of the first occurrence not ending before the timestamp
+        idx = np.searchsorted(self.__occ_end, timestamps_ns, side="right")
+        cumulative = self.__occ_cumulative[idx]
+        inside = idx < len(self.__occ_start)
+        idx_inside = idx[inside]
+        partial = np.clip(timestamps_ns[inside] - self.__occ_start[idx_inside], 0, self.__occ_lengths[idx_inside])
+        # if the day of the occurrence is not a working day, its length is 0 and nothing is added
+        cumulative[inside] += partial
+        return cumulative
+
+    def get_seconds(self, st: Any, et: Any) -> np.ndarray:
+        """
+        Calculates the business hours between the provided couples of timestamps
+
+        Parameters
+        -----------------
+        st
+            Start timestamps (array-like / Pandas series)
+        et
+            Complete timestamps (array-like / Pandas series)
+
+        Returns
+        -----------------
+        diff
+            Numpy array containing the difference (in seconds) in business hours for each couple of timestamps
+            (NaN if one of the timestamps is missing)
+        """
+        st = VectorizedBusinessHours.__to_naive_ns(st)
+        et = VectorizedBusinessHours.__to_naive_ns(et)
+        missing = (st == np.iinfo(np.int64).min) | (et == np.iinfo(np.int64).min)
+        if missing.all():
+            return np.full(len(st), np.nan)
+        if missing.any():
+            # the missing values are mapped to an existing timestamp in order to not extend the timeline
+            st = np.where(missing, st[~missing][0], st)
+            et = np.where(missing, st[~missing][0], et)
+
+        cumulative = self.get_cumulative_ns(np.concatenate((st, et)))
+        diff = np.maximum(cumulative[len(st):] - cumulative[:len(st)], 0) / 10 ** 9
+        diff[missing] = np.nan
+        return diff
+
+
+def soj_time_business_hours_diff_vectorized(st: Any, et: Any, business_hour_slots: List[Tuple[int]],
+                                            work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR) -> np.ndarray:
+    """
+    Vectorized version of soj_time_business_hours_diff, calculating the difference between the provided couples of
+    timestamps based on the business hours
+
+    Parameters
+    -----------------
+    st
+        Start timestamps (array-like / Pandas series)
+    et
+        Complete timestamps (array-like / Pandas series)
+    business_hour_slots
+        work schedule of the company (see soj_time_business_hours_diff)
+    work_calendar
+        work calendar (it permits querying if a given day is a working day in a given culture)
+
+    Returns
+    -----------------
+    diff
+        Numpy array containing the differences in business hours
+    """
+    return VectorizedBusinessHours(business_hour_slots, work_calendar).get_seconds(st, et)
@@ -14,7 +14,10 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from typing import List, Tuple, Any, Counter
+from collections import Counter as CounterClass
+from typing import List, Tuple, Any, Counter, Optional
+
+import numpy as np
 
 UnivariateCompressedTrace = List[Any]
 MultivariateCompressedTrace = List[Tuple[Any]]
@@ -33,3 +36,225 @@ MLT = MultivariateLookupTable
 
 UnivariateVariantCompressedLog = Counter[Tuple[Any]]
 UVCL = UnivariateVariantCompressedLog
+
+
+class EncodedUVCL(object):
+    """
+    Integer-encoded univariate variant compressed log.
+
+    The activities are encoded as integers (following their sorted order), and the variants are packed in a single
+    array of events (delimited by offsets) along with their counts. The DFG, the alphabet and the projections on
+    subsets of activities/variants are computed with array operations. The logs derived by projection share the
+    encoding of the original log, and may contain repeated variants (merged only when converted back to UVCL).
+    """
+
+    def __init__(self, activities: List[Any], events: np.ndarray, offsets: np.ndarray, counts: np.ndarray):
+        self.activities = activities
+        self.events = events
+        self.offsets = offsets
+        self.counts = counts
+
+    @staticmethod
+    def from_uvcl(log: UVCL, activities: Optional[List[Any]] = None) -> "EncodedUVCL":
+        """
+        Encodes an UVCL
+
+        Parameters
+        ----------------
+        log
+            UVCL
+        activities
+            (if provided) list of activities used as encoding (should contain all the activities of the log)
+
+        Returns
+        ----------------
+        encoded_log
+            Integer-encoded log
+        """
+        if activities is None:
+            activities = sorted(set(e for t in log for e in t))
+        index = {a: i for i, a in enumerate(activities)}
+        lengths = np.fromiter((len(t) for t in log), dtype=np.int64, count=len(log))
+        offsets = np.zeros(len(log) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        events = np.fromiter((index[e] for t in log for e in t), dtype=np.int64, count=int(offsets[-1]))
+        counts = np.fromiter(log.values(), dtype=np.int64, count=len(log))
+        return EncodedUVCL(activities, events, offsets, counts)
+
+    def to_uvcl(self) -> UVCL:
+        """
+        Decodes the log to an UVCL (merging the repeated variants)
+        """
+        log = CounterClass()
+        decoded = [self.activities[e] for e in self.events.tolist()]
+        offsets = self.offsets.tolist()
+        for i, c in enumerate(self.counts.tolist()):
+            log[tuple(decoded[offsets[i]:offsets[i + 1]])] += c
+        return log
+
+    def get_lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def get_alphabet_mask(self) -> np.ndarray:
+        """
+        Gets a boolean mask (indexed by the codes of the activities) of the activities occurring in the log
+        """
+        return np.bincount(self.events, minlength=len(self.activities)) > 0
+
+    def get_alphabet(self) -> List[Any]:
+        """
+        Gets the (sorted) alphabet of the log
+        """
+        return [self.activities[i] for i in np.flatnonzero(self.get_alphabet_mask()).tolist()]
+
+    def discover_dfg(self) -> Any:
+        """
+        Discovers the DFG of the log (the arcs are inserted in the order of first occurrence, the start/end
+        activities following the order of the alphabet)
+        """
+        from pm4py.objects.dfg.obj import DFG
+
+        dfg = DFG()
+        n = len(self.activities)
+        lengths = self.get_lengths()
+        weights = np.repeat(self.counts, lengths)
+        non_empty = lengths > 0
+
+        if len(self.events) > 1:
+            # the last event of each variant is not followed by any event of the same variant
+            is_last = np.zeros(len(self.events), dtype=bool)
+            is_last[self.offsets[1:][non_empty] - 1] = True
+            positions = np.flatnonzero(~is_last[:-1])
+            if len(positions) > 0:
+                pairs = self.events[positions] * n + self.events[positions + 1]
+                unique_pairs, first_index, inverse = np.unique(pairs, return_index=True, return_inverse=True)
+                frequency = np.bincount(inverse.ravel(), weights=weights[positions]).astype(np.int64)
+                order = np.argsort(first_index, kind="stable")
+                for p, f in zip(unique_pairs[order].tolist(), frequency[order].tolist()):
+                    dfg.graph[(self.activities[p // n], self.activities[p % n])] = f
+
+        starts = np.bincount(self.events[self.offsets[:-1][non_empty]], weights=self.counts[non_empty],
+                             minlength=n).astype(np.int64)
+        ends = np.bincount(self.events[self.offsets[1:][non_empty] - 1], weights=self.counts[non_empty],
+                           minlength=n).astype(np.int64)
+        for i in np.flatnonzero(starts).tolist():
+            dfg.start_activities[self.activities[i]] = int(starts[i])
+        for i in np.flatnonzero(ends).tolist():
+            dfg.end_activities[self.activities[i]] = int(ends[i])
+
+        return dfg
+
+    def project_activities(self, activities_mask: np.ndarray) -> "EncodedUVCL":
+        """
+        Projects the log on a subset of activities (keeping the same encoding)
+
+        Parameters
+        ----------------
+        activities_mask
+            Boolean mask (indexed by the codes of the activities) of the activities to keep
+
+        Returns
+        ----------------
+        projected_log
+            Projected log
+        """
+        keep = activities_mask[self.events]
+        cumulative = np.concatenate(([0], np.cumsum(keep, dtype=np.int64)))
+        offsets = cumulative[self.offsets]
+        return EncodedUVCL(self.activities, self.events[keep], offsets, self.counts)
+
+    def select_variants(self, variants_mask: np.ndarray) -> "EncodedUVCL":
+        """
+        Selects a subset of the variants of the log (keeping the same encoding)
+
+        Parameters
+        ----------------
+        variants_mask
+            Boolean mask of the variants to keep
+
+        Returns
+        ----------------
+        filtered_log
+            Filtered log
+        """
+        lengths = self.get_lengths()
+        events_mask = np.repeat(variants_mask, lengths)
+        offsets = np.zeros(int(np.count_nonzero(variants_mask)) + 1, dtype=np.int64)
+        np.cumsum(lengths[variants_mask], out=offsets[1:])
+        return EncodedUVCL(self.activities, self.events[events_mask], offsets, self.counts[variants_mask])
+
+    def merge_variants(self, keep_last_count: bool = False) -> "EncodedUVCL":
+        """
+        Merges the repeated variants of the log, each one in the position of its first occurrence (keeping the same
+        encoding)
+
+        Parameters
+        ----------------
+        keep_last_count
+            If True, the merged variant gets the count of the last occurrence (instead of the sum of the counts)
+
+        Returns
+        ----------------
+        merged_log
+            Log without repeated variants
+        """
+        events = self.events.tolist()
+        offsets = self.offsets.tolist()
+        first = dict()
+        counts = dict()
+        for i, c in enumerate(self.counts.tolist()):
+            variant = tuple(events[offsets[i]:offsets[i + 1]])
+            if variant not in first:
+                first[variant] = i
+                counts[variant] = c
+            elif keep_last_count:
+                counts[variant] = c
+            else:
+                counts[variant] += c
+        if len(first) == len(offsets) - 1:
+            return self
+        variants_mask = np.zeros(len(offsets) - 1, dtype=bool)
+        variants_mask[list(first.values())] = True
+        merged = self.select_variants(variants_mask)
+        merged.counts = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        return merged
+
+    def extract_segments(self, starts: np.ndarray, ends: np.ndarray, variants: np.ndarray,
+                         events_mask: Optional[np.ndarray] = None) -> "EncodedUVCL":
+        """
+        Extracts segments of the variants of the log as the variants of a new log (keeping the same encoding)
+
+        Parameters
+        ----------------
+        starts
+            Position (in the events of the log) of the first event of each segment
+        ends
+            Position (in the events of the log) following the last event of each segment
+        variants
+            Variant from which each segment is extracted (its count is the count of the segment)
+        events_mask
+            (if provided) Boolean mask of the events of the log to keep inside the segments
+
+        The segments should be sorted by position and should not overlap (empty segments are allowed)
+
+        Returns
+        ----------------
+        extracted_log
+            Log containing a variant for each segment
+        """
+        boundaries = np.zeros(len(self.events) + 1, dtype=np.int64)
+        np.add.at(boundaries, starts, 1)
+        np.add.at(boundaries, ends, -1)
+        keep = np.cumsum(boundaries[:-1]) > 0
+        if events_mask is not None:
+            keep &= events_mask
+        cumulative = np.concatenate(([0], np.cumsum(keep, dtype=np.int64)))
+        offsets = np.append(cumulative[starts], cumulative[-1])
+        return EncodedUVCL(self.activities, self.events[keep], offsets, self.counts[variants])
+
+    def get_activities_mask(self, activities) -> np.ndarray:
+        """
+        Gets a boolean mask (indexed by the codes of the activities) from a collection of activities
+        """
+        activities = set(activities)
+        return np.array([a in activities for a in self.activities], dtype=bool)
@@ -23,7 +23,7 @@ import pandas as pd
 
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.log.obj import EventLog
-from pm4py.util.compression.dtypes import UCL, MCL, ULT, MLT, UVCL
+from pm4py.util.compression.dtypes import UCL, MCL, ULT, MLT, UVCL, EncodedUVCL
 from pm4py.util import pandas_utils
 
 
@@ -42,7 +42,7 @@ def project_univariate(log: Union[EventLog, pd.DataFrame], key: str = 'concept:n
     :param df_glue: key to use for combining events into traces when the input is a dataframe.
     :param df_sorting_criterion_key: key to use as a sorting criterion for traces (typically timestamps)
     '''
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         return [[e[key] for e in t] for t in log]
     else:
         log = log.loc[:, [key, df_glue, df_sorting_criterion_key]]
@@ -79,9 +79,9 @@ def compress_univariate(log: Union[EventLog, pd.DataFrame], key: str = 'concept:
     if pandas_utils.check_is_pandas_dataframe(log):
         log = log.loc[:, [key, df_glue, df_sorting_criterion_key]]
     lookup = list(set([x for xs in [[e[key] for e in t] for t in log]
-                       for x in xs])) if type(log) is EventLog else pandas_utils.format_unique(log[key].unique())
+                       for x in xs])) if isinstance(log, EventLog) else pandas_utils.format_unique(log[key].unique())
     lookup_inv = {lookup[i]: i for i in range(len(lookup))}
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         return [[lookup_inv[t[i][key]] for i in range(0, len(t))] for t in log], lookup
     else:
         log[key] = log[key].map(lookup_inv)
@@ -132,9 +132,9 @@ def compress_multivariate(log: Union[EventLog, pd.DataFrame], keys: List[str] =
     for key in keys:
         if key not in uncompressed:
             lookup[key] = list(set([x for xs in [[e[key] for e in t] for t in log]
-                                    for x in xs])) if type(log) is EventLog else pandas_utils.format_unique(log[key].unique())
+                                    for x in xs])) if isinstance(log, EventLog) else pandas_utils.format_unique(log[key].unique())
             lookup_inv[key] = {lookup[key][i]: i for i in range(len(lookup[key]))}
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         encoded = list()
         for t in log:
             tr = list()
@@ -181,16 +181,13 @@ def discover_dfg(log: Union[UCL, MCL], index: int = 0) -> DFG:
 
 
 def discover_dfg_uvcl(log: UVCL) -> DFG:
-    dfg = DFG()
-    [dfg.graph.update({(t[i], t[i + 1]): log[t]}) for t in log for i in range(0, len(t) - 1) if len(t)]
-    for a in get_alphabet(log):
-        for t in log:
-            if len(t) > 0:
-                if t[0] == a:
-                    dfg.start_activities.update({a: log[t]})
-                if t[len(t) - 1] == a:
-                    dfg.end_activities.update({a: log[t]})
-    return dfg
+    """
+    Discover a DFG object from an univariate variant compressed log
+
+    :rtype: ``DFG``
+    :param log: univariate variant compressed log
+    """
+    return EncodedUVCL.from_uvcl(log).discover_dfg()
 
 
 def get_start_activities(log: Union[UCL, MCL, UVCL], index: int = 0) -> TCounter[Any]:
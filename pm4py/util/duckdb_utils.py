@@ -0,0 +1,165 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import datetime
+import importlib.util
+import os
+from typing import Any, List, Tuple
+
+# name of the view that refers to the relation in the SQL queries
+LOG_TABLE = "pm4py_log"
+# column containing the position of the events in the relation (used to break the ties between the timestamps,
+# as the position of the rows is used by the Pandas implementation); the numbering is executed by a streaming window
+INDEX_COLUMN = "pm4py_index"
+INDEXED_LOG_TABLE = "(SELECT *, ROW_NUMBER() OVER () AS " + INDEX_COLUMN + " FROM " + LOG_TABLE + ")"
+
+
+def check_is_duckdb_relation(log: Any) -> bool:
+    """
+    Checks if a log object should be processed by the DuckDB backend, i.e., if it is a DuckDB relation
+    or the path to a Parquet file (or to a directory of Parquet files)
+
+    Parameters
+    --------------
+    log
+        Log object
+
+    Returns
+    --------------
+    boolean
+        Boolean value
+    """
+    if importlib.util.find_spec("duckdb"):
+        if isinstance(log, str):
+            if os.path.isdir(log):
+                return any(x.lower().endswith(".parquet") for x in os.listdir(log))
+            return log.lower().endswith(".parquet")
+        import duckdb
+        return isinstance(log, duckdb.DuckDBPyRelation)
+    return False
+
+
+def get_relation(log: Any) -> Any:
+    """
+    Gets a DuckDB relation from the provided log object (the Parquet files are scanned lazily,
+    so the log is never loaded entirely in memory)
+
+    Parameters
+    --------------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+
+    Returns
+    --------------
+    relation
+        DuckDB relation
+    """
+    import duckdb
+
+    if isinstance(log, str):
+        if os.path.isdir(log):
+            log = os.path.join(log, "*.parquet")
+        return duckdb.read_parquet(log)
+    return log
+
+
+def query(log: Any, sql_query: str) -> Any:
+    """
+    Executes (lazily) a SQL query on the view LOG_TABLE referring to the provided log object
+
+    Parameters
+    --------------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    sql_query
+        SQL query
+
+    Returns
+    --------------
+    relation
+        DuckDB relation (result of the query)
+    """
+    return get_relation(log).query(LOG_TABLE, sql_query)
+
+
+def fetch(log: Any, sql_query: str) -> List[Tuple]:
+    """
+    Executes a SQL query on the view LOG_TABLE referring to the provided log object, and fetches the results
+
+    Parameters
+    --------------
+    log
+        DuckDB relation, or path to a Parquet file (or to a directory of Parquet files)
+    sql_query
+        SQL query
+
+    Returns
+    --------------
+    rows
+        Rows of the result
+    """
+    return query(log, sql_query).fetchall()
+
+
+def quote(identifier: str) -> str:
+    """
+    Quotes an identifier (e.g., a column name such as concept:name) to be used in a SQL query
+    """
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def literal(value: Any) -> str:
+    """
+    Expresses a Python value (string, number, boolean, None, datetime, or a collection of them) as a SQL literal
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            return "TIMESTAMPTZ '" + value.isoformat() + "'"
+        return "TIMESTAMP '" + value.isoformat() + "'"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(literal(x) for x in value) + "]"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def literal_list(values: Any) -> str:
+    """
+    Expresses a collection of values as a SQL list of literals, to be used in an IN clause
+    """
+    values = list(values)
+    if not values:
+        return "(NULL)"
+    return "(" + ", ".join(literal(x) for x in values) + ")"
+
+
+def get_comparable_datetime(log: Any, timestamp_key: str, dt: datetime.datetime) -> datetime.datetime:
+    """
+    Adapts a (timezone-aware) datetime object to the type of the timestamp column of the relation
+    (TIMESTAMP or TIMESTAMP WITH TIME ZONE), so that it can be compared with the values of the column
+    """
+    relation = get_relation(log)
+    column_type = str(relation.types[relation.columns.index(timestamp_key)]).upper()
+    if "TIME ZONE" in column_type:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+    elif dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return dt
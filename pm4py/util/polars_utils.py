@@ -0,0 +1,158 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import datetime
+import importlib.util
+from typing import Any, Optional
+
+
+def check_is_polars_dataframe(log: Any) -> bool:
+    """
+    Checks if a log object is a Polars dataframe (eager or lazy)
+
+    Parameters
+    --------------
+    log
+        Log object
+
+    Returns
+    --------------
+    boolean
+        Boolean value (True if the log object is a Polars DataFrame or LazyFrame)
+    """
+    if importlib.util.find_spec("polars"):
+        import polars as pl
+        return isinstance(log, (pl.DataFrame, pl.LazyFrame))
+    return False
+
+
+def to_lazy(df: Any) -> Any:
+    """
+    Gets a lazy version of the provided Polars dataframe, so that the queries of the
+    different backends can be optimized (and executed in parallel) by the Polars engine
+
+    Parameters
+    --------------
+    df
+        Polars DataFrame or LazyFrame
+
+    Returns
+    --------------
+    lazy_df
+        Polars LazyFrame
+    """
+    import polars as pl
+
+    if isinstance(df, pl.LazyFrame):
+        return df
+    return df.lazy()
+
+
+def return_same_type(original: Any, lazy_df: Any) -> Any:
+    """
+    Returns the result of a query (expressed on a LazyFrame) with the same type of the original dataframe,
+    i.e., the query is executed only if the original dataframe is eager
+
+    Parameters
+    --------------
+    original
+        Original Polars dataframe (DataFrame or LazyFrame)
+    lazy_df
+        Polars LazyFrame
+
+    Returns
+    --------------
+    df
+        Polars DataFrame (if the original dataframe is a DataFrame) or LazyFrame
+    """
+    import polars as pl
+
+    if isinstance(original, pl.LazyFrame):
+        return lazy_df
+    return lazy_df.collect()
+
+
+def get_columns(df: Any) -> list:
+    """
+    Gets the columns of a Polars dataframe (without executing the query, for a LazyFrame)
+
+    Parameters
+    --------------
+    df
+        Polars DataFrame or LazyFrame
+
+    Returns
+    --------------
+    columns
+        List of columns
+    """
+    return list(df.collect_schema().names())
+
+
+def check_polars_dataframe_columns(df: Any, activity_key: Optional[str] = None, case_id_key: Optional[str] = None,
+                                   timestamp_key: Optional[str] = None, start_timestamp_key: Optional[str] = None):
+    """
+    Checks if the Polars dataframe contains all the required columns (and the column types).
+    If not, raise an exception
+
+    Parameters
+    --------------
+    df
+        Polars DataFrame or LazyFrame
+    """
+    import polars as pl
+
+    schema = df.collect_schema()
+
+    for key, name in [(case_id_key, "case ID"), (activity_key, "activity")]:
+        if key is not None:
+            if key not in schema:
+                raise Exception("the specified " + name + " column is not contained in the dataframe. Available columns: " + str(sorted(schema.names())))
+            if not (schema[key] == pl.String or isinstance(schema[key], (pl.Categorical, pl.Enum))):
+                raise Exception("the " + name + " column should be of type string.")
+
+    for key, name in [(timestamp_key, "timestamp"), (start_timestamp_key, "start timestamp")]:
+        if key is not None:
+            if key not in schema:
+                raise Exception("the specified " + name + " column is not contained in the dataframe. Available columns: " + str(sorted(schema.names())))
+            if not schema[key].is_temporal():
+                raise Exception("the " + name + " column should be of type datetime.")
+
+
+def get_comparable_datetime(dt: datetime.datetime, dtype: Any) -> datetime.datetime:
+    """
+    Adapts a (timezone-aware) datetime object to the time zone of a Polars datetime column,
+    so that it can be compared with the values of the column
+
+    Parameters
+    --------------
+    dt
+        Datetime object
+    dtype
+        Polars datatype of the column
+
+    Returns
+    --------------
+    dt
+        Datetime object comparable with the values of the column
+    """
+    time_zone = getattr(dtype, "time_zone", None)
+    if time_zone is None:
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    elif dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt
@@ -41,7 +41,7 @@ def format_dataframe(df: pd.DataFrame, case_id: str = constants.CASE_CONCEPT_NAM
                      activity_key: str = xes_constants.DEFAULT_NAME_KEY,
                      timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY,
                      start_timestamp_key: str = xes_constants.DEFAULT_START_TIMESTAMP_KEY,
-                     timest_format: Optional[str] = None) -> pd.DataFrame:
+                     timest_format: Optional[str] = None, build_index: bool = False) -> pd.DataFrame:
     """
     Give the appropriate format on the dataframe, for process mining purposes
 
@@ -51,6 +51,7 @@ def format_dataframe(df: pd.DataFrame, case_id: str = constants.CASE_CONCEPT_NAM
     :param timestamp_key: Timestamp column
     :param start_timestamp_key: Start timestamp column
     :param timest_format: Timestamp format that is provided to Pandas
+    :param build_index: Builds (and attaches to the dataframe) an index of the cases/activities, which is re-used by the algorithms applied on the dataframe (DFG, start/end activities, variants, case durations, and the start/end activities and variants filters) until the dataframe is modified. The in-place modification of single values is not detected: in such case, call pm4py.objects.log.util.dataframe_index.invalidate on the dataframe (default: False)
     :rtype: ``pd.DataFrame``
 
     .. code-block:: python3
@@ -120,6 +121,9 @@ def format_dataframe(df: pd.DataFrame, case_id: str = constants.CASE_CONCEPT_NAM
     df.attrs[constants.PARAMETER_CONSTANT_TRANSITION_KEY] = xes_constants.DEFAULT_TRANSITION_KEY
     df.attrs[constants.PARAMETER_CONSTANT_RESOURCE_KEY] = xes_constants.DEFAULT_RESOURCE_KEY
     df.attrs[constants.PARAMETER_CONSTANT_CASEID_KEY] = constants.CASE_CONCEPT_NAME
+    if build_index:
+        from pm4py.objects.log.util import dataframe_index
+        dataframe_index.build(df)
     return df
 
 
@@ -231,7 +235,7 @@ def serialize(*args) -> Tuple[str, bytes]:
     from pm4py.objects.bpmn.obj import BPMN
     from collections import Counter
 
-    if type(args[0]) is EventLog:
+    if isinstance(args[0], EventLog):
         from pm4py.objects.log.exporter.xes import exporter as xes_exporter
         return (constants.AvailableSerializations.EVENT_LOG.value, xes_exporter.serialize(*args))
     elif pandas_utils.check_is_pandas_dataframe(args[0]):
@@ -352,12 +356,12 @@ def set_classifier(log, classifier, classifier_attribute=constants.DEFAULT_CLASS
     if type(classifier) is list:
         pass
     elif type(classifier) is str:
-        if type(log) is EventLog and classifier in log.classifiers:
+        if isinstance(log, EventLog) and classifier in log.classifiers:
             classifier = log.classifiers[classifier]
         else:
             classifier = [classifier]
 
-    if type(log) is EventLog:
+    if isinstance(log, EventLog):
         for trace in log:
             for event in trace:
                 event[classifier_attribute] = "+".join(list(event[x] for x in classifier))
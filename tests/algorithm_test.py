@@ -18,6 +18,43 @@ class AlgorithmTest(unittest.TestCase):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"),
                                  variant=xes_importer.Variants.CHUNK_REGEX)
 
+    def test_importing_xes_parallel_chunks(self):
+        import pm4py
+        for file in ["running-example.xes", "roadtraffic100traces.xes"]:
+            df = pm4py.read_xes(os.path.join("input_data", file))
+            df_chunks = pm4py.read_xes(os.path.join("input_data", file), variant="parallel_chunks",
+                                       chunk_size=2 ** 12, cores=2)
+            self.assertEqual(list(df.columns), list(df_chunks.columns))
+            self.assertTrue(df.equals(df_chunks))
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"),
+                                 variant=xes_importer.Variants.PARALLEL_CHUNKS)
+        self.assertEqual(len(log), 6)
+
+    def test_importing_xes_parallel_chunks_no_traces(self):
+        import gzip
+        import tempfile
+        content = b'<?xml version="1.0" encoding="UTF-8" ?>\n<log xes.version="1.0" xmlns="http://www.xes-standard.org/">\n\t<string key="concept:name" value="empty"/>\n</log>\n'
+        directory = tempfile.mkdtemp()
+        for file, opener in [("empty.xes", open), ("empty.xes.gz", gzip.open)]:
+            with opener(os.path.join(directory, file), "wb") as F:
+                F.write(content)
+            log = xes_importer.apply(os.path.join(directory, file), variant=xes_importer.Variants.PARALLEL_CHUNKS,
+                                     parameters={xes_importer.Variants.PARALLEL_CHUNKS.value.Parameters.CORES: 1})
+            self.assertEqual(len(log), 0)
+            self.assertEqual(log.attributes["concept:name"], "empty")
+
+    def test_importing_xes_parallel_chunks_character_references(self):
+        import pm4py
+        import tempfile
+        content = b'<?xml version="1.0" encoding="UTF-8" ?>\n<log xes.version="1.0" xmlns="http://www.xes-standard.org/">\n<trace><string key="concept:name" value="1"/><event><string key="concept:name" value="A&#10;B &#xE9; &amp;&lt;&quot;"/><date key="time:timestamp" value="2020-01-01T00:00:00.000+00:00"/></event></trace>\n</log>\n'
+        path = os.path.join(tempfile.mkdtemp(), "references.xes")
+        with open(path, "wb") as F:
+            F.write(content)
+        df = pm4py.read_xes(path)
+        df_chunks = pm4py.read_xes(path, variant="parallel_chunks", cores=1)
+        self.assertEqual(df_chunks["concept:name"].tolist(), ["A\nB \u00e9 &<\""])
+        self.assertEqual(df["concept:name"].tolist(), df_chunks["concept:name"].tolist())
+
     """def test_hiearch_clustering(self):
         from pm4py.algo.clustering.trace_attribute_driven import algorithm as clust_algorithm
         log = xes_importer.apply(os.path.join("input_data", "receipt.xes"), variant=xes_importer.Variants.LINE_BY_LINE,
@@ -70,6 +107,26 @@ class AlgorithmTest(unittest.TestCase):
         generalization = generalization_evaluation.apply(log, net, im, fm,
                                                          variant=generalization_evaluation.Variants.GENERALIZATION_TOKEN)
 
+    def test_tokenreplay_batched(self):
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        from pm4py.algo.discovery.alpha import algorithm as alpha_miner
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        from pm4py.algo.conformance.tokenreplay import algorithm as token_replay
+        reviewing = xes_importer.apply(os.path.join("input_data", "reviewing.xes"))
+        # the nets discovered by the inductive miner contain invisible transitions
+        logs_nets = [(log, alpha_miner.apply(log)), (log, process_tree_converter.apply(inductive_miner.apply(log))),
+                     (reviewing, process_tree_converter.apply(inductive_miner.apply(reviewing)))]
+        for this_log, (net, im, fm) in logs_nets:
+            classic = token_replay.apply(this_log, net, im, fm, variant=token_replay.Variants.TOKEN_REPLAY)
+            batched = token_replay.apply(this_log, net, im, fm, variant=token_replay.Variants.BATCHED)
+            self.assertEqual(len(classic), len(batched))
+            for x, y in zip(classic, batched):
+                for key in ["trace_is_fit", "missing_tokens", "consumed_tokens", "remaining_tokens", "produced_tokens",
+                            "activated_transitions", "transitions_with_problems", "reached_marking",
+                            "enabled_transitions_in_marking"]:
+                    self.assertEqual(x[key], y[key])
+                self.assertAlmostEqual(x["trace_fitness"], y["trace_fitness"])
+
     def test_evaluation(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
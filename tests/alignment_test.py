@@ -100,6 +100,63 @@ class AlignmentTest(unittest.TestCase):
         net, im, fm = pm4py.discover_petri_net_inductive(log)
         align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_TWEAKED_STATE_EQUATION_A_STAR)
 
+    def test_alignment_multiprocessing(self):
+        import pm4py
+        log = pm4py.read_xes("input_data/running-example.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.5)
+        aligned_traces = align_alg.apply_log(log, net, im, fm)
+        aligned_traces_mp = align_alg.apply_multiprocessing(log, net, im, fm, parameters={align_alg.Parameters.CORES: 2})
+        self.assertEqual([x["cost"] for x in aligned_traces], [x["cost"] for x in aligned_traces_mp])
+        self.assertEqual([x["fitness"] for x in aligned_traces], [x["fitness"] for x in aligned_traces_mp])
+
+    def test_alignment_cache(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.utils.cache import AlignmentsCache
+        log = pm4py.read_xes("input_data/running-example.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.5)
+        cache = AlignmentsCache()
+        aligned_traces = align_alg.apply_log(log, net, im, fm, parameters={align_alg.Parameters.ALIGNMENTS_CACHE: cache})
+        self.assertEqual(cache.get_statistics()["hits"], 0)
+        self.assertEqual(cache.get_statistics()["entries"], cache.get_statistics()["misses"])
+        aligned_traces_cache = align_alg.apply_log(log, net, im, fm, parameters={align_alg.Parameters.ALIGNMENTS_CACHE: cache})
+        self.assertEqual(cache.get_statistics()["hits"], cache.get_statistics()["entries"])
+        self.assertEqual([x["cost"] for x in aligned_traces], [x["cost"] for x in aligned_traces_cache])
+        self.assertEqual([x["fitness"] for x in aligned_traces], [x["fitness"] for x in aligned_traces_cache])
+        cache.close()
+        cache = AlignmentsCache()
+        align_alg.apply_log(log, net, im, fm, parameters={align_alg.Parameters.ALIGNMENTS_CACHE: cache,
+                                                          align_alg.Parameters.ENABLE_BEST_WORST_COST: False})
+        aligned_traces_cache = align_alg.apply_log(log, net, im, fm, parameters={align_alg.Parameters.ALIGNMENTS_CACHE: cache})
+        self.assertEqual([x["fitness"] for x in aligned_traces], [x["fitness"] for x in aligned_traces_cache])
+        cache.close()
+
+    def test_alignment_lp_heuristics_cache(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.utils.lp_heuristics import LpHeuristicsCache
+        log = pm4py.read_xes("input_data/roadtraffic100traces.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.5)
+        for variant in [align_alg.Variants.VERSION_STATE_EQUATION_A_STAR,
+                        align_alg.Variants.VERSION_TWEAKED_STATE_EQUATION_A_STAR]:
+            lp_cache = LpHeuristicsCache()
+            aligned_traces = align_alg.apply_log(log, net, im, fm, variant=variant,
+                                                 parameters={align_alg.Parameters.LP_HEURISTICS_CACHE: lp_cache})
+            self.assertGreater(lp_cache.hits, 0)
+            for trace, ali in zip(log, aligned_traces):
+                self.assertEqual(ali["cost"], align_alg.apply_trace(trace, net, im, fm, variant=variant)["cost"])
+
+    def test_alignment_prefix_sharing(self):
+        import pm4py
+        log = pm4py.read_xes("input_data/reviewing.xes", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+        aligned_traces = align_alg.apply_log(log, net, im, fm,
+                                             variant=align_alg.Variants.VERSION_DIJKSTRA_NO_HEURISTICS)
+        aligned_traces_trie = align_alg.apply_log(log, net, im, fm,
+                                                  variant=align_alg.Variants.VERSION_DIJKSTRA_PREFIX_SHARING)
+        self.assertEqual([x["cost"] for x in aligned_traces], [x["cost"] for x in aligned_traces_trie])
+        self.assertEqual([x["fitness"] for x in aligned_traces], [x["fitness"] for x in aligned_traces_trie])
+        ali = align_alg.apply_trace(log[0], net, im, fm, variant=align_alg.Variants.VERSION_DIJKSTRA_PREFIX_SHARING)
+        self.assertEqual(ali["cost"], aligned_traces[0]["cost"])
+        self.assertEqual([x[0] for x in ali["alignment"] if x[0] != ">>"], [x["concept:name"] for x in log[0]])
 
 
 if __name__ == "__main__":
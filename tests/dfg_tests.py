@@ -18,6 +18,66 @@ class DfgTests(unittest.TestCase):
         act_count = pm4py.get_event_attribute_values(log, "concept:name")
         dfg_filtering.filter_dfg_on_paths_percentage(dfg, sa, ea, act_count, 0.3)
 
+    def test_incremental_dfg(self):
+        import json
+        from pm4py.objects.dfg.obj import IncrementalDFG
+        df = pm4py.read_xes("input_data/roadtraffic100traces.xes")
+        dfg, sa, ea = pm4py.discover_dfg(df)
+        performance_dfg, _, _ = pm4py.discover_performance_dfg(df)
+        cases = list(df["case:concept:name"].unique())
+        first = IncrementalDFG()
+        first.add_log(df[df["case:concept:name"].isin(cases[:50])])
+        second = IncrementalDFG()
+        second.add_log(pm4py.convert_to_event_log(df[df["case:concept:name"].isin(cases[50:])]))
+        first.merge(IncrementalDFG.from_dict(json.loads(json.dumps(second.to_dict()))))
+        self.assertEqual((dict(first.graph), dict(first.start_activities), dict(first.end_activities)), (dfg, sa, ea))
+        performance = first.get_performance("all")
+        for arc in performance_dfg:
+            for measure in ["mean", "min", "max", "sum"]:
+                self.assertAlmostEqual(performance[arc][measure], performance_dfg[arc][measure], delta=1e-3)
+            self.assertAlmostEqual(performance[arc]["median"], performance_dfg[arc]["median"],
+                                   delta=0.02 * performance_dfg[arc]["median"])
+        for case_id in cases[50:]:
+            first.remove_case(case_id)
+        self.assertEqual((dict(first.graph), dict(first.start_activities), dict(first.end_activities)),
+                         pm4py.discover_dfg(df[df["case:concept:name"].isin(cases[:50])]))
+
+    def test_incremental_dfg_timestamp_resolution(self):
+        import pandas as pd
+        from pm4py.objects.dfg.obj import IncrementalDFG
+        df = pd.DataFrame({"case:concept:name": ["1", "1"], "concept:name": ["A", "B"],
+                           "time:timestamp": pd.to_datetime(["2024-01-01", "2024-01-02"], utc=True)})
+        for unit in ["s", "ms", "us", "ns"]:
+            dfg = IncrementalDFG()
+            dfg.add_log(df.astype({"time:timestamp": "datetime64[%s, UTC]" % unit}))
+            self.assertAlmostEqual(dfg.get_performance("mean")[("A", "B")], 86400.0, delta=1e-6)
+
+    def test_partitioned_dfg(self):
+        import os
+        import shutil
+        import tempfile
+        import numpy as np
+        from pm4py.algo.discovery.dfg.variants import partitioned
+        df = pm4py.read_xes("input_data/roadtraffic100traces.xes")
+        dfg, sa, ea = pm4py.discover_dfg(df)
+        performance_dfg, _, _ = pm4py.discover_performance_dfg(df)
+        parameters = {partitioned.Parameters.CORES: 2, partitioned.Parameters.NUM_PARTITIONS: 3}
+        self.assertEqual(partitioned.apply(df, parameters=parameters), (dfg, sa, ea))
+        self.assertEqual(pm4py.discover_dfg(df, multi_processing=True), (dfg, sa, ea))
+        directory = tempfile.mkdtemp()
+        try:
+            cases = list(df["case:concept:name"].unique())
+            for i in range(3):
+                df[df["case:concept:name"].isin(cases[i::3])].to_parquet(os.path.join(directory, "%d.parquet" % i))
+            self.assertEqual(pm4py.discover_dfg(directory), (dfg, sa, ea))
+            partitioned_performance_dfg, _, _ = pm4py.discover_performance_dfg(directory)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(set(partitioned_performance_dfg), set(performance_dfg))
+        for arc in performance_dfg:
+            for measure in ["mean", "median", "min", "max", "sum", "stdev"]:
+                np.testing.assert_allclose(partitioned_performance_dfg[arc][measure], performance_dfg[arc][measure])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -61,6 +61,27 @@ class HeuMinerTest(unittest.TestCase):
         net, im, fm = heuristics_miner.apply(log, variant=heuristics_miner.Variants.PLUSPLUS)
         gviz = pn_vis.apply(net, im, fm)
 
+    def test_heuristics_statistics(self):
+        import pickle
+        from pm4py.objects.heuristics_net.statistics import HeuristicsStatistics
+        df = pandas_utils.read_csv(os.path.join(INPUT_DATA_DIR, "interval_event_log.csv"))
+        df = dataframe_utils.convert_timestamp_columns_in_df(df, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT)
+        for variant in [heuristics_miner.Variants.CLASSIC, heuristics_miner.Variants.PLUSPLUS]:
+            statistics = heuristics_miner.discover_statistics(df, variant=variant)
+            restored = [pickle.loads(pickle.dumps(statistics)), HeuristicsStatistics.from_dict(statistics.to_dict())]
+            for dependency_thresh in [0.2, 0.5, 0.9]:
+                parameters = {"dependency_thresh": dependency_thresh}
+                heu_net = heuristics_miner.Variants.PLUSPLUS.value.apply_heu_pandas(df, parameters=parameters) if \
+                    variant == heuristics_miner.Variants.PLUSPLUS else heuristics_miner.apply_heu(df, parameters=parameters)
+                for stat in [statistics] + restored:
+                    heu_net_stat = heuristics_miner.apply_heu_statistics(stat, parameters=parameters, variant=variant)
+                    self.assertEqual(set(heu_net.nodes), set(heu_net_stat.nodes))
+                    for node in heu_net.nodes:
+                        self.assertEqual(
+                            {(x.node_name, y[0].dfg_value) for x, y in heu_net.nodes[node].output_connections.items()},
+                            {(x.node_name, y[0].dfg_value) for x, y in heu_net_stat.nodes[node].output_connections.items()})
+            net, im, fm = heuristics_miner.apply_statistics(statistics, variant=variant)
+
 
 if __name__ == "__main__":
     unittest.main()
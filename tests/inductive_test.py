@@ -166,6 +166,40 @@ class InductiveMinerTest(unittest.TestCase):
 
         tree = imfuvcl.apply(IMDataStructureUVCL(uvcl), parameters=parameters)
 
+    def test_inductive_miner_parallel_recursion(self):
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "roadtraffic100traces.xes"))
+        for variant, parameters in [(inductive_miner.Variants.IM, {}),
+                                    (inductive_miner.Variants.IMf, {"noise_threshold": 0.2})]:
+            tree = inductive_miner.apply(log, variant=variant, parameters=parameters)
+            parameters = dict(parameters)
+            parameters["parallel_recursion"] = True
+            parameters["parallel_min_size"] = 1
+            parameters["cores"] = 2
+            tree_parallel = inductive_miner.apply(log, variant=variant, parameters=parameters)
+            self.assertEqual(str(tree), str(tree_parallel))
+
+    def test_encoded_uvcl(self):
+        from collections import Counter
+        from pm4py.util.compression.dtypes import EncodedUVCL
+        uvcl = Counter({("a", "b", "c"): 3, ("a", "c", "b"): 2, ("a",): 1, (): 2, ("b", "b", "c", "a"): 1})
+        encoded = EncodedUVCL.from_uvcl(uvcl)
+        self.assertEqual(encoded.to_uvcl(), uvcl)
+        self.assertEqual(encoded.get_alphabet(), ["a", "b", "c"])
+        dfg = encoded.discover_dfg()
+        self.assertEqual(dfg.graph, Counter({("a", "b"): 3, ("b", "c"): 4, ("a", "c"): 2, ("c", "b"): 2,
+                                             ("b", "b"): 1, ("c", "a"): 1}))
+        self.assertEqual(dfg.start_activities, Counter({"a": 6, "b": 1}))
+        self.assertEqual(dfg.end_activities, Counter({"c": 3, "b": 2, "a": 2}))
+        projected = encoded.project_activities(encoded.get_activities_mask({"b", "c"}))
+        self.assertEqual(projected.to_uvcl(), Counter({("b", "c"): 3, ("c", "b"): 2, (): 3, ("b", "b", "c"): 1}))
+        self.assertEqual(projected.discover_dfg().graph, Counter({("b", "c"): 4, ("c", "b"): 2, ("b", "b"): 1}))
+        self.assertEqual(list(projected.merge_variants().to_uvcl().items()),
+                         [(("b", "c"), 3), (("c", "b"), 2), ((), 3), (("b", "b", "c"), 1)])
+        self.assertEqual(list(projected.merge_variants(keep_last_count=True).to_uvcl().items()),
+                         [(("b", "c"), 3), (("c", "b"), 2), ((), 2), (("b", "b", "c"), 1)])
+        segments = encoded.extract_segments([1, 4, 7, 8], [3, 6, 7, 11], [0, 1, 3, 4])
+        self.assertEqual(segments.to_uvcl(), Counter({("b", "c"): 3, ("c", "b"): 2, (): 2, ("b", "c", "a"): 1}))
+
 
 
 if __name__ == "__main__":
@@ -87,6 +87,22 @@ class OcelDiscoveryTest(unittest.TestCase):
         pm4py.save_vis_ocdfg(ocdfg, target_path, annotation="performance", act_metric="unique_objects", edge_metric="total_objects", act_threshold=2, edge_threshold=1, performance_aggregation="median")
         os.remove(target_path)
 
+    def test_discovery_ocfg_aggregated(self):
+        ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "example_log.jsonocel"))
+        ocdfg = pm4py.discover_ocdfg(ocel)
+        ocdfg_aggr = pm4py.discover_ocdfg(ocel, aggregated=True)
+        for key in ["activities_indep", "activities_ot", "start_activities", "end_activities", "edges"]:
+            for metric in ocdfg[key]:
+                if key == "activities_indep":
+                    self.assertEqual({x: len(y) for x, y in ocdfg[key][metric].items()}, ocdfg_aggr[key][metric])
+                else:
+                    self.assertEqual({ot: {x: len(y) for x, y in ocdfg[key][metric][ot].items()}
+                                      for ot in ocdfg[key][metric]}, ocdfg_aggr[key][metric])
+        for ot in ocdfg["edges_performance"]["total_objects"]:
+            for edge, times in ocdfg["edges_performance"]["total_objects"][ot].items():
+                self.assertAlmostEqual(sum(times) / len(times),
+                                       ocdfg_aggr["edges_performance"]["total_objects"][ot][edge]["mean"])
+
     def test_discovery_ocpn_im(self):
         ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "example_log.jsonocel"))
         ocpn = pm4py.discover_oc_petri_net(ocel, inductive_miner_variant="im")
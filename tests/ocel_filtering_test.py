@@ -114,6 +114,36 @@ class OcelFilteringTest(unittest.TestCase):
         ocel = pm4py.read_ocel(input_path)
         pm4py.filter_ocel_events_timestamp(ocel, "1981-01-01 00:00:00", "1982-01-01 00:00:00")
 
+    def test_ocel_index(self):
+        from copy import copy
+        from pm4py.objects.ocel.util import related_objects, related_events
+        input_path = os.path.join("input_data", "ocel", "example_log.jsonocel")
+        ocel = pm4py.read_ocel(input_path)
+        self.assertIsNone(ocel.get_index())
+        indexed_ocel = copy(ocel)
+        index = indexed_ocel.build_index()
+        self.assertIs(index, indexed_ocel.get_index())
+        self.assertEqual(related_objects.related_objects_dct_overall(ocel),
+                         related_objects.related_objects_dct_overall(indexed_ocel))
+        self.assertEqual(related_events.related_events_dct(ocel), related_events.related_events_dct(indexed_ocel))
+        filtered_ocel = pm4py.filter_ocel_objects(ocel, ["o1"], level=2)
+        filtered_indexed_ocel = pm4py.filter_ocel_objects(indexed_ocel, ["o1"], level=2)
+        self.assertEqual(set(filtered_ocel.objects["ocel:oid"]), set(filtered_indexed_ocel.objects["ocel:oid"]))
+        # the index is invalidated when a table is replaced
+        filtered_indexed_ocel = pm4py.filter_ocel_events(indexed_ocel, ["e1", "e2"])
+        self.assertEqual(len(filtered_indexed_ocel.get_index().event_ids), 2)
+        self.assertIs(index, indexed_ocel.get_index())
+        # as well as when a column is re-assigned
+        indexed_ocel.relations["ocel:oid"] = indexed_ocel.relations["ocel:oid"].copy()
+        self.assertIsNot(index, indexed_ocel.get_index())
+        index = indexed_ocel.get_index()
+        self.assertIs(index, indexed_ocel.get_index())
+        # the in-place modification of single values requires the explicit invalidation of the index
+        indexed_ocel.relations.loc[indexed_ocel.relations["ocel:oid"] == "o1", "ocel:oid"] = "o2"
+        indexed_ocel.invalidate_index()
+        self.assertIsNot(index, indexed_ocel.get_index())
+        self.assertNotIn("o1", [o for dct in related_events.related_events_dct(indexed_ocel).values() for o in dct])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -385,6 +385,40 @@ class OtherPartsTests(unittest.TestCase):
         from pm4py.algo.transformation.ocel.description.variants import variant1
         variant1.apply(ocel)
 
+    def test_compiled_petri_net_semantics(self):
+        import pm4py
+        from pm4py.objects.petri_net import semantics
+        from pm4py.objects.petri_net.compiled.obj import CompiledPetriNet
+        from pm4py.objects.petri_net.compiled.semantics import CompiledPetriNetSemantics
+        from pm4py.objects.petri_net.utils import reachability_graph
+        net, im, fm = pm4py.read_pnml(os.path.join("input_data", "running-example.pnml"))
+        cnet = CompiledPetriNet(net)
+        self.assertEqual(cnet.decode_marking(cnet.encode_marking(im)), im)
+        incoming, outgoing, _ = reachability_graph.marking_flow_petri(net, im)
+        for m in outgoing:
+            cm = cnet.encode_marking(m)
+            enabled = {cnet.transitions[t] for t in CompiledPetriNetSemantics.enabled_transitions(cnet, cm)}
+            self.assertEqual(enabled, semantics.enabled_transitions(net, m))
+            for t in enabled:
+                nm = CompiledPetriNetSemantics.fire(cnet, cnet.transition_indices[t], cm)
+                self.assertEqual(cnet.decode_marking(nm), semantics.execute(t, net, m))
+                self.assertEqual(outgoing[m][t], semantics.execute(t, net, m))
+
+    def test_columnar_event_log(self):
+        import pm4py
+        df = pm4py.read_xes(os.path.join("input_data", "running-example.xes"))
+        df = df.sort_values(["time:timestamp", "case:concept:name"], kind="stable")
+        log = converter.apply(df, variant=converter.Variants.TO_EVENT_LOG)
+        columnar_log = converter.apply(df, variant=converter.Variants.TO_COLUMNAR_EVENT_LOG)
+        self.assertEqual(len(log), len(columnar_log))
+        for trace, columnar_trace in zip(log, columnar_log):
+            self.assertEqual(trace.attributes, columnar_trace.attributes)
+            self.assertEqual([dict(x) for x in trace], [dict(x) for x in columnar_trace])
+        self.assertEqual(dfg_discovery.apply(log), dfg_discovery.apply(columnar_log))
+        columnar_log[0][0]["concept:name"] = "changed"
+        self.assertEqual(columnar_log[0][0]["concept:name"], "changed")
+        self.assertNotIn("changed", set(df["concept:name"]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -589,6 +589,18 @@ class SimplifiedInterfaceTest(unittest.TestCase):
     def test_ocel_flattening(self):
         ocel = pm4py.read_ocel("input_data/ocel/example_log.csv")
         pm4py.ocel_flattening(ocel, "order")
+
+    def test_ocel_flattening_per_type(self):
+        from pm4py.objects.ocel.util import flattening
+        ocel = pm4py.read_ocel("input_data/ocel/example_log.csv")
+        flat_logs = dict(flattening.flatten_per_type(ocel))
+        self.assertEqual(set(flat_logs), set(pm4py.ocel_get_object_types(ocel)))
+        for ot in flat_logs:
+            flat_log = pm4py.ocel_flattening(ocel, ot).sort_values(["case:concept:name", "ocel:eid"])
+            flat_log2 = flat_logs[ot].sort_values(["case:concept:name", "ocel:eid"])
+            self.assertTrue(flat_log.reset_index(drop=True).equals(flat_log2.reset_index(drop=True)))
+        self.assertEqual(len(flattening.flatten_all(ocel)), len(ocel.relations))
+
     def test_stats_var_tuples_df(self):
         dataframe = pandas_utils.read_csv("input_data/running-example-transformed.csv")
         dataframe = dataframe_utils.convert_timestamp_columns_in_df(dataframe, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT, timest_columns=["Timestamp"])
@@ -1114,6 +1126,160 @@ class SimplifiedInterfaceTest(unittest.TestCase):
         pm4py.write_ocel2(ocel, "test_output_data/ocel20_example.sqlite")
         os.remove("test_output_data/ocel20_example.sqlite")
 
+    def test_ocel2_json_streaming(self):
+        ocel = pm4py.read_ocel2_json("input_data/ocel/ocel20_example.jsonocel")
+        ocel_streaming = pm4py.read_ocel2_json("input_data/ocel/ocel20_example.jsonocel", variant_str="ocel20_streaming")
+        for table in ["events", "objects", "o2o", "object_changes"]:
+            self.assertTrue(getattr(ocel, table).reset_index(drop=True).equals(getattr(ocel_streaming, table).reset_index(drop=True)))
+        # the relations are compared row by row (the standard importer does not keep the order of the objects
+        # of an event)
+        columns = ["ocel:eid", "ocel:oid", "ocel:qualifier"]
+        self.assertEqual(ocel.relations[columns].sort_values(columns).values.tolist(),
+                         ocel_streaming.relations[columns].sort_values(columns).values.tolist())
+        from pm4py.objects.ocel.importer.jsonocel.variants import ocel20_streaming
+        ocel_batches = ocel20_streaming.apply("input_data/ocel/ocel20_example.jsonocel",
+                                              parameters={ocel20_streaming.Parameters.BATCH_SIZE: 2,
+                                                          ocel20_streaming.Parameters.CHUNK_SIZE: 16})
+        self.assertTrue(ocel_streaming.events.equals(ocel_batches.events))
+        self.assertTrue(ocel_streaming.relations.reset_index(drop=True).equals(ocel_batches.relations.reset_index(drop=True)))
+
+    def test_ocel2_json_streaming_qualifiers(self):
+        import json
+        import tempfile
+        from pm4py.objects.ocel.importer.jsonocel.variants import ocel20_streaming
+        content = {"objectTypes": [{"name": "order", "attributes": []}],
+                   "eventTypes": [{"name": "create", "attributes": []}],
+                   "objects": [{"id": "o1", "type": "order"}],
+                   "events": [{"id": "e1", "type": "create", "time": "2022-01-01T00:00:00Z",
+                               "relationships": [{"objectId": "o1", "qualifier": "creator"},
+                                                 {"objectId": "o1", "qualifier": "approver"}]}]}
+        path = os.path.join(tempfile.mkdtemp(), "qualifiers.jsonocel")
+        with open(path, "w") as F:
+            json.dump(content, F)
+        ocel = ocel20_streaming.apply(path)
+        self.assertEqual(ocel.relations[["ocel:eid", "ocel:oid", "ocel:qualifier"]].values.tolist(),
+                         [["e1", "o1", "creator"], ["e1", "o1", "approver"]])
+
+    def test_ocel2_sqlite_lazy(self):
+        from pm4py.objects.ocel.importer.sqlite import importer as sqlite_importer
+        ocel = pm4py.read_ocel2_sqlite("input_data/ocel/ocel20_example.sqlite")
+        lazy_ocel = sqlite_importer.apply("input_data/ocel/ocel20_example.sqlite", variant=sqlite_importer.Variants.OCEL20_LAZY)
+        # without filters, the materialized view is identical (row for row) to the log read by the eager importer
+        unfiltered_ocel = lazy_ocel.to_ocel()
+        for attr in ["events", "objects", "relations", "o2o", "object_changes"]:
+            self.assertTrue(getattr(ocel, attr).reset_index(drop=True).equals(getattr(unfiltered_ocel, attr).reset_index(drop=True)))
+        self.assertEqual(lazy_ocel.get_object_types_counts(), ocel.objects["ocel:type"].value_counts().to_dict())
+        self.assertEqual(lazy_ocel.get_activities_counts(), ocel.events["ocel:activity"].value_counts().to_dict())
+        lazy_ocel.close()
+        filtered_ocel = pm4py.filter_ocel_object_types(ocel, ["Invoice", "Payment"])
+        filtered_ocel = pm4py.filter_ocel_events_timestamp(filtered_ocel, "2022-01-13 12:00:00", "2022-02-28 00:00:00")
+        lazy_ocel = lazy_ocel.filter_object_types(["Invoice", "Payment"]).filter_timestamp("2022-01-13 12:00:00", "2022-02-28 00:00:00")
+        materialized_ocel = lazy_ocel.to_ocel()
+        self.assertEqual(set(filtered_ocel.events["ocel:eid"]), set(materialized_ocel.events["ocel:eid"]))
+        self.assertEqual(set(filtered_ocel.objects["ocel:oid"]), set(materialized_ocel.objects["ocel:oid"]))
+        self.assertEqual(len(filtered_ocel.relations), len(materialized_ocel.relations))
+        self.assertEqual(lazy_ocel.get_object_types_counts(), filtered_ocel.objects["ocel:type"].value_counts().to_dict())
+        self.assertEqual(lazy_ocel.get_activities_counts(), filtered_ocel.events["ocel:activity"].value_counts().to_dict())
+        ocdfg = pm4py.discover_ocdfg(filtered_ocel, aggregated=True)
+        lazy_ocdfg = lazy_ocel.discover_ocdfg()
+        for key in ["activities", "object_types", "activities_ot", "start_activities", "end_activities", "edges"]:
+            self.assertEqual(ocdfg[key], lazy_ocdfg[key])
+        for key in ["event_couples", "total_objects"]:
+            for ot in ocdfg["edges_performance"][key]:
+                for edge, performance in ocdfg["edges_performance"][key][ot].items():
+                    for metric in ["min", "max"]:
+                        self.assertEqual(performance[metric], lazy_ocdfg["edges_performance"][key][ot][edge][metric])
+        self.assertEqual(len(pm4py.ocel_flattening(filtered_ocel, "Invoice")), len(lazy_ocel.flatten("Invoice")))
+        # the selection is computed again after closing the connection of the view
+        lazy_ocel.close()
+        self.assertEqual(lazy_ocel.get_object_types_counts(), filtered_ocel.objects["ocel:type"].value_counts().to_dict())
+        lazy_ocel.close()
+        # the filters could select no events
+        empty_ocel = pm4py.filter_ocel_events_timestamp(ocel, "2030-01-01 00:00:00", "2031-01-01 00:00:00")
+        lazy_ocel = sqlite_importer.apply("input_data/ocel/ocel20_example.sqlite", variant=sqlite_importer.Variants.OCEL20_LAZY)
+        lazy_ocel = lazy_ocel.filter_timestamp("2030-01-01 00:00:00", "2031-01-01 00:00:00")
+        materialized_ocel = lazy_ocel.to_ocel()
+        for attr in ["events", "objects", "relations"]:
+            self.assertEqual(len(getattr(empty_ocel, attr)), 0)
+            self.assertEqual(len(getattr(materialized_ocel, attr)), 0)
+        self.assertEqual(len(pm4py.ocel_flattening(empty_ocel, "Invoice")), len(lazy_ocel.flatten("Invoice")))
+        self.assertEqual(len(lazy_ocel.filter_object_types(["Invoice"]).filter_activities(["Create Purchase Order"]).to_ocel().events), 0)
+        lazy_ocel.close()
+
+    def test_polars_backend(self):
+        import importlib.util
+        if importlib.util.find_spec("polars"):
+            import numpy as np
+            import polars as pl
+            df = pm4py.read_xes("input_data/roadtraffic100traces.xes")
+            for pl_df in [pl.from_pandas(df), pl.from_pandas(df).lazy()]:
+                self.assertEqual(pm4py.discover_dfg(pl_df), pm4py.discover_dfg(df))
+                self.assertEqual(pm4py.get_start_activities(pl_df), pm4py.get_start_activities(df))
+                self.assertEqual(pm4py.get_end_activities(pl_df), pm4py.get_end_activities(df))
+                self.assertEqual(pm4py.get_event_attribute_values(pl_df, "concept:name", count_once_per_case=True),
+                                 pm4py.get_event_attribute_values(df, "concept:name", count_once_per_case=True))
+                variants = pm4py.get_variants(pl_df)
+                self.assertEqual(variants, pm4py.get_variants(df))
+                self.assertTrue(np.allclose(pm4py.get_all_case_durations(pl_df), pm4py.get_all_case_durations(df)))
+                performance_dfg = pm4py.discover_performance_dfg(pl_df)[0]
+                expected_performance_dfg = pm4py.discover_performance_dfg(df)[0]
+                self.assertEqual(set(performance_dfg), set(expected_performance_dfg))
+                for arc in expected_performance_dfg:
+                    for measure in expected_performance_dfg[arc]:
+                        np.testing.assert_allclose(performance_dfg[arc][measure], expected_performance_dfg[arc][measure])
+                top_variants = sorted(variants, key=lambda x: (-variants[x], x))[:2]
+                filtered = [pm4py.filter_variants(pl_df, top_variants, retain=False),
+                            pm4py.filter_event_attribute_values(pl_df, "concept:name", ["Payment"], level="event"),
+                            pm4py.filter_time_range(pl_df, "2002-01-01 00:00:00", "2005-01-01 00:00:00", mode="traces_intersecting")]
+                expected = [pm4py.filter_variants(df, top_variants, retain=False),
+                            pm4py.filter_event_attribute_values(df, "concept:name", ["Payment"], level="event"),
+                            pm4py.filter_time_range(df, "2002-01-01 00:00:00", "2005-01-01 00:00:00", mode="traces_intersecting")]
+                for x, y in zip(filtered, expected):
+                    self.assertEqual(type(x), type(pl_df))
+                    x = x.collect() if isinstance(x, pl.LazyFrame) else x
+                    self.assertEqual(x["case:concept:name"].to_list(), y["case:concept:name"].tolist())
+
+    def test_duckdb_backend(self):
+        import importlib.util
+        from pm4py.util.duckdb_utils import check_is_duckdb_relation
+        # the paths of the other formats are not routed to the DuckDB backend
+        self.assertFalse(check_is_duckdb_relation("input_data/running-example.xes"))
+        self.assertFalse(check_is_duckdb_relation("compressed_input_data"))
+        self.assertEqual(check_is_duckdb_relation("input_data/running-example.parquet"),
+                         importlib.util.find_spec("duckdb") is not None)
+        if importlib.util.find_spec("duckdb"):
+            import duckdb
+            import numpy as np
+            df = pm4py.read_xes("input_data/roadtraffic100traces.xes")
+            df.to_parquet("test_output_data/roadtraffic100traces.parquet")
+            for log in [duckdb.from_df(df), "test_output_data/roadtraffic100traces.parquet"]:
+                self.assertEqual(pm4py.discover_dfg(log), pm4py.discover_dfg(df))
+                self.assertEqual(pm4py.get_start_activities(log), pm4py.get_start_activities(df))
+                self.assertEqual(pm4py.get_end_activities(log), pm4py.get_end_activities(df))
+                variants = pm4py.get_variants(log)
+                self.assertEqual(variants, pm4py.get_variants(df))
+                self.assertTrue(np.allclose(pm4py.get_all_case_durations(log), pm4py.get_all_case_durations(df)))
+                performance_dfg = pm4py.discover_performance_dfg(log)[0]
+                expected_performance_dfg = pm4py.discover_performance_dfg(df)[0]
+                self.assertEqual(set(performance_dfg), set(expected_performance_dfg))
+                for arc in expected_performance_dfg:
+                    for measure in expected_performance_dfg[arc]:
+                        np.testing.assert_allclose(performance_dfg[arc][measure], expected_performance_dfg[arc][measure])
+                top_variants = sorted(variants, key=lambda x: (-variants[x], x))[:2]
+                filtered = [pm4py.filter_variants(log, top_variants, retain=False),
+                            pm4py.filter_start_activities(log, ["Create Fine"]),
+                            pm4py.filter_end_activities(log, ["Payment"], retain=False),
+                            pm4py.filter_event_attribute_values(log, "concept:name", ["Payment"], level="event"),
+                            pm4py.filter_time_range(log, "2002-01-01 00:00:00", "2005-01-01 00:00:00", mode="traces_intersecting")]
+                expected = [pm4py.filter_variants(df, top_variants, retain=False),
+                            pm4py.filter_start_activities(df, ["Create Fine"]),
+                            pm4py.filter_end_activities(df, ["Payment"], retain=False),
+                            pm4py.filter_event_attribute_values(df, "concept:name", ["Payment"], level="event"),
+                            pm4py.filter_time_range(df, "2002-01-01 00:00:00", "2005-01-01 00:00:00", mode="traces_intersecting")]
+                for x, y in zip(filtered, expected):
+                    self.assertEqual(sorted(x.df()["case:concept:name"].tolist()), sorted(y["case:concept:name"].tolist()))
+            os.remove("test_output_data/roadtraffic100traces.parquet")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -79,6 +79,15 @@ class SimplifiedInterface2Test(unittest.TestCase):
             log = pm4py.read_xes("input_data/running-example.xes", return_legacy_log_object=legacy_obj)
             pm4py.discover_petri_net_ilp(log)
 
+    def test_ilp_miner_multiprocessing(self):
+        log = pm4py.read_xes("input_data/reviewing.xes")
+        for alpha in [1.0, 0.5]:
+            net1, im1, fm1 = pm4py.discover_petri_net_ilp(log, alpha=alpha, multi_processing=False)
+            net2, im2, fm2 = pm4py.discover_petri_net_ilp(log, alpha=alpha, multi_processing=True)
+            places1 = sorted((sorted(a.source.name for a in p.in_arcs), sorted(a.target.name for a in p.out_arcs)) for p in net1.places)
+            places2 = sorted((sorted(a.source.name for a in p.in_arcs), sorted(a.target.name for a in p.out_arcs)) for p in net2.places)
+            self.assertEqual(places1, places2)
+
 
 if __name__ == "__main__":
     unittest.main()
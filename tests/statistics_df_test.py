@@ -73,6 +73,91 @@ class StatisticsDfTest(unittest.TestCase):
         df = self.get_dataframe()
         msd_pandas.apply(df)
 
+    def test_dataframe_index(self):
+        import pm4py
+        from pm4py.objects.log.util import dataframe_index
+        df = pm4py.format_dataframe(self.get_dataframe())
+        indexed_df = pm4py.format_dataframe(self.get_dataframe(), build_index=True)
+        self.assertIsNotNone(dataframe_index.get(indexed_df))
+        self.assertEqual(pm4py.discover_dfg(df), pm4py.discover_dfg(indexed_df))
+        self.assertEqual(pm4py.get_variants(df), pm4py.get_variants(indexed_df))
+        self.assertEqual(pm4py.get_start_activities(df), pm4py.get_start_activities(indexed_df))
+        self.assertEqual(pm4py.get_end_activities(df), pm4py.get_end_activities(indexed_df))
+        self.assertEqual(pm4py.get_all_case_durations(df), pm4py.get_all_case_durations(indexed_df))
+        self.assertEqual(pm4py.get_all_case_durations(df, business_hours=True),
+                         pm4py.get_all_case_durations(indexed_df, business_hours=True))
+        self.assertEqual(pm4py.filter_variants_top_k(df, 3).index.tolist(),
+                         pm4py.filter_variants_top_k(indexed_df, 3).index.tolist())
+        for retain in [True, False]:
+            self.assertEqual(pm4py.filter_start_activities(df, ["Create Fine"], retain=retain).index.tolist(),
+                             pm4py.filter_start_activities(indexed_df, ["Create Fine"], retain=retain).index.tolist())
+            self.assertEqual(pm4py.filter_end_activities(df, ["Payment"], retain=retain).index.tolist(),
+                             pm4py.filter_end_activities(indexed_df, ["Payment"], retain=retain).index.tolist())
+        # the algorithms not using the index leave the dataframe (and its index) unchanged
+        index = dataframe_index.get(indexed_df)
+        pm4py.discover_performance_dfg(indexed_df, business_hours=True)
+        self.assertNotIn("start_timestamp", indexed_df.columns)
+        self.assertIs(index, dataframe_index.get(indexed_df))
+        # the in-place modification of single values requires the explicit invalidation of the index
+        indexed_df.loc[indexed_df.index[0], "concept:name"] = "Payment"
+        dataframe_index.invalidate(indexed_df)
+        self.assertIsNone(dataframe_index.get(indexed_df))
+        indexed_df = pm4py.format_dataframe(self.get_dataframe(), build_index=True)
+        indexed_df["concept:name"] = indexed_df["concept:name"] + "_"
+        self.assertIsNone(dataframe_index.get(indexed_df))
+
+    def test_business_hours_vectorized(self):
+        import numpy as np
+        import pandas as pd
+        import pm4py
+        from pm4py.util import business_hours, constants
+        df = pm4py.format_dataframe(self.get_dataframe())
+        st = df["time:timestamp"].iloc[:-1].reset_index(drop=True)
+        et = df["time:timestamp"].iloc[1:].reset_index(drop=True)
+        diff = business_hours.soj_time_business_hours_diff_vectorized(st, et, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+        for i in range(len(st)):
+            self.assertAlmostEqual(diff[i], business_hours.soj_time_business_hours_diff(
+                st[i], et[i], constants.DEFAULT_BUSINESS_HOUR_SLOTS))
+        # the second slot spans over the end of the week, overlapping with the first slot of the following week
+        slots = [(0, 30 * 3600), ((6 * 24 + 20) * 3600, (7 * 24 + 2) * 3600)]
+        st = st.iloc[:300]
+        et = st + pd.to_timedelta(np.arange(300) * 4999, unit="s")
+        diff = business_hours.soj_time_business_hours_diff_vectorized(st, et, slots)
+        for i in range(len(st)):
+            self.assertAlmostEqual(diff[i], business_hours.soj_time_business_hours_diff(st[i], et[i], slots))
+        dfg, sa, ea = pm4py.discover_performance_dfg(df, business_hours=True)
+        self.assertEqual(set(dfg), set(pm4py.discover_dfg(df)[0]))
+
+    def test_variants_ids(self):
+        import numpy as np
+        import pandas as pd
+        import pm4py
+        from pm4py.objects.log.util import pandas_numpy_variants
+        df = pm4py.read_xes(os.path.join("input_data", "roadtraffic100traces.xes"))
+        cases, variant_ids, variants, counts = pandas_numpy_variants.get_variants_ids(df)
+        case_variant = {c: tuple(g["concept:name"]) for c, g in df.groupby("case:concept:name")}
+        self.assertEqual(cases, sorted(case_variant))
+        self.assertEqual([variants[i] for i in variant_ids], [case_variant[c] for c in cases])
+        self.assertEqual(sum(counts), len(cases))
+        self.assertEqual(len(set(variants)), len(variants))
+        activity_codes = np.array([0, 1, 2, 0, 1, 2, 2, 1, 0])
+        case_offsets = np.array([0, 3, 6, 9])
+        self.assertEqual([x.tolist() for x in pandas_numpy_variants.encode_variants(activity_codes, case_offsets)],
+                         [[0, 0, 1], [0, 2], [2, 1]])
+        # the polynomial hashes modulo 2^64 of a Thue-Morse sequence and of its complement collide
+        thue_morse = np.array([bin(i).count("1") % 2 for i in range(2048)])
+        activity_codes = np.concatenate((thue_morse, 1 - thue_morse, thue_morse))
+        case_offsets = np.array([0, 2048, 4096, 6144])
+        self.assertEqual([x.tolist() for x in pandas_numpy_variants.encode_variants(activity_codes, case_offsets)],
+                         [[0, 1, 0], [0, 1], [2, 1]])
+        # the missing activities are not decoded as the last activity
+        df = pd.DataFrame({"case:concept:name": ["1", "1", "2", "2"], "concept:name": ["A", None, "A", "B"],
+                           "time:timestamp": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-01", "2020-01-02"])})
+        cases, variant_ids, variants, counts = pandas_numpy_variants.get_variants_ids(df)
+        self.assertEqual(variants[0][0], "A")
+        self.assertTrue(pd.isna(variants[0][1]))
+        self.assertEqual(variants[1], ("A", "B"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -59,6 +59,62 @@ class XesImportExportTest(unittest.TestCase):
         log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "bpic2012.xes.gz"), variant=xes_importer.Variants.RUSTXES)
         self.assertEqual(len(log), 13087)
 
+    def test_xes_to_parquet_streaming(self):
+        import pandas as pd
+        import pm4py
+        from pm4py.streaming.conversion import xes_to_parquet
+        output_path = os.path.join(OUTPUT_DATA_DIR, "running-example.parquet")
+        num_events = xes_to_parquet.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"), output_path,
+                                          parameters={xes_to_parquet.Parameters.BATCH_SIZE: 10,
+                                                      xes_to_parquet.Parameters.SCHEMA_INFERENCE_TRACES: 2})
+        dataframe = pd.read_parquet(output_path)
+        self.assertEqual(num_events, 42)
+        self.assertEqual(len(dataframe), 42)
+        self.assertEqual(dataframe["case:concept:name"].nunique(), 6)
+        self.assertEqual(pm4py.get_start_activities(dataframe), {"register request": 6})
+        os.remove(output_path)
+
+    def test_xes_to_parquet_streaming_default_parameters(self):
+        import pandas as pd
+        from pm4py.streaming.conversion import xes_to_parquet
+        output_path = os.path.join(OUTPUT_DATA_DIR, "running-example-default.parquet")
+        # the log contains less traces than the ones used (by default) to infer the schema
+        num_events = xes_to_parquet.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"), output_path)
+        self.assertEqual(num_events, 42)
+        self.assertEqual(len(pd.read_parquet(output_path)), 42)
+        os.remove(output_path)
+
+    def test_xes_to_parquet_streaming_incoherent_values(self):
+        from pm4py.streaming.conversion import xes_to_parquet
+        xes_path = os.path.join(OUTPUT_DATA_DIR, "incoherent-values.xes")
+        output_path = os.path.join(OUTPUT_DATA_DIR, "incoherent-values.parquet")
+        with open(xes_path, "w") as F:
+            F.write("<log><trace><string key=\"concept:name\" value=\"1\"/><event><string key=\"concept:name\" "
+                    "value=\"A\"/><int key=\"cost\" value=\"1\"/></event></trace><trace><string key=\"concept:name\" "
+                    "value=\"2\"/><event><string key=\"concept:name\" value=\"A\"/><float key=\"cost\" "
+                    "value=\"1.5\"/></event></trace></log>")
+        # the float value does not fit the integer type inferred from the first trace, and is not truncated
+        try:
+            with self.assertRaises(Exception):
+                xes_to_parquet.apply(xes_path, output_path,
+                                     parameters={xes_to_parquet.Parameters.SCHEMA_INFERENCE_TRACES: 1})
+        finally:
+            os.remove(xes_path)
+            if os.path.exists(output_path):
+                os.remove(output_path)
+
+    def test_xes_trace_stream_closes_file(self):
+        from pm4py.streaming.importer.xes.variants import xes_trace_stream
+        reader = xes_trace_stream.apply(os.path.join(COMPRESSED_INPUT_DATA, "01_running-example.xes.gz"))
+        first_file = reader.file
+        next(reader)
+        reader.reset()
+        self.assertTrue(first_file.closed)
+        traces = [trace for trace in reader if trace is not None]
+        self.assertEqual(len(traces), 6)
+        self.assertIsNone(reader.file)
+        self.assertIsNone(next(reader, None))
+
 
 if __name__ == "__main__":
     unittest.main()